@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Fan-out of push_message from synchronous code.
+
+--requests pushes are sent to a local HTTP server which adds --latency
+milliseconds, one after the other with MessagingApi, --concurrency at a
+time with async_req=True on as many threads, and through an AsyncBridge.
+
+    python benchmarks/async_bridge.py --requests 500 --concurrency 100 --latency 50
+"""
+
+import json
+import threading
+import time
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linebot.v3.async_bridge import AsyncBridge
+from linebot.v3.messaging import (
+    ApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+)
+
+BODY = json.dumps({'sentMessages': [{'id': '1', 'quoteToken': 'q'}]}).encode('utf-8')
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers['Content-Length']))
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    server = Server(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, name='server', daemon=True).start()
+    return server
+
+
+def client_threads():
+    return sum(1 for thread in threading.enumerate()
+               if thread.name != 'server' and 'process_request' not in thread.name)
+
+
+def requests(options):
+    return [PushMessageRequest(to='U{}'.format(i), messages=[TextMessage(text='hello')])
+            for i in range(options.requests)]
+
+
+def run_sequential(configuration, options):
+    with ApiClient(configuration) as api_client:
+        api = MessagingApi(api_client)
+        for request in requests(options):
+            api.push_message(request)
+        return client_threads()
+
+
+def run_threads(configuration, options):
+    with ApiClient(configuration, pool_threads=options.concurrency) as api_client:
+        api = MessagingApi(api_client)
+        futures = [api.push_message(request, async_req=True) for request in requests(options)]
+        threads = client_threads()
+        for future in futures:
+            future.result()
+        return threads
+
+
+def run_bridge(configuration, options):
+    with AsyncBridge(configuration, concurrency=options.concurrency) as bridge:
+        api = AsyncMessagingApi(bridge.api_client)
+        futures = [bridge.submit(api.push_message, request) for request in requests(options)]
+        time.sleep(options.latency)
+        threads = client_threads()
+        bridge.gather(*futures)
+        return threads
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--requests', type=int, default=500)
+    arg_parser.add_argument('--concurrency', type=int, default=100)
+    arg_parser.add_argument('--latency', type=float, default=50)
+    options = arg_parser.parse_args()
+    options.latency /= 1000
+
+    server = serve(options.latency)
+    configuration = Configuration(access_token='token',
+                                  host='http://127.0.0.1:{}'.format(server.server_address[1]))
+    configuration.connection_pool_maxsize = options.concurrency
+
+    print('{:<11} {:>8} {:>10}'.format('mode', 'threads', 'ms total'))
+    for name, run in (('sequential', run_sequential),
+                      ('threads', run_threads),
+                      ('bridge', run_bridge)):
+        baseline = client_threads()
+        started = time.perf_counter()
+        threads = run(configuration, options)
+        elapsed = time.perf_counter() - started
+        print('{:<11} {:>8} {:>10.0f}'.format(name, threads - baseline, elapsed * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
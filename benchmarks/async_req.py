@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Threads and memory of concurrent get_profile calls.
+
+--requests profiles are fetched from a local HTTP server which adds
+--latency milliseconds, --concurrency at a time:
+
+* threadpool: multiprocessing ThreadPool.apply_async, as async_req=True did,
+* executor: ApiClient with async_req=True, which returns futures,
+* asyncio: AsyncApiClient.map, without threads.
+
+Threads started by the client are counted while the requests are in flight;
+those of asyncio are the default executor in which aiohttp resolves host
+names. Memory is the peak of the Python allocations measured by tracemalloc.
+
+    python benchmarks/async_req.py --requests 200 --concurrency 20 --latency 20
+"""
+
+import asyncio
+import json
+import threading
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.pool import ThreadPool
+
+from linebot.v3.messaging import (
+    ApiClient,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+)
+
+BODY = json.dumps({'displayName': 'LINE', 'userId': 'U1234'}).encode('utf-8')
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='server', daemon=True).start()
+    return server
+
+
+def client_threads():
+    return sum(1 for thread in threading.enumerate()
+               if thread.name != 'server' and 'process_request' not in thread.name)
+
+
+def run_threadpool(configuration, options):
+    with ApiClient(configuration) as api_client:
+        api = MessagingApi(api_client)
+        pool = ThreadPool(options.concurrency)
+        results = [pool.apply_async(api.get_profile, ('U{}'.format(i),))
+                   for i in range(options.requests)]
+        threads = client_threads()
+        for result in results:
+            result.get()
+        pool.close()
+        pool.join()
+    return threads
+
+
+def run_executor(configuration, options):
+    with ApiClient(configuration, pool_threads=options.concurrency) as api_client:
+        api = MessagingApi(api_client)
+        futures = [api.get_profile('U{}'.format(i), async_req=True)
+                   for i in range(options.requests)]
+        threads = client_threads()
+        for future in futures:
+            future.result()
+    return threads
+
+
+def run_asyncio(configuration, options):
+    async def run():
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncMessagingApi(api_client)
+            task = asyncio.ensure_future(api_client.map(
+                api.get_profile, ['U{}'.format(i) for i in range(options.requests)],
+                concurrency=options.concurrency))
+            await asyncio.sleep(options.latency)
+            threads = client_threads()
+            await task
+        return threads
+
+    return asyncio.run(run())
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--requests', type=int, default=200)
+    arg_parser.add_argument('--concurrency', type=int, default=20)
+    arg_parser.add_argument('--latency', type=float, default=20)
+    options = arg_parser.parse_args()
+    options.latency /= 1000
+
+    server = serve(options.latency)
+    configuration = Configuration(access_token='token',
+                                  host='http://127.0.0.1:{}'.format(server.server_address[1]))
+
+    print('{:<11} {:>8} {:>14} {:>11}'.format('mode', 'threads', 'peak KiB', 'ms total'))
+    for name, run in (('threadpool', run_threadpool),
+                      ('executor', run_executor),
+                      ('asyncio', run_asyncio)):
+        baseline = client_threads()
+        tracemalloc.start()
+        started = time.perf_counter()
+        threads = run(configuration, options)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('{:<11} {:>8} {:>14.0f} {:>11.0f}'.format(name, threads - baseline, peak / 1024, elapsed * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Workers pushing messages while the API degrades.
+
+--workers threads each push --requests messages to a local HTTP server which
+answers 503 after --latency milliseconds: without a circuit breaker, with a
+CircuitBreaker, and with one which also sheds beyond --max-concurrency
+requests in flight.
+
+    python benchmarks/circuit_breaker.py --workers 16 --requests 20 --latency 200
+"""
+
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linebot.v3.circuit_breaker import CircuitBreaker
+from linebot.v3.exceptions import CircuitOpenError, ConcurrencyLimitError
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    Configuration,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+)
+
+BODY = b'{"message": "Service Unavailable"}'
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers['Content-Length']))
+            with lock:
+                server.requests += 1
+            time.sleep(latency)
+            self.send_response(503)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    lock = threading.Lock()
+    server = Server(('127.0.0.1', 0), Handler)
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(configuration, options):
+    request = PushMessageRequest(to='U1234', messages=[TextMessage(text='hello')])
+    outcomes = {'503': 0, 'open': 0, 'shed': 0}
+    lock = threading.Lock()
+
+    def work():
+        for _ in range(options.requests):
+            try:
+                api.push_message(request)
+            except ApiException:
+                outcome = '503'
+            except CircuitOpenError:
+                outcome = 'open'
+            except ConcurrencyLimitError:
+                outcome = 'shed'
+            with lock:
+                outcomes[outcome] += 1
+
+    with ApiClient(configuration) as api_client, ThreadPoolExecutor(options.workers) as executor:
+        api = MessagingApi(api_client)
+        for future in [executor.submit(work) for _ in range(options.workers)]:
+            future.result()
+    return outcomes
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--workers', type=int, default=16)
+    arg_parser.add_argument('--requests', type=int, default=20)
+    arg_parser.add_argument('--latency', type=float, default=200)
+    arg_parser.add_argument('--max-concurrency', type=int, default=4)
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000)
+    print('{:<10} {:>6} {:>6} {:>6} {:>6} {:>9}'.format(
+        'mode', 'sent', '503', 'open', 'shed', 'ms total'))
+    for name, breaker in (('none', None),
+                          ('breaker', CircuitBreaker()),
+                          ('shedding', CircuitBreaker(max_concurrency=options.max_concurrency))):
+        configuration = Configuration(
+            access_token='token', host='http://127.0.0.1:{}'.format(server.server_address[1]))
+        configuration.connection_pool_maxsize = options.workers
+        configuration.circuit_breaker = breaker
+        server.requests = 0
+        started = time.perf_counter()
+        outcomes = run(configuration, options)
+        elapsed = time.perf_counter() - started
+        print('{:<10} {:>6} {:>6} {:>6} {:>6} {:>9.0f}'.format(
+            name, server.requests, outcomes['503'], outcomes['open'], outcomes['shed'],
+            elapsed * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""urllib3 connection pool modes under concurrent get_profile calls.
+
+Each of 1, 16 and 128 threads fetches --requests profiles from a local
+keep-alive HTTP server which adds --latency milliseconds, through one
+ApiClient whose pool holds --maxsize connections: urllib3 as is, blocking
+mode, and adaptive mode growing up to 128 connections.
+
+    python benchmarks/connection_pool.py --requests 20 --latency 5 --maxsize 4
+"""
+
+import json
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linebot.v3.connection_pool import ConnectionPoolMonitor
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    MessagingApi,
+)
+
+BODY = json.dumps({'displayName': 'LINE', 'userId': 'U1234'}).encode('utf-8')
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    server = Server(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(host, monitor, threads, options):
+    configuration = Configuration(access_token='token', host=host)
+    configuration.connection_pool_maxsize = options.maxsize
+    configuration.connection_pool = monitor
+
+    def fetch():
+        for _ in range(options.requests):
+            api.get_profile('U1234')
+
+    with ApiClient(configuration) as api_client, ThreadPoolExecutor(threads) as executor:
+        api = MessagingApi(api_client)
+        started = time.perf_counter()
+        for future in [executor.submit(fetch) for _ in range(threads)]:
+            future.result()
+        elapsed = time.perf_counter() - started
+    return threads * options.requests / elapsed, monitor.stats()[host]
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--requests', type=int, default=20)
+    arg_parser.add_argument('--latency', type=float, default=5)
+    arg_parser.add_argument('--maxsize', type=int, default=4)
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000)
+    host = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    print('{:>7} {:<9} {:>8} {:>8} {:>10} {:>6} {:>8} {:>8}'.format(
+        'threads', 'mode', 'req/s', 'created', 'discarded', 'waits', 'wait ms', 'maxsize'))
+    for threads in (1, 16, 128):
+        for name, monitor in (('urllib3', ConnectionPoolMonitor()),
+                              ('block', ConnectionPoolMonitor(block=True)),
+                              ('adaptive', ConnectionPoolMonitor(adaptive=True, max_size=128))):
+            rate, stats = run(host, monitor, threads, options)
+            print('{:>7} {:<9} {:>8.0f} {:>8} {:>10} {:>6} {:>8.0f} {:>8}'.format(
+                threads, name, rate, stats['created'], stats['discarded'], stats['waits'],
+                stats['wait_seconds'] * 1e3, stats['maxsize']))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
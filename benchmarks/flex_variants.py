@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Personalized variants of one Flex bubble.
+
+Each variant changes three FlexText.text values of a 40 object bubble and
+is encoded to JSON. The bubble is rebuilt with the model constructors,
+deep-copied and assigned, or derived from a FlexTemplate.
+
+    python benchmarks/flex_variants.py --variants 10000
+"""
+
+import copy
+import json
+import time
+from argparse import ArgumentParser
+
+from linebot.v3.flex import FlexTemplate
+from linebot.v3.messaging import (
+    FlexBox,
+    FlexBubble,
+    FlexButton,
+    FlexSeparator,
+    FlexText,
+    URIAction,
+)
+
+ROWS = 9
+
+
+def build_bubble(name='{name}', points='{points}', rank='{rank}'):
+    rows = [
+        FlexBox(layout='baseline', spacing='sm', contents=[
+            FlexText(text='Item {}'.format(i), color='#aaaaaa', size='sm', flex=1),
+            FlexText(text='Value {}'.format(i), wrap=True, color='#666666', size='sm', flex=5),
+        ])
+        for i in range(ROWS)
+    ]
+    return FlexBubble(
+        header=FlexBox(layout='vertical', contents=[
+            FlexText(text=name, weight='bold', size='xl'),
+            FlexText(text=rank, size='sm', color='#999999'),
+        ]),
+        body=FlexBox(layout='vertical', contents=[
+            FlexText(text=points, weight='bold', size='xxl'),
+            FlexSeparator(margin='md'),
+            FlexBox(layout='vertical', margin='lg', spacing='sm', contents=rows),
+        ]),
+        footer=FlexBox(layout='vertical', spacing='sm', contents=[
+            FlexButton(style='link', height='sm', action=URIAction(label='CALL', uri='https://line.me/')),
+            FlexButton(style='link', height='sm', action=URIAction(label='WEBSITE', uri='https://line.me/')),
+        ]),
+    )
+
+
+def count_objects(obj):
+    if isinstance(obj, list):
+        return sum(count_objects(item) for item in obj)
+    if isinstance(obj, dict):
+        return 1 + sum(count_objects(value) for value in obj.values())
+    return 0
+
+
+def personalize(i):
+    return 'user{}'.format(i), '{} points'.format(i * 7), 'rank {}'.format(i % 5)
+
+
+def rebuild(variants):
+    for i in range(variants):
+        build_bubble(*personalize(i)).to_json()
+
+
+def deepcopy_and_assign(variants):
+    bubble = build_bubble()
+    for i in range(variants):
+        name, points, rank = personalize(i)
+        variant = copy.deepcopy(bubble)
+        variant.header.contents[0].text = name
+        variant.header.contents[1].text = rank
+        variant.body.contents[0].text = points
+        variant.to_json()
+
+
+def template(variants, encode):
+    base = FlexTemplate(build_bubble())
+    base.to_json()
+    for i in range(variants):
+        name, points, rank = personalize(i)
+        variant = base.set_all({
+            'header.contents.0.text': name,
+            'header.contents.1.text': rank,
+            'body.contents.0.text': points,
+        })
+        encode(variant)
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--variants', type=int, default=10000)
+    options = arg_parser.parse_args()
+
+    print('{} variants of a bubble of {} objects'.format(
+        options.variants, count_objects(build_bubble().to_dict())))
+    cases = [
+        ('rebuild models', rebuild),
+        ('deepcopy + assign', deepcopy_and_assign),
+        ('FlexTemplate to_json', lambda n: template(n, FlexTemplate.to_json)),
+        ('FlexTemplate to_dict', lambda n: template(n, lambda v: json.dumps(v.to_dict()))),
+    ]
+    print('{:<24} {:>10} {:>14}'.format('case', 'seconds', 'us/variant'))
+    for name, fn in cases:
+        started = time.perf_counter()
+        fn(options.variants)
+        elapsed = time.perf_counter() - started
+        print('{:<24} {:>10.2f} {:>14.1f}'.format(name, elapsed, elapsed * 1e6 / options.variants))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Overhead of the instrumentation hooks.
+
+MessagingApi.push_message is called without instrumentation, with a hook
+which does nothing and with PrometheusInstrumentation. ApiClient.request is
+replaced by a canned response, so only the client side work is measured.
+
+    python benchmarks/instrumentation.py --repeat 5000
+"""
+
+import time
+from argparse import ArgumentParser
+
+from linebot.v3.instrumentation import Instrumentation, PrometheusInstrumentation
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+)
+
+BODY = b'{"sentMessages":[{"id":"461230966842064897","quoteToken":"IStG5h1Tz7b"}]}'
+
+
+class CannedResponse(object):
+    status = 200
+    reason = 'OK'
+
+    def __init__(self):
+        self.data = BODY
+
+    def getheader(self, name, default=None):
+        return {'content-type': 'application/json', 'x-line-request-id': 'abc'}.get(name, default)
+
+    def getheaders(self):
+        return {'content-type': 'application/json', 'x-line-request-id': 'abc'}
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=5000)
+    options = arg_parser.parse_args()
+
+    request = PushMessageRequest(to='U4af4980629', messages=[TextMessage(text='Hello, world')])
+    print('{:<28} {:>10}'.format('instrumentation', 'us/call'))
+    for name, instrumentation in (('none', None),
+                                  ('Instrumentation', Instrumentation()),
+                                  ('PrometheusInstrumentation', PrometheusInstrumentation())):
+        configuration = Configuration(access_token='token')
+        configuration.instrumentation = instrumentation
+        api_client = ApiClient(configuration)
+        api_client.request = lambda *args, **kwargs: CannedResponse()
+        api = MessagingApi(api_client)
+        api.push_message(request)
+        started = time.perf_counter()
+        for _ in range(options.repeat):
+            api.push_message(request)
+        elapsed = (time.perf_counter() - started) / options.repeat
+        print('{:<28} {:>10.1f}'.format(name, elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    main()
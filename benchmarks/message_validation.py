@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Validating the same Flex message repeatedly.
+
+MessagingApi.validate_push is called against a local HTTP server which adds
+--latency milliseconds, directly and through ValidationCache.
+
+    python benchmarks/message_validation.py --repeat 200 --latency 50
+"""
+
+import time
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from linebot.v3.message_validation import ValidationCache, check_messages
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    FlexBox,
+    FlexBubble,
+    FlexMessage,
+    FlexText,
+    MessagingApi,
+    ValidateMessageRequest,
+)
+
+
+def flex_request():
+    rows = [FlexText(text='Row {}'.format(i)) for i in range(20)]
+    bubble = FlexBubble(body=FlexBox(layout='vertical', contents=rows))
+    return ValidateMessageRequest(messages=[FlexMessage(alt_text='Rows', contents=bubble)])
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers['Content-Length']))
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timeit(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=200)
+    arg_parser.add_argument('--latency', type=float, default=50, help='milliseconds')
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000)
+    configuration = Configuration(
+        access_token='token', host='http://127.0.0.1:{}'.format(server.server_port))
+    request = flex_request()
+
+    with ApiClient(configuration) as api_client:
+        api = MessagingApi(api_client)
+        cache = ValidationCache(api)
+        print('{:<20} {:>12}'.format('method', 'us/call'))
+        for name, fn in (
+            ('validate_push', lambda: api.validate_push(request)),
+            ('check_messages', lambda: check_messages(request)),
+            ('ValidationCache', lambda: cache.validate_push(request)),
+        ):
+            print('{:<20} {:>12.1f}'.format(name, timeit(fn, options.repeat) * 1e6))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Cost of the generated models on the two hot paths of a bot.
+
+"webhook" parses a body of text message events with mentions and emojis
+through WebhookParser. "push" builds a PushMessageRequest with a text and a
+Flex message, either with the model constructors or from a dict, and
+serializes it the way MessagingApi.push_message does. "flex" builds Flex
+bubbles whose body is a tree of boxes 3 and 6 levels deep with from_dict.
+
+    python benchmarks/model_parsing.py --events 100 --repeat 200
+"""
+
+import base64
+import functools
+import hashlib
+import hmac
+import json
+import time
+from argparse import ArgumentParser
+
+from linebot.v3 import WebhookParser
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    FlexBox,
+    FlexBubble,
+    FlexButton,
+    FlexMessage,
+    FlexText,
+    PushMessageRequest,
+    TextMessage,
+    URIAction,
+)
+
+CHANNEL_SECRET = 'channel_secret'
+
+
+def make_webhook_body(events):
+    event = {
+        'type': 'message',
+        'mode': 'active',
+        'timestamp': 1462629479859,
+        'source': {'type': 'group', 'groupId': 'Ca56f94637cc4347f90a25382909b24b9',
+                   'userId': 'U206d25c2ea6bd87c17655609a1c37cb8'},
+        'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3ZR',
+        'deliveryContext': {'isRedelivery': False},
+        'replyToken': 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA',
+        'message': {
+            'id': '325708',
+            'type': 'text',
+            'text': '@example Hello, world! (love) (love)',
+            'quoteToken': 'q3Plxr4AgKd',
+            'emojis': [
+                {'index': 23, 'length': 6, 'productId': '5ac1bfd5040ab15980c9b435', 'emojiId': '001'},
+                {'index': 30, 'length': 6, 'productId': '5ac1bfd5040ab15980c9b435', 'emojiId': '002'},
+            ],
+            'mention': {'mentionees': [
+                {'index': 0, 'length': 8, 'type': 'user', 'userId': 'U49585cd0d5'},
+                {'index': 9, 'length': 4, 'type': 'all'},
+            ]},
+        },
+    }
+    body = json.dumps({'destination': 'U123', 'events': [event] * events})
+    signature = base64.b64encode(hmac.new(
+        CHANNEL_SECRET.encode('utf-8'), body.encode('utf-8'), hashlib.sha256).digest())
+    return body, signature.decode('utf-8')
+
+
+def build_push_request():
+    bubble = FlexBubble(
+        body=FlexBox(layout='vertical', contents=[
+            FlexText(text='Brown Cafe', weight='bold', size='xl'),
+            FlexBox(layout='baseline', contents=[
+                FlexText(text='Place', color='#aaaaaa', flex=1),
+                FlexText(text='Shinjuku, Tokyo', wrap=True, flex=5),
+            ]),
+        ]),
+        footer=FlexBox(layout='vertical', contents=[
+            FlexButton(action=URIAction(label='CALL', uri='https://line.me/')),
+        ]),
+    )
+    return PushMessageRequest(to='U4af4980629', messages=[
+        TextMessage(text='Hello, world'),
+        FlexMessage(alt_text='Brown Cafe', contents=bubble),
+    ])
+
+
+def make_flex_tree(depth, breadth=3):
+    if depth == 1:
+        return {'type': 'text', 'text': 'Brown Cafe',
+                'action': {'type': 'uri', 'label': 'open', 'uri': 'https://line.me/'}}
+    return {'type': 'box', 'layout': 'vertical',
+            'contents': [make_flex_tree(depth - 1, breadth) for _ in range(breadth)]}
+
+
+def count_models(obj):
+    if isinstance(obj, list):
+        return sum(count_models(item) for item in obj)
+    if isinstance(obj, dict):
+        return 1 + sum(count_models(value) for value in obj.values())
+    return 0
+
+
+def timeit(fn, repeat):
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=100)
+    arg_parser.add_argument('--repeat', type=int, default=200)
+    options = arg_parser.parse_args()
+
+    parser = WebhookParser(CHANNEL_SECRET)
+    body, signature = make_webhook_body(options.events)
+    api_client = ApiClient(Configuration(access_token='token'))
+    push_request = build_push_request()
+    push_dict = push_request.to_dict()
+
+    # (name, fn, items per call, calls)
+    cases = [
+        ('webhook parse', lambda: parser.parse(body, signature), options.events, options.repeat),
+        ('push build (constructors)', build_push_request, 1, options.repeat * 10),
+        ('push build (from_dict)', lambda: PushMessageRequest.from_dict(push_dict),
+         1, options.repeat * 10),
+        ('push serialize', lambda: json.dumps(api_client.sanitize_for_serialization(push_request)),
+         1, options.repeat * 10),
+    ]
+    for depth in (3, 6):
+        flex_dict = {'type': 'bubble', 'body': make_flex_tree(depth)}
+        models = count_models(flex_dict)
+        cases.append(('flex from_dict (depth {})'.format(depth),
+                      functools.partial(FlexBubble.from_dict, flex_dict),
+                      models, max(1, options.repeat * 100 // models)))
+    print('{:<28} {:>12} {:>12}'.format('case', 'us/call', 'us/model'))
+    for name, fn, items, calls in cases:
+        elapsed = timeit(fn, calls)
+        print('{:<28} {:>12.1f} {:>12.1f}'.format(name, elapsed * 1e6, elapsed * 1e6 / items))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Looking up the profile of the sender of every event.
+
+MessagingApi.get_profile is called for --events events from --users users
+against a local HTTP server which adds --latency milliseconds, directly and
+through ProfileCache.
+
+    python benchmarks/profile_cache.py --events 500 --users 50 --latency 20
+"""
+
+import json
+import random
+import time
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    MessagingApi,
+)
+from linebot.v3.profile_cache import ProfileCache
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps({'userId': self.path.rsplit('/', 1)[1],
+                               'displayName': 'Brown'}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=500)
+    arg_parser.add_argument('--users', type=int, default=50)
+    arg_parser.add_argument('--latency', type=float, default=20, help='milliseconds')
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000)
+    configuration = Configuration(
+        access_token='token', host='http://127.0.0.1:{}'.format(server.server_port))
+    user_ids = ['U{:032x}'.format(random.randrange(options.users)) for _ in range(options.events)]
+
+    with ApiClient(configuration) as api_client:
+        api = MessagingApi(api_client)
+        print('{:<12} {:>10} {:>12}'.format('method', 'requests', 'ms/event'))
+        for name, get_profile in (('direct', api.get_profile),
+                                  ('ProfileCache', ProfileCache(api).get_profile)):
+            requests = len(set(user_ids)) if name == 'ProfileCache' else len(user_ids)
+            started = time.perf_counter()
+            for user_id in user_ids:
+                get_profile(user_id)
+            elapsed = (time.perf_counter() - started) / len(user_ids)
+            print('{:<12} {:>10} {:>12.2f}'.format(name, requests, elapsed * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Client side cost of MessagingApi.push_message.
+
+The request is built once with the model constructors and sent repeatedly
+with client_side_validation enabled and disabled. ApiClient.call_api is
+replaced by a no-op, so only the work done before the HTTP request is measured.
+
+    python benchmarks/push_message.py --repeat 2000
+"""
+
+import time
+from argparse import ArgumentParser
+
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    FlexBox,
+    FlexBubble,
+    FlexButton,
+    FlexMessage,
+    FlexText,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+    URIAction,
+)
+
+
+def text_request():
+    return PushMessageRequest(to='U4af4980629', messages=[TextMessage(text='Hello, world')])
+
+
+def flex_request():
+    rows = [
+        FlexBox(layout='baseline', contents=[
+            FlexText(text='Place', color='#aaaaaa', flex=1),
+            FlexText(text='Shinjuku, Tokyo {}'.format(i), wrap=True, flex=5),
+        ])
+        for i in range(5)
+    ]
+    bubble = FlexBubble(
+        body=FlexBox(layout='vertical', contents=[FlexText(text='Brown Cafe', weight='bold')] + rows),
+        footer=FlexBox(layout='vertical', contents=[
+            FlexButton(action=URIAction(label='CALL', uri='https://line.me/')),
+        ]),
+    )
+    return PushMessageRequest(to='U4af4980629', messages=[
+        FlexMessage(alt_text='Brown Cafe', contents=bubble),
+    ])
+
+
+def timeit(fn, repeat):
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=2000)
+    options = arg_parser.parse_args()
+
+    print('{:<8} {:>22} {:>12}'.format('payload', 'client_side_validation', 'us/call'))
+    for name, request in (('text', text_request()), ('flex', flex_request())):
+        for validation in (True, False):
+            configuration = Configuration(access_token='token')
+            configuration.client_side_validation = validation
+            api_client = ApiClient(configuration)
+            api_client.call_api = lambda *args, **kwargs: None
+            api = MessagingApi(api_client)
+            elapsed = timeit(lambda: api.push_message(request), options.repeat)
+            print('{:<8} {:>22} {:>12.1f}'.format(name, str(validation), elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    main()
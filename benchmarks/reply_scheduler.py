@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Replies to a backlog of events whose reply tokens are about to expire.
+
+--events message events, received between 0 and --ttl seconds ago, are
+answered by --workers threads through a local HTTP server which adds
+--latency milliseconds and rejects reply tokens older than --ttl seconds:
+in arrival order, pushing after a rejected reply, and with ReplyScheduler.
+
+    python benchmarks/reply_scheduler.py --events 400 --workers 4 --ttl 4 --latency 20
+"""
+
+import json
+import random
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    Configuration,
+    MessagingApi,
+    PushMessageRequest,
+    ReplyMessageRequest,
+    TextMessage,
+)
+from linebot.v3.reply_scheduler import ReplyScheduler
+from linebot.v3.webhooks import MessageEvent
+
+MESSAGES = [TextMessage(text='hello')]
+SENT = json.dumps({'sentMessages': [{'id': '1', 'quoteToken': 'q'}]}).encode('utf-8')
+INVALID = b'{"message": "Invalid reply token"}'
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(latency, ttl):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            time.sleep(latency)
+            with lock:
+                server.counts[self.path] = server.counts.get(self.path, 0) + 1
+            status = 200
+            if self.path.endswith('/reply') and float(body['replyToken']) + ttl < time.time():
+                status = 400
+                server.counts['rejected'] = server.counts.get('rejected', 0) + 1
+            data = SENT if status == 200 else INVALID
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    lock = threading.Lock()
+    server = Server(('127.0.0.1', 0), Handler)
+    server.counts = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def events(options):
+    now = time.time()
+    rng = random.Random(0)
+    received = sorted(now - rng.uniform(0, options.ttl) for _ in range(options.events))
+    return [MessageEvent.from_dict({
+        'type': 'message',
+        'source': {'type': 'user', 'userId': 'U1234'},
+        'timestamp': int(timestamp * 1000),
+        'mode': 'active',
+        'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3ZR',
+        'deliveryContext': {'isRedelivery': False},
+        'replyToken': repr(timestamp),
+        'message': {'type': 'text', 'id': '1', 'text': 'hi', 'quoteToken': 'q'},
+    }) for timestamp in received]
+
+
+def run_fifo(api, options):
+    def reply(event):
+        try:
+            api.reply_message(ReplyMessageRequest(reply_token=event.reply_token, messages=MESSAGES))
+        except ApiException:
+            api.push_message(PushMessageRequest(to=event.source.user_id, messages=MESSAGES))
+
+    with ThreadPoolExecutor(options.workers) as executor:
+        list(executor.map(reply, events(options)))
+
+
+def run_scheduler(api, options):
+    with ReplyScheduler(api, workers=options.workers, ttl=options.ttl,
+                        margin=2 * options.latency / 1000) as scheduler:
+        futures = [scheduler.reply(event, MESSAGES) for event in events(options)]
+        for future in futures:
+            future.result()
+    return scheduler.stats()['latency']
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=400)
+    arg_parser.add_argument('--workers', type=int, default=4)
+    arg_parser.add_argument('--ttl', type=float, default=4)
+    arg_parser.add_argument('--latency', type=float, default=20)
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000, options.ttl)
+    configuration = Configuration(
+        access_token='token', host='http://127.0.0.1:{}'.format(server.server_address[1]))
+    print('{:<10} {:>8} {:>9} {:>7} {:>12} {:>9}'.format(
+        'mode', 'replied', 'rejected', 'pushed', 'round trips', 'ms total'))
+    with ApiClient(configuration) as api_client:
+        api = MessagingApi(api_client)
+        for name, run in (('fifo', run_fifo), ('scheduler', run_scheduler)):
+            server.counts = {}
+            started = time.perf_counter()
+            latency = run(api, options)
+            elapsed = time.perf_counter() - started
+            counts = server.counts
+            replies = counts.get('/v2/bot/message/reply', 0)
+            pushes = counts.get('/v2/bot/message/push', 0)
+            rejected = counts.get('rejected', 0)
+            print('{:<10} {:>8} {:>9} {:>7} {:>12} {:>9.0f}'.format(
+                name, replies - rejected, rejected, pushes, replies + pushes, elapsed * 1e3))
+            if latency:
+                print('  reply token age at send (s): ' + ' '.join(
+                    '<={}:{}'.format(bound, count) for bound, count in latency['buckets'].items()))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
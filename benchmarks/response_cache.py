@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Polling MessagingApi.get_rich_menu_list.
+
+The rich menu list is fetched --repeat times from a local HTTP server which
+adds --latency milliseconds, without a response cache and with one in memory
+and on disk.
+
+    python benchmarks/response_cache.py --repeat 200 --latency 20
+"""
+
+import json
+import tempfile
+import time
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    MessagingApi,
+)
+from linebot.v3.response_cache import DiskBackend, ResponseCache
+
+BODY = json.dumps({'richmenus': [{
+    'richMenuId': 'richmenu-{}'.format(i),
+    'size': {'width': 2500, 'height': 843},
+    'selected': False,
+    'name': 'Menu {}'.format(i),
+    'chatBarText': 'Menu',
+    'areas': [{'bounds': {'x': 0, 'y': 0, 'width': 2500, 'height': 843},
+               'action': {'type': 'postback', 'data': 'action=buy'}}],
+} for i in range(10)]}).encode('utf-8')
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=200)
+    arg_parser.add_argument('--latency', type=float, default=20, help='milliseconds')
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000)
+    directory = tempfile.mkdtemp()
+    print('{:<10} {:>12}'.format('cache', 'us/call'))
+    for name, cache in (('none', None),
+                        ('memory', ResponseCache()),
+                        ('disk', ResponseCache(backend=DiskBackend(directory)))):
+        configuration = Configuration(
+            access_token='token', host='http://127.0.0.1:{}'.format(server.server_port))
+        configuration.response_cache = cache
+        with ApiClient(configuration) as api_client:
+            api = MessagingApi(api_client)
+            api.get_rich_menu_list()
+            started = time.perf_counter()
+            for _ in range(options.repeat):
+                api.get_rich_menu_list()
+            elapsed = (time.perf_counter() - started) / options.repeat
+        print('{:<10} {:>12.1f}'.format(name, elapsed * 1e6))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
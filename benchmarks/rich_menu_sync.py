@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Deploying --menus rich menus of which one changed.
+
+The naive deployment recreates every menu, uploads every image and
+repoints every alias one call at a time, as in examples/rich-menu.
+RichMenuSync only recreates the changed menu. The API is an in-memory fake
+in which every call takes --latency milliseconds.
+
+    python benchmarks/rich_menu_sync.py --menus 10 --latency 50
+"""
+
+import itertools
+import threading
+import time
+from argparse import ArgumentParser
+from types import SimpleNamespace
+
+from linebot.v3.rich_menu_sync import RichMenuSpec, RichMenuSync
+
+
+class FakeApi(object):
+    def __init__(self, latency):
+        self.latency = latency
+        self.menus = {}
+        self.aliases = {}
+        self.calls = 0
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def _call(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+    def get_rich_menu_list(self):
+        self._call()
+        return SimpleNamespace(richmenus=[SimpleNamespace(rich_menu_id=rich_menu_id, name=name)
+                                          for rich_menu_id, name in list(self.menus.items())])
+
+    def get_rich_menu_alias_list(self):
+        self._call()
+        return SimpleNamespace(aliases=[
+            SimpleNamespace(rich_menu_alias_id=alias, rich_menu_id=rich_menu_id)
+            for alias, rich_menu_id in list(self.aliases.items())])
+
+    def get_default_rich_menu_id(self):
+        self._call()
+        return SimpleNamespace(rich_menu_id=None)
+
+    def create_rich_menu(self, rich_menu_request):
+        self._call()
+        rich_menu_id = 'richmenu-{}'.format(next(self._ids))
+        self.menus[rich_menu_id] = rich_menu_request.name
+        return SimpleNamespace(rich_menu_id=rich_menu_id)
+
+    def set_rich_menu_image(self, rich_menu_id, body, _headers=None):
+        self._call()
+
+    def create_rich_menu_alias(self, request):
+        self._call()
+        self.aliases[request.rich_menu_alias_id] = request.rich_menu_id
+
+    def update_rich_menu_alias(self, alias, request):
+        self._call()
+        self.aliases[alias] = request.rich_menu_id
+
+    def delete_rich_menu_alias(self, alias):
+        self._call()
+        del self.aliases[alias]
+
+    def set_default_rich_menu(self, rich_menu_id):
+        self._call()
+
+    def delete_rich_menu(self, rich_menu_id):
+        self._call()
+        del self.menus[rich_menu_id]
+
+    def rich_menu_batch_with_http_info(self, request):
+        self._call()
+        return SimpleNamespace(headers={'x-line-request-id': 'request'})
+
+    def get_rich_menu_batch_progress(self, request_id):
+        self._call()
+        return SimpleNamespace(phase='succeeded')
+
+
+def specs(menus, changed):
+    return [RichMenuSpec({
+        'size': {'width': 2500, 'height': 843},
+        'selected': False,
+        'name': 'menu-{}'.format(i),
+        'chatBarText': 'Menu v2' if i == changed else 'Menu',
+        'areas': [{'bounds': {'x': 0, 'y': 0, 'width': 2500, 'height': 843},
+                   'action': {'type': 'postback', 'data': str(i)}}],
+    }, b'\x89PNG' + bytes(1024), aliases=['alias-{}'.format(i)]) for i in range(menus)]
+
+
+def naive(api, specs):
+    for spec in specs:
+        old = [rich_menu_id for rich_menu_id, name in api.menus.items() if name == spec.name]
+        rich_menu_id = api.create_rich_menu(SimpleNamespace(name=spec.name)).rich_menu_id
+        api.set_rich_menu_image(rich_menu_id, spec.image)
+        for alias in spec.aliases:
+            api.update_rich_menu_alias(alias, SimpleNamespace(rich_menu_id=rich_menu_id))
+        for rich_menu_id in old:
+            api.delete_rich_menu(rich_menu_id)
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--menus', type=int, default=10)
+    arg_parser.add_argument('--latency', type=float, default=50, help='milliseconds')
+    options = arg_parser.parse_args()
+
+    print('{:<14} {:>8} {:>10}'.format('deployment', 'calls', 'seconds'))
+    api = FakeApi(options.latency / 1000)
+    naive(api, specs(options.menus, None))
+    api.calls = 0
+    started = time.perf_counter()
+    naive(api, specs(options.menus, 0))
+    print('{:<14} {:>8} {:>10.2f}'.format('naive', api.calls, time.perf_counter() - started))
+
+    api = FakeApi(options.latency / 1000)
+    sync = RichMenuSync(api, api, poll_interval=0)
+    sync.sync(specs(options.menus, None))
+    api.calls = 0
+    started = time.perf_counter()
+    sync.sync(specs(options.menus, 0))
+    print('{:<14} {:>8} {:>10.2f}'.format('RichMenuSync', api.calls, time.perf_counter() - started))
+
+
+if __name__ == '__main__':
+    main()
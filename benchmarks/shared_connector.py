@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""TLS handshakes of AsyncApiClients created per request, with and without a SharedConnector.
+
+A local HTTPS server with a self-signed certificate (made with the openssl
+command) stands in for the API. Every simulated webhook creates an
+AsyncApiClient, calls get_profile and closes the client, --concurrency at
+a time.
+
+    python benchmarks/shared_connector.py --requests 500 --concurrency 10
+"""
+
+import asyncio
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+from argparse import ArgumentParser
+
+from aiohttp import web
+
+from linebot.v3.connector import SharedConnector
+from linebot.v3.messaging import AsyncApiClient, AsyncMessagingApi, Configuration
+
+
+def make_certificate(directory):
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-keyout', key, '-out', cert, '-subj', '/CN=127.0.0.1',
+                    '-addext', 'subjectAltName=IP:127.0.0.1'],
+                   check=True, capture_output=True)
+    return cert, key
+
+
+async def serve(cert, key, connections):
+    async def profile(request):
+        connections.add(request.transport.get_extra_info('peername'))
+        return web.json_response({'displayName': 'LINE', 'userId': request.match_info['user_id']})
+
+    app = web.Application()
+    app.router.add_get('/v2/bot/profile/{user_id}', profile)
+    ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ssl_context.load_cert_chain(cert, key)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0, ssl_context=ssl_context).start()
+    return runner, 'https://127.0.0.1:{}'.format(runner.addresses[0][1])
+
+
+async def run(configuration, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle(i):
+        async with semaphore:
+            async with AsyncApiClient(configuration) as api_client:
+                await AsyncMessagingApi(api_client).get_profile('U{}'.format(i))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[handle(i) for i in range(requests)])
+    return time.perf_counter() - started
+
+
+async def main_async(options, cert, key):
+    connections = set()
+    runner, host = await serve(cert, key, connections)
+    try:
+        print('{:<10} {:>11} {:>12}'.format('connector', 'handshakes', 'ms/request'))
+        for name in ('per client', 'shared'):
+            configuration = Configuration(access_token='token', host=host)
+            configuration.ssl_ca_cert = cert
+            if name == 'shared':
+                configuration.connector = SharedConnector(
+                    ssl_context=ssl.create_default_context(cafile=cert))
+            connections.clear()
+            elapsed = await run(configuration, options.requests, options.concurrency)
+            if configuration.connector is not None:
+                await configuration.connector.close()
+            print('{:<10} {:>11} {:>12.2f}'.format(
+                name, len(connections), elapsed / options.requests * 1e3))
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--requests', type=int, default=500)
+    arg_parser.add_argument('--concurrency', type=int, default=10)
+    options = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        asyncio.run(main_async(options, cert, key))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Bursts of get_group_summary for the same group, with and without SingleFlight.
+
+--handlers threads, or asyncio tasks, each fetch the summary of one of
+--groups groups, --bursts times, from a local HTTP server which adds
+--latency milliseconds.
+
+    python benchmarks/single_flight.py --handlers 50 --groups 2 --bursts 10 --latency 20
+"""
+
+import asyncio
+import json
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linebot.v3.messaging import (
+    ApiClient,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+)
+from linebot.v3.single_flight import SingleFlight
+
+BODY = json.dumps({'groupId': 'C1', 'groupName': 'group'}).encode('utf-8')
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            with lock:
+                server.requests += 1
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+
+    lock = threading.Lock()
+    server = Server(('127.0.0.1', 0), Handler)
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def group_ids(options):
+    return ['C{}'.format(i % options.groups) for i in range(options.handlers)]
+
+
+def run_threads(configuration, options):
+    with ApiClient(configuration) as api_client, ThreadPoolExecutor(options.handlers) as executor:
+        api = MessagingApi(api_client)
+        for _ in range(options.bursts):
+            list(executor.map(api.get_group_summary, group_ids(options)))
+
+
+def run_tasks(configuration, options):
+    async def run():
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncMessagingApi(api_client)
+            for _ in range(options.bursts):
+                await asyncio.gather(*map(api.get_group_summary, group_ids(options)))
+
+    asyncio.run(run())
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--handlers', type=int, default=50)
+    arg_parser.add_argument('--groups', type=int, default=2)
+    arg_parser.add_argument('--bursts', type=int, default=10)
+    arg_parser.add_argument('--latency', type=float, default=20)
+    options = arg_parser.parse_args()
+
+    server = serve(options.latency / 1000)
+    print('{:<8} {:<14} {:>9} {:>10} {:>10}'.format(
+        'mode', 'single_flight', 'requests', 'coalesced', 'ms total'))
+    for name, run in (('threads', run_threads), ('asyncio', run_tasks)):
+        for single_flight in (None, SingleFlight()):
+            configuration = Configuration(
+                access_token='token', host='http://127.0.0.1:{}'.format(server.server_address[1]))
+            configuration.connection_pool_maxsize = options.handlers
+            configuration.single_flight = single_flight
+            server.requests = 0
+            started = time.perf_counter()
+            run(configuration, options)
+            elapsed = time.perf_counter() - started
+            coalesced = single_flight.stats()['coalesced'] if single_flight else 0
+            print('{:<8} {:<14} {:>9} {:>10} {:>10.0f}'.format(
+                name, 'on' if single_flight else 'off', server.requests, coalesced,
+                elapsed * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Overhead of tracing in WebhookHandler.handle.
+
+A webhook body of --events text message events is handled by a handler
+which does nothing, without OpenTelemetry, with the API but no SDK (the
+global no-op provider) and with the SDK recording every span.
+
+    python benchmarks/tracing.py --events 10 --repeat 2000
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from argparse import ArgumentParser
+
+from linebot.v3 import WebhookHandler, tracing
+from linebot.v3.webhooks import MessageEvent
+
+SECRET = 'channel_secret'
+
+
+def body(events):
+    return json.dumps({'destination': 'Uxxx', 'events': [{
+        'type': 'message',
+        'mode': 'active',
+        'timestamp': 1462629479859,
+        'source': {'type': 'user', 'userId': 'U4af4980629'},
+        'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3Z{}'.format(i),
+        'deliveryContext': {'isRedelivery': False},
+        'replyToken': 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA',
+        'message': {'id': str(i), 'type': 'text', 'text': 'Hello', 'quoteToken': 'q'},
+    } for i in range(events)]})
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=10)
+    arg_parser.add_argument('--repeat', type=int, default=2000)
+    options = arg_parser.parse_args()
+
+    webhook_body = body(options.events)
+    signature = base64.b64encode(hmac.new(
+        SECRET.encode('utf-8'), webhook_body.encode('utf-8'), hashlib.sha256).digest()).decode('utf-8')
+    handler = WebhookHandler(SECRET)
+    handler.add(MessageEvent)(lambda event: None)
+
+    opentelemetry = tracing.trace
+    try:
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        exporter = InMemorySpanExporter()
+        sdk = TracerProvider()
+        sdk.add_span_processor(SimpleSpanProcessor(exporter))
+    except ImportError:
+        sdk = None
+
+    print('{:<18} {:>12}'.format('tracing', 'us/request'))
+    for name, trace, provider in (('no opentelemetry', None, None),
+                                  ('no-op provider', opentelemetry, None),
+                                  ('sdk', opentelemetry, sdk)):
+        if name != 'no opentelemetry' and (opentelemetry is None or (name == 'sdk' and sdk is None)):
+            continue
+        # as if opentelemetry were not installed
+        tracing.trace = trace
+        tracing.set_tracer_provider(provider)
+        handler.handle(webhook_body, signature)
+        started = time.perf_counter()
+        for _ in range(options.repeat):
+            handler.handle(webhook_body, signature)
+            if name == 'sdk':
+                exporter.clear()
+        elapsed = (time.perf_counter() - started) / options.repeat
+        print('{:<18} {:>12.1f}'.format(name, elapsed * 1e6))
+    tracing.trace = opentelemetry
+    tracing.set_tracer_provider(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Flattening webhook events into tables: per object vs. linebot.v3.columnar.
+
+"per object" parses the bodies into models and appends one row per event
+by attribute access, as analytics code usually does. The other cases
+decode the bodies with json and convert the whole batch with to_columns,
+to_numpy and to_arrow (skipped when numpy or pyarrow is not installed).
+
+    python benchmarks/webhook_columnar.py --bodies 1000
+"""
+
+import json
+import os
+import time
+from argparse import ArgumentParser
+
+from linebot.v3 import WebhookParser
+from linebot.v3.columnar import schema, to_columns, to_numpy, to_arrow
+
+WEBHOOK_JSON = os.path.join(os.path.dirname(__file__), '..', 'tests', 'v3', 'text', 'webhook.json')
+
+
+def per_object(parser, bodies):
+    tables = {}
+    for body in bodies:
+        payload = parser.parse(body, 'signature', as_payload=True)
+        for event in payload.events:
+            source = event.source
+            table = tables.setdefault(event.type, {name: [] for name, path, kind in schema(event.type)})
+            row = {
+                'destination': payload.destination,
+                'type': event.type,
+                'timestamp': event.timestamp,
+                'mode': event.mode,
+                'webhook_event_id': event.webhook_event_id,
+                'is_redelivery': event.delivery_context.is_redelivery,
+                'source_type': source.type if source else None,
+                'user_id': getattr(source, 'user_id', None),
+                'group_id': getattr(source, 'group_id', None),
+                'room_id': getattr(source, 'room_id', None),
+            }
+            for name, path, kind in schema(event.type)[len(row):]:
+                value = event
+                for key in path:
+                    value = getattr(value, _snake_case(key), None)
+                row[name] = value
+            for name, value in row.items():
+                table[name].append(value)
+    return tables
+
+
+def _snake_case(key):
+    return ''.join('_' + c.lower() if c.isupper() else c for c in key)
+
+
+def timeit(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--bodies', type=int, default=1000)
+    options = arg_parser.parse_args()
+
+    with open(WEBHOOK_JSON) as fp:
+        body = fp.read()
+    bodies = [body] * options.bodies
+    events = options.bodies * len(json.loads(body)['events'])
+
+    parser = WebhookParser('channel_secret')
+    parser.signature_validator.validate = lambda a, b: True
+
+    cases = [
+        ('per object (models)', lambda: per_object(parser, bodies)),
+        ('to_columns', lambda: to_columns([json.loads(b) for b in bodies])),
+    ]
+    try:
+        import numpy  # noqa: F401
+        cases.append(('to_numpy', lambda: to_numpy([json.loads(b) for b in bodies])))
+    except ImportError:
+        print('numpy is not installed, skipping to_numpy')
+    try:
+        import pyarrow  # noqa: F401
+        cases.append(('to_arrow', lambda: to_arrow([json.loads(b) for b in bodies])))
+    except ImportError:
+        print('pyarrow is not installed, skipping to_arrow')
+
+    print('{} events'.format(events))
+    print('{:<22} {:>10} {:>14}'.format('case', 'seconds', 'events/s'))
+    for name, fn in cases:
+        elapsed = timeit(fn)
+        print('{:<22} {:>10.3f} {:>14.0f}'.format(name, elapsed, events / elapsed))
+
+
+if __name__ == '__main__':
+    main()
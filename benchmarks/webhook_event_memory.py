@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Memory needed to hold webhook events in a buffer.
+
+N events, cycling through the event types of tests/v3/text/webhook.json,
+are decoded one by one and kept in a list as the decoded JSON dict, as an
+EventView, or as the Event model. Memory is measured with tracemalloc.
+
+    python benchmarks/webhook_event_memory.py --events 1000000
+"""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+from linebot.v3.models import EventView
+from linebot.v3.webhooks.models import Event
+
+WEBHOOK_JSON = os.path.join(os.path.dirname(__file__), '..', 'tests', 'v3', 'text', 'webhook.json')
+
+
+def load_events():
+    with open(WEBHOOK_JSON) as fp:
+        events = json.load(fp)['events']
+    return [json.dumps(event) for event in events if event['type'] != 'undefined']
+
+
+def build(events, count, convert):
+    buffer = []
+    for i in range(count):
+        event = json.loads(events[i % len(events)])
+        # every event gets its own id, as in a real stream
+        event['webhookEventId'] = '01H{:023d}'.format(i)
+        buffer.append(convert(event))
+    return buffer
+
+
+def measure(events, count, convert):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    buffer = build(events, count, convert)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del buffer
+    return size, elapsed
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=1000000)
+    arg_parser.add_argument('--skip-models', action='store_true',
+                            help='do not build the pydantic models, which is slow')
+    options = arg_parser.parse_args()
+
+    events = load_events()
+    cases = [
+        ('dict', lambda event: event),
+        ('EventView', EventView.from_dict),
+    ]
+    if not options.skip_models:
+        cases.append(('Event model', Event.from_dict))
+
+    print('{} events, {} event types'.format(options.events, len({json.loads(e)['type'] for e in events})))
+    print('{:<12} {:>10} {:>12} {:>10}'.format('held as', 'MB', 'bytes/event', 'seconds'))
+    for name, convert in cases:
+        size, elapsed = measure(events, options.events, convert)
+        print('{:<12} {:>10.1f} {:>12.0f} {:>10.1f}'.format(
+            name, size / 1024 / 1024, size / options.events, elapsed))
+
+
+if __name__ == '__main__':
+    main()
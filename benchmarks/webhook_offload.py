@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Signature validation and parsing on the event loop vs. on a thread pool.
+
+For each body size, N webhook requests are validated and parsed concurrently
+by AsyncWebhookParser, while a ticker task measures how long the event loop
+is blocked. "inline" runs on the loop thread, "offload" on a thread pool.
+
+    python benchmarks/webhook_offload.py --requests 200 --workers 4
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+
+from linebot.v3 import AsyncWebhookParser, SignatureValidator
+
+CHANNEL_SECRET = 'channel_secret'
+SIZES = [1024, 10 * 1024, 100 * 1024, 1024 * 1024]
+
+
+def make_body(size):
+    event = {
+        'type': 'message',
+        'mode': 'active',
+        'timestamp': 1462629479859,
+        'source': {'type': 'user', 'userId': 'U206d25c2ea6bd87c17655609a1c37cb8'},
+        'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3ZR',
+        'deliveryContext': {'isRedelivery': False},
+        'replyToken': 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA',
+        'message': {'id': '325708', 'type': 'text', 'text': 'x' * 200, 'quoteToken': 'q'},
+    }
+    event_size = len(json.dumps(event))
+    events = [event] * max(1, size // (event_size + 2))
+    body = json.dumps({'destination': 'U123', 'events': events})
+    signature = base64.b64encode(hmac.new(
+        CHANNEL_SECRET.encode('utf-8'), body.encode('utf-8'), hashlib.sha256).digest())
+    return body, signature.decode('utf-8')
+
+
+async def ticker(stop, interval=0.001):
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run(parser, body, signature, requests):
+    stop = asyncio.Event()
+    tick = asyncio.ensure_future(ticker(stop))
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    await asyncio.gather(*[parser.parse(body, signature) for _ in range(requests)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    return elapsed, await tick
+
+
+def validate_only(body, signature, requests):
+    validator = SignatureValidator(CHANNEL_SECRET)
+    started = time.perf_counter()
+    for _ in range(requests):
+        validator.validate(body, signature)
+    return time.perf_counter() - started
+
+
+def main():
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument('--requests', type=int, default=100)
+    arg_parser.add_argument('--workers', type=int, default=4)
+    options = arg_parser.parse_args()
+
+    pool = ThreadPoolExecutor(max_workers=options.workers)
+    inline = AsyncWebhookParser(CHANNEL_SECRET)
+    offload = AsyncWebhookParser(CHANNEL_SECRET, offload_threshold=0, executor=pool)
+
+    print('{:>8} {:>14} {:>12} {:>12} {:>16}'.format(
+        'size', 'mode', 'req/s', 'MB/s', 'max loop stall'))
+    for size in SIZES:
+        body, signature = make_body(size)
+        # keep the amount of JSON per row roughly constant above 10KB
+        requests = max(2, options.requests * 10 * 1024 // max(size, 10 * 1024))
+        megabytes = len(body) * requests / 1024 / 1024
+
+        elapsed = validate_only(body, signature, requests)
+        print('{:>8} {:>14} {:>12.0f} {:>12.1f} {:>16}'.format(
+            len(body), 'validate only', requests / elapsed, megabytes / elapsed, '-'))
+        for mode, parser in (('inline', inline), ('offload', offload)):
+            elapsed, stall = asyncio.run(run(parser, body, signature, requests))
+            print('{:>8} {:>14} {:>12.0f} {:>12.1f} {:>13.1f} ms'.format(
+                len(body), mode, requests / elapsed, megabytes / elapsed, stall * 1000))
+    pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -443,16 +443,15 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
         if (cp.isArray) {
             String constraints = "";
             if (cp.maxItems != null) {
-                constraints += String.format(Locale.ROOT, ", max_items=%d", cp.maxItems);
+                constraints += String.format(Locale.ROOT, ", max_length=%d", cp.maxItems);
             }
             if (cp.minItems != null) {
-                constraints += String.format(Locale.ROOT, ", min_items=%d", cp.minItems);
+                constraints += String.format(Locale.ROOT, ", min_length=%d", cp.minItems);
             }
-            if (cp.getUniqueItems()) {
-                constraints += ", unique_items=True";
-            }
-            pydanticImports.add("conlist");
-            return String.format(Locale.ROOT, "conlist(%s%s)",
+            // pydantic 2 has no unique_items, so unique items are a set
+            String container = cp.getUniqueItems() ? "conset" : "conlist";
+            pydanticImports.add(container);
+            return String.format(Locale.ROOT, "%s(%s%s)", container,
                     getPydanticType(cp.items, typingImports, pydanticImports, datetimeImports, modelImports, exampleImports, classname),
                     constraints);
         } else if (cp.isMap) {
@@ -471,7 +470,7 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                     fieldCustomization.add("min_length=" + cp.getMinLength());
                 }
                 if (cp.getPattern() != null) {
-                    pydanticImports.add("validator");
+                    pydanticImports.add("field_validator");
                     // use validator instead as regex doesn't support flags, e.g. IGNORECASE
                     //fieldCustomization.add(String.format(Locale.ROOT, "regex=r'%s'", cp.getPattern()));
                 }
@@ -590,7 +589,7 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                     fieldCustomization.add("max_length=" + cp.getMaxLength());
                 }
                 if (cp.getPattern() != null) {
-                    pydanticImports.add("validator");
+                    pydanticImports.add("field_validator");
                     // use validator instead as regex doesn't support flags, e.g. IGNORECASE
                     //fieldCustomization.add(Locale.ROOT, String.format(Locale.ROOT, "regex=r'%s'", cp.getPattern()));
                 }
@@ -703,7 +702,7 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
         }
 
         if (cp.isEnum) {
-            pydanticImports.add("validator");
+            pydanticImports.add("field_validator");
         }
 
         /* comment out the following since Literal requires python 3.8
@@ -723,17 +722,16 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
         if (cp.isArray) {
             String constraints = "";
             if (cp.maxItems != null) {
-                constraints += String.format(Locale.ROOT, ", max_items=%d", cp.maxItems);
+                constraints += String.format(Locale.ROOT, ", max_length=%d", cp.maxItems);
             }
             if (cp.minItems != null) {
-                constraints += String.format(Locale.ROOT, ", min_items=%d", cp.minItems);
-            }
-            if (cp.getUniqueItems()) {
-                constraints += ", unique_items=True";
+                constraints += String.format(Locale.ROOT, ", min_length=%d", cp.minItems);
             }
-            pydanticImports.add("conlist");
+            // pydantic 2 has no unique_items, so unique items are a set
+            String container = cp.getUniqueItems() ? "conset" : "conlist";
+            pydanticImports.add(container);
             typingImports.add("List"); // for return type
-            return String.format(Locale.ROOT, "conlist(%s%s)",
+            return String.format(Locale.ROOT, "%s(%s%s)", container,
                     getPydanticType(cp.items, typingImports, pydanticImports, datetimeImports, modelImports, exampleImports, classname),
                     constraints);
         } else if (cp.isMap) {
@@ -751,7 +749,7 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                     fieldCustomization.add("min_length=" + cp.getMinLength());
                 }
                 if (cp.getPattern() != null) {
-                    pydanticImports.add("validator");
+                    pydanticImports.add("field_validator");
                     // use validator instead as regex doesn't support flags, e.g. IGNORECASE
                     //fieldCustomization.add(Locale.ROOT, String.format(Locale.ROOT, "regex=r'%s'", cp.getPattern()));
                 }
@@ -870,7 +868,7 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                     fieldCustomization.add("max_length=" + cp.getMaxLength());
                 }
                 if (cp.getPattern() != null) {
-                    pydanticImports.add("validator");
+                    pydanticImports.add("field_validator");
                     // use validator instead as regex doesn't support flags, e.g. IGNORECASE
                     //fieldCustomization.add(Locale.ROOT, String.format(Locale.ROOT, "regex=r'%s'", cp.getPattern()));
                 }
@@ -955,6 +953,13 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                 } else {
                     LOGGER.error("Failed to look up {} from the imports (map of set) of models.", cp.dataType);
                 }
+                CodegenModel referenced = codegenModelMap.get(cp.dataType);
+                if (referenced != null && referenced.hasChildren && referenced.getDiscriminator() != null) {
+                    // pydantic 2 serializes by the declared type, so subclass
+                    // instances would lose their own fields
+                    pydanticImports.add("SerializeAsAny");
+                    return String.format(Locale.ROOT, "SerializeAsAny[%s]", cp.dataType);
+                }
             }
             return cp.dataType;
         } else {
@@ -1055,7 +1060,7 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
         // need pydantic imports
         if (!pydanticImports.isEmpty()) {
             Map<String, String> item = new HashMap<>();
-            item.put("import", String.format(Locale.ROOT, "from pydantic.v1 import %s\n", StringUtils.join(pydanticImports, ", ")));
+            item.put("import", String.format(Locale.ROOT, "from pydantic import %s\n", StringUtils.join(pydanticImports, ", ")));
             newImports.add(item);
         }
 
@@ -1237,13 +1242,13 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                 pydanticImports.add("Field");
                 pydanticImports.add("StrictStr");
                 pydanticImports.add("ValidationError");
-                pydanticImports.add("validator");
+                pydanticImports.add("field_validator");
             } else if (!model.anyOf.isEmpty()) { // anyOF
                 codegenProperties = model.getComposedSchemas().getAnyOf();
                 pydanticImports.add("Field");
                 pydanticImports.add("StrictStr");
                 pydanticImports.add("ValidationError");
-                pydanticImports.add("validator");
+                pydanticImports.add("field_validator");
             } else { // typical model
                 codegenProperties = model.vars;
                 if (model.getDiscriminator() != null && model.getDiscriminator().getMappedModels() != null) {
@@ -1338,6 +1343,18 @@ public class PythonNextgenCustomClientGenerator extends AbstractPythonCodegen im
                 pydanticImports.add("BaseModel");
             }
 
+            if (!model.isEnum) {
+                // model_config and the class variables of the model
+                pydanticImports.add("ConfigDict");
+                typingImports.add("ClassVar");
+                typingImports.add("List");
+                if (model.getDiscriminator() != null
+                        && (model.hasChildren || !model.oneOf.isEmpty() || !model.anyOf.isEmpty())) {
+                    // discriminator mappings
+                    typingImports.add("Dict");
+                }
+            }
+
             // set enum type in extensions and update `name` in enumVars
             if (model.isEnum) {
                 for (Map<String, Object> enumVars : (List<Map<String, Object>>) model.getAllowableValues().get("enumVars")) {
@@ -17,6 +17,14 @@
 from .webhook import (  # noqa
     SignatureValidator,
     WebhookParser,
+    AsyncWebhookParser,
     WebhookHandler,
+    AsyncWebhookHandler,
     WebhookPayload,
 )
+from .executor import (  # noqa
+    BackgroundExecutor,
+    AsyncBackgroundExecutor,
+    ShardedExecutor,
+    AsyncShardedExecutor,
+)
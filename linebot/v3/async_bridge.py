@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.async_bridge module.
+
+Calls the async API clients from synchronous code, e.g. Flask or Django
+views, through an event loop running in a background thread. Hundreds of
+requests can then be in flight without hundreds of threads.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import threading
+import time
+
+from linebot.v3.messaging import AsyncApiClient
+from linebot.v3.utils import LOGGER
+
+# Seconds the bridges which are still open wait to close at interpreter exit.
+EXIT_TIMEOUT = 5
+
+
+class AsyncBridge(object):
+    """Event loop thread with an AsyncApiClient shared by synchronous callers.
+
+    The loop starts on first use. :py:meth:`api` returns a synchronous
+    facade of an async API class, and :py:meth:`submit`, :py:meth:`map` and
+    :py:meth:`gather` schedule many calls at once.
+    """
+
+    def __init__(self, configuration, concurrency=None):
+        """__init__ method.
+
+        :param configuration: Configuration of the AsyncApiClient
+        :param int concurrency: Maximum number of calls in flight, or None
+            for the limit of the connection pool only
+        """
+        self.api_client = AsyncApiClient(configuration)
+        self.concurrency = concurrency
+        self._semaphore = None
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+    def _start(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name='linebot-async-bridge', daemon=True)
+                self._thread.start()
+                self._loop = loop
+                atexit.register(self._close_at_exit)
+            return self._loop
+
+    async def _call(self, func, args, kwargs):
+        if self.concurrency is None:
+            return await func(*args, **kwargs)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            return await func(*args, **kwargs)
+
+    def submit(self, func, *args, **kwargs):
+        """Schedule a call on the event loop and return its future.
+
+        :param func: Method of an async API, or another coroutine function
+        :param args: Positional arguments of func
+        :param kwargs: Keyword arguments of func
+        :rtype: :py:class:`concurrent.futures.Future`
+        """
+        return asyncio.run_coroutine_threadsafe(self._call(func, args, kwargs), self._start())
+
+    def gather(self, *futures, timeout=None, return_exceptions=False):
+        """Wait for futures and return their results in order.
+
+        :param futures: Futures returned by :py:meth:`submit`
+        :param float timeout: Seconds to wait for all of them, or None
+        :param bool return_exceptions: Return the exceptions of failed calls
+            instead of raising the first one
+        :rtype: list
+        """
+        done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        if not_done:
+            raise concurrent.futures.TimeoutError(
+                '{} of {} calls did not complete'.format(len(not_done), len(futures)))
+        if return_exceptions:
+            return [future.exception() or future.result() for future in futures]
+        return [future.result() for future in futures]
+
+    def map(self, func, *iterables, timeout=None, return_exceptions=False):
+        """Call func for each item concurrently and return the results in order.
+
+        :param func: Method of an async API, or another coroutine function
+        :param iterables: Arguments of each call, as with the builtin map
+        :param float timeout: See :py:meth:`gather`
+        :param bool return_exceptions: See :py:meth:`gather`
+        :rtype: list
+        """
+        futures = [self.submit(func, *args) for args in zip(*iterables)]
+        return self.gather(*futures, timeout=timeout, return_exceptions=return_exceptions)
+
+    def api(self, api_class):
+        """Return a synchronous facade of an async API class.
+
+        >>> api = bridge.api(AsyncMessagingApi)
+        >>> api.push_message(push_message_request)
+        >>> future = api.push_message(push_message_request, async_req=True)
+
+        :param api_class: Async API class of linebot.v3.messaging, e.g.
+            AsyncMessagingApi or AsyncMessagingApiBlob
+        :rtype: :py:class:`BridgedApi`
+        """
+        return BridgedApi(self, api_class(self.api_client))
+
+    def close(self, timeout=None):
+        """Close the AsyncApiClient and stop the event loop.
+
+        :param float timeout: Seconds to wait for the client to close and the
+            loop to stop, or None to wait until they do
+        :raises RuntimeError: If called from the event loop thread, which
+            would wait for itself
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError('AsyncBridge.close() cannot be called from its event loop')
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        atexit.unregister(self._close_at_exit)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            asyncio.run_coroutine_threadsafe(self.api_client.close(), loop).result(timeout)
+        except concurrent.futures.TimeoutError:
+            LOGGER.warning('AsyncApiClient of the bridge did not close in %s seconds', timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(None if deadline is None else max(0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            LOGGER.warning('Event loop of the bridge did not stop in %s seconds', timeout)
+        else:
+            loop.close()
+        self._semaphore = None
+
+    def _close_at_exit(self):
+        self.close(EXIT_TIMEOUT)
+
+
+class BridgedApi(object):
+    """Synchronous facade of an async API, returned by :py:meth:`AsyncBridge.api`.
+
+    Its methods have the same arguments as those of MessagingApi and the
+    other synchronous APIs: they block until the response is received, or
+    return a :py:class:`concurrent.futures.Future` with ``async_req=True``.
+    """
+
+    def __init__(self, bridge, api):
+        """__init__ method.
+
+        :param bridge: Bridge which runs the calls
+        :type bridge: :py:class:`AsyncBridge`
+        :param api: Async API, e.g. AsyncMessagingApi
+        """
+        self.bridge = bridge
+        self.api = api
+
+    def __getattr__(self, name):
+        """Return a synchronous version of a method of the async API."""
+        func = getattr(self.api, name)
+        if name.startswith('_') or not callable(func):
+            return func
+
+        @functools.wraps(func)
+        def call(*args, async_req=False, **kwargs):
+            future = self.bridge.submit(func, *args, **kwargs)
+            if async_req:
+                return future
+            return future.result()
+
+        return call
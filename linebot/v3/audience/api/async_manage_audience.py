@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictBool, StrictInt, StrictStr, conint
+from pydantic import Field, StrictBool, StrictInt, StrictStr, conint
 
 from typing import Optional
 
@@ -78,7 +79,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_audience_to_audience_group(add_audience_to_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param add_audience_to_audience_group_request: (required)
         :type add_audience_to_audience_group_request: AddAudienceToAudienceGroupRequest
@@ -90,7 +91,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -109,7 +110,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_audience_to_audience_group_with_http_info(add_audience_to_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param add_audience_to_audience_group_request: (required)
         :type add_audience_to_audience_group_request: AddAudienceToAudienceGroupRequest
@@ -134,7 +135,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -230,7 +231,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_group(create_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_audience_group_request: (required)
         :type create_audience_group_request: CreateAudienceGroupRequest
@@ -242,7 +243,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: CreateAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -261,7 +262,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_group_with_http_info(create_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_audience_group_request: (required)
         :type create_audience_group_request: CreateAudienceGroupRequest
@@ -286,7 +287,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(CreateAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -388,7 +389,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_click_based_audience_group(create_click_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_click_based_audience_group_request: (required)
         :type create_click_based_audience_group_request: CreateClickBasedAudienceGroupRequest
@@ -400,7 +401,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: CreateClickBasedAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -419,7 +420,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_click_based_audience_group_with_http_info(create_click_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_click_based_audience_group_request: (required)
         :type create_click_based_audience_group_request: CreateClickBasedAudienceGroupRequest
@@ -444,7 +445,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(CreateClickBasedAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -546,7 +547,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_imp_based_audience_group(create_imp_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_imp_based_audience_group_request: (required)
         :type create_imp_based_audience_group_request: CreateImpBasedAudienceGroupRequest
@@ -558,7 +559,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: CreateImpBasedAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -577,7 +578,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_imp_based_audience_group_with_http_info(create_imp_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_imp_based_audience_group_request: (required)
         :type create_imp_based_audience_group_request: CreateImpBasedAudienceGroupRequest
@@ -602,7 +603,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(CreateImpBasedAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -704,7 +705,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_audience_group(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -716,7 +717,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -735,7 +736,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_audience_group_with_http_info(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -760,7 +761,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -849,7 +850,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_data(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -861,7 +862,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetAudienceDataResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -880,7 +881,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_data_with_http_info(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -905,7 +906,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetAudienceDataResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1001,7 +1002,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_groups(page, description, status, size, includes_external_public_groups, create_route, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1023,7 +1024,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetAudienceGroupsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1042,7 +1043,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_groups_with_http_info(page, description, status, size, includes_external_public_groups, create_route, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1077,7 +1078,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetAudienceGroupsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1192,7 +1193,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_data(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1204,7 +1205,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetSharedAudienceDataResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1223,7 +1224,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_data_with_http_info(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1248,7 +1249,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetSharedAudienceDataResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1344,7 +1345,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_groups(page, description, status, size, create_route, includes_owned_audience_groups, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1366,7 +1367,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetSharedAudienceGroupsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1385,7 +1386,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_groups_with_http_info(page, description, status, size, create_route, includes_owned_audience_groups, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1420,7 +1421,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetSharedAudienceGroupsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1535,7 +1536,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_audience_group_description(audience_group_id, update_audience_group_description_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1549,7 +1550,7 @@ class AsyncManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -1568,7 +1569,7 @@ class AsyncManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_audience_group_description_with_http_info(audience_group_id, update_audience_group_description_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1595,7 +1596,7 @@ class AsyncManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictBool, StrictBytes, StrictInt, StrictStr, constr
+from pydantic import Field, StrictBool, StrictBytes, StrictInt, StrictStr, constr
 
 from typing import Optional, Union
 
@@ -65,7 +66,7 @@ class AsyncManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_user_ids_to_audience(file, audience_group_id, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -81,7 +82,7 @@ class AsyncManageAudienceBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -100,7 +101,7 @@ class AsyncManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_user_ids_to_audience_with_http_info(file, audience_group_id, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -129,7 +130,7 @@ class AsyncManageAudienceBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -244,7 +245,7 @@ class AsyncManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_for_uploading_user_ids(file, description, is_ifa_audience, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -262,7 +263,7 @@ class AsyncManageAudienceBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: CreateAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -281,7 +282,7 @@ class AsyncManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_for_uploading_user_ids_with_http_info(file, description, is_ifa_audience, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -312,7 +313,7 @@ class AsyncManageAudienceBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(CreateAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictBool, StrictInt, StrictStr, conint
+from pydantic import Field, StrictBool, StrictInt, StrictStr, conint
 
 from typing import Optional
 
@@ -68,7 +69,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_audience_to_audience_group(add_audience_to_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param add_audience_to_audience_group_request: (required)
         :type add_audience_to_audience_group_request: AddAudienceToAudienceGroupRequest
@@ -80,7 +81,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -97,7 +98,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_audience_to_audience_group_with_http_info(add_audience_to_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param add_audience_to_audience_group_request: (required)
         :type add_audience_to_audience_group_request: AddAudienceToAudienceGroupRequest
@@ -122,7 +123,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -210,7 +211,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_group(create_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_audience_group_request: (required)
         :type create_audience_group_request: CreateAudienceGroupRequest
@@ -222,7 +223,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: CreateAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -239,7 +240,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_group_with_http_info(create_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_audience_group_request: (required)
         :type create_audience_group_request: CreateAudienceGroupRequest
@@ -264,7 +265,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(CreateAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -358,7 +359,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_click_based_audience_group(create_click_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_click_based_audience_group_request: (required)
         :type create_click_based_audience_group_request: CreateClickBasedAudienceGroupRequest
@@ -370,7 +371,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: CreateClickBasedAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -387,7 +388,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_click_based_audience_group_with_http_info(create_click_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_click_based_audience_group_request: (required)
         :type create_click_based_audience_group_request: CreateClickBasedAudienceGroupRequest
@@ -412,7 +413,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(CreateClickBasedAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -506,7 +507,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_imp_based_audience_group(create_imp_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_imp_based_audience_group_request: (required)
         :type create_imp_based_audience_group_request: CreateImpBasedAudienceGroupRequest
@@ -518,7 +519,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: CreateImpBasedAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -535,7 +536,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_imp_based_audience_group_with_http_info(create_imp_based_audience_group_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_imp_based_audience_group_request: (required)
         :type create_imp_based_audience_group_request: CreateImpBasedAudienceGroupRequest
@@ -560,7 +561,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(CreateImpBasedAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -654,7 +655,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_audience_group(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -666,7 +667,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -683,7 +684,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_audience_group_with_http_info(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -708,7 +709,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -789,7 +790,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_data(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -801,7 +802,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetAudienceDataResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -818,7 +819,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_data_with_http_info(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -843,7 +844,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetAudienceDataResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -931,7 +932,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_groups(page, description, status, size, includes_external_public_groups, create_route, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -953,7 +954,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetAudienceGroupsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -970,7 +971,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_audience_groups_with_http_info(page, description, status, size, includes_external_public_groups, create_route, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1005,7 +1006,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetAudienceGroupsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1112,7 +1113,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_data(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1124,7 +1125,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetSharedAudienceDataResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1141,7 +1142,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_data_with_http_info(audience_group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1166,7 +1167,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetSharedAudienceDataResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1254,7 +1255,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_groups(page, description, status, size, create_route, includes_owned_audience_groups, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1276,7 +1277,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetSharedAudienceGroupsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1293,7 +1294,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_shared_audience_groups_with_http_info(page, description, status, size, create_route, includes_owned_audience_groups, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param page: The page to return when getting (paginated) results. Must be 1 or higher. (required)
         :type page: int
@@ -1328,7 +1329,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetSharedAudienceGroupsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1435,7 +1436,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_audience_group_description(audience_group_id, update_audience_group_description_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1449,7 +1450,7 @@ class ManageAudience(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -1466,7 +1467,7 @@ class ManageAudience(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_audience_group_description_with_http_info(audience_group_id, update_audience_group_description_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param audience_group_id: The audience ID. (required)
         :type audience_group_id: int
@@ -1493,7 +1494,7 @@ class ManageAudience(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictBool, StrictBytes, StrictInt, StrictStr, constr
+from pydantic import Field, StrictBool, StrictBytes, StrictInt, StrictStr, constr
 
 from typing import Optional, Union
 
@@ -55,7 +56,7 @@ class ManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_user_ids_to_audience(file, audience_group_id, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -71,7 +72,7 @@ class ManageAudienceBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -88,7 +89,7 @@ class ManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_user_ids_to_audience_with_http_info(file, audience_group_id, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -117,7 +118,7 @@ class ManageAudienceBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -224,7 +225,7 @@ class ManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_for_uploading_user_ids(file, description, is_ifa_audience, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -242,7 +243,7 @@ class ManageAudienceBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: CreateAudienceGroupResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -259,7 +260,7 @@ class ManageAudienceBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_audience_for_uploading_user_ids_with_http_info(file, description, is_ifa_audience, upload_description, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param file: A text file with one user ID or IFA entered per line. Specify text/plain as Content-Type. Max file number: 1 Max number: 1,500,000  (required)
         :type file: bytearray
@@ -290,7 +291,7 @@ class ManageAudienceBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(CreateAudienceGroupResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -12,12 +12,13 @@
 """
 
 
-import atexit
+import asyncio
 import datetime
+import functools
+import inspect
 from dateutil.parser import parse
 import json
 import mimetypes
-from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
@@ -45,8 +46,8 @@ class AsyncApiClient(object):
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
-    :param pool_threads: The number of threads to use for async requests
-        to the API. More threads means more concurrent API requests.
+    :param pool_threads: Unused; requests run on the event loop. Kept for
+        compatibility.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -60,7 +61,6 @@ class AsyncApiClient(object):
         'datetime': datetime.datetime,
         'object': object,
     }
-    _pool = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None, pool_threads=1):
@@ -74,7 +74,6 @@ class AsyncApiClient(object):
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
-        self.default_headers['Authorization'] = 'Bearer ' + configuration.access_token
         self.cookie = cookie
         # Set default User-Agent.
         self.user_agent = f"line-bot-sdk-python/{__version__}"
@@ -94,22 +93,6 @@ class AsyncApiClient(object):
 
     async def close(self):
         await self.rest_client.close()
-        if self._pool:
-            self._pool.close()
-            self._pool.join()
-            self._pool = None
-            if hasattr(atexit, 'unregister'):
-                atexit.unregister(self.close)
-
-    @property
-    def pool(self):
-        """Create thread pool on first request
-         avoids instantiating unused threadpool for blocking clients.
-        """
-        if self._pool is None:
-            atexit.register(self.close)
-            self._pool = ThreadPool(self.pool_threads)
-        return self._pool
 
     @property
     def user_agent(self):
@@ -159,76 +142,114 @@ class AsyncApiClient(object):
             _request_auth=None):
 
         config = self.configuration
+        record = None
+        if config.instrumentation is not None:
+            record = config.instrumentation.start(method, resource_path)
 
-        # header parameters
-        header_params = header_params or {}
-        header_params.update(self.default_headers)
-        if self.cookie:
-            header_params['Cookie'] = self.cookie
-        if header_params:
-            header_params = self.sanitize_for_serialization(header_params)
-            header_params = dict(self.parameters_to_tuples(header_params,
-                                                           collection_formats))
-
-        # path parameters
-        if path_params:
-            path_params = self.sanitize_for_serialization(path_params)
-            path_params = self.parameters_to_tuples(path_params,
-                                                    collection_formats)
-            for k, v in path_params:
-                # specified safe chars, encode everything
-                resource_path = resource_path.replace(
-                    '{%s}' % k,
-                    quote(str(v), safe=config.safe_chars_for_path_param)
-                )
-
-        # post parameters
-        if post_params or files:
-            post_params = post_params if post_params else []
-            post_params = self.sanitize_for_serialization(post_params)
-            post_params = self.parameters_to_tuples(post_params,
-                                                    collection_formats)
-            post_params.extend(self.files_parameters(files))
-
-        # auth setting
-        self.update_params_for_auth(
-            header_params, query_params, auth_settings,
-            resource_path, method, body,
-            request_auth=_request_auth)
-
-        # body
-        if body:
-            body = self.sanitize_for_serialization(body)
-
-        # request url
-        if self.configuration.host is not None:
-            url = self.configuration.host + resource_path
-        else:
-            # use server/host defined in path or operation instead
-            url = _host + resource_path
-
-        # query parameters
-        if query_params:
-            query_params = self.sanitize_for_serialization(query_params)
-            url_query = self.parameters_to_url_query(query_params,
-                                                     collection_formats)
-            url += "?" + url_query
-
+        try:
+            # header parameters
+            header_params = header_params or {}
+            header_params.update(self.default_headers)
+            if self.cookie:
+                header_params['Cookie'] = self.cookie
+            if header_params:
+                header_params = self.sanitize_for_serialization(header_params)
+                header_params = dict(self.parameters_to_tuples(header_params,
+                                                               collection_formats))
+
+            # path parameters
+            if path_params:
+                path_params = self.sanitize_for_serialization(path_params)
+                path_params = self.parameters_to_tuples(path_params,
+                                                        collection_formats)
+                for k, v in path_params:
+                    # specified safe chars, encode everything
+                    resource_path = resource_path.replace(
+                        '{%s}' % k,
+                        quote(str(v), safe=config.safe_chars_for_path_param)
+                    )
+
+            # post parameters
+            if post_params or files:
+                post_params = post_params if post_params else []
+                post_params = self.sanitize_for_serialization(post_params)
+                post_params = self.parameters_to_tuples(post_params,
+                                                        collection_formats)
+                post_params.extend(self.files_parameters(files))
+
+            # auth setting
+            access_token = None
+            if auth_settings and not _request_auth:
+                access_token = await self._access_token()
+            self.update_params_for_auth(
+                header_params, query_params, auth_settings,
+                resource_path, method, body,
+                request_auth=_request_auth, access_token=access_token)
+
+            # body
+            if body:
+                body = self.sanitize_for_serialization(body)
+
+            # request url
+            if self.configuration.host is not None:
+                url = self.configuration.host + resource_path
+            else:
+                # use server/host defined in path or operation instead
+                url = _host + resource_path
+
+            # query parameters
+            if query_params:
+                query_params = self.sanitize_for_serialization(query_params)
+                url_query = self.parameters_to_url_query(query_params,
+                                                         collection_formats)
+                url += "?" + url_query
+
+            if record is not None:
+                record.serialized(body)
+
+            call = functools.partial(
+                self.__perform_request, method, resource_path, url,
+                query_params, header_params, post_params, body,
+                response_types_map, _preload_content, _request_timeout, record)
+            if config.single_flight is None or not _preload_content:
+                return await call(_return_http_data_only)
+            # identical GET requests in flight share the response
+            response = await config.single_flight.async_call(
+                method, resource_path, url, header_params,
+                functools.partial(call, False), record)
+            return response.data if _return_http_data_only else response
+        except Exception as e:
+            if record is not None:
+                record.failed(e)
+            raise
+
+    async def __perform_request(
+            self, method, resource_path, url, query_params, header_params,
+            post_params, body, response_types_map, _preload_content,
+            _request_timeout, record, _return_http_data_only):
+        config = self.configuration
         try:
             # perform request and return response
-            response_data = await self.request(
-                method, url,
+            request = functools.partial(
+                self.request, method, url,
                 query_params=query_params,
                 headers=header_params,
                 post_params=post_params, body=body,
                 _preload_content=_preload_content,
                 _request_timeout=_request_timeout)
+            if config.response_cache is not None and _preload_content:
+                response_data = await config.response_cache.async_call(
+                    method, resource_path, url, header_params, request)
+            else:
+                response_data = await request()
         except ApiException as e:
             if e.body:
                 e.body = e.body.decode('utf-8')
             raise e
 
         self.last_response = response_data
+        if record is not None:
+            record.received(response_data)
 
         return_data = None # assuming derialization is not needed
         # data needs deserialization or returns HTTP data (deserialized) only
@@ -253,6 +274,9 @@ class AsyncApiClient(object):
           else:
               return_data = None
 
+        if record is not None:
+            record.deserialized()
+
         if _return_http_data_only:
             return return_data
         else:
@@ -405,8 +429,8 @@ class AsyncApiClient(object):
         :type _request_token: dict, optional
         :return:
             If async_req parameter is True,
-            the request will be called asynchronously.
-            The method will return the request thread.
+            the request is scheduled at once.
+            The method will return an asyncio.Task.
             If parameter async_req is False or missing,
             then the method will return the response directly.
         """
@@ -419,18 +443,53 @@ class AsyncApiClient(object):
                                    _preload_content, _request_timeout, _host,
                                    _request_auth)
 
-        return self.pool.apply_async(self.__call_api, (resource_path,
-                                                       method, path_params,
-                                                       query_params,
-                                                       header_params, body,
-                                                       post_params, files,
-                                                       response_types_map,
-                                                       auth_settings,
-                                                       _return_http_data_only,
-                                                       collection_formats,
-                                                       _preload_content,
-                                                       _request_timeout,
-                                                       _host, _request_auth))
+        return asyncio.ensure_future(self.__call_api(resource_path,
+                                                     method, path_params,
+                                                     query_params,
+                                                     header_params, body,
+                                                     post_params, files,
+                                                     response_types_map,
+                                                     auth_settings,
+                                                     _return_http_data_only,
+                                                     collection_formats,
+                                                     _preload_content,
+                                                     _request_timeout,
+                                                     _host, _request_auth))
+
+    async def gather(self, *calls, concurrency=None, return_exceptions=False):
+        """Awaits API calls concurrently and returns their results in order.
+
+        >>> profiles = await api_client.gather(
+        ...     *[api.get_profile(user_id) for user_id in user_ids], concurrency=10)
+
+        :param calls: Awaitables of API calls. Coroutines start once one of
+            the concurrency slots is free.
+        :param concurrency: Maximum number of calls in flight, or None.
+        :param return_exceptions: Return the exceptions of failed calls
+            instead of raising the first one, as asyncio.gather does.
+        """
+        if concurrency is not None:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def limited(call):
+                async with semaphore:
+                    return await call
+
+            calls = [limited(call) for call in calls]
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def map(self, func, *iterables, concurrency=None, return_exceptions=False):
+        """Calls an API method for each item and returns the results in order.
+
+        >>> profiles = await api_client.map(api.get_profile, user_ids, concurrency=10)
+
+        :param func: API method, or another function returning an awaitable.
+        :param iterables: Arguments of each call, as with the builtin map.
+        :param concurrency: Maximum number of calls in flight, or None.
+        :param return_exceptions: See :py:meth:`gather`.
+        """
+        return await self.gather(*map(func, *iterables), concurrency=concurrency,
+                                 return_exceptions=return_exceptions)
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
@@ -613,9 +672,18 @@ class AsyncApiClient(object):
 
         return content_types[0]
 
+    async def _access_token(self):
+        """Return the token of access_token_provider, or None when it is not set."""
+        if self.configuration.access_token_provider is None:
+            return None
+        access_token = self.configuration.access_token_provider()
+        if inspect.isawaitable(access_token):
+            access_token = await access_token
+        return access_token
+
     def update_params_for_auth(self, headers, queries, auth_settings,
                                resource_path, method, body,
-                               request_auth=None):
+                               request_auth=None, access_token=None):
         """Updates header and query params based on authentication setting.
 
         :param headers: Header parameters dict to be updated.
@@ -627,6 +695,12 @@ class AsyncApiClient(object):
         The object type is the return value of sanitize_for_serialization().
         :param request_auth: if set, the provided settings will
                              override the token in the configuration.
+        :param access_token: if set, the token to use in place of
+                             access_token of the configuration.
+
+        Otherwise the access token is given by access_token_provider of the
+        configuration, when set, for every request. AsyncApiClient awaits
+        the token of a coroutine function before calling this method.
         """
         if not auth_settings:
             return
@@ -637,8 +711,17 @@ class AsyncApiClient(object):
                                     request_auth)
             return
 
+        if access_token is None and \
+                self.configuration.access_token_provider is not None:
+            access_token = self.configuration.access_token_provider()
+            if inspect.iscoroutine(access_token):
+                access_token.close()
+                raise ApiValueError(
+                    "Pass the token of a coroutine function access_token_provider "
+                    "as access_token")
+        settings = self.configuration.auth_settings(access_token)
         for auth in auth_settings:
-            auth_setting = self.configuration.auth_settings().get(auth)
+            auth_setting = settings.get(auth)
             if auth_setting:
                 self._apply_auth_params(headers, queries,
                                         resource_path, method, body,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, conlist
 from linebot.v3.audience.models.audience import Audience
 
 class AddAudienceToAudienceGroupRequest(BaseModel):
@@ -29,18 +29,22 @@ class AddAudienceToAudienceGroupRequest(BaseModel):
     """
     audience_group_id: Optional[StrictInt] = Field(None, alias="audienceGroupId", description="The audience ID.")
     upload_description: Optional[StrictStr] = Field(None, alias="uploadDescription", description="The audience's name.")
-    audiences: Optional[conlist(Audience, max_items=10000)] = Field(None, description="An array of up to 10,000 user IDs or IFAs.")
+    audiences: Optional[conlist(Audience, max_length=10000)] = Field(None, description="An array of up to 10,000 user IDs or IFAs.")
 
-    __properties = ["audienceGroupId", "uploadDescription", "audiences"]
+    __properties: ClassVar[List[str]] = ["audienceGroupId", "uploadDescription", "audiences"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,11 +57,11 @@ class AddAudienceToAudienceGroupRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in audiences (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in audiences (list)
         _items = []
         if self.audiences:
             for _item in self.audiences:
@@ -73,9 +77,9 @@ class AddAudienceToAudienceGroupRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AddAudienceToAudienceGroupRequest.parse_obj(obj)
+            return AddAudienceToAudienceGroupRequest.model_validate(obj)
 
-        _obj = AddAudienceToAudienceGroupRequest.parse_obj({
+        _obj = AddAudienceToAudienceGroupRequest.model_validate({
             "audience_group_id": obj.get("audienceGroupId"),
             "upload_description": obj.get("uploadDescription"),
             "audiences": [Audience.from_dict(_item) for _item in obj.get("audiences")] if obj.get("audiences") is not None else None
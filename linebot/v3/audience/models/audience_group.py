@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from linebot.v3.audience.models.audience_group_create_route import AudienceGroupCreateRoute
 from linebot.v3.audience.models.audience_group_failed_type import AudienceGroupFailedType
 from linebot.v3.audience.models.audience_group_permission import AudienceGroupPermission
@@ -43,16 +43,20 @@ class AudienceGroup(BaseModel):
     permission: Optional[AudienceGroupPermission] = None
     create_route: Optional[AudienceGroupCreateRoute] = Field(None, alias="createRoute")
 
-    __properties = ["audienceGroupId", "type", "description", "status", "failedType", "audienceCount", "created", "requestId", "clickUrl", "isIfaAudience", "permission", "createRoute"]
+    __properties: ClassVar[List[str]] = ["audienceGroupId", "type", "description", "status", "failedType", "audienceCount", "created", "requestId", "clickUrl", "isIfaAudience", "permission", "createRoute"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -65,13 +69,13 @@ class AudienceGroup(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         # set to None if failed_type (nullable) is None
-        # and __fields_set__ contains the field
-        if self.failed_type is None and "failed_type" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.failed_type is None and "failed_type" in self.model_fields_set:
             _dict['failedType'] = None
 
         return _dict
@@ -83,9 +87,9 @@ class AudienceGroup(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AudienceGroup.parse_obj(obj)
+            return AudienceGroup.model_validate(obj)
 
-        _obj = AudienceGroup.parse_obj({
+        _obj = AudienceGroup.model_validate({
             "audience_group_id": obj.get("audienceGroupId"),
             "type": obj.get("type"),
             "description": obj.get("description"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from linebot.v3.audience.models.audience_group_job_failed_type import AudienceGroupJobFailedType
 from linebot.v3.audience.models.audience_group_job_status import AudienceGroupJobStatus
 from linebot.v3.audience.models.audience_group_job_type import AudienceGroupJobType
@@ -38,16 +38,20 @@ class AudienceGroupJob(BaseModel):
     audience_count: Optional[StrictInt] = Field(None, alias="audienceCount", description="The number of accounts (recipients) that were added or removed.")
     created: Optional[StrictInt] = Field(None, description="When the job was created (in UNIX time).")
 
-    __properties = ["audienceGroupJobId", "audienceGroupId", "description", "type", "jobStatus", "failedType", "audienceCount", "created"]
+    __properties: ClassVar[List[str]] = ["audienceGroupJobId", "audienceGroupId", "description", "type", "jobStatus", "failedType", "audienceCount", "created"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -60,10 +64,10 @@ class AudienceGroupJob(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -73,9 +77,9 @@ class AudienceGroupJob(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AudienceGroupJob.parse_obj(obj)
+            return AudienceGroupJob.model_validate(obj)
 
-        _obj = AudienceGroupJob.parse_obj({
+        _obj = AudienceGroupJob.model_validate({
             "audience_group_job_id": obj.get("audienceGroupJobId"),
             "audience_group_id": obj.get("audienceGroupId"),
             "description": obj.get("description"),
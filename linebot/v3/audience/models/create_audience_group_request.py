@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr, conlist, constr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr, conlist, constr
 from linebot.v3.audience.models.audience import Audience
 
 class CreateAudienceGroupRequest(BaseModel):
@@ -30,18 +30,22 @@ class CreateAudienceGroupRequest(BaseModel):
     description: Optional[constr(strict=True, max_length=120)] = Field(None, description="The audience's name. This is case-insensitive, meaning AUDIENCE and audience are considered identical. Max character limit: 120 ")
     is_ifa_audience: Optional[StrictBool] = Field(None, alias="isIfaAudience", description="To specify recipients by IFAs: set true. To specify recipients by user IDs: set false or omit isIfaAudience property. ")
     upload_description: Optional[StrictStr] = Field(None, alias="uploadDescription", description="The description to register for the job (in jobs[].description). ")
-    audiences: Optional[conlist(Audience, max_items=10000)] = Field(None, description="An array of user IDs or IFAs. Max number: 10,000 ")
+    audiences: Optional[conlist(Audience, max_length=10000)] = Field(None, description="An array of user IDs or IFAs. Max number: 10,000 ")
 
-    __properties = ["description", "isIfaAudience", "uploadDescription", "audiences"]
+    __properties: ClassVar[List[str]] = ["description", "isIfaAudience", "uploadDescription", "audiences"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,11 +58,11 @@ class CreateAudienceGroupRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in audiences (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in audiences (list)
         _items = []
         if self.audiences:
             for _item in self.audiences:
@@ -74,9 +78,9 @@ class CreateAudienceGroupRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CreateAudienceGroupRequest.parse_obj(obj)
+            return CreateAudienceGroupRequest.model_validate(obj)
 
-        _obj = CreateAudienceGroupRequest.parse_obj({
+        _obj = CreateAudienceGroupRequest.model_validate({
             "description": obj.get("description"),
             "is_ifa_audience": obj.get("isIfaAudience"),
             "upload_description": obj.get("uploadDescription"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, constr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, constr
 
 class CreateClickBasedAudienceGroupRequest(BaseModel):
     """
@@ -30,16 +30,20 @@ class CreateClickBasedAudienceGroupRequest(BaseModel):
     request_id: Optional[StrictStr] = Field(None, alias="requestId", description="The request ID of a broadcast or narrowcast message sent in the past 60 days. Each Messaging API request has a request ID. ")
     click_url: Optional[constr(strict=True, max_length=2000)] = Field(None, alias="clickUrl", description="The URL clicked by the user. If empty, users who clicked any URL in the message are added to the list of recipients. Max character limit: 2,000 ")
 
-    __properties = ["description", "requestId", "clickUrl"]
+    __properties: ClassVar[List[str]] = ["description", "requestId", "clickUrl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class CreateClickBasedAudienceGroupRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class CreateClickBasedAudienceGroupRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CreateClickBasedAudienceGroupRequest.parse_obj(obj)
+            return CreateClickBasedAudienceGroupRequest.model_validate(obj)
 
-        _obj = CreateClickBasedAudienceGroupRequest.parse_obj({
+        _obj = CreateClickBasedAudienceGroupRequest.model_validate({
             "description": obj.get("description"),
             "request_id": obj.get("requestId"),
             "click_url": obj.get("clickUrl")
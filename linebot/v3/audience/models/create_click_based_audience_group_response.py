@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr, field_validator
 from linebot.v3.audience.models.audience_group_type import AudienceGroupType
 
 class CreateClickBasedAudienceGroupResponse(BaseModel):
@@ -38,9 +38,9 @@ class CreateClickBasedAudienceGroupResponse(BaseModel):
     expire_timestamp: Optional[StrictInt] = Field(None, alias="expireTimestamp", description="Time of audience expiration. Only returned for specific audiences.")
     is_ifa_audience: Optional[StrictBool] = Field(False, alias="isIfaAudience", description="The value indicating the type of account to be sent, as specified when creating the audience for uploading user IDs. One of:  true: Accounts are specified with IFAs. false (default): Accounts are specified with user IDs. ")
 
-    __properties = ["audienceGroupId", "type", "description", "created", "requestId", "clickUrl", "createRoute", "permission", "expireTimestamp", "isIfaAudience"]
+    __properties: ClassVar[List[str]] = ["audienceGroupId", "type", "description", "created", "requestId", "clickUrl", "createRoute", "permission", "expireTimestamp", "isIfaAudience"]
 
-    @validator('create_route')
+    @field_validator('create_route')
     def create_route_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -50,7 +50,7 @@ class CreateClickBasedAudienceGroupResponse(BaseModel):
             raise ValueError("must be one of enum values ('MESSAGING_API')")
         return value
 
-    @validator('permission')
+    @field_validator('permission')
     def permission_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -60,14 +60,18 @@ class CreateClickBasedAudienceGroupResponse(BaseModel):
             raise ValueError("must be one of enum values ('READ', 'READ_WRITE')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -80,10 +84,10 @@ class CreateClickBasedAudienceGroupResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -93,9 +97,9 @@ class CreateClickBasedAudienceGroupResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CreateClickBasedAudienceGroupResponse.parse_obj(obj)
+            return CreateClickBasedAudienceGroupResponse.model_validate(obj)
 
-        _obj = CreateClickBasedAudienceGroupResponse.parse_obj({
+        _obj = CreateClickBasedAudienceGroupResponse.model_validate({
             "audience_group_id": obj.get("audienceGroupId"),
             "type": obj.get("type"),
             "description": obj.get("description"),
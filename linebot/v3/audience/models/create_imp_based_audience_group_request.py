@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, constr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, constr
 
 class CreateImpBasedAudienceGroupRequest(BaseModel):
     """
@@ -29,16 +29,20 @@ class CreateImpBasedAudienceGroupRequest(BaseModel):
     description: Optional[constr(strict=True, max_length=120, min_length=1)] = Field(None, description="The audience's name. This is case-insensitive, meaning `AUDIENCE` and `audience` are considered identical. Max character limit: 120 ")
     request_id: Optional[StrictStr] = Field(None, alias="requestId", description="The request ID of a broadcast or narrowcast message sent in the past 60 days. Each Messaging API request has a request ID. ")
 
-    __properties = ["description", "requestId"]
+    __properties: ClassVar[List[str]] = ["description", "requestId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class CreateImpBasedAudienceGroupRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class CreateImpBasedAudienceGroupRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CreateImpBasedAudienceGroupRequest.parse_obj(obj)
+            return CreateImpBasedAudienceGroupRequest.model_validate(obj)
 
-        _obj = CreateImpBasedAudienceGroupRequest.parse_obj({
+        _obj = CreateImpBasedAudienceGroupRequest.model_validate({
             "description": obj.get("description"),
             "request_id": obj.get("requestId")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from linebot.v3.audience.models.audience_group_type import AudienceGroupType
 
 class CreateImpBasedAudienceGroupResponse(BaseModel):
@@ -33,16 +33,20 @@ class CreateImpBasedAudienceGroupResponse(BaseModel):
     created: Optional[StrictInt] = Field(None, description="When the audience was created (in UNIX time).")
     request_id: Optional[StrictStr] = Field(None, alias="requestId", description="The request ID that was specified when the audience was created.")
 
-    __properties = ["audienceGroupId", "type", "description", "created", "requestId"]
+    __properties: ClassVar[List[str]] = ["audienceGroupId", "type", "description", "created", "requestId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,10 +59,10 @@ class CreateImpBasedAudienceGroupResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -68,9 +72,9 @@ class CreateImpBasedAudienceGroupResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CreateImpBasedAudienceGroupResponse.parse_obj(obj)
+            return CreateImpBasedAudienceGroupResponse.model_validate(obj)
 
-        _obj = CreateImpBasedAudienceGroupResponse.parse_obj({
+        _obj = CreateImpBasedAudienceGroupResponse.model_validate({
             "audience_group_id": obj.get("audienceGroupId"),
             "type": obj.get("type"),
             "description": obj.get("description"),
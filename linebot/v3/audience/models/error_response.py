@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 from linebot.v3.audience.models.error_detail import ErrorDetail
 
 class ErrorResponse(BaseModel):
@@ -30,16 +30,20 @@ class ErrorResponse(BaseModel):
     message: StrictStr = Field(..., description="Message containing information about the error.")
     details: Optional[conlist(ErrorDetail)] = Field(None, description="An array of error details. If the array is empty, this property will not be included in the response.")
 
-    __properties = ["message", "details"]
+    __properties: ClassVar[List[str]] = ["message", "details"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,11 +56,11 @@ class ErrorResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in details (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in details (list)
         _items = []
         if self.details:
             for _item in self.details:
@@ -72,9 +76,9 @@ class ErrorResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ErrorResponse.parse_obj(obj)
+            return ErrorResponse.model_validate(obj)
 
-        _obj = ErrorResponse.parse_obj({
+        _obj = ErrorResponse.model_validate({
             "message": obj.get("message"),
             "details": [ErrorDetail.from_dict(_item) for _item in obj.get("details")] if obj.get("details") is not None else None
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.audience.models.adaccount import Adaccount
 from linebot.v3.audience.models.audience_group import AudienceGroup
 from linebot.v3.audience.models.audience_group_job import AudienceGroupJob
@@ -30,19 +30,23 @@ class GetAudienceDataResponse(BaseModel):
     https://developers.line.biz/en/reference/messaging-api/#get-audience-group
     """
     audience_group: Optional[AudienceGroup] = Field(None, alias="audienceGroup")
-    jobs: Optional[conlist(AudienceGroupJob, max_items=50)] = Field(None, description="An array of jobs. This array is used to keep track of each attempt to add new user IDs or IFAs to an audience for uploading user IDs. Empty array is returned for any other type of audience. Max: 50 ")
+    jobs: Optional[conlist(AudienceGroupJob, max_length=50)] = Field(None, description="An array of jobs. This array is used to keep track of each attempt to add new user IDs or IFAs to an audience for uploading user IDs. Empty array is returned for any other type of audience. Max: 50 ")
     adaccount: Optional[Adaccount] = None
 
-    __properties = ["audienceGroup", "jobs", "adaccount"]
+    __properties: ClassVar[List[str]] = ["audienceGroup", "jobs", "adaccount"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,21 +59,21 @@ class GetAudienceDataResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of audience_group
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of audience_group
         if self.audience_group:
             _dict['audienceGroup'] = self.audience_group.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in jobs (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in jobs (list)
         _items = []
         if self.jobs:
             for _item in self.jobs:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['jobs'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of adaccount
+        # override the default output from pydantic by calling `to_dict()` of adaccount
         if self.adaccount:
             _dict['adaccount'] = self.adaccount.to_dict()
         return _dict
@@ -81,9 +85,9 @@ class GetAudienceDataResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetAudienceDataResponse.parse_obj(obj)
+            return GetAudienceDataResponse.model_validate(obj)
 
-        _obj = GetAudienceDataResponse.parse_obj({
+        _obj = GetAudienceDataResponse.model_validate({
             "audience_group": AudienceGroup.from_dict(obj.get("audienceGroup")) if obj.get("audienceGroup") is not None else None,
             "jobs": [AudienceGroupJob.from_dict(_item) for _item in obj.get("jobs")] if obj.get("jobs") is not None else None,
             "adaccount": Adaccount.from_dict(obj.get("adaccount")) if obj.get("adaccount") is not None else None
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictInt, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, conlist
 from linebot.v3.audience.models.audience_group import AudienceGroup
 
 class GetSharedAudienceGroupsResponse(BaseModel):
@@ -34,16 +34,20 @@ class GetSharedAudienceGroupsResponse(BaseModel):
     page: Optional[StrictInt] = Field(None, description="The current page number.")
     size: Optional[StrictInt] = Field(None, description="The maximum number of audiences on the current page.")
 
-    __properties = ["audienceGroups", "hasNextPage", "totalCount", "readWriteAudienceGroupTotalCount", "page", "size"]
+    __properties: ClassVar[List[str]] = ["audienceGroups", "hasNextPage", "totalCount", "readWriteAudienceGroupTotalCount", "page", "size"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -56,11 +60,11 @@ class GetSharedAudienceGroupsResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in audience_groups (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in audience_groups (list)
         _items = []
         if self.audience_groups:
             for _item in self.audience_groups:
@@ -76,9 +80,9 @@ class GetSharedAudienceGroupsResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetSharedAudienceGroupsResponse.parse_obj(obj)
+            return GetSharedAudienceGroupsResponse.model_validate(obj)
 
-        _obj = GetSharedAudienceGroupsResponse.parse_obj({
+        _obj = GetSharedAudienceGroupsResponse.model_validate({
             "audience_groups": [AudienceGroup.from_dict(_item) for _item in obj.get("audienceGroups")] if obj.get("audienceGroups") is not None else None,
             "has_next_page": obj.get("hasNextPage"),
             "total_count": obj.get("totalCount"),
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.cache module.
+
+Storage with expiry and LRU eviction, and sharing of identical concurrent
+calls, used by the caches of this package.
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """Thread-safe mapping which evicts the least recently used entries.
+
+    Each entry may expire a number of seconds after it was set.
+    """
+
+    def __init__(self, max_size):
+        """__init__ method.
+
+        :param int max_size: Maximum number of entries
+        """
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """__len__ method."""
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the value of key, or default if it is missing or expired.
+
+        :param key: Key
+        :param default: Returned when there is no fresh entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        """Store a value, evicting the least recently used entries beyond max_size.
+
+        :param key: Key
+        :param value: Value
+        :param float ttl: (optional) Seconds after which the entry expires.
+            None keeps it until it is evicted.
+        """
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def remove(self, match):
+        """Remove the entries whose key matches.
+
+        :param match: Function which returns True for the keys to remove
+        :rtype: int
+        :return: Number of removed entries
+        """
+        with self._lock:
+            keys = [key for key in self._entries if match(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _Call(object):
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+def _copy(error):
+    # each follower raises its own exception, so that raising does not
+    # rewrite the traceback of the one raised by the leader or other followers
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
+
+
+def _retrieve(future):
+    # followers may not be waiting for it
+    if not future.cancelled():
+        future.exception()
+
+
+class InFlight(object):
+    """Calls in flight by key, so that identical concurrent calls share one.
+
+    The first caller of a key, the leader, makes the call with :py:meth:`lead`
+    or :py:meth:`async_lead`; the others, the followers, get its result or
+    exception with :py:meth:`follow` or :py:meth:`async_follow`. Nothing is
+    kept once the call has completed.
+    """
+
+    def __init__(self):
+        """__init__ method."""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """__len__ method."""
+        return len(self._calls)
+
+    def join(self, key):
+        """Join the call of key from a thread.
+
+        :param key: Key of the call
+        :rtype: (object, bool)
+        :return: The call and whether the caller is its leader
+        """
+        return self._join(key, _Call)
+
+    def async_join(self, key):
+        """Join the call of key from the running event loop.
+
+        :param key: Key of the call; include the loop if the object is
+            used by several event loops
+        :rtype: (asyncio.Future, bool)
+        :return: The future of the call and whether the caller is its leader
+        """
+        future, leader = self._join(key, asyncio.get_running_loop().create_future)
+        if leader:
+            future.add_done_callback(_retrieve)
+        return future, leader
+
+    def _join(self, key, new):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = new()
+                return call, True
+            return call, False
+
+    def _leave(self, key):
+        with self._lock:
+            del self._calls[key]
+
+    def lead(self, key, call, fn, done=None):
+        """Make the call as its leader and share its outcome with the followers.
+
+        :param key: Key of the call
+        :param call: Call returned by :py:meth:`join`
+        :param fn: Function which makes the call
+        :param done: (optional) Function called with the value before the
+            followers are released, e.g. to cache it
+        """
+        try:
+            call.value = fn()
+            if done is not None:
+                done(call.value)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._leave(key)
+            call.done.set()
+        return call.value
+
+    @staticmethod
+    def follow(call):
+        """Wait for the leader and return its value, or raise a copy of its exception.
+
+        :param call: Call returned by :py:meth:`join`
+        """
+        call.done.wait()
+        if call.error is not None:
+            raise _copy(call.error) from call.error
+        return call.value
+
+    async def async_lead(self, key, future, fn, done=None):
+        """Make the call as its leader and share its outcome with the followers.
+
+        :param key: Key of the call
+        :param future: Future returned by :py:meth:`async_join`
+        :param fn: Coroutine function which makes the call
+        :param done: (optional) Function called with the value before the
+            followers are released, e.g. to cache it
+        """
+        try:
+            value = await fn()
+            if done is not None:
+                done(value)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            self._leave(key)
+        return value
+
+    @staticmethod
+    async def async_follow(future):
+        """Wait for the leader and return its value, or raise a copy of its exception.
+
+        A cancelled follower does not cancel the call.
+
+        :param future: Future returned by :py:meth:`async_join`
+        """
+        try:
+            return await asyncio.shield(future)
+        except Exception as e:
+            if future.done() and not future.cancelled() and future.exception() is e:
+                raise _copy(e) from e
+            raise
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.circuit_breaker module.
+
+Fails fast when the API degrades, and sheds load beyond a number of requests
+in flight. Set a :py:class:`CircuitBreaker` as ``circuit_breaker`` of the
+Configuration.
+"""
+
+import functools
+import math
+import re
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from linebot.v3.exceptions import CircuitOpenError, ConcurrencyLimitError
+from linebot.v3.utils import LOGGER
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Endpoint groups with their own circuit on each host, as (name, regular
+# expression of the resource path); other paths share the 'other' circuit.
+DEFAULT_GROUPS = (
+    ('message', r'^/v2/bot/message/'),
+    ('richmenu', r'^/v2/bot/(user/[^/]+/)?richmenu'),
+    ('profile', r'^/v2/bot/(profile|group|room|followers|info)'),
+)
+
+
+def _failed_status(status):
+    return status == 0 or status >= 500
+
+
+def _failed(error):
+    status = getattr(error, 'status', None)
+    if status is not None:
+        return _failed_status(status)
+    # invalid arguments say nothing about the API
+    return not isinstance(error, ValueError)
+
+
+class _Circuit(object):
+    __slots__ = ('name', 'state', 'buckets', 'opened_at', 'probes',
+                 'requests', 'failures', 'rejected', 'opened')
+
+    def __init__(self, name):
+        self.name = name
+        self.state = CLOSED
+        # [second, requests, failures] of the last window seconds
+        self.buckets = deque()
+        self.opened_at = None
+        self.probes = 0
+        self.requests = 0
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+
+
+class CircuitBreaker(object):
+    """Circuit breaker per host and endpoint group, with a concurrency limit.
+
+    Each circuit counts the requests and failures, i.e. transport errors,
+    timeouts and 5xx responses, of the last window seconds. Once there were
+    at least minimum_requests of them and failure_rate of them failed, the
+    circuit opens: requests raise
+    :py:class:`linebot.v3.exceptions.CircuitOpenError` at once for
+    open_seconds. Then up to half_open_requests probe requests are let
+    through; the circuit closes when one succeeds and opens again when one
+    fails.
+
+    With max_concurrency, requests beyond that number in flight raise
+    :py:class:`linebot.v3.exceptions.ConcurrencyLimitError` instead of
+    waiting, so a slow API does not hold every worker.
+
+    The breaker is shared, not copied, when the Configuration is copied.
+    """
+
+    def __init__(self, failure_rate=0.5, minimum_requests=20, window=30, open_seconds=30,
+                 half_open_requests=1, groups=DEFAULT_GROUPS, max_concurrency=None):
+        """__init__ method.
+
+        :param float failure_rate: Share of failed requests which opens a circuit
+        :param int minimum_requests: Requests in the window below which a
+            circuit stays closed
+        :param float window: Seconds of requests counted by a circuit
+        :param float open_seconds: Seconds a circuit stays open before probing
+        :param int half_open_requests: Probe requests let through at once
+            when a circuit is half open
+        :param groups: (name, regular expression of the resource path) of the
+            endpoint groups, which override :py:data:`DEFAULT_GROUPS`
+        :type groups: list[(str, str)]
+        :param int max_concurrency: Maximum number of requests in flight
+            through this breaker, or None for no limit
+        """
+        self.failure_rate = failure_rate
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.open_seconds = open_seconds
+        self.half_open_requests = half_open_requests
+        self.groups = [(name, re.compile(pattern)) for name, pattern in groups]
+        self.max_concurrency = max_concurrency
+        self._circuits = {}
+        self._in_flight = 0
+        self._shed = 0
+        self._lock = threading.Lock()
+
+    def _name(self, url):
+        parts = urlsplit(url)
+        for group, pattern in self.groups:
+            if pattern.search(parts.path):
+                break
+        else:
+            group = 'other'
+        return '{}/{}'.format(parts.netloc, group)
+
+    def _acquire(self, url):
+        name = self._name(url)
+        now = time.monotonic()
+        with self._lock:
+            if self.max_concurrency is not None and self._in_flight >= self.max_concurrency:
+                self._shed += 1
+                raise ConcurrencyLimitError(
+                    '{} requests in flight, shedding a request to {}'.format(
+                        self._in_flight, name))
+            circuit = self._circuits.get(name)
+            if circuit is None:
+                circuit = self._circuits[name] = _Circuit(name)
+            if circuit.state == OPEN:
+                retry_after = circuit.opened_at + self.open_seconds - now
+                if retry_after > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(
+                        'Circuit of {} is open'.format(name), retry_after=retry_after)
+                circuit.state = HALF_OPEN
+            probe = circuit.state == HALF_OPEN
+            if probe:
+                if circuit.probes >= self.half_open_requests:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(
+                        'Circuit of {} is half open'.format(name), retry_after=0)
+                circuit.probes += 1
+            self._in_flight += 1
+        return circuit, probe
+
+    def _open(self, circuit, now):
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.opened += 1
+        circuit.buckets.clear()
+        LOGGER.warning('Circuit of %s opened for %s seconds', circuit.name, self.open_seconds)
+
+    def _release(self, circuit, probe, failed):
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            if probe:
+                circuit.probes -= 1
+            if failed is None:
+                # cancelled
+                return
+            circuit.requests += 1
+            if failed:
+                circuit.failures += 1
+            if probe:
+                if failed:
+                    self._open(circuit, now)
+                elif circuit.state == HALF_OPEN:
+                    circuit.state = CLOSED
+                    LOGGER.info('Circuit of %s closed', circuit.name)
+                return
+            if circuit.state != CLOSED:
+                # sent before the circuit opened
+                return
+
+            second = math.floor(now)
+            buckets = circuit.buckets
+            if buckets and buckets[-1][0] == second:
+                bucket = buckets[-1]
+            else:
+                bucket = [second, 0, 0]
+                buckets.append(bucket)
+            bucket[1] += 1
+            bucket[2] += int(failed)
+            while buckets[0][0] <= second - self.window:
+                buckets.popleft()
+            if failed:
+                requests = sum(bucket[1] for bucket in buckets)
+                failures = sum(bucket[2] for bucket in buckets)
+                if requests >= self.minimum_requests and \
+                        failures >= self.failure_rate * requests:
+                    self._open(circuit, now)
+
+    def wrap(self, request):
+        """Guard the request method of a REST client.
+
+        Called by the REST client of ApiClient.
+
+        :param request: request method of :py:class:`RESTClientObject`
+        """
+        @functools.wraps(request)
+        def guarded(method, url, *args, **kwargs):
+            circuit, probe = self._acquire(url)
+            failed = None
+            try:
+                response = request(method, url, *args, **kwargs)
+                failed = _failed_status(response.status)
+                return response
+            except Exception as e:
+                failed = _failed(e)
+                raise
+            finally:
+                self._release(circuit, probe, failed)
+
+        return guarded
+
+    def wrap_async(self, request):
+        """Guard the request method of an async REST client.
+
+        Called by the REST client of AsyncApiClient.
+
+        :param request: request coroutine function of the async
+            :py:class:`RESTClientObject`
+        """
+        @functools.wraps(request)
+        async def guarded(method, url, *args, **kwargs):
+            circuit, probe = self._acquire(url)
+            failed = None
+            try:
+                response = await request(method, url, *args, **kwargs)
+                failed = _failed_status(response.status)
+                return response
+            except Exception as e:
+                failed = _failed(e)
+                raise
+            finally:
+                self._release(circuit, probe, failed)
+
+        return guarded
+
+    def stats(self):
+        """Return the number of requests in flight and shed, and the state of each circuit.
+
+        Circuits are keyed by ``host/group``, e.g. ``api.line.me/message``,
+        with their ``state``, the ``requests`` and ``failures`` counted since
+        the breaker was created, the requests ``rejected`` while open and the
+        times it ``opened``.
+
+        :rtype: dict
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuits = {}
+            for name, circuit in self._circuits.items():
+                state = circuit.state
+                if state == OPEN and now - circuit.opened_at >= self.open_seconds:
+                    state = HALF_OPEN
+                circuits[name] = {
+                    'state': state,
+                    'requests': circuit.requests,
+                    'failures': circuit.failures,
+                    'rejected': circuit.rejected,
+                    'opened': circuit.opened,
+                }
+            return {'in_flight': self._in_flight, 'shed': self._shed, 'circuits': circuits}
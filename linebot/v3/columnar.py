@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.columnar module.
+
+Converts batches of webhook events to columns, one table per event type.
+:py:func:`to_numpy` needs numpy and :py:func:`to_arrow` needs pyarrow,
+which are not installed with this package.
+"""
+
+STRING = 'string'
+INT = 'int'
+FLOAT = 'float'
+BOOL = 'bool'
+
+# (column name, path in the event JSON, kind)
+COMMON_COLUMNS = (
+    ('destination', None, STRING),
+    ('type', ('type',), STRING),
+    ('timestamp', ('timestamp',), INT),
+    ('mode', ('mode',), STRING),
+    ('webhook_event_id', ('webhookEventId',), STRING),
+    ('is_redelivery', ('deliveryContext', 'isRedelivery'), BOOL),
+    ('source_type', ('source', 'type'), STRING),
+    ('user_id', ('source', 'userId'), STRING),
+    ('group_id', ('source', 'groupId'), STRING),
+    ('room_id', ('source', 'roomId'), STRING),
+)
+
+_REPLY_TOKEN = ('reply_token', ('replyToken',), STRING)
+
+EVENT_COLUMNS = {
+    'message': (
+        _REPLY_TOKEN,
+        ('message_id', ('message', 'id'), STRING),
+        ('message_type', ('message', 'type'), STRING),
+        ('message_text', ('message', 'text'), STRING),
+        ('message_quote_token', ('message', 'quoteToken'), STRING),
+        ('message_quoted_message_id', ('message', 'quotedMessageId'), STRING),
+        ('message_package_id', ('message', 'packageId'), STRING),
+        ('message_sticker_id', ('message', 'stickerId'), STRING),
+        ('message_file_name', ('message', 'fileName'), STRING),
+        ('message_file_size', ('message', 'fileSize'), INT),
+        ('message_duration', ('message', 'duration'), INT),
+        ('message_title', ('message', 'title'), STRING),
+        ('message_address', ('message', 'address'), STRING),
+        ('message_latitude', ('message', 'latitude'), FLOAT),
+        ('message_longitude', ('message', 'longitude'), FLOAT),
+        ('message_content_provider_type', ('message', 'contentProvider', 'type'), STRING),
+    ),
+    'postback': (
+        _REPLY_TOKEN,
+        ('postback_data', ('postback', 'data'), STRING),
+    ),
+    'follow': (
+        _REPLY_TOKEN,
+        ('follow_is_unblocked', ('follow', 'isUnblocked'), BOOL),
+    ),
+    'unfollow': (),
+    'join': (_REPLY_TOKEN,),
+    'leave': (),
+    'memberJoined': (_REPLY_TOKEN,),
+    'memberLeft': (),
+    'delivery': (
+        ('delivery_data', ('delivery', 'data'), STRING),
+    ),
+    'beacon': (
+        _REPLY_TOKEN,
+        ('beacon_hwid', ('beacon', 'hwid'), STRING),
+        ('beacon_type', ('beacon', 'type'), STRING),
+        ('beacon_dm', ('beacon', 'dm'), STRING),
+    ),
+    'accountLink': (
+        _REPLY_TOKEN,
+        ('link_result', ('link', 'result'), STRING),
+        ('link_nonce', ('link', 'nonce'), STRING),
+    ),
+    'things': (
+        _REPLY_TOKEN,
+        ('things_type', ('things', 'type'), STRING),
+        ('things_device_id', ('things', 'deviceId'), STRING),
+    ),
+    'unsend': (
+        ('unsend_message_id', ('unsend', 'messageId'), STRING),
+    ),
+    'videoPlayComplete': (
+        _REPLY_TOKEN,
+        ('video_play_complete_tracking_id', ('videoPlayComplete', 'trackingId'), STRING),
+    ),
+    'membership': (
+        _REPLY_TOKEN,
+        ('membership_type', ('membership', 'type'), STRING),
+        ('membership_id', ('membership', 'membershipId'), INT),
+    ),
+    'module': (
+        ('module_type', ('module', 'type'), STRING),
+        ('module_bot_id', ('module', 'botId'), STRING),
+    ),
+    'activated': (
+        ('chat_control_expire_at', ('chatControl', 'expireAt'), INT),
+    ),
+    'deactivated': (),
+    'botSuspended': (),
+    'botResumed': (),
+}
+
+_EMPTY = {}
+
+
+def schema(event_type):
+    """Return the columns of the table of an event type.
+
+    Event types which are not known to this module get the common columns.
+
+    :param str event_type: Event type, e.g. ``message``
+    :rtype: list[tuple[str, tuple[str] | None, str]]
+    :return: (column name, path in the event JSON, kind) of each column
+    """
+    return COMMON_COLUMNS + EVENT_COLUMNS.get(event_type, ())
+
+
+def _column(events, path):
+    if len(path) == 1:
+        key, = path
+        return [event.get(key) for event in events]
+    if len(path) == 2:
+        outer, key = path
+        return [(event.get(outer) or _EMPTY).get(key) for event in events]
+    values = events
+    for key in path:
+        values = [(value or _EMPTY).get(key) for value in values]
+    return values
+
+
+def _events(payload):
+    if isinstance(payload, dict):
+        return payload.get('destination'), payload.get('events') or []
+    events = payload.events or []
+    # models and views are converted back to their JSON dict
+    return payload.destination, [
+        event if isinstance(event, dict) else event.to_dict() for event in events]
+
+
+def to_columns(payloads):
+    """Convert webhook payloads to columns, one table per event type.
+
+    Each column is built over the whole batch at once from the event dicts,
+    without creating the models. Pass the decoded JSON of the webhook bodies
+    for the best performance; the events of a
+    :py:class:`linebot.v3.webhook.WebhookPayload` are converted back to dicts
+    first.
+
+    :param payloads: Decoded webhook bodies (dict) or WebhookPayload objects
+    :type payloads: list[dict | :py:class:`linebot.v3.webhook.WebhookPayload`]
+    :rtype: dict[str, dict[str, list]]
+    :return: Columns of each event type, by event type and column name
+    """
+    destinations = {}
+    grouped = {}
+    for payload in payloads:
+        destination, events = _events(payload)
+        for event in events:
+            event_type = event.get('type')
+            grouped.setdefault(event_type, []).append(event)
+            destinations.setdefault(event_type, []).append(destination)
+
+    tables = {}
+    for event_type, events in grouped.items():
+        table = {}
+        for name, path, kind in schema(event_type):
+            if path is None:
+                table[name] = destinations[event_type]
+            else:
+                table[name] = _column(events, path)
+        tables[event_type] = table
+    return tables
+
+
+def to_numpy(payloads):
+    """Convert webhook payloads to numpy record arrays, one per event type.
+
+    Strings are stored as objects, missing numbers as NaN (float columns)
+    or 0 (int columns), and missing booleans as False.
+
+    :param payloads: Decoded webhook bodies (dict) or WebhookPayload objects
+    :type payloads: list[dict | :py:class:`linebot.v3.webhook.WebhookPayload`]
+    :rtype: dict[str, numpy.recarray]
+    """
+    import numpy
+
+    dtypes = {STRING: object, INT: numpy.int64, FLOAT: numpy.float64, BOOL: numpy.bool_}
+    missing = {STRING: None, INT: 0, FLOAT: numpy.nan, BOOL: False}
+
+    arrays = {}
+    for event_type, table in to_columns(payloads).items():
+        columns = []
+        names = []
+        for name, path, kind in schema(event_type):
+            values = table[name]
+            if kind != STRING and None in values:
+                values = [missing[kind] if value is None else value for value in values]
+            columns.append(numpy.array(values, dtype=dtypes[kind]))
+            names.append(name)
+        arrays[event_type] = numpy.rec.fromarrays(columns, names=names)
+    return arrays
+
+
+def to_arrow(payloads):
+    """Convert webhook payloads to pyarrow tables, one per event type.
+
+    Missing values are stored as nulls.
+
+    :param payloads: Decoded webhook bodies (dict) or WebhookPayload objects
+    :type payloads: list[dict | :py:class:`linebot.v3.webhook.WebhookPayload`]
+    :rtype: dict[str, pyarrow.Table]
+    """
+    import pyarrow
+
+    types = {STRING: pyarrow.string(), INT: pyarrow.int64(),
+             FLOAT: pyarrow.float64(), BOOL: pyarrow.bool_()}
+
+    tables = {}
+    for event_type, table in to_columns(payloads).items():
+        fields = schema(event_type)
+        tables[event_type] = pyarrow.table(
+            [pyarrow.array(table[name], type=types[kind]) for name, path, kind in fields],
+            schema=pyarrow.schema([(name, types[kind]) for name, path, kind in fields]))
+    return tables
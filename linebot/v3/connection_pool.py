@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.connection_pool module.
+
+Metrics and sizing of the urllib3 connection pools of the generated API clients.
+Set a :py:class:`ConnectionPoolMonitor` as ``connection_pool`` of the Configuration.
+"""
+
+import queue
+import threading
+import time
+import weakref
+
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+
+from linebot.v3.utils import LOGGER
+
+_COUNTERS = ('created', 'discarded', 'waits', 'timeouts', 'grown')
+
+
+class _MonitoredPool(object):
+    # set on the subclasses created by each ConnectionPoolMonitor
+    monitor = None
+
+    def __init__(self, *args, **kwargs):
+        super(_MonitoredPool, self).__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._stats = dict.fromkeys(_COUNTERS, 0)
+        self._stats.update(peak_in_use=0, wait_seconds=0.0, max_wait_seconds=0.0)
+        self.monitor._register(self)
+
+    def _grow(self, size):
+        pool = self.pool
+        with pool.mutex:
+            added = size - pool.maxsize
+            if added <= 0:
+                return
+            pool.maxsize = size
+            if self.block:
+                # free slots of a blocking pool are None placeholders
+                pool.queue[:0] = [None] * added
+                pool.not_empty.notify(added)
+        with self._stats_lock:
+            self._stats['grown'] += 1
+        LOGGER.debug('Connection pool of %s grown to %d', self.host, size)
+
+    def _get_conn(self, timeout=None):
+        monitor = self.monitor
+        if timeout is None:
+            timeout = monitor.block_timeout
+        with self._stats_lock:
+            self._in_use += 1
+            in_use = self._in_use
+            if in_use > self._stats['peak_in_use']:
+                self._stats['peak_in_use'] = in_use
+        pool = self.pool
+        if (monitor.adaptive and pool is not None and in_use > pool.maxsize
+                and pool.maxsize < monitor.max_size):
+            self._grow(min(in_use, monitor.max_size))
+
+        waits = self.block and pool is not None and pool.empty()
+        started = time.perf_counter()
+        try:
+            conn = super(_MonitoredPool, self)._get_conn(timeout)
+        except Exception as e:
+            with self._stats_lock:
+                self._in_use -= 1
+                if isinstance(e, EmptyPoolError):
+                    self._stats['timeouts'] += 1
+            raise
+        finally:
+            if waits:
+                elapsed = time.perf_counter() - started
+                with self._stats_lock:
+                    self._stats['waits'] += 1
+                    self._stats['wait_seconds'] += elapsed
+                    if elapsed > self._stats['max_wait_seconds']:
+                        self._stats['max_wait_seconds'] = elapsed
+        return conn
+
+    def _new_conn(self):
+        with self._stats_lock:
+            self._stats['created'] += 1
+        return super(_MonitoredPool, self)._new_conn()
+
+    def _put_conn(self, conn):
+        with self._stats_lock:
+            self._in_use -= 1
+        pool = self.pool
+        if pool is None or self.block:
+            return super(_MonitoredPool, self)._put_conn(conn)
+        try:
+            pool.put(conn, block=False)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats['discarded'] += 1
+            if conn:
+                conn.close()
+
+    def pool_stats(self):
+        pool = self.pool
+        if pool is None:
+            maxsize = idle = 0
+        else:
+            with pool.mutex:
+                maxsize = pool.maxsize
+                idle = sum(1 for conn in pool.queue if conn is not None)
+        with self._stats_lock:
+            stats = dict(self._stats, in_use=self._in_use)
+        stats.update(maxsize=maxsize, idle=idle)
+        return stats
+
+
+class ConnectionPoolMonitor(object):
+    """Measures and sizes the urllib3 connection pools of ApiClient.
+
+    Each pool counts the connections in use and idle, those created and
+    those discarded because the pool was full, and the time spent waiting
+    for a connection.
+
+    By default, urllib3 opens a new connection when all of them are in use,
+    and closes it afterwards if the pool is full. With block=True, requests
+    wait for a free connection instead, for up to block_timeout seconds, then
+    raise :py:class:`urllib3.exceptions.EmptyPoolError`. With adaptive=True,
+    a pool grows to the number of concurrent requests, up to max_size; it
+    never shrinks.
+
+    The monitor is shared, not copied, when the Configuration is copied.
+    """
+
+    def __init__(self, block=False, block_timeout=None, adaptive=False, max_size=128):
+        """__init__ method.
+
+        :param bool block: Wait for a free connection rather than opening
+            one beyond the pool size
+        :param float block_timeout: Seconds to wait for a free connection,
+            or None to wait indefinitely
+        :param bool adaptive: Grow the pools to the observed concurrency
+        :param int max_size: Maximum size of a pool grown by adaptive mode
+        """
+        self.block = block
+        self.block_timeout = block_timeout
+        self.adaptive = adaptive
+        self.max_size = max_size
+        self._pools = weakref.WeakSet()
+        self._lock = threading.Lock()
+        attributes = {'monitor': self}
+        self.pool_classes_by_scheme = {
+            'http': type('MonitoredHTTPConnectionPool',
+                         (_MonitoredPool, HTTPConnectionPool), attributes),
+            'https': type('MonitoredHTTPSConnectionPool',
+                          (_MonitoredPool, HTTPSConnectionPool), attributes),
+        }
+
+    def _register(self, pool):
+        with self._lock:
+            self._pools.add(pool)
+
+    def install(self, pool_manager):
+        """Make a urllib3 pool manager create monitored pools.
+
+        Called by ApiClient when it creates its pool manager.
+
+        :param pool_manager: Pool manager
+        :type pool_manager: :py:class:`urllib3.PoolManager`
+        """
+        pool_manager.pool_classes_by_scheme = self.pool_classes_by_scheme
+        pool_manager.connection_pool_kw['block'] = self.block
+
+    def stats(self):
+        """Return the metrics of the pools by host.
+
+        The pools of the ApiClients which use this monitor are added up, by
+        ``scheme://host:port``: ``maxsize``, ``in_use``, ``idle``,
+        ``peak_in_use``, the number of connections ``created``, ``discarded``
+        when the pool was full, ``waits`` for a free connection, ``timeouts``
+        of those waits and pools ``grown``, and the ``wait_seconds`` in total
+        and ``max_wait_seconds``.
+
+        :rtype: dict[str, dict]
+        """
+        with self._lock:
+            pools = list(self._pools)
+        stats = {}
+        for pool in pools:
+            key = '{}://{}:{}'.format(pool.scheme, pool.host, pool.port)
+            pool_stats = pool.pool_stats()
+            total = stats.get(key)
+            if total is None:
+                stats[key] = pool_stats
+                continue
+            for name, value in pool_stats.items():
+                if name.startswith(('peak_', 'max_')):
+                    total[name] = max(total[name], value)
+                else:
+                    total[name] += value
+        return stats
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.connector module.
+
+Connection pool shared by the generated async API clients.
+Set a :py:class:`SharedConnector` as ``connector`` of the Configuration.
+"""
+
+import asyncio
+import ssl
+import threading
+import weakref
+
+import aiohttp
+
+
+class SharedConnector(object):
+    """aiohttp connector shared by AsyncApiClients.
+
+    Each AsyncApiClient otherwise has its own pool of connections, so an
+    AsyncMessagingApi created per request makes a new TLS handshake every
+    time. With a shared connector, the clients of every v3 package reuse the
+    same keep-alive connections.
+
+    aiohttp connectors are bound to an event loop, so one is created on first
+    use in each loop. Its ssl_context replaces the TLS settings of the
+    configurations which use it; their proxy settings still apply.
+
+    The connector is shared, not copied, when the Configuration is copied.
+    """
+
+    def __init__(self, limit=100, limit_per_host=0, keepalive_timeout=15, ssl_context=None):
+        """__init__ method.
+
+        :param int limit: Maximum number of connections, 0 for no limit
+        :param int limit_per_host: Maximum number of connections to a host,
+            0 for no limit
+        :param float keepalive_timeout: Seconds for which an idle connection is kept
+        :param ssl.SSLContext ssl_context: TLS settings, the system defaults if None
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ssl_context = ssl_context if ssl_context is not None else ssl.create_default_context()
+        self._connectors = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Return the connector of the running event loop, creating it if needed.
+
+        Called by AsyncApiClient when it creates its session.
+
+        :rtype: :py:class:`aiohttp.TCPConnector`
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            connector = self._connectors.get(loop)
+            if connector is None or connector.closed:
+                connector = self._connectors[loop] = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ssl=self.ssl_context)
+            return connector
+
+    async def close(self):
+        """Close the connections of the running event loop.
+
+        Call it once the clients are no longer used, e.g. on application
+        shutdown. A later request opens new connections.
+        """
+        with self._lock:
+            connector = self._connectors.pop(asyncio.get_running_loop(), None)
+        if connector is not None:
+            await connector.close()
+
+    async def __aenter__(self):
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method."""
+        await self.close()
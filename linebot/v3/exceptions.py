@@ -52,3 +52,60 @@ class InvalidSignatureError(BaseError):
         :param str message: Human readable message
         """
         super(InvalidSignatureError, self).__init__(message)
+
+
+class QueueFullError(BaseError):
+    """When a webhook event queue is full, this error will be raised."""
+
+    def __init__(self, message='-'):
+        """__init__ method.
+
+        :param str message: Human readable message
+        """
+        super(QueueFullError, self).__init__(message)
+
+
+class InvalidMessageError(BaseError):
+    """When a message object is invalid, this error will be raised."""
+
+    def __init__(self, message='-'):
+        """__init__ method.
+
+        :param str message: Human readable message
+        """
+        super(InvalidMessageError, self).__init__(message)
+
+
+class RichMenuSyncError(BaseError):
+    """When rich menus could not be brought to the desired state, this error will be raised."""
+
+    def __init__(self, message='-'):
+        """__init__ method.
+
+        :param str message: Human readable message
+        """
+        super(RichMenuSyncError, self).__init__(message)
+
+
+class CircuitOpenError(BaseError):
+    """When the circuit of a host and endpoint group is open, this error will be raised."""
+
+    def __init__(self, message='-', retry_after=None):
+        """__init__ method.
+
+        :param str message: Human readable message
+        :param float retry_after: Seconds until the circuit lets a request through
+        """
+        super(CircuitOpenError, self).__init__(message)
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimitError(BaseError):
+    """When too many requests are in flight, this error will be raised."""
+
+    def __init__(self, message='-'):
+        """__init__ method.
+
+        :param str message: Human readable message
+        """
+        super(ConcurrencyLimitError, self).__init__(message)
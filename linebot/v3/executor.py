@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.executor module."""
+
+
+import asyncio
+import inspect
+import queue
+import itertools
+import threading
+import time
+import zlib
+
+from .exceptions import QueueFullError
+from .utils import LOGGER
+from .webhooks import GroupSource, RoomSource, UserSource
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_REJECT = 'reject'
+OVERFLOW_DROP_OLDEST = 'drop_oldest'
+
+_OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_REJECT, OVERFLOW_DROP_OLDEST)
+
+_STOP = object()
+
+
+class ExecutorMetrics(object):
+    """Counters and queue lag of an event executor."""
+
+    def __init__(self):
+        """__init__ method."""
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    def incr(self, name, value=1):
+        """Increment a counter.
+
+        :param str name: Counter name
+        :param int value: (optional) Increment
+        """
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def observe_lag(self, lag):
+        """Record the time an event spent in the queue.
+
+        :param float lag: Seconds between enqueue and dispatch
+        """
+        with self._lock:
+            self.last_lag = lag
+            self.total_lag += lag
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def to_dict(self):
+        """Return a snapshot of the metrics.
+
+        :rtype: dict
+        """
+        with self._lock:
+            started = self.completed + self.failed
+            return {
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'dropped': self.dropped,
+                'last_lag': self.last_lag,
+                'max_lag': self.max_lag,
+                'avg_lag': self.total_lag / started if started else 0.0,
+            }
+
+
+def source_key(event):
+    """Return the conversation ID of the event.
+
+    :param event: Webhook event
+    :rtype: str | None
+    :return: group ID, room ID or user ID of the event source,
+        or None if the event has no source
+    """
+    source = getattr(event, 'source', None)
+    if isinstance(source, GroupSource):
+        return source.group_id
+    if isinstance(source, RoomSource):
+        return source.room_id
+    if isinstance(source, UserSource):
+        return source.user_id
+    return None
+
+
+def _check_overflow(overflow):
+    if overflow not in _OVERFLOW_POLICIES:
+        raise ValueError(
+            'overflow must be one of {0}, got {1!r}'.format(_OVERFLOW_POLICIES, overflow))
+
+
+class BackgroundExecutor(object):
+    """Run webhook handlers on a bounded queue served by worker threads.
+
+    Pass an instance to :py:class:`linebot.v3.webhook.WebhookHandler` so that
+    ``handle`` only validates, parses and enqueues, and returns before any
+    handler has run.
+    """
+
+    def __init__(self, max_workers=4, max_queue_size=1000,
+                 overflow=OVERFLOW_BLOCK, block_timeout=None):
+        """__init__ method.
+
+        :param int max_workers: Number of worker threads
+        :param int max_queue_size: Maximum number of queued events. 0 means unbounded.
+        :param str overflow: What to do when the queue is full.
+            'block' waits up to block_timeout and then raises QueueFullError,
+            'reject' raises QueueFullError immediately,
+            'drop_oldest' discards the oldest queued event.
+        :param float block_timeout: (optional) Seconds to wait with the 'block' policy.
+            None waits forever.
+        """
+        _check_overflow(overflow)
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.metrics = ExecutorMetrics()
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._workers = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._submitting = 0
+        self._shutdown = False
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method. Drains the queue."""
+        self.shutdown()
+
+    @property
+    def queue_depth(self):
+        """Number of events waiting for a worker.
+
+        :rtype: int
+        """
+        return self._queue.qsize()
+
+    def stats(self):
+        """Return queue depth and metrics.
+
+        :rtype: dict
+        """
+        stats = self.metrics.to_dict()
+        stats['queue_depth'] = self.queue_depth
+        return stats
+
+    def submit(self, fn, event, *args):
+        """Enqueue ``fn(event, *args)``.
+
+        :param fn: Callable run on a worker thread
+        :param event: Webhook event
+        :raises QueueFullError: If the queue is full and the overflow policy
+            is 'reject', or 'block' timed out
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot submit after shutdown')
+            self._submitting += 1
+        try:
+            self._start_workers()
+
+            item = (time.monotonic(), fn, event, args)
+            if self.overflow == OVERFLOW_DROP_OLDEST:
+                self._put_dropping_oldest(item)
+            else:
+                try:
+                    if self.overflow == OVERFLOW_BLOCK:
+                        self._queue.put(item, timeout=self.block_timeout)
+                    else:
+                        self._queue.put_nowait(item)
+                except queue.Full:
+                    self.metrics.incr('rejected')
+                    raise QueueFullError(
+                        'Event queue is full. size=' + str(self.max_queue_size))
+            self.metrics.incr('submitted')
+        finally:
+            with self._lock:
+                self._submitting -= 1
+                if not self._submitting:
+                    self._idle.notify_all()
+
+    def shutdown(self, wait=True, timeout=None):
+        """Stop accepting events and drain the queue.
+
+        :param bool wait: Wait until every queued event has been handled
+        :param float timeout: (optional) Maximum seconds to wait for the drain
+        :rtype: bool
+        :return: True if all workers have finished
+        """
+        with self._lock:
+            stopping = not self._shutdown
+            self._shutdown = True
+            # Submits in progress finish first, so that no event is queued
+            # behind the stop sentinels or drops one of them.
+            self._idle.wait_for(lambda: not self._submitting)
+            workers = list(self._workers)
+        if stopping:
+            for _ in workers:
+                self._queue.put(_STOP)
+
+        if not wait:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            worker.join(remaining)
+        return not any(worker.is_alive() for worker in workers)
+
+    def _put_dropping_oldest(self, item):
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self._queue.task_done()
+                self.metrics.incr('dropped')
+                LOGGER.warning('Event queue is full. The oldest event was dropped.')
+
+    def _start_workers(self):
+        if len(self._workers) >= self.max_workers:
+            return
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name='linebot-webhook-worker-' + str(len(self._workers)),
+                    daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                enqueued_at, fn, event, args = item
+                self.metrics.observe_lag(time.monotonic() - enqueued_at)
+                try:
+                    fn(event, *args)
+                except Exception:
+                    self.metrics.incr('failed')
+                    LOGGER.exception('Webhook handler raised an exception')
+                else:
+                    self.metrics.incr('completed')
+            finally:
+                self._queue.task_done()
+
+
+class AsyncBackgroundExecutor(object):
+    """Run webhook handlers on a bounded asyncio queue served by worker tasks.
+
+    Pass an instance to :py:class:`linebot.v3.webhook.AsyncWebhookHandler`.
+    Worker tasks are created on the running event loop at the first submit.
+    """
+
+    def __init__(self, max_workers=4, max_queue_size=1000,
+                 overflow=OVERFLOW_BLOCK, block_timeout=None):
+        """__init__ method.
+
+        :param int max_workers: Number of worker tasks
+        :param int max_queue_size: Maximum number of queued events. 0 means unbounded.
+        :param str overflow: 'block', 'reject' or 'drop_oldest'.
+            See :py:class:`BackgroundExecutor`.
+        :param float block_timeout: (optional) Seconds to wait with the 'block' policy.
+            None waits forever.
+        """
+        _check_overflow(overflow)
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.metrics = ExecutorMetrics()
+        self._queue = None
+        self._workers = []
+        self._idle = None
+        self._submitting = 0
+        self._shutdown = False
+
+    async def __aenter__(self):
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method. Drains the queue."""
+        await self.shutdown()
+
+    @property
+    def queue_depth(self):
+        """Number of events waiting for a worker.
+
+        :rtype: int
+        """
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self):
+        """Return queue depth and metrics.
+
+        :rtype: dict
+        """
+        stats = self.metrics.to_dict()
+        stats['queue_depth'] = self.queue_depth
+        return stats
+
+    async def submit(self, fn, event, *args):
+        """Enqueue ``fn(event, *args)``.
+
+        ``fn`` may be a coroutine function or a plain function.
+
+        :param fn: Callable run on a worker task
+        :param event: Webhook event
+        :raises QueueFullError: If the queue is full and the overflow policy
+            is 'reject', or 'block' timed out
+        """
+        if self._shutdown:
+            raise RuntimeError('cannot submit after shutdown')
+        self._start_workers()
+        self._submitting += 1
+        self._idle.clear()
+        try:
+            item = (time.monotonic(), fn, event, args)
+            if self.overflow == OVERFLOW_DROP_OLDEST:
+                while self._queue.full():
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.metrics.incr('dropped')
+                    LOGGER.warning('Event queue is full. The oldest event was dropped.')
+                self._queue.put_nowait(item)
+            else:
+                try:
+                    if self.overflow == OVERFLOW_BLOCK:
+                        await asyncio.wait_for(self._queue.put(item), self.block_timeout)
+                    else:
+                        self._queue.put_nowait(item)
+                except (asyncio.QueueFull, asyncio.TimeoutError):
+                    self.metrics.incr('rejected')
+                    raise QueueFullError(
+                        'Event queue is full. size=' + str(self.max_queue_size))
+            self.metrics.incr('submitted')
+        finally:
+            self._submitting -= 1
+            if not self._submitting:
+                self._idle.set()
+
+    async def shutdown(self, wait=True, timeout=None):
+        """Stop accepting events and drain the queue.
+
+        :param bool wait: Wait until every queued event has been handled.
+            If False, the worker tasks are cancelled.
+        :param float timeout: (optional) Maximum seconds to wait for the drain
+        :rtype: bool
+        :return: True if all workers have finished
+        """
+        stopping = not self._shutdown
+        self._shutdown = True
+        if not self._workers:
+            return True
+        if not wait:
+            for worker in self._workers:
+                worker.cancel()
+            return False
+
+        if stopping:
+            # Submits waiting for room finish first, so that no event is
+            # queued behind the stop sentinels.
+            await self._idle.wait()
+            for _ in self._workers:
+                await self._queue.put(_STOP)
+
+        _, pending = await asyncio.wait(self._workers, timeout=timeout)
+        return not pending
+
+    def _start_workers(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._idle = asyncio.Event()
+            self._idle.set()
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.ensure_future(self._work()))
+
+    async def _work(self):
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                enqueued_at, fn, event, args = item
+                self.metrics.observe_lag(time.monotonic() - enqueued_at)
+                try:
+                    result = fn(event, *args)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    self.metrics.incr('failed')
+                    LOGGER.exception('Webhook handler raised an exception')
+                else:
+                    self.metrics.incr('completed')
+            finally:
+                self._queue.task_done()
+
+
+class _ShardedExecutorBase(object):
+
+    def __init__(self, lanes, key):
+        self.key = key or source_key
+        self.lanes = lanes
+        self._round_robin = itertools.count()
+
+    def lane_for(self, event):
+        """Return the lane index the event is routed to.
+
+        Events without a key are spread over the lanes.
+
+        :param event: Webhook event
+        :rtype: int
+        """
+        key = self.key(event)
+        if key is None:
+            return next(self._round_robin) % len(self.lanes)
+        return zlib.crc32(key.encode('utf-8')) % len(self.lanes)
+
+    @property
+    def queue_depth(self):
+        """Number of events waiting in all lanes.
+
+        :rtype: int
+        """
+        return sum(lane.queue_depth for lane in self.lanes)
+
+    def stats(self):
+        """Return metrics of each lane.
+
+        :rtype: list[dict]
+        """
+        return [lane.stats() for lane in self.lanes]
+
+
+class ShardedExecutor(_ShardedExecutorBase):
+    """Run webhook handlers in parallel while keeping each conversation in order.
+
+    Events are routed by their source (group ID, room ID or user ID) to one of
+    ``num_lanes`` lanes. Each lane is served by a single worker thread, so
+    events of one conversation are handled in the order they were received.
+    """
+
+    def __init__(self, num_lanes=4, max_queue_size=1000,
+                 overflow=OVERFLOW_BLOCK, block_timeout=None, key=None):
+        """__init__ method.
+
+        :param int num_lanes: Number of lanes (worker threads)
+        :param int max_queue_size: Maximum number of queued events per lane
+        :param str overflow: 'block', 'reject' or 'drop_oldest'.
+            See :py:class:`BackgroundExecutor`.
+        :param float block_timeout: (optional) Seconds to wait with the 'block' policy
+        :param key: (optional) Function which returns the ordering key of an event.
+            Default is :py:func:`source_key`.
+        """
+        super(ShardedExecutor, self).__init__(
+            [BackgroundExecutor(max_workers=1, max_queue_size=max_queue_size,
+                                overflow=overflow, block_timeout=block_timeout)
+             for _ in range(num_lanes)],
+            key)
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method. Drains the lanes."""
+        self.shutdown()
+
+    def submit(self, fn, event, *args):
+        """Enqueue ``fn(event, *args)`` on the lane of the event.
+
+        :param fn: Callable run on the lane's worker thread
+        :param event: Webhook event
+        :raises QueueFullError: If the lane's queue is full
+        """
+        self.lanes[self.lane_for(event)].submit(fn, event, *args)
+
+    def shutdown(self, wait=True, timeout=None):
+        """Stop accepting events and drain every lane.
+
+        :param bool wait: Wait until every queued event has been handled
+        :param float timeout: (optional) Maximum seconds to wait for the drain
+        :rtype: bool
+        :return: True if all lanes have finished
+        """
+        for lane in self.lanes:
+            lane.shutdown(wait=False)
+        if not wait:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        finished = True
+        for lane in self.lanes:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            finished = lane.shutdown(timeout=remaining) and finished
+        return finished
+
+
+class AsyncShardedExecutor(_ShardedExecutorBase):
+    """asyncio version of :py:class:`ShardedExecutor`.
+
+    Each lane is served by a single worker task.
+    """
+
+    def __init__(self, num_lanes=4, max_queue_size=1000,
+                 overflow=OVERFLOW_BLOCK, block_timeout=None, key=None):
+        """__init__ method.
+
+        :param int num_lanes: Number of lanes (worker tasks)
+        :param int max_queue_size: Maximum number of queued events per lane
+        :param str overflow: 'block', 'reject' or 'drop_oldest'.
+            See :py:class:`BackgroundExecutor`.
+        :param float block_timeout: (optional) Seconds to wait with the 'block' policy
+        :param key: (optional) Function which returns the ordering key of an event.
+            Default is :py:func:`source_key`.
+        """
+        super(AsyncShardedExecutor, self).__init__(
+            [AsyncBackgroundExecutor(max_workers=1, max_queue_size=max_queue_size,
+                                     overflow=overflow, block_timeout=block_timeout)
+             for _ in range(num_lanes)],
+            key)
+
+    async def __aenter__(self):
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method. Drains the lanes."""
+        await self.shutdown()
+
+    async def submit(self, fn, event, *args):
+        """Enqueue ``fn(event, *args)`` on the lane of the event.
+
+        :param fn: Callable run on the lane's worker task
+        :param event: Webhook event
+        :raises QueueFullError: If the lane's queue is full
+        """
+        await self.lanes[self.lane_for(event)].submit(fn, event, *args)
+
+    async def shutdown(self, wait=True, timeout=None):
+        """Stop accepting events and drain every lane.
+
+        :param bool wait: Wait until every queued event has been handled.
+            If False, the worker tasks are cancelled.
+        :param float timeout: (optional) Maximum seconds to wait for the drain
+        :rtype: bool
+        :return: True if all lanes have finished
+        """
+        results = await asyncio.gather(
+            *[lane.shutdown(wait=wait, timeout=timeout) for lane in self.lanes])
+        return all(results)
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.flex module."""
+
+import json
+
+from linebot.v3.messaging.models.flex_container import FlexContainer
+
+
+class _Node(object):
+    """Immutable JSON object or array, which caches its encoded form."""
+
+    __slots__ = ('keys', 'values', '_json', '_dict')
+
+    def __init__(self, keys, values):
+        # keys is None for arrays
+        self.keys = keys
+        self.values = values
+        self._json = None
+        self._dict = None
+
+    @classmethod
+    def freeze(cls, obj):
+        if isinstance(obj, dict):
+            return cls(tuple(obj), tuple(cls.freeze(value) for value in obj.values()))
+        if isinstance(obj, (list, tuple)):
+            return cls(None, tuple(cls.freeze(value) for value in obj))
+        return obj
+
+    def index(self, key):
+        if self.keys is None:
+            if not isinstance(key, int) or not -len(self.values) <= key < len(self.values):
+                raise KeyError(key)
+            return key + len(self.values) if key < 0 else key
+        try:
+            return self.keys.index(key)
+        except ValueError:
+            raise KeyError(key)
+
+    def replace(self, path, value):
+        key = path[0]
+        try:
+            i = self.index(key)
+        except KeyError:
+            if self.keys is None or len(path) > 1:
+                raise
+            # new key of an object
+            return _Node(self.keys + (key,), self.values + (_Node.freeze(value),))
+
+        if len(path) == 1:
+            child = _Node.freeze(value)
+        else:
+            child = self.values[i]
+            if not isinstance(child, _Node):
+                raise KeyError(path[1])
+            child = child.replace(path[1:], value)
+        values = self.values[:i] + (child,) + self.values[i + 1:]
+        return _Node(self.keys, values)
+
+    def encode(self):
+        if self._json is None:
+            values = [_encode(value) for value in self.values]
+            if self.keys is None:
+                self._json = '[' + ', '.join(values) + ']'
+            else:
+                self._json = '{' + ', '.join(
+                    json.dumps(key) + ': ' + value for key, value in zip(self.keys, values)) + '}'
+        return self._json
+
+    def to_dict(self):
+        if self._dict is None:
+            values = [_to_dict(value) for value in self.values]
+            if self.keys is None:
+                self._dict = values
+            else:
+                self._dict = dict(zip(self.keys, values))
+        return self._dict
+
+
+def _encode(value):
+    if isinstance(value, _Node):
+        return value.encode()
+    return json.dumps(value)
+
+
+def _to_dict(value):
+    if isinstance(value, _Node):
+        return value.to_dict()
+    return value
+
+
+def _split(path):
+    if isinstance(path, str):
+        return tuple(int(key) if key.lstrip('-').isdigit() else key for key in path.split('.'))
+    return tuple(path)
+
+
+class FlexTemplate(object):
+    """Immutable Flex container for building many personalized variants.
+
+    :py:meth:`set` returns a new template which shares every unchanged
+    subtree with the template it was made from, and each subtree caches
+    its encoded JSON, so :py:meth:`to_json` of a variant only encodes the
+    objects on the changed paths.
+
+    Values are set as they are, without validation; :py:meth:`to_model`
+    validates the result.
+    """
+
+    def __init__(self, contents):
+        """__init__ method.
+
+        :param contents: Flex container, e.g. FlexBubble,
+            or its JSON dict
+        :type contents: :py:class:`linebot.v3.messaging.FlexContainer` | dict
+        """
+        if isinstance(contents, _Node):
+            self._root = contents
+            return
+        if not isinstance(contents, dict):
+            contents = contents.to_dict()
+        self._root = _Node.freeze(contents)
+
+    def get(self, path):
+        """Return the value at path.
+
+        :param path: Keys of the JSON dict from the root, either as a tuple,
+            e.g. ``('body', 'contents', 0, 'text')``, or dot-separated,
+            e.g. ``'body.contents.0.text'``
+        :type path: tuple | str
+        :return: Value, or its JSON dict for objects and arrays
+        """
+        value = self._root
+        for key in _split(path):
+            if not isinstance(value, _Node):
+                raise KeyError(key)
+            value = value.values[value.index(key)]
+        return _to_dict(value)
+
+    def set(self, path, value):
+        """Return a new template with value set at path.
+
+        :param path: Keys of the JSON dict from the root, see :py:meth:`get`.
+            The last key may be a new key of an object.
+        :type path: tuple | str
+        :param value: New value; a JSON dict or a model for objects
+        :rtype: :py:class:`FlexTemplate`
+        """
+        if hasattr(value, 'to_dict'):
+            value = value.to_dict()
+        path = _split(path)
+        if not path:
+            return FlexTemplate(value)
+        return FlexTemplate(self._root.replace(path, value))
+
+    def set_all(self, values):
+        """Return a new template with all the values set.
+
+        :param dict values: Values by path, see :py:meth:`set`
+        :rtype: :py:class:`FlexTemplate`
+        """
+        template = self
+        for path, value in values.items():
+            template = template.set(path, value)
+        return template
+
+    def to_json(self):
+        """Return the JSON of the container, as ``json.dumps(self.to_dict())``.
+
+        :rtype: str
+        """
+        return self._root.encode()
+
+    def to_dict(self):
+        """Return the JSON dict of the container.
+
+        Unchanged subtrees are shared between variants; do not modify it.
+
+        :rtype: dict
+        """
+        return self._root.to_dict()
+
+    def to_model(self):
+        """Return the container as a validated model.
+
+        :rtype: :py:class:`linebot.v3.messaging.FlexContainer`
+        """
+        return FlexContainer.from_dict(self.to_dict())
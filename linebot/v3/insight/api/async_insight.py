@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, constr, validator
+from pydantic import Field, constr, field_validator
 
 from typing import Optional
 
@@ -69,7 +70,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_friends_demographics(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -79,7 +80,7 @@ class AsyncInsight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetFriendsDemographicsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -98,7 +99,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_friends_demographics_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -121,7 +122,7 @@ class AsyncInsight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetFriendsDemographicsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -212,7 +213,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_event(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param request_id: Request ID of a narrowcast message or broadcast message. Each Messaging API request has a request ID.  (required)
         :type request_id: str
@@ -224,7 +225,7 @@ class AsyncInsight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetMessageEventResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -243,7 +244,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_event_with_http_info(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param request_id: Request ID of a narrowcast message or broadcast message. Each Messaging API request has a request ID.  (required)
         :type request_id: str
@@ -268,7 +269,7 @@ class AsyncInsight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetMessageEventResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -363,7 +364,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_followers(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date for which to retrieve the number of followers.  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9 
         :type var_date: str
@@ -375,7 +376,7 @@ class AsyncInsight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetNumberOfFollowersResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -394,7 +395,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_followers_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date for which to retrieve the number of followers.  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9 
         :type var_date: str
@@ -419,7 +420,7 @@ class AsyncInsight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetNumberOfFollowersResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -514,7 +515,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_message_deliveries(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date for which to retrieve number of sent messages. - Format: yyyyMMdd (e.g. 20191231) - Timezone: UTC+9  (required)
         :type var_date: str
@@ -526,7 +527,7 @@ class AsyncInsight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetNumberOfMessageDeliveriesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -545,7 +546,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_message_deliveries_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date for which to retrieve number of sent messages. - Format: yyyyMMdd (e.g. 20191231) - Timezone: UTC+9  (required)
         :type var_date: str
@@ -570,7 +571,7 @@ class AsyncInsight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetNumberOfMessageDeliveriesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -665,7 +666,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_statistics_per_unit(custom_aggregation_unit, var_from, to, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param custom_aggregation_unit: Name of aggregation unit specified when sending the message. Case-sensitive. For example, `Promotion_a` and `Promotion_A` are regarded as different unit names.  (required)
         :type custom_aggregation_unit: str
@@ -681,7 +682,7 @@ class AsyncInsight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetStatisticsPerUnitResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -700,7 +701,7 @@ class AsyncInsight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_statistics_per_unit_with_http_info(custom_aggregation_unit, var_from, to, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param custom_aggregation_unit: Name of aggregation unit specified when sending the message. Case-sensitive. For example, `Promotion_a` and `Promotion_A` are regarded as different unit names.  (required)
         :type custom_aggregation_unit: str
@@ -729,7 +730,7 @@ class AsyncInsight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetStatisticsPerUnitResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, constr, validator
+from pydantic import Field, constr, field_validator
 
 from typing import Optional
 
@@ -59,7 +60,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_friends_demographics(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -69,7 +70,7 @@ class Insight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetFriendsDemographicsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -86,7 +87,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_friends_demographics_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -109,7 +110,7 @@ class Insight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetFriendsDemographicsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -192,7 +193,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_event(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param request_id: Request ID of a narrowcast message or broadcast message. Each Messaging API request has a request ID.  (required)
         :type request_id: str
@@ -204,7 +205,7 @@ class Insight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetMessageEventResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -221,7 +222,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_event_with_http_info(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param request_id: Request ID of a narrowcast message or broadcast message. Each Messaging API request has a request ID.  (required)
         :type request_id: str
@@ -246,7 +247,7 @@ class Insight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetMessageEventResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -333,7 +334,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_followers(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date for which to retrieve the number of followers.  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9 
         :type var_date: str
@@ -345,7 +346,7 @@ class Insight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetNumberOfFollowersResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -362,7 +363,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_followers_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date for which to retrieve the number of followers.  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9 
         :type var_date: str
@@ -387,7 +388,7 @@ class Insight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetNumberOfFollowersResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -474,7 +475,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_message_deliveries(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date for which to retrieve number of sent messages. - Format: yyyyMMdd (e.g. 20191231) - Timezone: UTC+9  (required)
         :type var_date: str
@@ -486,7 +487,7 @@ class Insight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetNumberOfMessageDeliveriesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -503,7 +504,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_message_deliveries_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date for which to retrieve number of sent messages. - Format: yyyyMMdd (e.g. 20191231) - Timezone: UTC+9  (required)
         :type var_date: str
@@ -528,7 +529,7 @@ class Insight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetNumberOfMessageDeliveriesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -615,7 +616,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_statistics_per_unit(custom_aggregation_unit, var_from, to, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param custom_aggregation_unit: Name of aggregation unit specified when sending the message. Case-sensitive. For example, `Promotion_a` and `Promotion_A` are regarded as different unit names.  (required)
         :type custom_aggregation_unit: str
@@ -631,7 +632,7 @@ class Insight(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetStatisticsPerUnitResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -648,7 +649,7 @@ class Insight(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_statistics_per_unit_with_http_info(custom_aggregation_unit, var_from, to, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param custom_aggregation_unit: Name of aggregation unit specified when sending the message. Case-sensitive. For example, `Promotion_a` and `Promotion_A` are regarded as different unit names.  (required)
         :type custom_aggregation_unit: str
@@ -677,7 +678,7 @@ class Insight(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetStatisticsPerUnitResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -14,10 +14,12 @@
 
 import atexit
 import datetime
+import functools
 from dateutil.parser import parse
 import json
 import mimetypes
-from multiprocessing.pool import ThreadPool
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import os
 import re
 import tempfile
@@ -46,7 +48,8 @@ class ApiClient(object):
     :param cookie: a cookie to include in the header when making calls
         to the API
     :param pool_threads: The number of threads to use for async requests
-        to the API. More threads means more concurrent API requests.
+        to the API, unless the configuration has an executor. More threads
+        means more concurrent API requests.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -74,7 +77,6 @@ class ApiClient(object):
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
-        self.default_headers['Authorization'] = 'Bearer ' + configuration.access_token
         self.cookie = cookie
         # Set default User-Agent.
         self.user_agent = f"line-bot-sdk-python/{__version__}"
@@ -88,20 +90,24 @@ class ApiClient(object):
 
     def close(self):
         if self._pool:
-            self._pool.close()
-            self._pool.join()
+            self._pool.shutdown()
             self._pool = None
             if hasattr(atexit, 'unregister'):
                 atexit.unregister(self.close)
 
     @property
     def pool(self):
-        """Create thread pool on first request
-         avoids instantiating unused threadpool for blocking clients.
+        """Executor which runs the requests made with async_req=True.
+
+        The executor of the configuration when set, else an executor of
+        pool_threads threads created on first request, which avoids
+        instantiating unused threads for blocking clients.
         """
+        if self.configuration.executor is not None:
+            return self.configuration.executor
         if self._pool is None:
             atexit.register(self.close)
-            self._pool = ThreadPool(self.pool_threads)
+            self._pool = ThreadPoolExecutor(self.pool_threads)
         return self._pool
 
     @property
@@ -152,76 +158,111 @@ class ApiClient(object):
             _request_auth=None):
 
         config = self.configuration
-
-        # header parameters
-        header_params = header_params or {}
-        header_params.update(self.default_headers)
-        if self.cookie:
-            header_params['Cookie'] = self.cookie
-        if header_params:
-            header_params = self.sanitize_for_serialization(header_params)
-            header_params = dict(self.parameters_to_tuples(header_params,
-                                                           collection_formats))
-
-        # path parameters
-        if path_params:
-            path_params = self.sanitize_for_serialization(path_params)
-            path_params = self.parameters_to_tuples(path_params,
-                                                    collection_formats)
-            for k, v in path_params:
-                # specified safe chars, encode everything
-                resource_path = resource_path.replace(
-                    '{%s}' % k,
-                    quote(str(v), safe=config.safe_chars_for_path_param)
-                )
-
-        # post parameters
-        if post_params or files:
-            post_params = post_params if post_params else []
-            post_params = self.sanitize_for_serialization(post_params)
-            post_params = self.parameters_to_tuples(post_params,
-                                                    collection_formats)
-            post_params.extend(self.files_parameters(files))
-
-        # auth setting
-        self.update_params_for_auth(
-            header_params, query_params, auth_settings,
-            resource_path, method, body,
-            request_auth=_request_auth)
-
-        # body
-        if body:
-            body = self.sanitize_for_serialization(body)
-
-        # request url
-        if self.configuration.host is not None:
-            url = self.configuration.host + resource_path
-        else:
-            # use server/host defined in path or operation instead
-            url = _host + resource_path
-
-        # query parameters
-        if query_params:
-            query_params = self.sanitize_for_serialization(query_params)
-            url_query = self.parameters_to_url_query(query_params,
-                                                     collection_formats)
-            url += "?" + url_query
+        record = None
+        if config.instrumentation is not None:
+            record = config.instrumentation.start(method, resource_path)
 
+        try:
+            # header parameters
+            header_params = header_params or {}
+            header_params.update(self.default_headers)
+            if self.cookie:
+                header_params['Cookie'] = self.cookie
+            if header_params:
+                header_params = self.sanitize_for_serialization(header_params)
+                header_params = dict(self.parameters_to_tuples(header_params,
+                                                               collection_formats))
+
+            # path parameters
+            if path_params:
+                path_params = self.sanitize_for_serialization(path_params)
+                path_params = self.parameters_to_tuples(path_params,
+                                                        collection_formats)
+                for k, v in path_params:
+                    # specified safe chars, encode everything
+                    resource_path = resource_path.replace(
+                        '{%s}' % k,
+                        quote(str(v), safe=config.safe_chars_for_path_param)
+                    )
+
+            # post parameters
+            if post_params or files:
+                post_params = post_params if post_params else []
+                post_params = self.sanitize_for_serialization(post_params)
+                post_params = self.parameters_to_tuples(post_params,
+                                                        collection_formats)
+                post_params.extend(self.files_parameters(files))
+
+            # auth setting
+            self.update_params_for_auth(
+                header_params, query_params, auth_settings,
+                resource_path, method, body,
+                request_auth=_request_auth)
+
+            # body
+            if body:
+                body = self.sanitize_for_serialization(body)
+
+            # request url
+            if self.configuration.host is not None:
+                url = self.configuration.host + resource_path
+            else:
+                # use server/host defined in path or operation instead
+                url = _host + resource_path
+
+            # query parameters
+            if query_params:
+                query_params = self.sanitize_for_serialization(query_params)
+                url_query = self.parameters_to_url_query(query_params,
+                                                         collection_formats)
+                url += "?" + url_query
+
+            if record is not None:
+                record.serialized(body)
+
+            call = functools.partial(
+                self.__perform_request, method, resource_path, url,
+                query_params, header_params, post_params, body,
+                response_types_map, _preload_content, _request_timeout, record)
+            if config.single_flight is None or not _preload_content:
+                return call(_return_http_data_only)
+            # identical GET requests in flight share the response
+            response = config.single_flight.call(
+                method, resource_path, url, header_params,
+                functools.partial(call, False), record)
+            return response.data if _return_http_data_only else response
+        except Exception as e:
+            if record is not None:
+                record.failed(e)
+            raise
+
+    def __perform_request(
+            self, method, resource_path, url, query_params, header_params,
+            post_params, body, response_types_map, _preload_content,
+            _request_timeout, record, _return_http_data_only):
+        config = self.configuration
         try:
             # perform request and return response
-            response_data = self.request(
-                method, url,
+            request = functools.partial(
+                self.request, method, url,
                 query_params=query_params,
                 headers=header_params,
                 post_params=post_params, body=body,
                 _preload_content=_preload_content,
                 _request_timeout=_request_timeout)
+            if config.response_cache is not None and _preload_content:
+                response_data = config.response_cache.call(
+                    method, resource_path, url, header_params, request)
+            else:
+                response_data = request()
         except ApiException as e:
             if e.body:
                 e.body = e.body.decode('utf-8')
             raise e
 
         self.last_response = response_data
+        if record is not None:
+            record.received(response_data)
 
         return_data = None # assuming derialization is not needed
         # data needs deserialization or returns HTTP data (deserialized) only
@@ -246,6 +287,9 @@ class ApiClient(object):
           else:
               return_data = None
 
+        if record is not None:
+            record.deserialized()
+
         if _return_http_data_only:
             return return_data
         else:
@@ -399,7 +443,7 @@ class ApiClient(object):
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
-            The method will return the request thread.
+            The method will return a concurrent.futures.Future.
             If parameter async_req is False or missing,
             then the method will return the response directly.
         """
@@ -412,18 +456,20 @@ class ApiClient(object):
                                    _preload_content, _request_timeout, _host,
                                    _request_auth)
 
-        return self.pool.apply_async(self.__call_api, (resource_path,
-                                                       method, path_params,
-                                                       query_params,
-                                                       header_params, body,
-                                                       post_params, files,
-                                                       response_types_map,
-                                                       auth_settings,
-                                                       _return_http_data_only,
-                                                       collection_formats,
-                                                       _preload_content,
-                                                       _request_timeout,
-                                                       _host, _request_auth))
+        # in the context of the caller, e.g. its tracing span
+        return self.pool.submit(contextvars.copy_context().run,
+                                self.__call_api, resource_path,
+                                method, path_params,
+                                query_params,
+                                header_params, body,
+                                post_params, files,
+                                response_types_map,
+                                auth_settings,
+                                _return_http_data_only,
+                                collection_formats,
+                                _preload_content,
+                                _request_timeout,
+                                _host, _request_auth)
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
@@ -620,6 +666,9 @@ class ApiClient(object):
         The object type is the return value of sanitize_for_serialization().
         :param request_auth: if set, the provided settings will
                              override the token in the configuration.
+
+        The access token is given by access_token_provider of the
+        configuration, when set, for every request.
         """
         if not auth_settings:
             return
@@ -630,8 +679,12 @@ class ApiClient(object):
                                     request_auth)
             return
 
+        access_token = None
+        if self.configuration.access_token_provider is not None:
+            access_token = self.configuration.access_token_provider()
+        settings = self.configuration.auth_settings(access_token)
         for auth in auth_settings:
-            auth_setting = self.configuration.auth_settings().get(auth)
+            auth_setting = settings.get(auth)
             if auth_setting:
                 self._apply_auth_params(headers, queries,
                                         resource_path, method, body,
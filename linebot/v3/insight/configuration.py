@@ -59,6 +59,11 @@ class Configuration(object):
 
     _default = None
 
+    # shared by the copies of a configuration instead of being copied
+    _shared = ('access_token_provider', 'response_cache', 'instrumentation',
+               'connector', 'executor', 'connection_pool', 'single_flight',
+               'circuit_breaker')
+
     def __init__(self, host=None,
                  api_key=None, api_key_prefix=None,
                  username=None, password=None,
@@ -106,6 +111,13 @@ class Configuration(object):
         self.access_token = access_token
         """Access token
         """
+        self.access_token_provider = None
+        """Function called for every request which returns the access token,
+           in place of access_token, e.g. to rotate tokens without creating new
+           clients. AsyncApiClient also accepts a coroutine function. It
+           should cache the token, since it is called for every request.
+           Copies of the configuration share it, with the object it is bound to.
+        """
         self.logger = {}
         """Logging Settings
         """
@@ -165,8 +177,48 @@ class Configuration(object):
         self.retries = None
         """Adding retries to override urllib3 default value 3
         """
-        # Enable client side validation
         self.client_side_validation = True
+        """Validate the arguments of API methods before sending the request.
+           Set to False to skip it when the arguments are model instances
+           which were already validated when they were built.
+        """
+        self.response_cache = None
+        """linebot.v3.response_cache.ResponseCache for the responses of GET requests.
+           None disables caching.
+        """
+        self.instrumentation = None
+        """linebot.v3.instrumentation.Instrumentation which receives the timings
+           and sizes of every request. None disables instrumentation.
+        """
+        self.connector = None
+        """linebot.v3.connector.SharedConnector whose connections are shared by
+           the AsyncApiClients of this configuration and its copies. None gives
+           each AsyncApiClient its own connection pool.
+        """
+        self.executor = None
+        """concurrent.futures.Executor which runs the requests made with
+           async_req=True by the ApiClients of this configuration and its
+           copies. None gives each ApiClient its own executor.
+        """
+        self.connection_pool = None
+        """linebot.v3.connection_pool.ConnectionPoolMonitor which measures and
+           sizes the urllib3 connection pools of ApiClient. None uses plain
+           urllib3 pools.
+        """
+        self.single_flight = None
+        """linebot.v3.single_flight.SingleFlight which makes identical concurrent
+           GET requests share one request. None sends each of them.
+        """
+        self.request_timeout = (5, 30)
+        """Default timeout in seconds of the requests which do not set
+           _request_timeout: a (connection, read) tuple, or a total timeout.
+           None waits indefinitely, or 5 minutes with AsyncApiClient.
+        """
+        self.circuit_breaker = None
+        """linebot.v3.circuit_breaker.CircuitBreaker which fails fast when the
+           API degrades and limits the requests in flight. None sends every
+           request.
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -185,7 +237,9 @@ class Configuration(object):
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k in self._shared:
+                setattr(result, k, v)
+            elif k not in ('logger', 'logger_file_handler'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
@@ -349,18 +403,21 @@ class Configuration(object):
             basic_auth=username + ':' + password
         ).get('authorization')
 
-    def auth_settings(self):
+    def auth_settings(self, access_token=None):
         """Gets Auth Settings dict for api client.
 
+        :param access_token: Access token used in place of self.access_token.
         :return: The Auth Settings information dict.
         """
+        if access_token is None:
+            access_token = self.access_token
         auth = {}
-        if self.access_token is not None:
+        if access_token is not None:
             auth['Bearer'] = {
                 'type': 'bearer',
                 'in': 'header',
                 'key': 'Authorization',
-                'value': 'Bearer ' + self.access_token
+                'value': 'Bearer ' + access_token
             }
         return auth
 
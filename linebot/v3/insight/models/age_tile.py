@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional, Union
-from pydantic.v1 import BaseModel, Field, StrictFloat, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr, field_validator
 
 class AgeTile(BaseModel):
     """
@@ -28,9 +28,9 @@ class AgeTile(BaseModel):
     age: Optional[StrictStr] = Field(None, description="users' age")
     percentage: Optional[Union[StrictFloat, StrictInt]] = Field(None, description="Percentage")
 
-    __properties = ["age", "percentage"]
+    __properties: ClassVar[List[str]] = ["age", "percentage"]
 
-    @validator('age')
+    @field_validator('age')
     def age_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -40,14 +40,18 @@ class AgeTile(BaseModel):
             raise ValueError("must be one of enum values ('from0to14', 'from15to19', 'from20to24', 'from25to29', 'from30to34', 'from35to39', 'from40to44', 'from45to49', 'from50', 'from50to54', 'from55to59', 'from60to64', 'from65to69', 'from70', 'unknown')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -60,10 +64,10 @@ class AgeTile(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -73,9 +77,9 @@ class AgeTile(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AgeTile.parse_obj(obj)
+            return AgeTile.model_validate(obj)
 
-        _obj = AgeTile.parse_obj({
+        _obj = AgeTile.model_validate({
             "age": obj.get("age"),
             "percentage": obj.get("percentage")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional, Union
-from pydantic.v1 import BaseModel, Field, StrictFloat, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr, field_validator
 
 class AppTypeTile(BaseModel):
     """
@@ -28,9 +28,9 @@ class AppTypeTile(BaseModel):
     app_type: Optional[StrictStr] = Field(None, alias="appType", description="users' OS")
     percentage: Optional[Union[StrictFloat, StrictInt]] = Field(None, description="Percentage")
 
-    __properties = ["appType", "percentage"]
+    __properties: ClassVar[List[str]] = ["appType", "percentage"]
 
-    @validator('app_type')
+    @field_validator('app_type')
     def app_type_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -40,14 +40,18 @@ class AppTypeTile(BaseModel):
             raise ValueError("must be one of enum values ('ios', 'android', 'others')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -60,10 +64,10 @@ class AppTypeTile(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -73,9 +77,9 @@ class AppTypeTile(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AppTypeTile.parse_obj(obj)
+            return AppTypeTile.model_validate(obj)
 
-        _obj = AppTypeTile.parse_obj({
+        _obj = AppTypeTile.model_validate({
             "app_type": obj.get("appType"),
             "percentage": obj.get("percentage")
         })
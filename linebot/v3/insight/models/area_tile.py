@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional, Union
-from pydantic.v1 import BaseModel, Field, StrictFloat, StrictInt, StrictStr
+from typing import ClassVar, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
 
 class AreaTile(BaseModel):
     """
@@ -28,16 +28,20 @@ class AreaTile(BaseModel):
     area: Optional[StrictStr] = Field(None, description="users' country and region")
     percentage: Optional[Union[StrictFloat, StrictInt]] = Field(None, description="Percentage")
 
-    __properties = ["area", "percentage"]
+    __properties: ClassVar[List[str]] = ["area", "percentage"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class AreaTile(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class AreaTile(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AreaTile.parse_obj(obj)
+            return AreaTile.model_validate(obj)
 
-        _obj = AreaTile.parse_obj({
+        _obj = AreaTile.model_validate({
             "area": obj.get("area"),
             "percentage": obj.get("percentage")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, conlist
 from linebot.v3.insight.models.age_tile import AgeTile
 from linebot.v3.insight.models.app_type_tile import AppTypeTile
 from linebot.v3.insight.models.area_tile import AreaTile
@@ -38,16 +38,20 @@ class GetFriendsDemographicsResponse(BaseModel):
     app_types: Optional[conlist(AppTypeTile)] = Field(None, alias="appTypes", description="Percentage by OS.")
     subscription_periods: Optional[conlist(SubscriptionPeriodTile)] = Field(None, alias="subscriptionPeriods", description="Percentage per friendship duration.")
 
-    __properties = ["available", "genders", "ages", "areas", "appTypes", "subscriptionPeriods"]
+    __properties: ClassVar[List[str]] = ["available", "genders", "ages", "areas", "appTypes", "subscriptionPeriods"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -60,39 +64,39 @@ class GetFriendsDemographicsResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in genders (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in genders (list)
         _items = []
         if self.genders:
             for _item in self.genders:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['genders'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in ages (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in ages (list)
         _items = []
         if self.ages:
             for _item in self.ages:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['ages'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in areas (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in areas (list)
         _items = []
         if self.areas:
             for _item in self.areas:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['areas'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in app_types (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in app_types (list)
         _items = []
         if self.app_types:
             for _item in self.app_types:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['appTypes'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in subscription_periods (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in subscription_periods (list)
         _items = []
         if self.subscription_periods:
             for _item in self.subscription_periods:
@@ -108,9 +112,9 @@ class GetFriendsDemographicsResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetFriendsDemographicsResponse.parse_obj(obj)
+            return GetFriendsDemographicsResponse.model_validate(obj)
 
-        _obj = GetFriendsDemographicsResponse.parse_obj({
+        _obj = GetFriendsDemographicsResponse.model_validate({
             "available": obj.get("available"),
             "genders": [GenderTile.from_dict(_item) for _item in obj.get("genders")] if obj.get("genders") is not None else None,
             "ages": [AgeTile.from_dict(_item) for _item in obj.get("ages")] if obj.get("ages") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.insight.models.get_message_event_response_click import GetMessageEventResponseClick
 from linebot.v3.insight.models.get_message_event_response_message import GetMessageEventResponseMessage
 from linebot.v3.insight.models.get_message_event_response_overview import GetMessageEventResponseOverview
@@ -33,16 +33,20 @@ class GetMessageEventResponse(BaseModel):
     messages: Optional[conlist(GetMessageEventResponseMessage)] = Field(None, description="Array of information about individual message bubbles.")
     clicks: Optional[conlist(GetMessageEventResponseClick)] = Field(None, description="Array of information about opened URLs in the message.")
 
-    __properties = ["overview", "messages", "clicks"]
+    __properties: ClassVar[List[str]] = ["overview", "messages", "clicks"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,21 +59,21 @@ class GetMessageEventResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of overview
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of overview
         if self.overview:
             _dict['overview'] = self.overview.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in messages (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in messages (list)
         _items = []
         if self.messages:
             for _item in self.messages:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['messages'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in clicks (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in clicks (list)
         _items = []
         if self.clicks:
             for _item in self.clicks:
@@ -85,9 +89,9 @@ class GetMessageEventResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetMessageEventResponse.parse_obj(obj)
+            return GetMessageEventResponse.model_validate(obj)
 
-        _obj = GetMessageEventResponse.parse_obj({
+        _obj = GetMessageEventResponse.model_validate({
             "overview": GetMessageEventResponseOverview.from_dict(obj.get("overview")) if obj.get("overview") is not None else None,
             "messages": [GetMessageEventResponseMessage.from_dict(_item) for _item in obj.get("messages")] if obj.get("messages") is not None else None,
             "clicks": [GetMessageEventResponseClick.from_dict(_item) for _item in obj.get("clicks")] if obj.get("clicks") is not None else None
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt
 
 class GetMessageEventResponseMessage(BaseModel):
     """
@@ -38,16 +38,20 @@ class GetMessageEventResponseMessage(BaseModel):
     unique_media_played75_percent: Optional[StrictInt] = Field(None, alias="uniqueMediaPlayed75Percent", description="Number of users that started playing audio or video in the bubble and played 75% of the total time.")
     unique_media_played100_percent: Optional[StrictInt] = Field(None, alias="uniqueMediaPlayed100Percent", description="Number of users that started playing audio or video in the bubble and played 100% of the total time.")
 
-    __properties = ["seq", "impression", "mediaPlayed", "mediaPlayed25Percent", "mediaPlayed50Percent", "mediaPlayed75Percent", "mediaPlayed100Percent", "uniqueMediaPlayed", "uniqueMediaPlayed25Percent", "uniqueMediaPlayed50Percent", "uniqueMediaPlayed75Percent", "uniqueMediaPlayed100Percent"]
+    __properties: ClassVar[List[str]] = ["seq", "impression", "mediaPlayed", "mediaPlayed25Percent", "mediaPlayed50Percent", "mediaPlayed75Percent", "mediaPlayed100Percent", "uniqueMediaPlayed", "uniqueMediaPlayed25Percent", "uniqueMediaPlayed50Percent", "uniqueMediaPlayed75Percent", "uniqueMediaPlayed100Percent"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -60,63 +64,63 @@ class GetMessageEventResponseMessage(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         # set to None if impression (nullable) is None
-        # and __fields_set__ contains the field
-        if self.impression is None and "impression" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.impression is None and "impression" in self.model_fields_set:
             _dict['impression'] = None
 
         # set to None if media_played (nullable) is None
-        # and __fields_set__ contains the field
-        if self.media_played is None and "media_played" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.media_played is None and "media_played" in self.model_fields_set:
             _dict['mediaPlayed'] = None
 
         # set to None if media_played25_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.media_played25_percent is None and "media_played25_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.media_played25_percent is None and "media_played25_percent" in self.model_fields_set:
             _dict['mediaPlayed25Percent'] = None
 
         # set to None if media_played50_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.media_played50_percent is None and "media_played50_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.media_played50_percent is None and "media_played50_percent" in self.model_fields_set:
             _dict['mediaPlayed50Percent'] = None
 
         # set to None if media_played75_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.media_played75_percent is None and "media_played75_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.media_played75_percent is None and "media_played75_percent" in self.model_fields_set:
             _dict['mediaPlayed75Percent'] = None
 
         # set to None if media_played100_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.media_played100_percent is None and "media_played100_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.media_played100_percent is None and "media_played100_percent" in self.model_fields_set:
             _dict['mediaPlayed100Percent'] = None
 
         # set to None if unique_media_played (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played is None and "unique_media_played" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played is None and "unique_media_played" in self.model_fields_set:
             _dict['uniqueMediaPlayed'] = None
 
         # set to None if unique_media_played25_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played25_percent is None and "unique_media_played25_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played25_percent is None and "unique_media_played25_percent" in self.model_fields_set:
             _dict['uniqueMediaPlayed25Percent'] = None
 
         # set to None if unique_media_played50_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played50_percent is None and "unique_media_played50_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played50_percent is None and "unique_media_played50_percent" in self.model_fields_set:
             _dict['uniqueMediaPlayed50Percent'] = None
 
         # set to None if unique_media_played75_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played75_percent is None and "unique_media_played75_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played75_percent is None and "unique_media_played75_percent" in self.model_fields_set:
             _dict['uniqueMediaPlayed75Percent'] = None
 
         # set to None if unique_media_played100_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played100_percent is None and "unique_media_played100_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played100_percent is None and "unique_media_played100_percent" in self.model_fields_set:
             _dict['uniqueMediaPlayed100Percent'] = None
 
         return _dict
@@ -128,9 +132,9 @@ class GetMessageEventResponseMessage(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetMessageEventResponseMessage.parse_obj(obj)
+            return GetMessageEventResponseMessage.model_validate(obj)
 
-        _obj = GetMessageEventResponseMessage.parse_obj({
+        _obj = GetMessageEventResponseMessage.model_validate({
             "seq": obj.get("seq"),
             "impression": obj.get("impression"),
             "media_played": obj.get("mediaPlayed"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class GetMessageEventResponseOverview(BaseModel):
     """
@@ -33,16 +33,20 @@ class GetMessageEventResponseOverview(BaseModel):
     unique_media_played: Optional[StrictInt] = Field(None, alias="uniqueMediaPlayed", description="Number of users who started playing any video or audio in the message.")
     unique_media_played100_percent: Optional[StrictInt] = Field(None, alias="uniqueMediaPlayed100Percent", description="Number of users who played the entirety of any video or audio in the message.")
 
-    __properties = ["requestId", "timestamp", "delivered", "uniqueImpression", "uniqueClick", "uniqueMediaPlayed", "uniqueMediaPlayed100Percent"]
+    __properties: ClassVar[List[str]] = ["requestId", "timestamp", "delivered", "uniqueImpression", "uniqueClick", "uniqueMediaPlayed", "uniqueMediaPlayed100Percent"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,28 +59,28 @@ class GetMessageEventResponseOverview(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         # set to None if unique_impression (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_impression is None and "unique_impression" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_impression is None and "unique_impression" in self.model_fields_set:
             _dict['uniqueImpression'] = None
 
         # set to None if unique_click (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_click is None and "unique_click" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_click is None and "unique_click" in self.model_fields_set:
             _dict['uniqueClick'] = None
 
         # set to None if unique_media_played (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played is None and "unique_media_played" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played is None and "unique_media_played" in self.model_fields_set:
             _dict['uniqueMediaPlayed'] = None
 
         # set to None if unique_media_played100_percent (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_media_played100_percent is None and "unique_media_played100_percent" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_media_played100_percent is None and "unique_media_played100_percent" in self.model_fields_set:
             _dict['uniqueMediaPlayed100Percent'] = None
 
         return _dict
@@ -88,9 +92,9 @@ class GetMessageEventResponseOverview(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetMessageEventResponseOverview.parse_obj(obj)
+            return GetMessageEventResponseOverview.model_validate(obj)
 
-        _obj = GetMessageEventResponseOverview.parse_obj({
+        _obj = GetMessageEventResponseOverview.model_validate({
             "request_id": obj.get("requestId"),
             "timestamp": obj.get("timestamp"),
             "delivered": obj.get("delivered"),
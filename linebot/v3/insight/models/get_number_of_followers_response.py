@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, field_validator
 
 class GetNumberOfFollowersResponse(BaseModel):
     """
@@ -31,9 +31,9 @@ class GetNumberOfFollowersResponse(BaseModel):
     targeted_reaches: Optional[StrictInt] = Field(None, alias="targetedReaches", description="The number of users, as of the specified date, that the LINE Official Account can reach through targeted messages based on gender, age, and/or region. This number only includes users who are active on LINE or LINE services and whose demographics have a high level of certainty. ")
     blocks: Optional[StrictInt] = Field(None, description="The number of users blocking the account as of the specified date. The number decreases when a user unblocks the account.   ")
 
-    __properties = ["status", "followers", "targetedReaches", "blocks"]
+    __properties: ClassVar[List[str]] = ["status", "followers", "targetedReaches", "blocks"]
 
-    @validator('status')
+    @field_validator('status')
     def status_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -43,14 +43,18 @@ class GetNumberOfFollowersResponse(BaseModel):
             raise ValueError("must be one of enum values ('ready', 'unready', 'out_of_service')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -63,10 +67,10 @@ class GetNumberOfFollowersResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -76,9 +80,9 @@ class GetNumberOfFollowersResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetNumberOfFollowersResponse.parse_obj(obj)
+            return GetNumberOfFollowersResponse.model_validate(obj)
 
-        _obj = GetNumberOfFollowersResponse.parse_obj({
+        _obj = GetNumberOfFollowersResponse.model_validate({
             "status": obj.get("status"),
             "followers": obj.get("followers"),
             "targeted_reaches": obj.get("targetedReaches"),
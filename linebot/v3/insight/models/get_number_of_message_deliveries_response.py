@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, field_validator
 
 class GetNumberOfMessageDeliveriesResponse(BaseModel):
     """
@@ -38,9 +38,9 @@ class GetNumberOfMessageDeliveriesResponse(BaseModel):
     api_narrowcast: Optional[StrictInt] = Field(None, alias="apiNarrowcast", description="Number of narrowcast messages sent with the `Send narrowcast message` Messaging API operation.")
     api_reply: Optional[StrictInt] = Field(None, alias="apiReply", description="Number of replies sent with the `Send reply message` Messaging API operation.")
 
-    __properties = ["status", "broadcast", "targeting", "autoResponse", "welcomeResponse", "chat", "apiBroadcast", "apiPush", "apiMulticast", "apiNarrowcast", "apiReply"]
+    __properties: ClassVar[List[str]] = ["status", "broadcast", "targeting", "autoResponse", "welcomeResponse", "chat", "apiBroadcast", "apiPush", "apiMulticast", "apiNarrowcast", "apiReply"]
 
-    @validator('status')
+    @field_validator('status')
     def status_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -50,14 +50,18 @@ class GetNumberOfMessageDeliveriesResponse(BaseModel):
             raise ValueError("must be one of enum values ('ready', 'unready', 'out_of_service')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -70,10 +74,10 @@ class GetNumberOfMessageDeliveriesResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -83,9 +87,9 @@ class GetNumberOfMessageDeliveriesResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetNumberOfMessageDeliveriesResponse.parse_obj(obj)
+            return GetNumberOfMessageDeliveriesResponse.model_validate(obj)
 
-        _obj = GetNumberOfMessageDeliveriesResponse.parse_obj({
+        _obj = GetNumberOfMessageDeliveriesResponse.model_validate({
             "status": obj.get("status"),
             "broadcast": obj.get("broadcast"),
             "targeting": obj.get("targeting"),
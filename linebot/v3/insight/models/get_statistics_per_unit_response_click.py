@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class GetStatisticsPerUnitResponseClick(BaseModel):
     """
@@ -32,16 +32,20 @@ class GetStatisticsPerUnitResponseClick(BaseModel):
     unique_click: Optional[StrictInt] = Field(None, alias="uniqueClick", description="Number of users that opened the URL in the bubble.")
     unique_click_of_request: Optional[StrictInt] = Field(None, alias="uniqueClickOfRequest", description="Number of users who opened this url through any link in the message. If another message bubble contains the same URL and a user opens both links, it's counted only once. ")
 
-    __properties = ["seq", "url", "click", "uniqueClick", "uniqueClickOfRequest"]
+    __properties: ClassVar[List[str]] = ["seq", "url", "click", "uniqueClick", "uniqueClickOfRequest"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,23 +58,23 @@ class GetStatisticsPerUnitResponseClick(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         # set to None if click (nullable) is None
-        # and __fields_set__ contains the field
-        if self.click is None and "click" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.click is None and "click" in self.model_fields_set:
             _dict['click'] = None
 
         # set to None if unique_click (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_click is None and "unique_click" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_click is None and "unique_click" in self.model_fields_set:
             _dict['uniqueClick'] = None
 
         # set to None if unique_click_of_request (nullable) is None
-        # and __fields_set__ contains the field
-        if self.unique_click_of_request is None and "unique_click_of_request" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.unique_click_of_request is None and "unique_click_of_request" in self.model_fields_set:
             _dict['uniqueClickOfRequest'] = None
 
         return _dict
@@ -82,9 +86,9 @@ class GetStatisticsPerUnitResponseClick(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetStatisticsPerUnitResponseClick.parse_obj(obj)
+            return GetStatisticsPerUnitResponseClick.model_validate(obj)
 
-        _obj = GetStatisticsPerUnitResponseClick.parse_obj({
+        _obj = GetStatisticsPerUnitResponseClick.model_validate({
             "seq": obj.get("seq"),
             "url": obj.get("url"),
             "click": obj.get("click"),
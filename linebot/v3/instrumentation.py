@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.instrumentation module.
+
+Hooks into the requests made by the generated API clients.
+Set an :py:class:`Instrumentation` as ``instrumentation`` of the Configuration.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+
+PHASES = ('serialize', 'request', 'deserialize')
+
+
+class RequestRecord(object):
+    """Timings and sizes of one API request."""
+
+    __slots__ = ('method', 'path', 'status', 'request_id', 'request_size',
+                 'response_size', 'timings', 'error', 'extra', '_instrumentation', '_mark')
+
+    def __init__(self, instrumentation, method, path):
+        """__init__ method.
+
+        :param instrumentation: Instrumentation which receives the record
+        :type instrumentation: :py:class:`Instrumentation`
+        :param str method: HTTP method
+        :param str path: Endpoint template, e.g. ``/v2/bot/profile/{userId}``
+        """
+        self.method = method
+        self.path = path
+        #: HTTP status code, or None when no response was received
+        self.status = None
+        #: x-line-request-id header of the response
+        self.request_id = None
+        #: Bytes of the JSON request body, or None for other bodies
+        self.request_size = None
+        #: Bytes of the response body
+        self.response_size = None
+        #: Seconds spent in each phase, by phase name in :py:data:`PHASES`
+        self.timings = {}
+        #: Exception raised by the request, if any
+        self.error = None
+        #: State kept by instrumentations between start and finish
+        self.extra = {}
+        self._instrumentation = instrumentation
+        self._mark = time.perf_counter()
+
+    def _phase(self, phase):
+        now = time.perf_counter()
+        self.timings[phase] = now - self._mark
+        self._mark = now
+
+    def serialized(self, body):
+        """Record the end of the serialize phase.
+
+        :param body: Sanitized request body
+        """
+        if isinstance(body, (dict, list)):
+            self.request_size = len(json.dumps(body).encode('utf-8'))
+        elif isinstance(body, (bytes, bytearray, str)):
+            self.request_size = len(body)
+        self._phase('serialize')
+
+    def received(self, response):
+        """Record the end of the request phase, before the body is decoded.
+
+        :param response: REST response
+        """
+        self._phase('request')
+        self.status = response.status
+        self.request_id = response.getheader('x-line-request-id')
+        if isinstance(response.data, (bytes, bytearray)):
+            self.response_size = len(response.data)
+
+    def _finish(self):
+        instrumentation, self._instrumentation = self._instrumentation, None
+        if instrumentation is not None:
+            instrumentation.finish(self)
+
+    def failed(self, error):
+        """Record an exception raised in any phase, and finish the record.
+
+        The time since the last phase is recorded as the phase which failed.
+        Nothing is recorded once the record has finished.
+
+        :param Exception error: Exception
+        """
+        if self._instrumentation is None:
+            return
+        self._phase(next((phase for phase in PHASES if phase not in self.timings),
+                         PHASES[-1]))
+        self.error = error
+        self.status = getattr(error, 'status', None) or self.status
+        headers = getattr(error, 'headers', None)
+        if headers is not None:
+            self.request_id = headers.get('x-line-request-id')
+        self._finish()
+
+    def deserialized(self):
+        """Record the end of the deserialize phase, and finish the record."""
+        if self._instrumentation is None:
+            return
+        self._phase('deserialize')
+        self._finish()
+
+
+class Instrumentation(object):
+    """Base class of instrumentation hooks.
+
+    ApiClient and AsyncApiClient create a :py:class:`RequestRecord` with
+    :py:meth:`start` for every request and pass it to :py:meth:`finish` once
+    the request has completed or failed. Nothing is measured when no
+    instrumentation is set.
+
+    The instrumentation is shared, not copied, when the Configuration is
+    copied.
+    """
+
+    def start(self, method, path):
+        """Return the record of a new request.
+
+        :param str method: HTTP method
+        :param str path: Endpoint template, e.g. ``/v2/bot/profile/{userId}``
+        :rtype: :py:class:`RequestRecord`
+        """
+        record = RequestRecord(self, method, path)
+        self.started(record)
+        return record
+
+    def started(self, record):
+        """Handle a new request. Override this method if needed.
+
+        :param record: Record of the request
+        :type record: :py:class:`RequestRecord`
+        """
+
+    def finish(self, record):
+        """Handle a completed request. Override this method.
+
+        It is called on the thread or event loop which made the request,
+        so it should be quick and must not raise.
+
+        :param record: Record of the request
+        :type record: :py:class:`RequestRecord`
+        """
+
+
+class CompositeInstrumentation(Instrumentation):
+    """Passes the records to several instrumentations."""
+
+    def __init__(self, *instrumentations):
+        """__init__ method.
+
+        :param instrumentations: Instrumentations, called in this order
+        :type instrumentations: :py:class:`Instrumentation`
+        """
+        self.instrumentations = instrumentations
+
+    def started(self, record):
+        """Pass a new record to each instrumentation.
+
+        :param record: Record of the request
+        :type record: :py:class:`RequestRecord`
+        """
+        for instrumentation in self.instrumentations:
+            instrumentation.started(record)
+
+    def finish(self, record):
+        """Pass a completed record to each instrumentation.
+
+        :param record: Record of the request
+        :type record: :py:class:`RequestRecord`
+        """
+        for instrumentation in self.instrumentations:
+            instrumentation.finish(record)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Collects Prometheus-style metrics of the requests.
+
+    :py:meth:`render` returns them in the Prometheus text format, to be
+    served on the metrics endpoint of your application.
+    """
+
+    def __init__(self, prefix='linebot', buckets=(
+            0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)):
+        """__init__ method.
+
+        :param str prefix: Prefix of the metric names
+        :param buckets: Upper bounds in seconds of the duration histogram buckets
+        :type buckets: tuple[float]
+        """
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._bytes = {}
+        self._durations = {}
+
+    def finish(self, record):
+        """Count the request and add its timings to the histograms.
+
+        :param record: Record of the request
+        :type record: :py:class:`RequestRecord`
+        """
+        status = str(record.status) if record.status is not None else 'error'
+        with self._lock:
+            key = (record.method, record.path, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            for direction, size in (('request', record.request_size),
+                                    ('response', record.response_size)):
+                if size is not None:
+                    key = (record.method, record.path, direction)
+                    self._bytes[key] = self._bytes.get(key, 0) + size
+            for phase, seconds in record.timings.items():
+                key = (record.method, record.path, phase)
+                histogram = self._durations.get(key)
+                if histogram is None:
+                    # bucket counts, then sum and count
+                    histogram = self._durations[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+                histogram[bisect_left(self.buckets, seconds)] += 1
+                histogram[-2] += seconds
+                histogram[-1] += 1
+
+    def render(self):
+        """Return the metrics in the Prometheus text exposition format.
+
+        :rtype: str
+        """
+        name = self.prefix + '_requests_total'
+        lines = ['# HELP {} API requests by endpoint and status.'.format(name),
+                 '# TYPE {} counter'.format(name)]
+        with self._lock:
+            for (method, path, status), count in sorted(self._requests.items()):
+                lines.append('{}{{method="{}",path="{}",status="{}"}} {}'.format(
+                    name, method, path, status, count))
+
+            name = self.prefix + '_bytes_total'
+            lines += ['# HELP {} Bytes of the request and response bodies.'.format(name),
+                      '# TYPE {} counter'.format(name)]
+            for (method, path, direction), size in sorted(self._bytes.items()):
+                lines.append('{}{{method="{}",path="{}",direction="{}"}} {}'.format(
+                    name, method, path, direction, size))
+
+            name = self.prefix + '_request_duration_seconds'
+            lines += ['# HELP {} Seconds spent in each phase of API requests.'.format(name),
+                      '# TYPE {} histogram'.format(name)]
+            for (method, path, phase), histogram in sorted(self._durations.items()):
+                labels = 'method="{}",path="{}",phase="{}"'.format(method, path, phase)
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), histogram):
+                    cumulative += count
+                    lines.append('{}_bucket{{{},le="{}"}} {}'.format(
+                        name, labels, bound, cumulative))
+                lines.append('{}_sum{{{}}} {}'.format(name, labels, histogram[-2]))
+                lines.append('{}_count{{{}}} {}'.format(name, labels, histogram[-1]))
+        return '\n'.join(lines) + '\n'
@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictStr
+from pydantic import Field, StrictStr
 
 from linebot.v3.liff.models.add_liff_app_request import AddLiffAppRequest
 from linebot.v3.liff.models.add_liff_app_response import AddLiffAppResponse
@@ -66,7 +67,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_liff_app(add_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param add_liff_app_request: (required)
         :type add_liff_app_request: AddLiffAppRequest
@@ -78,7 +79,7 @@ class AsyncLiff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: AddLiffAppResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -97,7 +98,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_liff_app_with_http_info(add_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param add_liff_app_request: (required)
         :type add_liff_app_request: AddLiffAppRequest
@@ -122,7 +123,7 @@ class AsyncLiff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(AddLiffAppResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -226,7 +227,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_liff_app(liff_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -238,7 +239,7 @@ class AsyncLiff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -257,7 +258,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_liff_app_with_http_info(liff_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -282,7 +283,7 @@ class AsyncLiff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -371,7 +372,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_all_liff_apps(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -381,7 +382,7 @@ class AsyncLiff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetAllLiffAppsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -400,7 +401,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_all_liff_apps_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -423,7 +424,7 @@ class AsyncLiff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetAllLiffAppsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -516,7 +517,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_liff_app(liff_id, update_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -530,7 +531,7 @@ class AsyncLiff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -549,7 +550,7 @@ class AsyncLiff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_liff_app_with_http_info(liff_id, update_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -576,7 +577,7 @@ class AsyncLiff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
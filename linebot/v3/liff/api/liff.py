@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictStr
+from pydantic import Field, StrictStr
 
 from linebot.v3.liff.models.add_liff_app_request import AddLiffAppRequest
 from linebot.v3.liff.models.add_liff_app_response import AddLiffAppResponse
@@ -56,7 +57,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_liff_app(add_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param add_liff_app_request: (required)
         :type add_liff_app_request: AddLiffAppRequest
@@ -68,7 +69,7 @@ class Liff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: AddLiffAppResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -85,7 +86,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.add_liff_app_with_http_info(add_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param add_liff_app_request: (required)
         :type add_liff_app_request: AddLiffAppRequest
@@ -110,7 +111,7 @@ class Liff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(AddLiffAppResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -206,7 +207,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_liff_app(liff_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -218,7 +219,7 @@ class Liff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -235,7 +236,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_liff_app_with_http_info(liff_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -260,7 +261,7 @@ class Liff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -341,7 +342,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_all_liff_apps(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -351,7 +352,7 @@ class Liff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetAllLiffAppsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -368,7 +369,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_all_liff_apps_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -391,7 +392,7 @@ class Liff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetAllLiffAppsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -476,7 +477,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_liff_app(liff_id, update_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -490,7 +491,7 @@ class Liff(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -507,7 +508,7 @@ class Liff(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_liff_app_with_http_info(liff_id, update_liff_app_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param liff_id: ID of the LIFF app to be updated (required)
         :type liff_id: str
@@ -534,7 +535,7 @@ class Liff(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
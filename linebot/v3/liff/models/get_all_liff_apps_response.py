@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, conlist
 from linebot.v3.liff.models.liff_app import LiffApp
 
 class GetAllLiffAppsResponse(BaseModel):
@@ -28,16 +28,20 @@ class GetAllLiffAppsResponse(BaseModel):
     """
     apps: Optional[conlist(LiffApp)] = None
 
-    __properties = ["apps"]
+    __properties: ClassVar[List[str]] = ["apps"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,11 +54,11 @@ class GetAllLiffAppsResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in apps (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in apps (list)
         _items = []
         if self.apps:
             for _item in self.apps:
@@ -70,9 +74,9 @@ class GetAllLiffAppsResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetAllLiffAppsResponse.parse_obj(obj)
+            return GetAllLiffAppsResponse.model_validate(obj)
 
-        _obj = GetAllLiffAppsResponse.parse_obj({
+        _obj = GetAllLiffAppsResponse.model_validate({
             "apps": [LiffApp.from_dict(_item) for _item in obj.get("apps")] if obj.get("apps") is not None else None
         })
         return _obj
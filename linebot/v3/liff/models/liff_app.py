@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 from linebot.v3.liff.models.liff_bot_prompt import LiffBotPrompt
 from linebot.v3.liff.models.liff_features import LiffFeatures
 from linebot.v3.liff.models.liff_scope import LiffScope
@@ -37,16 +37,20 @@ class LiffApp(BaseModel):
     scope: Optional[conlist(LiffScope)] = None
     bot_prompt: Optional[LiffBotPrompt] = Field(None, alias="botPrompt")
 
-    __properties = ["liffId", "view", "description", "features", "permanentLinkPattern", "scope", "botPrompt"]
+    __properties: ClassVar[List[str]] = ["liffId", "view", "description", "features", "permanentLinkPattern", "scope", "botPrompt"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -59,14 +63,14 @@ class LiffApp(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of view
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of view
         if self.view:
             _dict['view'] = self.view.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of features
+        # override the default output from pydantic by calling `to_dict()` of features
         if self.features:
             _dict['features'] = self.features.to_dict()
         return _dict
@@ -78,9 +82,9 @@ class LiffApp(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return LiffApp.parse_obj(obj)
+            return LiffApp.model_validate(obj)
 
-        _obj = LiffApp.parse_obj({
+        _obj = LiffApp.model_validate({
             "liff_id": obj.get("liffId"),
             "view": LiffView.from_dict(obj.get("view")) if obj.get("view") is not None else None,
             "description": obj.get("description"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool
 
 class LiffFeatures(BaseModel):
     """
@@ -28,16 +28,20 @@ class LiffFeatures(BaseModel):
     ble: Optional[StrictBool] = Field(None, description="`true` if the LIFF app supports Bluetooth® Low Energy for LINE Things. `false` otherwise. ")
     qr_code: Optional[StrictBool] = Field(False, alias="qrCode", description="`true` to use the 2D code reader in the LIFF app. false otherwise. The default value is `false`. ")
 
-    __properties = ["ble", "qrCode"]
+    __properties: ClassVar[List[str]] = ["ble", "qrCode"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class LiffFeatures(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class LiffFeatures(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return LiffFeatures.parse_obj(obj)
+            return LiffFeatures.model_validate(obj)
 
-        _obj = LiffFeatures.parse_obj({
+        _obj = LiffFeatures.model_validate({
             "ble": obj.get("ble"),
             "qr_code": obj.get("qrCode") if obj.get("qrCode") is not None else False
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr, field_validator
 
 class LiffView(BaseModel):
     """
@@ -30,23 +30,27 @@ class LiffView(BaseModel):
     url: StrictStr = Field(..., description="Endpoint URL. This is the URL of the web app that implements the LIFF app (e.g. https://example.com). Used when the LIFF app is launched using the LIFF URL. The URL scheme must be https. URL fragments (#URL-fragment) can't be specified. ")
     module_mode: Optional[StrictBool] = Field(None, alias="moduleMode", description="`true` to use the LIFF app in modular mode. When in modular mode, the action button in the header is not displayed. ")
 
-    __properties = ["type", "url", "moduleMode"]
+    __properties: ClassVar[List[str]] = ["type", "url", "moduleMode"]
 
-    @validator('type')
+    @field_validator('type')
     def type_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('compact', 'tall', 'full'):
             raise ValueError("must be one of enum values ('compact', 'tall', 'full')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -59,10 +63,10 @@ class LiffView(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -72,9 +76,9 @@ class LiffView(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return LiffView.parse_obj(obj)
+            return LiffView.model_validate(obj)
 
-        _obj = LiffView.parse_obj({
+        _obj = LiffView.model_validate({
             "type": obj.get("type"),
             "url": obj.get("url"),
             "module_mode": obj.get("moduleMode")
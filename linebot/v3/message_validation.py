@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.message_validation module."""
+
+import hashlib
+import json
+import threading
+
+from linebot.v3.cache import LRUCache
+from linebot.v3.exceptions import InvalidMessageError
+from linebot.v3.messaging.exceptions import ApiException
+from linebot.v3.messaging.models.message import Message
+
+MAX_MESSAGES = 5
+
+# Limits of the Messaging API which are not part of its OpenAPI schema.
+MAX_TEXT_LENGTH = 5000
+MAX_FLEX_ALT_TEXT_LENGTH = 1500
+MAX_TEMPLATE_ALT_TEXT_LENGTH = 400
+MAX_BUBBLE_SIZE = 30 * 1024
+MAX_CAROUSEL_SIZE = 50 * 1024
+MAX_CAROUSEL_BUBBLES = 12
+MAX_BUTTONS_ACTIONS = 4
+MAX_BUTTONS_TEXT_LENGTH = 160
+CONFIRM_ACTIONS = 2
+MAX_CONFIRM_TEXT_LENGTH = 240
+MAX_CAROUSEL_COLUMNS = 10
+MAX_CAROUSEL_COLUMN_ACTIONS = 3
+MAX_CAROUSEL_COLUMN_TEXT_LENGTH = 120
+
+
+def _messages(request):
+    if isinstance(request, list):
+        messages = request
+    elif isinstance(request, dict):
+        messages = request.get('messages')
+    else:
+        messages = request.messages
+    if not isinstance(messages, list):
+        raise InvalidMessageError('messages must be a list')
+    return [message if isinstance(message, dict) else message.to_dict() for message in messages]
+
+
+def message_hash(request):
+    """Return the hash of the messages of a request.
+
+    The messages are serialized to JSON with sorted keys, so the hash does not
+    depend on the order in which the fields were set.
+
+    :param request: ValidateMessageRequest, its JSON dict or a list of messages
+    :rtype: str
+    """
+    encoded = json.dumps(_messages(request), sort_keys=True, separators=(',', ':'),
+                         ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _check_length(path, value, limit):
+    if value is not None and len(value) > limit:
+        raise InvalidMessageError(
+            '{}: must be at most {} characters, got {}'.format(path, limit, len(value)))
+
+
+def _check_count(path, values, limit):
+    if values is not None and len(values) > limit:
+        raise InvalidMessageError(
+            '{}: must have at most {} items, got {}'.format(path, limit, len(values)))
+
+
+def _check_flex(path, message):
+    _check_length(path + '.altText', message.get('altText'), MAX_FLEX_ALT_TEXT_LENGTH)
+    contents = message.get('contents') or {}
+    size = len(json.dumps(contents, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+    if contents.get('type') == 'carousel':
+        bubbles = contents.get('contents') or []
+        _check_count(path + '.contents.contents', bubbles, MAX_CAROUSEL_BUBBLES)
+        if size > MAX_CAROUSEL_SIZE:
+            raise InvalidMessageError('{}.contents: must be at most {} bytes, got {}'.format(
+                path, MAX_CAROUSEL_SIZE, size))
+    elif size > MAX_BUBBLE_SIZE:
+        raise InvalidMessageError('{}.contents: must be at most {} bytes, got {}'.format(
+            path, MAX_BUBBLE_SIZE, size))
+
+
+def _check_template(path, message):
+    _check_length(path + '.altText', message.get('altText'), MAX_TEMPLATE_ALT_TEXT_LENGTH)
+    template = message.get('template') or {}
+    path = path + '.template'
+    template_type = template.get('type')
+    if template_type == 'buttons':
+        _check_count(path + '.actions', template.get('actions'), MAX_BUTTONS_ACTIONS)
+        _check_length(path + '.text', template.get('text'), MAX_BUTTONS_TEXT_LENGTH)
+    elif template_type == 'confirm':
+        actions = template.get('actions') or []
+        if len(actions) != CONFIRM_ACTIONS:
+            raise InvalidMessageError('{}.actions: must have {} items, got {}'.format(
+                path, CONFIRM_ACTIONS, len(actions)))
+        _check_length(path + '.text', template.get('text'), MAX_CONFIRM_TEXT_LENGTH)
+    elif template_type in ('carousel', 'image_carousel'):
+        columns = template.get('columns') or []
+        _check_count(path + '.columns', columns, MAX_CAROUSEL_COLUMNS)
+        if template_type == 'carousel':
+            counts = set()
+            for i, column in enumerate(columns):
+                column_path = '{}.columns[{}]'.format(path, i)
+                actions = column.get('actions') or []
+                _check_count(column_path + '.actions', actions, MAX_CAROUSEL_COLUMN_ACTIONS)
+                _check_length(column_path + '.text', column.get('text'),
+                              MAX_CAROUSEL_COLUMN_TEXT_LENGTH)
+                counts.add(len(actions))
+            if len(counts) > 1:
+                raise InvalidMessageError(
+                    '{}.columns: every column must have the same number of actions'.format(path))
+
+
+def check_messages(messages):
+    """Validate message objects locally, without calling the API.
+
+    The messages are validated against the generated models, which follow
+    the OpenAPI schema, and against the size and count limits of the
+    Messaging API for text, Flex and template messages. A message which
+    passes may still be rejected by the API, e.g. for an invalid URL.
+
+    :param messages: ValidateMessageRequest, its JSON dict or a list of messages
+    :raises InvalidMessageError: If a message is invalid
+    """
+    messages = _messages(messages)
+    if not 1 <= len(messages) <= MAX_MESSAGES:
+        raise InvalidMessageError('messages: must have 1 to {} items, got {}'.format(
+            MAX_MESSAGES, len(messages)))
+
+    for i, message in enumerate(messages):
+        path = 'messages[{}]'.format(i)
+        try:
+            Message.from_dict(message)
+        except (ValueError, TypeError, KeyError) as e:
+            raise InvalidMessageError('{}: {}'.format(path, e))
+
+        message_type = message.get('type')
+        if message_type in ('text', 'textV2'):
+            _check_length(path + '.text', message.get('text'), MAX_TEXT_LENGTH)
+        elif message_type == 'flex':
+            _check_flex(path, message)
+        elif message_type == 'template':
+            _check_template(path, message)
+
+
+class _ValidationCacheBase(object):
+    def __init__(self, api, ttl=3600, max_size=1024, check_locally=True):
+        self.api = api
+        self.ttl = ttl
+        self.max_size = max_size
+        self.check_locally = check_locally
+        self._entries = LRUCache(max_size)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'local_errors': 0}
+
+    def _lookup(self, endpoint, request):
+        key = (endpoint, message_hash(request))
+        entry = self._entries.get(key)
+        with self._lock:
+            if entry is not None:
+                self._stats['hits'] += 1
+                return key, entry
+            self._stats['misses'] += 1
+
+        if self.check_locally:
+            try:
+                check_messages(request)
+            except InvalidMessageError:
+                with self._lock:
+                    self._stats['local_errors'] += 1
+                raise
+        return key, None
+
+    def _store(self, key, error):
+        if error is not None:
+            # keep the response, not the exception with its traceback
+            error = (type(error), error.status, error.reason, error.body, error.headers)
+        # wrapped, so that a cached success is not None
+        self._entries.set(key, (error,), self.ttl)
+
+    @staticmethod
+    def _rejected(entry):
+        cls, status, reason, body, headers = entry[0]
+        error = cls(status=status, reason=reason)
+        error.body = body
+        error.headers = headers
+        return error
+
+    @staticmethod
+    def _is_cacheable(error):
+        # a rejected message stays rejected; server errors may not
+        return error.status is not None and 400 <= error.status < 500 and error.status != 429
+
+    def clear(self):
+        """Remove all the cached results."""
+        self._entries.clear()
+
+    def stats(self):
+        """Return the number of cache hits, misses and evictions.
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['evictions'] = self._entries.evictions
+        stats['size'] = len(self._entries)
+        return stats
+
+
+def _sync_endpoint(endpoint):
+    def validate(self, validate_message_request, **kwargs):
+        key, entry = self._lookup(endpoint, validate_message_request)
+        if entry is None:
+            try:
+                getattr(self.api, endpoint)(validate_message_request, **kwargs)
+            except ApiException as e:
+                if self._is_cacheable(e):
+                    self._store(key, e)
+                raise
+            self._store(key, None)
+        elif entry[0] is not None:
+            raise self._rejected(entry)
+
+    validate.__name__ = endpoint
+    validate.__doc__ = """Call {} unless the messages were validated before.
+
+        :param validate_message_request: ValidateMessageRequest or its JSON dict
+        :raises InvalidMessageError: If a message is invalid locally
+        :raises ApiException: If the API rejects the messages, now or before
+        """.format(endpoint)
+    return validate
+
+
+def _async_endpoint(endpoint):
+    async def validate(self, validate_message_request, **kwargs):
+        key, entry = self._lookup(endpoint, validate_message_request)
+        if entry is None:
+            try:
+                await getattr(self.api, endpoint)(validate_message_request, **kwargs)
+            except ApiException as e:
+                if self._is_cacheable(e):
+                    self._store(key, e)
+                raise
+            self._store(key, None)
+        elif entry[0] is not None:
+            raise self._rejected(entry)
+
+    validate.__name__ = endpoint
+    validate.__doc__ = """Call {} unless the messages were validated before.
+
+        :param validate_message_request: ValidateMessageRequest or its JSON dict
+        :raises InvalidMessageError: If a message is invalid locally
+        :raises ApiException: If the API rejects the messages, now or before
+        """.format(endpoint)
+    return validate
+
+
+class ValidationCache(_ValidationCacheBase):
+    """Caches the results of the validate_* methods of MessagingApi.
+
+    The results are keyed by the endpoint and the hash of the messages, and
+    kept for ttl seconds, at most max_size of them. Messages which the API
+    rejected are cached too, and an ApiException of the same response is
+    raised again.
+    With check_locally, messages are checked with :py:func:`check_messages`
+    before calling the API.
+    """
+
+    def __init__(self, api, ttl=3600, max_size=1024, check_locally=True):
+        """__init__ method.
+
+        :param api: MessagingApi
+        :type api: :py:class:`linebot.v3.messaging.MessagingApi`
+        :param float ttl: Seconds for which a result is cached
+        :param int max_size: Maximum number of cached results
+        :param bool check_locally: Check messages locally before calling the API
+        """
+        super(ValidationCache, self).__init__(api, ttl, max_size, check_locally)
+
+    validate_push = _sync_endpoint('validate_push')
+    validate_reply = _sync_endpoint('validate_reply')
+    validate_multicast = _sync_endpoint('validate_multicast')
+    validate_narrowcast = _sync_endpoint('validate_narrowcast')
+    validate_broadcast = _sync_endpoint('validate_broadcast')
+
+
+class AsyncValidationCache(_ValidationCacheBase):
+    """Caches the results of the validate_* methods of AsyncMessagingApi.
+
+    Same as :py:class:`ValidationCache`, with coroutine methods.
+    """
+
+    def __init__(self, api, ttl=3600, max_size=1024, check_locally=True):
+        """__init__ method.
+
+        :param api: AsyncMessagingApi
+        :type api: :py:class:`linebot.v3.messaging.AsyncMessagingApi`
+        :param float ttl: Seconds for which a result is cached
+        :param int max_size: Maximum number of cached results
+        :param bool check_locally: Check messages locally before calling the API
+        """
+        super(AsyncValidationCache, self).__init__(api, ttl, max_size, check_locally)
+
+    validate_push = _async_endpoint('validate_push')
+    validate_reply = _async_endpoint('validate_reply')
+    validate_multicast = _async_endpoint('validate_multicast')
+    validate_narrowcast = _async_endpoint('validate_narrowcast')
+    validate_broadcast = _async_endpoint('validate_broadcast')
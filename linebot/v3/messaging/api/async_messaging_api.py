@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictInt, StrictStr, conint, constr, validator
+from pydantic import Field, StrictInt, StrictStr, conint, constr, field_validator
 
 from typing import Any, Dict, Optional
 
@@ -110,7 +111,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.broadcast(broadcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param broadcast_request: (required)
         :type broadcast_request: BroadcastRequest
@@ -124,7 +125,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -143,7 +144,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.broadcast_with_http_info(broadcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param broadcast_request: (required)
         :type broadcast_request: BroadcastRequest
@@ -170,7 +171,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -280,7 +281,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.cancel_default_rich_menu(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -290,7 +291,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -309,7 +310,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.cancel_default_rich_menu_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -332,7 +333,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -417,7 +418,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -429,7 +430,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuIdResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -448,7 +449,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu_with_http_info(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -473,7 +474,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuIdResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -575,7 +576,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu_alias(create_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_rich_menu_alias_request: (required)
         :type create_rich_menu_alias_request: CreateRichMenuAliasRequest
@@ -587,7 +588,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -606,7 +607,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu_alias_with_http_info(create_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param create_rich_menu_alias_request: (required)
         :type create_rich_menu_alias_request: CreateRichMenuAliasRequest
@@ -631,7 +632,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -731,7 +732,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -743,7 +744,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -762,7 +763,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -787,7 +788,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -876,7 +877,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu_alias(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_alias_id: Rich menu alias ID that you want to delete. (required)
         :type rich_menu_alias_id: str
@@ -888,7 +889,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -907,7 +908,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu_alias_with_http_info(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_alias_id: Rich menu alias ID that you want to delete. (required)
         :type rich_menu_alias_id: str
@@ -932,7 +933,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -1025,7 +1026,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_name_list(limit, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param limit: The maximum number of aggregation units you can get per request. 
         :type limit: str
@@ -1039,7 +1040,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetAggregationUnitNameListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1058,7 +1059,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_name_list_with_http_info(limit, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param limit: The maximum number of aggregation units you can get per request. 
         :type limit: str
@@ -1085,7 +1086,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetAggregationUnitNameListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1184,7 +1185,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_usage(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1194,7 +1195,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetAggregationUnitUsageResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1213,7 +1214,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_usage_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1236,7 +1237,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetAggregationUnitUsageResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1327,7 +1328,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_bot_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1337,7 +1338,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: BotInfoResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1356,7 +1357,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_bot_info_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1379,7 +1380,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(BotInfoResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1470,7 +1471,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_default_rich_menu_id(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1480,7 +1481,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuIdResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1499,7 +1500,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_default_rich_menu_id_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1522,7 +1523,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuIdResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1613,7 +1614,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_followers(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. Include this parameter to get the next array of user IDs. 
         :type start: str
@@ -1627,7 +1628,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetFollowersResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1646,7 +1647,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_followers_with_http_info(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. Include this parameter to get the next array of user IDs. 
         :type start: str
@@ -1673,7 +1674,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetFollowersResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1772,7 +1773,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_count(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1784,7 +1785,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GroupMemberCountResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1803,7 +1804,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_count_with_http_info(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1828,7 +1829,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GroupMemberCountResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1923,7 +1924,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_profile(group_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1937,7 +1938,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GroupUserProfileResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1956,7 +1957,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_profile_with_http_info(group_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1983,7 +1984,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GroupUserProfileResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2082,7 +2083,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_members_ids(group_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2096,7 +2097,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: MembersIdsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2115,7 +2116,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_members_ids_with_http_info(group_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2142,7 +2143,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(MembersIdsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2241,7 +2242,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_summary(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2253,7 +2254,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GroupSummaryResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2272,7 +2273,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_summary_with_http_info(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2297,7 +2298,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GroupSummaryResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2392,7 +2393,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_joined_membership_users(membership_id, start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param membership_id: Membership plan ID. (required)
         :type membership_id: int
@@ -2408,7 +2409,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetJoinedMembershipUsersResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2427,7 +2428,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_joined_membership_users_with_http_info(membership_id, start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param membership_id: Membership plan ID. (required)
         :type membership_id: int
@@ -2456,7 +2457,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetJoinedMembershipUsersResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2561,7 +2562,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_list(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2571,7 +2572,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: MembershipListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2590,7 +2591,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2613,7 +2614,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(MembershipListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2705,7 +2706,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_subscription(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -2717,7 +2718,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetMembershipSubscriptionResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2736,7 +2737,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_subscription_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -2761,7 +2762,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetMembershipSubscriptionResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2858,7 +2859,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2868,7 +2869,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: MessageQuotaResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2887,7 +2888,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2910,7 +2911,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(MessageQuotaResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3001,7 +3002,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota_consumption(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -3011,7 +3012,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: QuotaConsumptionResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3030,7 +3031,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota_consumption_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -3053,7 +3054,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(QuotaConsumptionResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3144,7 +3145,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_narrowcast_progress(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param request_id: The narrowcast message's request ID. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -3156,7 +3157,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: NarrowcastProgressResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3175,7 +3176,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_narrowcast_progress_with_http_info(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param request_id: The narrowcast message's request ID. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -3200,7 +3201,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(NarrowcastProgressResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3295,7 +3296,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_broadcast_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3307,7 +3308,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3326,7 +3327,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_broadcast_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3351,7 +3352,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3446,7 +3447,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_multicast_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3458,7 +3459,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3477,7 +3478,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_multicast_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3502,7 +3503,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3597,7 +3598,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_push_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3609,7 +3610,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3628,7 +3629,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_push_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3653,7 +3654,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3748,7 +3749,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_reply_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3760,7 +3761,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3779,7 +3780,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_reply_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3804,7 +3805,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3899,7 +3900,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_pnp_message_statistics(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the message was sent  Format: `yyyyMMdd` (Example:`20211231`) Time zone: UTC+9  (required)
         :type var_date: str
@@ -3911,7 +3912,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3930,7 +3931,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_pnp_message_statistics_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param var_date: Date the message was sent  Format: `yyyyMMdd` (Example:`20211231`) Time zone: UTC+9  (required)
         :type var_date: str
@@ -3955,7 +3956,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4050,7 +4051,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_profile(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -4062,7 +4063,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: UserProfileResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4081,7 +4082,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_profile_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -4106,7 +4107,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(UserProfileResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4201,7 +4202,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -4213,7 +4214,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4232,7 +4233,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -4257,7 +4258,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4352,7 +4353,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_alias_id: The rich menu alias ID whose information you want to obtain. (required)
         :type rich_menu_alias_id: str
@@ -4364,7 +4365,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuAliasResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4383,7 +4384,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias_with_http_info(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_alias_id: The rich menu alias ID whose information you want to obtain. (required)
         :type rich_menu_alias_id: str
@@ -4408,7 +4409,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuAliasResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4503,7 +4504,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias_list(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4513,7 +4514,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuAliasListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4532,7 +4533,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4555,7 +4556,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuAliasListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4646,7 +4647,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_batch_progress(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param request_id: A request ID used to batch control the rich menu linked to the user. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -4658,7 +4659,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuBatchProgressResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4677,7 +4678,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_batch_progress_with_http_info(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param request_id: A request ID used to batch control the rich menu linked to the user. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -4702,7 +4703,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuBatchProgressResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4797,7 +4798,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_id_of_user(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -4809,7 +4810,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuIdResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4828,7 +4829,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_id_of_user_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -4853,7 +4854,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuIdResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4948,7 +4949,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_list(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4958,7 +4959,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RichMenuListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4977,7 +4978,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -5000,7 +5001,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RichMenuListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5091,7 +5092,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_count(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5103,7 +5104,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RoomMemberCountResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5122,7 +5123,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_count_with_http_info(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5147,7 +5148,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RoomMemberCountResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5242,7 +5243,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_profile(room_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5256,7 +5257,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: RoomUserProfileResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5275,7 +5276,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_profile_with_http_info(room_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5302,7 +5303,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(RoomUserProfileResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5401,7 +5402,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_members_ids(room_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5415,7 +5416,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: MembersIdsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5434,7 +5435,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_members_ids_with_http_info(room_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5461,7 +5462,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(MembersIdsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5560,7 +5561,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_webhook_endpoint(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -5570,7 +5571,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetWebhookEndpointResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5589,7 +5590,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_webhook_endpoint_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -5612,7 +5613,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetWebhookEndpointResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5703,7 +5704,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_link_token(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID for the LINE account to be linked. Found in the `source` object of account link event objects. Do not use the LINE ID used in LINE.  (required)
         :type user_id: str
@@ -5715,7 +5716,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: IssueLinkTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5734,7 +5735,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_link_token_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID for the LINE account to be linked. Found in the `source` object of account link event objects. Do not use the LINE ID used in LINE.  (required)
         :type user_id: str
@@ -5759,7 +5760,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(IssueLinkTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5854,7 +5855,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_group(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -5866,7 +5867,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -5885,7 +5886,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_group_with_http_info(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -5910,7 +5911,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -6003,7 +6004,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_room(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -6015,7 +6016,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6034,7 +6035,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_room_with_http_info(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -6059,7 +6060,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -6148,7 +6149,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_user(user_id, rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -6162,7 +6163,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6181,7 +6182,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_user_with_http_info(user_id, rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -6208,7 +6209,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -6301,7 +6302,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_users(rich_menu_bulk_link_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_bulk_link_request: (required)
         :type rich_menu_bulk_link_request: RichMenuBulkLinkRequest
@@ -6313,7 +6314,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6332,7 +6333,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_users_with_http_info(rich_menu_bulk_link_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_bulk_link_request: (required)
         :type rich_menu_bulk_link_request: RichMenuBulkLinkRequest
@@ -6357,7 +6358,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -6453,7 +6454,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.mark_messages_as_read(mark_messages_as_read_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param mark_messages_as_read_request: (required)
         :type mark_messages_as_read_request: MarkMessagesAsReadRequest
@@ -6465,7 +6466,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6484,7 +6485,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.mark_messages_as_read_with_http_info(mark_messages_as_read_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param mark_messages_as_read_request: (required)
         :type mark_messages_as_read_request: MarkMessagesAsReadRequest
@@ -6509,7 +6510,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -6605,7 +6606,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.multicast(multicast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param multicast_request: (required)
         :type multicast_request: MulticastRequest
@@ -6619,7 +6620,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -6638,7 +6639,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.multicast_with_http_info(multicast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param multicast_request: (required)
         :type multicast_request: MulticastRequest
@@ -6665,7 +6666,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -6775,7 +6776,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.narrowcast(narrowcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param narrowcast_request: (required)
         :type narrowcast_request: NarrowcastRequest
@@ -6789,7 +6790,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -6808,7 +6809,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.narrowcast_with_http_info(narrowcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param narrowcast_request: (required)
         :type narrowcast_request: NarrowcastRequest
@@ -6835,7 +6836,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -6945,7 +6946,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_message(push_message_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param push_message_request: (required)
         :type push_message_request: PushMessageRequest
@@ -6959,7 +6960,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: PushMessageResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -6978,7 +6979,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_message_with_http_info(push_message_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param push_message_request: (required)
         :type push_message_request: PushMessageRequest
@@ -7005,7 +7006,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(PushMessageResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -7115,7 +7116,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_messages_by_phone(pnp_messages_request, x_line_delivery_tag, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param pnp_messages_request: (required)
         :type pnp_messages_request: PnpMessagesRequest
@@ -7129,7 +7130,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7148,7 +7149,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_messages_by_phone_with_http_info(pnp_messages_request, x_line_delivery_tag, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param pnp_messages_request: (required)
         :type pnp_messages_request: PnpMessagesRequest
@@ -7175,7 +7176,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -7279,7 +7280,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.reply_message(reply_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param reply_message_request: (required)
         :type reply_message_request: ReplyMessageRequest
@@ -7291,7 +7292,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: ReplyMessageResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -7310,7 +7311,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.reply_message_with_http_info(reply_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param reply_message_request: (required)
         :type reply_message_request: ReplyMessageRequest
@@ -7335,7 +7336,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(ReplyMessageResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -7439,7 +7440,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.rich_menu_batch(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -7451,7 +7452,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7470,7 +7471,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.rich_menu_batch_with_http_info(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -7495,7 +7496,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -7591,7 +7592,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_default_rich_menu(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -7603,7 +7604,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7622,7 +7623,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_default_rich_menu_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -7647,7 +7648,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -7736,7 +7737,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_webhook_endpoint(set_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param set_webhook_endpoint_request: (required)
         :type set_webhook_endpoint_request: SetWebhookEndpointRequest
@@ -7748,7 +7749,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7767,7 +7768,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_webhook_endpoint_with_http_info(set_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param set_webhook_endpoint_request: (required)
         :type set_webhook_endpoint_request: SetWebhookEndpointRequest
@@ -7792,7 +7793,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -7888,7 +7889,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.show_loading_animation(show_loading_animation_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param show_loading_animation_request: (required)
         :type show_loading_animation_request: ShowLoadingAnimationRequest
@@ -7900,7 +7901,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -7919,7 +7920,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.show_loading_animation_with_http_info(show_loading_animation_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param show_loading_animation_request: (required)
         :type show_loading_animation_request: ShowLoadingAnimationRequest
@@ -7944,7 +7945,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -8047,7 +8048,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.test_webhook_endpoint(test_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param test_webhook_endpoint_request:
         :type test_webhook_endpoint_request: TestWebhookEndpointRequest
@@ -8059,7 +8060,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: TestWebhookEndpointResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -8078,7 +8079,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.test_webhook_endpoint_with_http_info(test_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param test_webhook_endpoint_request:
         :type test_webhook_endpoint_request: TestWebhookEndpointRequest
@@ -8103,7 +8104,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(TestWebhookEndpointResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -8205,7 +8206,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_user(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -8217,7 +8218,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8236,7 +8237,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_user_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -8261,7 +8262,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -8350,7 +8351,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_users(rich_menu_bulk_unlink_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_bulk_unlink_request: (required)
         :type rich_menu_bulk_unlink_request: RichMenuBulkUnlinkRequest
@@ -8362,7 +8363,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8381,7 +8382,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_users_with_http_info(rich_menu_bulk_unlink_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_bulk_unlink_request: (required)
         :type rich_menu_bulk_unlink_request: RichMenuBulkUnlinkRequest
@@ -8406,7 +8407,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -8502,7 +8503,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_rich_menu_alias(rich_menu_alias_id, update_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_alias_id: The rich menu alias ID you want to update. (required)
         :type rich_menu_alias_id: str
@@ -8516,7 +8517,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8535,7 +8536,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_rich_menu_alias_with_http_info(rich_menu_alias_id, update_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_alias_id: The rich menu alias ID you want to update. (required)
         :type rich_menu_alias_id: str
@@ -8562,7 +8563,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -8666,7 +8667,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_broadcast(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8678,7 +8679,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8697,7 +8698,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_broadcast_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8722,7 +8723,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -8818,7 +8819,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_multicast(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8830,7 +8831,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8849,7 +8850,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_multicast_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8874,7 +8875,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -8970,7 +8971,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_narrowcast(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8982,7 +8983,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -9001,7 +9002,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_narrowcast_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -9026,7 +9027,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -9122,7 +9123,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_push(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -9134,7 +9135,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -9153,7 +9154,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_push_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -9178,7 +9179,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -9274,7 +9275,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_reply(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -9286,7 +9287,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -9305,7 +9306,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_reply_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -9330,7 +9331,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -9426,7 +9427,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_batch_request(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -9438,7 +9439,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -9457,7 +9458,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_batch_request_with_http_info(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -9482,7 +9483,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -9578,7 +9579,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_object(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -9590,7 +9591,7 @@ class AsyncMessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -9609,7 +9610,7 @@ class AsyncMessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_object_with_http_info(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -9634,7 +9635,7 @@ class AsyncMessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
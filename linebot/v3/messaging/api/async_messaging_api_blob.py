@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictBytes, StrictStr
+from pydantic import Field, StrictBytes, StrictStr
 
 from typing import Optional, Union
 
@@ -65,7 +66,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -77,7 +78,7 @@ class AsyncMessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: bytearray
         """
         kwargs['_return_http_data_only'] = True
@@ -96,7 +97,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_with_http_info(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -121,7 +122,7 @@ class AsyncMessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -227,7 +228,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_preview(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param message_id: Message ID of image or video (required)
         :type message_id: str
@@ -239,7 +240,7 @@ class AsyncMessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: bytearray
         """
         kwargs['_return_http_data_only'] = True
@@ -258,7 +259,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_preview_with_http_info(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param message_id: Message ID of image or video (required)
         :type message_id: str
@@ -283,7 +284,7 @@ class AsyncMessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -389,7 +390,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_transcoding_by_message_id(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -401,7 +402,7 @@ class AsyncMessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetMessageContentTranscodingResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -420,7 +421,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_transcoding_by_message_id_with_http_info(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -445,7 +446,7 @@ class AsyncMessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetMessageContentTranscodingResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -551,7 +552,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_image(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of the rich menu with the image to be downloaded (required)
         :type rich_menu_id: str
@@ -563,7 +564,7 @@ class AsyncMessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: bytearray
         """
         kwargs['_return_http_data_only'] = True
@@ -582,7 +583,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_image_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: ID of the rich menu with the image to be downloaded (required)
         :type rich_menu_id: str
@@ -607,7 +608,7 @@ class AsyncMessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -713,7 +714,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_rich_menu_image(rich_menu_id, body, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: The ID of the rich menu to attach the image to (required)
         :type rich_menu_id: str
@@ -727,7 +728,7 @@ class AsyncMessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -746,7 +747,7 @@ class AsyncMessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_rich_menu_image_with_http_info(rich_menu_id, body, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param rich_menu_id: The ID of the rich menu to attach the image to (required)
         :type rich_menu_id: str
@@ -773,7 +774,7 @@ class AsyncMessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictInt, StrictStr, conint, constr, validator
+from pydantic import Field, StrictInt, StrictStr, conint, constr, field_validator
 
 from typing import Any, Dict, Optional
 
@@ -100,7 +101,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.broadcast(broadcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param broadcast_request: (required)
         :type broadcast_request: BroadcastRequest
@@ -114,7 +115,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -131,7 +132,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.broadcast_with_http_info(broadcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param broadcast_request: (required)
         :type broadcast_request: BroadcastRequest
@@ -158,7 +159,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -260,7 +261,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.cancel_default_rich_menu(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -270,7 +271,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -287,7 +288,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.cancel_default_rich_menu_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -310,7 +311,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -387,7 +388,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -399,7 +400,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuIdResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -416,7 +417,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu_with_http_info(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -441,7 +442,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuIdResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -535,7 +536,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu_alias(create_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_rich_menu_alias_request: (required)
         :type create_rich_menu_alias_request: CreateRichMenuAliasRequest
@@ -547,7 +548,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -564,7 +565,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.create_rich_menu_alias_with_http_info(create_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param create_rich_menu_alias_request: (required)
         :type create_rich_menu_alias_request: CreateRichMenuAliasRequest
@@ -589,7 +590,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -681,7 +682,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -693,7 +694,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -710,7 +711,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -735,7 +736,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -816,7 +817,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu_alias(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_alias_id: Rich menu alias ID that you want to delete. (required)
         :type rich_menu_alias_id: str
@@ -828,7 +829,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -845,7 +846,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.delete_rich_menu_alias_with_http_info(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_alias_id: Rich menu alias ID that you want to delete. (required)
         :type rich_menu_alias_id: str
@@ -870,7 +871,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -955,7 +956,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_name_list(limit, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param limit: The maximum number of aggregation units you can get per request. 
         :type limit: str
@@ -969,7 +970,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetAggregationUnitNameListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -986,7 +987,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_name_list_with_http_info(limit, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param limit: The maximum number of aggregation units you can get per request. 
         :type limit: str
@@ -1013,7 +1014,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetAggregationUnitNameListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1104,7 +1105,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_usage(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1114,7 +1115,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetAggregationUnitUsageResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1131,7 +1132,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_aggregation_unit_usage_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1154,7 +1155,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetAggregationUnitUsageResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1237,7 +1238,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_bot_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1247,7 +1248,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: BotInfoResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1264,7 +1265,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_bot_info_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1287,7 +1288,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(BotInfoResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1370,7 +1371,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_default_rich_menu_id(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1380,7 +1381,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuIdResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1397,7 +1398,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_default_rich_menu_id_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -1420,7 +1421,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuIdResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1503,7 +1504,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_followers(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. Include this parameter to get the next array of user IDs. 
         :type start: str
@@ -1517,7 +1518,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetFollowersResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1534,7 +1535,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_followers_with_http_info(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. Include this parameter to get the next array of user IDs. 
         :type start: str
@@ -1561,7 +1562,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetFollowersResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1652,7 +1653,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_count(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1664,7 +1665,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GroupMemberCountResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1681,7 +1682,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_count_with_http_info(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1706,7 +1707,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GroupMemberCountResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1793,7 +1794,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_profile(group_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1807,7 +1808,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GroupUserProfileResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1824,7 +1825,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_member_profile_with_http_info(group_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1851,7 +1852,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GroupUserProfileResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1942,7 +1943,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_members_ids(group_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -1956,7 +1957,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: MembersIdsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1973,7 +1974,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_members_ids_with_http_info(group_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2000,7 +2001,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(MembersIdsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2091,7 +2092,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_summary(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2103,7 +2104,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GroupSummaryResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2120,7 +2121,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_group_summary_with_http_info(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -2145,7 +2146,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GroupSummaryResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2232,7 +2233,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_joined_membership_users(membership_id, start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param membership_id: Membership plan ID. (required)
         :type membership_id: int
@@ -2248,7 +2249,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetJoinedMembershipUsersResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2265,7 +2266,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_joined_membership_users_with_http_info(membership_id, start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param membership_id: Membership plan ID. (required)
         :type membership_id: int
@@ -2294,7 +2295,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetJoinedMembershipUsersResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2391,7 +2392,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_list(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2401,7 +2402,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: MembershipListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2418,7 +2419,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2441,7 +2442,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(MembershipListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2525,7 +2526,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_subscription(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -2537,7 +2538,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetMembershipSubscriptionResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2554,7 +2555,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_membership_subscription_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -2579,7 +2580,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetMembershipSubscriptionResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2668,7 +2669,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2678,7 +2679,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: MessageQuotaResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2695,7 +2696,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2718,7 +2719,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(MessageQuotaResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2801,7 +2802,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota_consumption(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2811,7 +2812,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: QuotaConsumptionResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2828,7 +2829,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_quota_consumption_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -2851,7 +2852,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(QuotaConsumptionResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -2934,7 +2935,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_narrowcast_progress(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param request_id: The narrowcast message's request ID. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -2946,7 +2947,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: NarrowcastProgressResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -2963,7 +2964,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_narrowcast_progress_with_http_info(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param request_id: The narrowcast message's request ID. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -2988,7 +2989,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(NarrowcastProgressResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3075,7 +3076,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_broadcast_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3087,7 +3088,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3104,7 +3105,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_broadcast_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: yyyyMMdd (e.g. 20191231) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3129,7 +3130,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3216,7 +3217,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_multicast_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3228,7 +3229,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3245,7 +3246,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_multicast_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3270,7 +3271,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3357,7 +3358,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_push_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3369,7 +3370,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3386,7 +3387,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_push_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3411,7 +3412,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3498,7 +3499,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_reply_messages(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3510,7 +3511,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3527,7 +3528,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_number_of_sent_reply_messages_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the messages were sent  Format: `yyyyMMdd` (e.g. `20191231`) Timezone: UTC+9  (required)
         :type var_date: str
@@ -3552,7 +3553,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3639,7 +3640,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_pnp_message_statistics(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the message was sent  Format: `yyyyMMdd` (Example:`20211231`) Time zone: UTC+9  (required)
         :type var_date: str
@@ -3651,7 +3652,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: NumberOfMessagesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3668,7 +3669,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_pnp_message_statistics_with_http_info(var_date, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param var_date: Date the message was sent  Format: `yyyyMMdd` (Example:`20211231`) Time zone: UTC+9  (required)
         :type var_date: str
@@ -3693,7 +3694,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(NumberOfMessagesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3780,7 +3781,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_profile(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -3792,7 +3793,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: UserProfileResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3809,7 +3810,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_profile_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID (required)
         :type user_id: str
@@ -3834,7 +3835,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(UserProfileResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -3921,7 +3922,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -3933,7 +3934,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -3950,7 +3951,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -3975,7 +3976,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4062,7 +4063,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_alias_id: The rich menu alias ID whose information you want to obtain. (required)
         :type rich_menu_alias_id: str
@@ -4074,7 +4075,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuAliasResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4091,7 +4092,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias_with_http_info(rich_menu_alias_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_alias_id: The rich menu alias ID whose information you want to obtain. (required)
         :type rich_menu_alias_id: str
@@ -4116,7 +4117,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuAliasResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4203,7 +4204,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias_list(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4213,7 +4214,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuAliasListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4230,7 +4231,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_alias_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4253,7 +4254,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuAliasListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4336,7 +4337,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_batch_progress(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param request_id: A request ID used to batch control the rich menu linked to the user. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -4348,7 +4349,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuBatchProgressResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4365,7 +4366,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_batch_progress_with_http_info(request_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param request_id: A request ID used to batch control the rich menu linked to the user. Each Messaging API request has a request ID. (required)
         :type request_id: str
@@ -4390,7 +4391,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuBatchProgressResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4477,7 +4478,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_id_of_user(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -4489,7 +4490,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuIdResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4506,7 +4507,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_id_of_user_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -4531,7 +4532,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuIdResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4618,7 +4619,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_list(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4628,7 +4629,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RichMenuListResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4645,7 +4646,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -4668,7 +4669,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RichMenuListResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4751,7 +4752,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_count(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -4763,7 +4764,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RoomMemberCountResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4780,7 +4781,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_count_with_http_info(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -4805,7 +4806,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RoomMemberCountResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -4892,7 +4893,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_profile(room_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -4906,7 +4907,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: RoomUserProfileResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -4923,7 +4924,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_member_profile_with_http_info(room_id, user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -4950,7 +4951,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(RoomUserProfileResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5041,7 +5042,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_members_ids(room_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5055,7 +5056,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: MembersIdsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5072,7 +5073,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_room_members_ids_with_http_info(room_id, start, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5099,7 +5100,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(MembersIdsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5190,7 +5191,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_webhook_endpoint(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -5200,7 +5201,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetWebhookEndpointResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5217,7 +5218,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_webhook_endpoint_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
@@ -5240,7 +5241,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetWebhookEndpointResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5323,7 +5324,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_link_token(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID for the LINE account to be linked. Found in the `source` object of account link event objects. Do not use the LINE ID used in LINE.  (required)
         :type user_id: str
@@ -5335,7 +5336,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: IssueLinkTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -5352,7 +5353,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_link_token_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID for the LINE account to be linked. Found in the `source` object of account link event objects. Do not use the LINE ID used in LINE.  (required)
         :type user_id: str
@@ -5377,7 +5378,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(IssueLinkTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -5464,7 +5465,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_group(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -5476,7 +5477,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -5493,7 +5494,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_group_with_http_info(group_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param group_id: Group ID (required)
         :type group_id: str
@@ -5518,7 +5519,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -5603,7 +5604,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_room(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5615,7 +5616,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -5632,7 +5633,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.leave_room_with_http_info(room_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param room_id: Room ID (required)
         :type room_id: str
@@ -5657,7 +5658,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -5738,7 +5739,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_user(user_id, rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -5752,7 +5753,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -5769,7 +5770,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_user_with_http_info(user_id, rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -5796,7 +5797,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -5881,7 +5882,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_users(rich_menu_bulk_link_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_bulk_link_request: (required)
         :type rich_menu_bulk_link_request: RichMenuBulkLinkRequest
@@ -5893,7 +5894,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -5910,7 +5911,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.link_rich_menu_id_to_users_with_http_info(rich_menu_bulk_link_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_bulk_link_request: (required)
         :type rich_menu_bulk_link_request: RichMenuBulkLinkRequest
@@ -5935,7 +5936,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -6023,7 +6024,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.mark_messages_as_read(mark_messages_as_read_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param mark_messages_as_read_request: (required)
         :type mark_messages_as_read_request: MarkMessagesAsReadRequest
@@ -6035,7 +6036,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6052,7 +6053,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.mark_messages_as_read_with_http_info(mark_messages_as_read_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param mark_messages_as_read_request: (required)
         :type mark_messages_as_read_request: MarkMessagesAsReadRequest
@@ -6077,7 +6078,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -6165,7 +6166,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.multicast(multicast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param multicast_request: (required)
         :type multicast_request: MulticastRequest
@@ -6179,7 +6180,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -6196,7 +6197,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.multicast_with_http_info(multicast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param multicast_request: (required)
         :type multicast_request: MulticastRequest
@@ -6223,7 +6224,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -6325,7 +6326,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.narrowcast(narrowcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param narrowcast_request: (required)
         :type narrowcast_request: NarrowcastRequest
@@ -6339,7 +6340,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -6356,7 +6357,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.narrowcast_with_http_info(narrowcast_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param narrowcast_request: (required)
         :type narrowcast_request: NarrowcastRequest
@@ -6383,7 +6384,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -6485,7 +6486,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_message(push_message_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param push_message_request: (required)
         :type push_message_request: PushMessageRequest
@@ -6499,7 +6500,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: PushMessageResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -6516,7 +6517,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_message_with_http_info(push_message_request, x_line_retry_key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param push_message_request: (required)
         :type push_message_request: PushMessageRequest
@@ -6543,7 +6544,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(PushMessageResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -6645,7 +6646,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_messages_by_phone(pnp_messages_request, x_line_delivery_tag, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param pnp_messages_request: (required)
         :type pnp_messages_request: PnpMessagesRequest
@@ -6659,7 +6660,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6676,7 +6677,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.push_messages_by_phone_with_http_info(pnp_messages_request, x_line_delivery_tag, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param pnp_messages_request: (required)
         :type pnp_messages_request: PnpMessagesRequest
@@ -6703,7 +6704,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -6799,7 +6800,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.reply_message(reply_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param reply_message_request: (required)
         :type reply_message_request: ReplyMessageRequest
@@ -6811,7 +6812,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: ReplyMessageResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -6828,7 +6829,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.reply_message_with_http_info(reply_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param reply_message_request: (required)
         :type reply_message_request: ReplyMessageRequest
@@ -6853,7 +6854,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(ReplyMessageResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -6949,7 +6950,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.rich_menu_batch(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -6961,7 +6962,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -6978,7 +6979,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.rich_menu_batch_with_http_info(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -7003,7 +7004,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -7091,7 +7092,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_default_rich_menu(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -7103,7 +7104,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7120,7 +7121,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_default_rich_menu_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of a rich menu (required)
         :type rich_menu_id: str
@@ -7145,7 +7146,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -7226,7 +7227,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_webhook_endpoint(set_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param set_webhook_endpoint_request: (required)
         :type set_webhook_endpoint_request: SetWebhookEndpointRequest
@@ -7238,7 +7239,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7255,7 +7256,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_webhook_endpoint_with_http_info(set_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param set_webhook_endpoint_request: (required)
         :type set_webhook_endpoint_request: SetWebhookEndpointRequest
@@ -7280,7 +7281,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -7368,7 +7369,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.show_loading_animation(show_loading_animation_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param show_loading_animation_request: (required)
         :type show_loading_animation_request: ShowLoadingAnimationRequest
@@ -7380,7 +7381,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: object
         """
         kwargs['_return_http_data_only'] = True
@@ -7397,7 +7398,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.show_loading_animation_with_http_info(show_loading_animation_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param show_loading_animation_request: (required)
         :type show_loading_animation_request: ShowLoadingAnimationRequest
@@ -7422,7 +7423,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(object, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -7517,7 +7518,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.test_webhook_endpoint(test_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param test_webhook_endpoint_request:
         :type test_webhook_endpoint_request: TestWebhookEndpointRequest
@@ -7529,7 +7530,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: TestWebhookEndpointResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -7546,7 +7547,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.test_webhook_endpoint_with_http_info(test_webhook_endpoint_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param test_webhook_endpoint_request:
         :type test_webhook_endpoint_request: TestWebhookEndpointRequest
@@ -7571,7 +7572,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(TestWebhookEndpointResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -7665,7 +7666,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_user(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -7677,7 +7678,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7694,7 +7695,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_user_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param user_id: User ID. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE. (required)
         :type user_id: str
@@ -7719,7 +7720,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -7800,7 +7801,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_users(rich_menu_bulk_unlink_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_bulk_unlink_request: (required)
         :type rich_menu_bulk_unlink_request: RichMenuBulkUnlinkRequest
@@ -7812,7 +7813,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7829,7 +7830,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.unlink_rich_menu_id_from_users_with_http_info(rich_menu_bulk_unlink_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_bulk_unlink_request: (required)
         :type rich_menu_bulk_unlink_request: RichMenuBulkUnlinkRequest
@@ -7854,7 +7855,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -7942,7 +7943,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_rich_menu_alias(rich_menu_alias_id, update_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_alias_id: The rich menu alias ID you want to update. (required)
         :type rich_menu_alias_id: str
@@ -7956,7 +7957,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -7973,7 +7974,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.update_rich_menu_alias_with_http_info(rich_menu_alias_id, update_rich_menu_alias_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_alias_id: The rich menu alias ID you want to update. (required)
         :type rich_menu_alias_id: str
@@ -8000,7 +8001,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8096,7 +8097,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_broadcast(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8108,7 +8109,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8125,7 +8126,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_broadcast_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8150,7 +8151,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8238,7 +8239,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_multicast(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8250,7 +8251,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8267,7 +8268,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_multicast_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8292,7 +8293,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8380,7 +8381,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_narrowcast(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8392,7 +8393,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8409,7 +8410,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_narrowcast_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8434,7 +8435,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8522,7 +8523,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_push(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8534,7 +8535,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8551,7 +8552,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_push_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8576,7 +8577,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8664,7 +8665,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_reply(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8676,7 +8677,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8693,7 +8694,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_reply_with_http_info(validate_message_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param validate_message_request: (required)
         :type validate_message_request: ValidateMessageRequest
@@ -8718,7 +8719,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8806,7 +8807,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_batch_request(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -8818,7 +8819,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8835,7 +8836,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_batch_request_with_http_info(rich_menu_batch_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_batch_request: (required)
         :type rich_menu_batch_request: RichMenuBatchRequest
@@ -8860,7 +8861,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -8948,7 +8949,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_object(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -8960,7 +8961,7 @@ class MessagingApi(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -8977,7 +8978,7 @@ class MessagingApi(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.validate_rich_menu_object_with_http_info(rich_menu_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_request: (required)
         :type rich_menu_request: RichMenuRequest
@@ -9002,7 +9003,7 @@ class MessagingApi(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
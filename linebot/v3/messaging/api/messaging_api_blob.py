@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictBytes, StrictStr
+from pydantic import Field, StrictBytes, StrictStr
 
 from typing import Optional, Union
 
@@ -55,7 +56,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -67,7 +68,7 @@ class MessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: bytearray
         """
         kwargs['_return_http_data_only'] = True
@@ -84,7 +85,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_with_http_info(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -109,7 +110,7 @@ class MessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -207,7 +208,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_preview(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param message_id: Message ID of image or video (required)
         :type message_id: str
@@ -219,7 +220,7 @@ class MessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: bytearray
         """
         kwargs['_return_http_data_only'] = True
@@ -236,7 +237,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_preview_with_http_info(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param message_id: Message ID of image or video (required)
         :type message_id: str
@@ -261,7 +262,7 @@ class MessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -359,7 +360,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_transcoding_by_message_id(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -371,7 +372,7 @@ class MessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetMessageContentTranscodingResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -388,7 +389,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_message_content_transcoding_by_message_id_with_http_info(message_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param message_id: Message ID of video or audio (required)
         :type message_id: str
@@ -413,7 +414,7 @@ class MessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetMessageContentTranscodingResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -511,7 +512,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_image(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of the rich menu with the image to be downloaded (required)
         :type rich_menu_id: str
@@ -523,7 +524,7 @@ class MessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: bytearray
         """
         kwargs['_return_http_data_only'] = True
@@ -540,7 +541,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_rich_menu_image_with_http_info(rich_menu_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: ID of the rich menu with the image to be downloaded (required)
         :type rich_menu_id: str
@@ -565,7 +566,7 @@ class MessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -663,7 +664,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_rich_menu_image(rich_menu_id, body, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: The ID of the rich menu to attach the image to (required)
         :type rich_menu_id: str
@@ -677,7 +678,7 @@ class MessagingApiBlob(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -694,7 +695,7 @@ class MessagingApiBlob(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.set_rich_menu_image_with_http_info(rich_menu_id, body, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param rich_menu_id: The ID of the rich menu to attach the image to (required)
         :type rich_menu_id: str
@@ -721,7 +722,7 @@ class MessagingApiBlob(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict
 from linebot.v3.messaging.models.age_demographic import AgeDemographic
 from linebot.v3.messaging.models.demographic_filter import DemographicFilter
 
@@ -31,16 +31,20 @@ class AgeDemographicFilter(DemographicFilter):
     lt: Optional[AgeDemographic] = None
     type: str = "age"
 
-    __properties = ["type", "gte", "lt"]
+    __properties: ClassVar[List[str]] = ["type", "gte", "lt"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,10 +57,10 @@ class AgeDemographicFilter(DemographicFilter):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -66,9 +70,9 @@ class AgeDemographicFilter(DemographicFilter):
             return None
 
         if not isinstance(obj, dict):
-            return AgeDemographicFilter.parse_obj(obj)
+            return AgeDemographicFilter.model_validate(obj)
 
-        _obj = AgeDemographicFilter.parse_obj({
+        _obj = AgeDemographicFilter.model_validate({
             "type": obj.get("type"),
             "gte": obj.get("gte"),
             "lt": obj.get("lt")
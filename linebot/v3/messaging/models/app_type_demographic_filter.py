@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, conlist
 from linebot.v3.messaging.models.app_type_demographic import AppTypeDemographic
 from linebot.v3.messaging.models.demographic_filter import DemographicFilter
 
@@ -30,16 +30,20 @@ class AppTypeDemographicFilter(DemographicFilter):
     one_of: Optional[conlist(AppTypeDemographic)] = Field(None, alias="oneOf")
     type: str = "appType"
 
-    __properties = ["type", "oneOf"]
+    __properties: ClassVar[List[str]] = ["type", "oneOf"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class AppTypeDemographicFilter(DemographicFilter):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class AppTypeDemographicFilter(DemographicFilter):
             return None
 
         if not isinstance(obj, dict):
-            return AppTypeDemographicFilter.parse_obj(obj)
+            return AppTypeDemographicFilter.model_validate(obj)
 
-        _obj = AppTypeDemographicFilter.parse_obj({
+        _obj = AppTypeDemographicFilter.model_validate({
             "type": obj.get("type"),
             "one_of": obj.get("oneOf")
         })
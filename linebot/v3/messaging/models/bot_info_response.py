@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
 class BotInfoResponse(BaseModel):
     """
@@ -34,30 +34,34 @@ class BotInfoResponse(BaseModel):
     chat_mode: StrictStr = Field(..., alias="chatMode", description="Chat settings set in the LINE Official Account Manager. One of:  `chat`: Chat is set to \"On\". `bot`: Chat is set to \"Off\". ")
     mark_as_read_mode: StrictStr = Field(..., alias="markAsReadMode", description="Automatic read setting for messages. If the chat is set to \"Off\", auto is returned. If the chat is set to \"On\", manual is returned.  `auto`: Auto read setting is enabled. `manual`: Auto read setting is disabled.  ")
 
-    __properties = ["userId", "basicId", "premiumId", "displayName", "pictureUrl", "chatMode", "markAsReadMode"]
+    __properties: ClassVar[List[str]] = ["userId", "basicId", "premiumId", "displayName", "pictureUrl", "chatMode", "markAsReadMode"]
 
-    @validator('chat_mode')
+    @field_validator('chat_mode')
     def chat_mode_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('chat', 'bot'):
             raise ValueError("must be one of enum values ('chat', 'bot')")
         return value
 
-    @validator('mark_as_read_mode')
+    @field_validator('mark_as_read_mode')
     def mark_as_read_mode_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('auto', 'manual'):
             raise ValueError("must be one of enum values ('auto', 'manual')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -70,10 +74,10 @@ class BotInfoResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -83,9 +87,9 @@ class BotInfoResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return BotInfoResponse.parse_obj(obj)
+            return BotInfoResponse.model_validate(obj)
 
-        _obj = BotInfoResponse.parse_obj({
+        _obj = BotInfoResponse.model_validate({
             "user_id": obj.get("userId"),
             "basic_id": obj.get("basicId"),
             "premium_id": obj.get("premiumId"),
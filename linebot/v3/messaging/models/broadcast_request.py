@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictBool, conlist
 from linebot.v3.messaging.models.message import Message
 
 class BroadcastRequest(BaseModel):
@@ -27,19 +27,23 @@ class BroadcastRequest(BaseModel):
     BroadcastRequest
     https://developers.line.biz/en/reference/messaging-api/#send-broadcast-message
     """
-    messages: conlist(Message, max_items=5, min_items=1) = Field(..., description="List of Message objects.")
+    messages: conlist(SerializeAsAny[Message], max_length=5, min_length=1) = Field(..., description="List of Message objects.")
     notification_disabled: Optional[StrictBool] = Field(False, alias="notificationDisabled", description="`true`: The user doesn’t receive a push notification when a message is sent. `false`: The user receives a push notification when the message is sent (unless they have disabled push notifications in LINE and/or their device). The default value is false. ")
 
-    __properties = ["messages", "notificationDisabled"]
+    __properties: ClassVar[List[str]] = ["messages", "notificationDisabled"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,11 +56,11 @@ class BroadcastRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in messages (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in messages (list)
         _items = []
         if self.messages:
             for _item in self.messages:
@@ -72,9 +76,9 @@ class BroadcastRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return BroadcastRequest.parse_obj(obj)
+            return BroadcastRequest.model_validate(obj)
 
-        _obj = BroadcastRequest.parse_obj({
+        _obj = BroadcastRequest.model_validate({
             "messages": [Message.from_dict(_item) for _item in obj.get("messages")] if obj.get("messages") is not None else None,
             "notification_disabled": obj.get("notificationDisabled") if obj.get("notificationDisabled") is not None else False
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictStr, conlist
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.template import Template
 
@@ -33,20 +33,24 @@ class ButtonsTemplate(Template):
     image_background_color: Optional[StrictStr] = Field(None, alias="imageBackgroundColor")
     title: Optional[StrictStr] = None
     text: StrictStr = Field(...)
-    default_action: Optional[Action] = Field(None, alias="defaultAction")
-    actions: conlist(Action) = Field(...)
+    default_action: Optional[SerializeAsAny[Action]] = Field(None, alias="defaultAction")
+    actions: conlist(SerializeAsAny[Action]) = Field(...)
     type: str = "buttons"
 
-    __properties = ["type", "thumbnailImageUrl", "imageAspectRatio", "imageSize", "imageBackgroundColor", "title", "text", "defaultAction", "actions"]
+    __properties: ClassVar[List[str]] = ["type", "thumbnailImageUrl", "imageAspectRatio", "imageSize", "imageBackgroundColor", "title", "text", "defaultAction", "actions"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -59,14 +63,14 @@ class ButtonsTemplate(Template):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of default_action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of default_action
         if self.default_action:
             _dict['defaultAction'] = self.default_action.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in actions (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in actions (list)
         _items = []
         if self.actions:
             for _item in self.actions:
@@ -82,9 +86,9 @@ class ButtonsTemplate(Template):
             return None
 
         if not isinstance(obj, dict):
-            return ButtonsTemplate.parse_obj(obj)
+            return ButtonsTemplate.model_validate(obj)
 
-        _obj = ButtonsTemplate.parse_obj({
+        _obj = ButtonsTemplate.model_validate({
             "type": obj.get("type"),
             "thumbnail_image_url": obj.get("thumbnailImageUrl"),
             "image_aspect_ratio": obj.get("imageAspectRatio"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictStr, conlist
 from linebot.v3.messaging.models.action import Action
 
 class CarouselColumn(BaseModel):
@@ -30,19 +30,23 @@ class CarouselColumn(BaseModel):
     image_background_color: Optional[StrictStr] = Field(None, alias="imageBackgroundColor")
     title: Optional[StrictStr] = None
     text: StrictStr = Field(...)
-    default_action: Optional[Action] = Field(None, alias="defaultAction")
-    actions: conlist(Action) = Field(...)
+    default_action: Optional[SerializeAsAny[Action]] = Field(None, alias="defaultAction")
+    actions: conlist(SerializeAsAny[Action]) = Field(...)
 
-    __properties = ["thumbnailImageUrl", "imageBackgroundColor", "title", "text", "defaultAction", "actions"]
+    __properties: ClassVar[List[str]] = ["thumbnailImageUrl", "imageBackgroundColor", "title", "text", "defaultAction", "actions"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,14 +59,14 @@ class CarouselColumn(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of default_action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of default_action
         if self.default_action:
             _dict['defaultAction'] = self.default_action.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in actions (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in actions (list)
         _items = []
         if self.actions:
             for _item in self.actions:
@@ -78,9 +82,9 @@ class CarouselColumn(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CarouselColumn.parse_obj(obj)
+            return CarouselColumn.model_validate(obj)
 
-        _obj = CarouselColumn.parse_obj({
+        _obj = CarouselColumn.model_validate({
             "thumbnail_image_url": obj.get("thumbnailImageUrl"),
             "image_background_color": obj.get("imageBackgroundColor"),
             "title": obj.get("title"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr, conlist
 from linebot.v3.messaging.models.carousel_column import CarouselColumn
 from linebot.v3.messaging.models.template import Template
 
@@ -32,16 +32,20 @@ class CarouselTemplate(Template):
     image_size: Optional[StrictStr] = Field(None, alias="imageSize")
     type: str = "carousel"
 
-    __properties = ["type", "columns", "imageAspectRatio", "imageSize"]
+    __properties: ClassVar[List[str]] = ["type", "columns", "imageAspectRatio", "imageSize"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,11 +58,11 @@ class CarouselTemplate(Template):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in columns (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in columns (list)
         _items = []
         if self.columns:
             for _item in self.columns:
@@ -74,9 +78,9 @@ class CarouselTemplate(Template):
             return None
 
         if not isinstance(obj, dict):
-            return CarouselTemplate.parse_obj(obj)
+            return CarouselTemplate.model_validate(obj)
 
-        _obj = CarouselTemplate.parse_obj({
+        _obj = CarouselTemplate.model_validate({
             "type": obj.get("type"),
             "columns": [CarouselColumn.from_dict(_item) for _item in obj.get("columns")] if obj.get("columns") is not None else None,
             "image_aspect_ratio": obj.get("imageAspectRatio"),
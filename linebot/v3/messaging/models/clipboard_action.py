@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, constr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, constr
 from linebot.v3.messaging.models.action import Action
 
 class ClipboardAction(Action):
@@ -30,16 +30,20 @@ class ClipboardAction(Action):
     clipboard_text: constr(strict=True, max_length=1000, min_length=1) = Field(..., alias="clipboardText", description="Text that is copied to the clipboard. Max character limit: 1000 ")
     type: str = "clipboard"
 
-    __properties = ["type", "label", "clipboardText"]
+    __properties: ClassVar[List[str]] = ["type", "label", "clipboardText"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class ClipboardAction(Action):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class ClipboardAction(Action):
             return None
 
         if not isinstance(obj, dict):
-            return ClipboardAction.parse_obj(obj)
+            return ClipboardAction.model_validate(obj)
 
-        _obj = ClipboardAction.parse_obj({
+        _obj = ClipboardAction.model_validate({
             "type": obj.get("type"),
             "label": obj.get("label"),
             "clipboard_text": obj.get("clipboardText")
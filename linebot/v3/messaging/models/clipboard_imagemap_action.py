@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr, constr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr, constr
 from linebot.v3.messaging.models.imagemap_action import ImagemapAction
 from linebot.v3.messaging.models.imagemap_area import ImagemapArea
 
@@ -32,16 +32,20 @@ class ClipboardImagemapAction(ImagemapAction):
     label: Optional[StrictStr] = None
     type: str = "clipboard"
 
-    __properties = ["type", "area", "clipboardText", "label"]
+    __properties: ClassVar[List[str]] = ["type", "area", "clipboardText", "label"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,11 +58,11 @@ class ClipboardImagemapAction(ImagemapAction):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of area
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of area
         if self.area:
             _dict['area'] = self.area.to_dict()
         return _dict
@@ -70,9 +74,9 @@ class ClipboardImagemapAction(ImagemapAction):
             return None
 
         if not isinstance(obj, dict):
-            return ClipboardImagemapAction.parse_obj(obj)
+            return ClipboardImagemapAction.model_validate(obj)
 
-        _obj = ClipboardImagemapAction.parse_obj({
+        _obj = ClipboardImagemapAction.model_validate({
             "type": obj.get("type"),
             "area": ImagemapArea.from_dict(obj.get("area")) if obj.get("area") is not None else None,
             "clipboard_text": obj.get("clipboardText"),
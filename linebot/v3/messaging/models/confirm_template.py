@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictStr, conlist
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.template import Template
 
@@ -28,19 +28,23 @@ class ConfirmTemplate(Template):
     ConfirmTemplate
     """
     text: StrictStr = Field(...)
-    actions: conlist(Action) = Field(...)
+    actions: conlist(SerializeAsAny[Action]) = Field(...)
     type: str = "confirm"
 
-    __properties = ["type", "text", "actions"]
+    __properties: ClassVar[List[str]] = ["type", "text", "actions"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,11 +57,11 @@ class ConfirmTemplate(Template):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in actions (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in actions (list)
         _items = []
         if self.actions:
             for _item in self.actions:
@@ -73,9 +77,9 @@ class ConfirmTemplate(Template):
             return None
 
         if not isinstance(obj, dict):
-            return ConfirmTemplate.parse_obj(obj)
+            return ConfirmTemplate.model_validate(obj)
 
-        _obj = ConfirmTemplate.parse_obj({
+        _obj = ConfirmTemplate.model_validate({
             "type": obj.get("type"),
             "text": obj.get("text"),
             "actions": [Action.from_dict(_item) for _item in obj.get("actions")] if obj.get("actions") is not None else None
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictStr, constr, validator
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, constr, field_validator
 
 class CreateRichMenuAliasRequest(BaseModel):
     """
@@ -29,23 +29,27 @@ class CreateRichMenuAliasRequest(BaseModel):
     rich_menu_alias_id: constr(strict=True, max_length=32, min_length=1) = Field(..., alias="richMenuAliasId", description="Rich menu alias ID, which can be any ID, unique for each channel.")
     rich_menu_id: StrictStr = Field(..., alias="richMenuId", description="The rich menu ID to be associated with the rich menu alias.")
 
-    __properties = ["richMenuAliasId", "richMenuId"]
+    __properties: ClassVar[List[str]] = ["richMenuAliasId", "richMenuId"]
 
-    @validator('rich_menu_alias_id')
+    @field_validator('rich_menu_alias_id')
     def rich_menu_alias_id_validate_regular_expression(cls, value):
         """Validates the regular expression"""
         if not re.match(r"^[a-z0-9_-]{1,32}$", value):
             raise ValueError(r"must validate the regular expression /^[a-z0-9_-]{1,32}$/")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -58,10 +62,10 @@ class CreateRichMenuAliasRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -71,9 +75,9 @@ class CreateRichMenuAliasRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CreateRichMenuAliasRequest.parse_obj(obj)
+            return CreateRichMenuAliasRequest.model_validate(obj)
 
-        _obj = CreateRichMenuAliasRequest.parse_obj({
+        _obj = CreateRichMenuAliasRequest.model_validate({
             "rich_menu_alias_id": obj.get("richMenuAliasId"),
             "rich_menu_id": obj.get("richMenuId")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import StrictStr, constr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, StrictStr, constr, field_validator
 from linebot.v3.messaging.models.action import Action
 
 class DatetimePickerAction(Action):
@@ -34,9 +34,9 @@ class DatetimePickerAction(Action):
     min: Optional[StrictStr] = None
     type: str = "datetimepicker"
 
-    __properties = ["type", "label", "data", "mode", "initial", "max", "min"]
+    __properties: ClassVar[List[str]] = ["type", "label", "data", "mode", "initial", "max", "min"]
 
-    @validator('mode')
+    @field_validator('mode')
     def mode_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -46,14 +46,18 @@ class DatetimePickerAction(Action):
             raise ValueError("must be one of enum values ('date', 'time', 'datetime')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -66,10 +70,10 @@ class DatetimePickerAction(Action):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -79,9 +83,9 @@ class DatetimePickerAction(Action):
             return None
 
         if not isinstance(obj, dict):
-            return DatetimePickerAction.parse_obj(obj)
+            return DatetimePickerAction.model_validate(obj)
 
-        _obj = DatetimePickerAction.parse_obj({
+        _obj = DatetimePickerAction.model_validate({
             "type": obj.get("type"),
             "label": obj.get("label"),
             "data": obj.get("data"),
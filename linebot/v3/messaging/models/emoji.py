@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class Emoji(BaseModel):
     """
@@ -29,16 +29,20 @@ class Emoji(BaseModel):
     product_id: Optional[StrictStr] = Field(None, alias="productId")
     emoji_id: Optional[StrictStr] = Field(None, alias="emojiId")
 
-    __properties = ["index", "productId", "emojiId"]
+    __properties: ClassVar[List[str]] = ["index", "productId", "emojiId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class Emoji(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class Emoji(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Emoji.parse_obj(obj)
+            return Emoji.model_validate(obj)
 
-        _obj = Emoji.parse_obj({
+        _obj = Emoji.model_validate({
             "index": obj.get("index"),
             "product_id": obj.get("productId"),
             "emoji_id": obj.get("emojiId")
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.substitution_object import SubstitutionObject
 
 class EmojiSubstitutionObject(SubstitutionObject):
@@ -31,16 +31,20 @@ class EmojiSubstitutionObject(SubstitutionObject):
     emoji_id: StrictStr = Field(..., alias="emojiId")
     type: str = "emoji"
 
-    __properties = ["type", "productId", "emojiId"]
+    __properties: ClassVar[List[str]] = ["type", "productId", "emojiId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,10 +57,10 @@ class EmojiSubstitutionObject(SubstitutionObject):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -66,9 +70,9 @@ class EmojiSubstitutionObject(SubstitutionObject):
             return None
 
         if not isinstance(obj, dict):
-            return EmojiSubstitutionObject.parse_obj(obj)
+            return EmojiSubstitutionObject.model_validate(obj)
 
-        _obj = EmojiSubstitutionObject.parse_obj({
+        _obj = EmojiSubstitutionObject.model_validate({
             "type": obj.get("type"),
             "product_id": obj.get("productId"),
             "emoji_id": obj.get("emojiId")
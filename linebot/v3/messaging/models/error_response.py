@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 from linebot.v3.messaging.models.error_detail import ErrorDetail
 from linebot.v3.messaging.models.sent_message import SentMessage
 
@@ -30,18 +30,22 @@ class ErrorResponse(BaseModel):
     """
     message: StrictStr = Field(..., description="Message containing information about the error.")
     details: Optional[conlist(ErrorDetail)] = Field(None, description="An array of error details. If the array is empty, this property will not be included in the response.")
-    sent_messages: Optional[conlist(SentMessage, max_items=5, min_items=1)] = Field(None, alias="sentMessages", description="Array of sent messages.")
+    sent_messages: Optional[conlist(SentMessage, max_length=5, min_length=1)] = Field(None, alias="sentMessages", description="Array of sent messages.")
 
-    __properties = ["message", "details", "sentMessages"]
+    __properties: ClassVar[List[str]] = ["message", "details", "sentMessages"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,18 +58,18 @@ class ErrorResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in details (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in details (list)
         _items = []
         if self.details:
             for _item in self.details:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['details'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in sent_messages (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in sent_messages (list)
         _items = []
         if self.sent_messages:
             for _item in self.sent_messages:
@@ -81,9 +85,9 @@ class ErrorResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ErrorResponse.parse_obj(obj)
+            return ErrorResponse.model_validate(obj)
 
-        _obj = ErrorResponse.parse_obj({
+        _obj = ErrorResponse.model_validate({
             "message": obj.get("message"),
             "details": [ErrorDetail.from_dict(_item) for _item in obj.get("details")] if obj.get("details") is not None else None,
             "sent_messages": [SentMessage.from_dict(_item) for _item in obj.get("sentMessages")] if obj.get("sentMessages") is not None else None
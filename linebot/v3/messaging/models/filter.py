@@ -18,26 +18,30 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, SerializeAsAny
 from linebot.v3.messaging.models.demographic_filter import DemographicFilter
 
 class Filter(BaseModel):
     """
     Filter for narrowcast
     """
-    demographic: Optional[DemographicFilter] = None
+    demographic: Optional[SerializeAsAny[DemographicFilter]] = None
 
-    __properties = ["demographic"]
+    __properties: ClassVar[List[str]] = ["demographic"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,11 +54,11 @@ class Filter(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of demographic
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of demographic
         if self.demographic:
             _dict['demographic'] = self.demographic.to_dict()
         return _dict
@@ -66,9 +70,9 @@ class Filter(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Filter.parse_obj(obj)
+            return Filter.model_validate(obj)
 
-        _obj = Filter.parse_obj({
+        _obj = Filter.model_validate({
             "demographic": DemographicFilter.from_dict(obj.get("demographic")) if obj.get("demographic") is not None else None
         })
         return _obj
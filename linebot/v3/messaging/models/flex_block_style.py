@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 
 class FlexBlockStyle(BaseModel):
     """
@@ -29,16 +29,20 @@ class FlexBlockStyle(BaseModel):
     separator: Optional[StrictBool] = None
     separator_color: Optional[StrictStr] = Field(None, alias="separatorColor")
 
-    __properties = ["backgroundColor", "separator", "separatorColor"]
+    __properties: ClassVar[List[str]] = ["backgroundColor", "separator", "separatorColor"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class FlexBlockStyle(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class FlexBlockStyle(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return FlexBlockStyle.parse_obj(obj)
+            return FlexBlockStyle.model_validate(obj)
 
-        _obj = FlexBlockStyle.parse_obj({
+        _obj = FlexBlockStyle.model_validate({
             "background_color": obj.get("backgroundColor"),
             "separator": obj.get("separator"),
             "separator_color": obj.get("separatorColor")
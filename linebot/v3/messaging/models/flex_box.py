@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictInt, StrictStr, conlist, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictInt, StrictStr, conlist, field_validator
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.flex_box_background import FlexBoxBackground
 from linebot.v3.messaging.models.flex_component import FlexComponent
@@ -30,7 +30,7 @@ class FlexBox(FlexComponent):
     """
     layout: StrictStr = Field(...)
     flex: Optional[StrictInt] = None
-    contents: conlist(FlexComponent) = Field(...)
+    contents: conlist(SerializeAsAny[FlexComponent]) = Field(...)
     spacing: Optional[StrictStr] = None
     margin: Optional[StrictStr] = None
     position: Optional[StrictStr] = None
@@ -51,22 +51,22 @@ class FlexBox(FlexComponent):
     padding_bottom: Optional[StrictStr] = Field(None, alias="paddingBottom")
     padding_start: Optional[StrictStr] = Field(None, alias="paddingStart")
     padding_end: Optional[StrictStr] = Field(None, alias="paddingEnd")
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
     justify_content: Optional[StrictStr] = Field(None, alias="justifyContent")
     align_items: Optional[StrictStr] = Field(None, alias="alignItems")
-    background: Optional[FlexBoxBackground] = None
+    background: Optional[SerializeAsAny[FlexBoxBackground]] = None
     type: str = "box"
 
-    __properties = ["type", "layout", "flex", "contents", "spacing", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "backgroundColor", "borderColor", "borderWidth", "cornerRadius", "width", "maxWidth", "height", "maxHeight", "paddingAll", "paddingTop", "paddingBottom", "paddingStart", "paddingEnd", "action", "justifyContent", "alignItems", "background"]
+    __properties: ClassVar[List[str]] = ["type", "layout", "flex", "contents", "spacing", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "backgroundColor", "borderColor", "borderWidth", "cornerRadius", "width", "maxWidth", "height", "maxHeight", "paddingAll", "paddingTop", "paddingBottom", "paddingStart", "paddingEnd", "action", "justifyContent", "alignItems", "background"]
 
-    @validator('layout')
+    @field_validator('layout')
     def layout_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('horizontal', 'vertical', 'baseline'):
             raise ValueError("must be one of enum values ('horizontal', 'vertical', 'baseline')")
         return value
 
-    @validator('position')
+    @field_validator('position')
     def position_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -76,7 +76,7 @@ class FlexBox(FlexComponent):
             raise ValueError("must be one of enum values ('relative', 'absolute')")
         return value
 
-    @validator('justify_content')
+    @field_validator('justify_content')
     def justify_content_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -86,7 +86,7 @@ class FlexBox(FlexComponent):
             raise ValueError("must be one of enum values ('center', 'flex-start', 'flex-end', 'space-between', 'space-around', 'space-evenly')")
         return value
 
-    @validator('align_items')
+    @field_validator('align_items')
     def align_items_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -96,14 +96,18 @@ class FlexBox(FlexComponent):
             raise ValueError("must be one of enum values ('center', 'flex-start', 'flex-end')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -116,21 +120,21 @@ class FlexBox(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in contents (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in contents (list)
         _items = []
         if self.contents:
             for _item in self.contents:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['contents'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of background
+        # override the default output from pydantic by calling `to_dict()` of background
         if self.background:
             _dict['background'] = self.background.to_dict()
         return _dict
@@ -142,9 +146,9 @@ class FlexBox(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexBox.parse_obj(obj)
+            return FlexBox.model_validate(obj)
 
-        _obj = FlexBox.parse_obj({
+        _obj = FlexBox.model_validate({
             "type": obj.get("type"),
             "layout": obj.get("layout"),
             "flex": obj.get("flex"),
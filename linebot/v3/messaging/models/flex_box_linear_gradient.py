@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.flex_box_background import FlexBoxBackground
 
 class FlexBoxLinearGradient(FlexBoxBackground):
@@ -33,16 +33,20 @@ class FlexBoxLinearGradient(FlexBoxBackground):
     center_position: Optional[StrictStr] = Field(None, alias="centerPosition")
     type: str = "linearGradient"
 
-    __properties = ["type", "angle", "startColor", "endColor", "centerColor", "centerPosition"]
+    __properties: ClassVar[List[str]] = ["type", "angle", "startColor", "endColor", "centerColor", "centerPosition"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,10 +59,10 @@ class FlexBoxLinearGradient(FlexBoxBackground):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -68,9 +72,9 @@ class FlexBoxLinearGradient(FlexBoxBackground):
             return None
 
         if not isinstance(obj, dict):
-            return FlexBoxLinearGradient.parse_obj(obj)
+            return FlexBoxLinearGradient.model_validate(obj)
 
-        _obj = FlexBoxLinearGradient.parse_obj({
+        _obj = FlexBoxLinearGradient.model_validate({
             "type": obj.get("type"),
             "angle": obj.get("angle"),
             "start_color": obj.get("startColor"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, SerializeAsAny, StrictStr, field_validator
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.flex_box import FlexBox
 from linebot.v3.messaging.models.flex_bubble_styles import FlexBubbleStyles
@@ -33,16 +33,16 @@ class FlexBubble(FlexContainer):
     direction: Optional[StrictStr] = None
     styles: Optional[FlexBubbleStyles] = None
     header: Optional[FlexBox] = None
-    hero: Optional[FlexComponent] = None
+    hero: Optional[SerializeAsAny[FlexComponent]] = None
     body: Optional[FlexBox] = None
     footer: Optional[FlexBox] = None
     size: Optional[StrictStr] = None
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
     type: str = "bubble"
 
-    __properties = ["type", "direction", "styles", "header", "hero", "body", "footer", "size", "action"]
+    __properties: ClassVar[List[str]] = ["type", "direction", "styles", "header", "hero", "body", "footer", "size", "action"]
 
-    @validator('direction')
+    @field_validator('direction')
     def direction_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -52,7 +52,7 @@ class FlexBubble(FlexContainer):
             raise ValueError("must be one of enum values ('ltr', 'rtl')")
         return value
 
-    @validator('size')
+    @field_validator('size')
     def size_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -62,14 +62,18 @@ class FlexBubble(FlexContainer):
             raise ValueError("must be one of enum values ('nano', 'micro', 'deca', 'hecto', 'kilo', 'mega', 'giga')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -82,26 +86,26 @@ class FlexBubble(FlexContainer):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of styles
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of styles
         if self.styles:
             _dict['styles'] = self.styles.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of header
+        # override the default output from pydantic by calling `to_dict()` of header
         if self.header:
             _dict['header'] = self.header.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of hero
+        # override the default output from pydantic by calling `to_dict()` of hero
         if self.hero:
             _dict['hero'] = self.hero.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of body
+        # override the default output from pydantic by calling `to_dict()` of body
         if self.body:
             _dict['body'] = self.body.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of footer
+        # override the default output from pydantic by calling `to_dict()` of footer
         if self.footer:
             _dict['footer'] = self.footer.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -113,9 +117,9 @@ class FlexBubble(FlexContainer):
             return None
 
         if not isinstance(obj, dict):
-            return FlexBubble.parse_obj(obj)
+            return FlexBubble.model_validate(obj)
 
-        _obj = FlexBubble.parse_obj({
+        _obj = FlexBubble.model_validate({
             "type": obj.get("type"),
             "direction": obj.get("direction"),
             "styles": FlexBubbleStyles.from_dict(obj.get("styles")) if obj.get("styles") is not None else None,
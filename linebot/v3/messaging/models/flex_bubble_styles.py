@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict
 from linebot.v3.messaging.models.flex_block_style import FlexBlockStyle
 
 class FlexBubbleStyles(BaseModel):
@@ -31,16 +31,20 @@ class FlexBubbleStyles(BaseModel):
     body: Optional[FlexBlockStyle] = None
     footer: Optional[FlexBlockStyle] = None
 
-    __properties = ["header", "hero", "body", "footer"]
+    __properties: ClassVar[List[str]] = ["header", "hero", "body", "footer"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,20 +57,20 @@ class FlexBubbleStyles(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of header
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of header
         if self.header:
             _dict['header'] = self.header.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of hero
+        # override the default output from pydantic by calling `to_dict()` of hero
         if self.hero:
             _dict['hero'] = self.hero.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of body
+        # override the default output from pydantic by calling `to_dict()` of body
         if self.body:
             _dict['body'] = self.body.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of footer
+        # override the default output from pydantic by calling `to_dict()` of footer
         if self.footer:
             _dict['footer'] = self.footer.to_dict()
         return _dict
@@ -78,9 +82,9 @@ class FlexBubbleStyles(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return FlexBubbleStyles.parse_obj(obj)
+            return FlexBubbleStyles.model_validate(obj)
 
-        _obj = FlexBubbleStyles.parse_obj({
+        _obj = FlexBubbleStyles.model_validate({
             "header": FlexBlockStyle.from_dict(obj.get("header")) if obj.get("header") is not None else None,
             "hero": FlexBlockStyle.from_dict(obj.get("hero")) if obj.get("hero") is not None else None,
             "body": FlexBlockStyle.from_dict(obj.get("body")) if obj.get("body") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictBool, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictBool, StrictInt, StrictStr, field_validator
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
@@ -30,7 +30,7 @@ class FlexButton(FlexComponent):
     flex: Optional[StrictInt] = None
     color: Optional[StrictStr] = None
     style: Optional[StrictStr] = None
-    action: Action = Field(...)
+    action: SerializeAsAny[Action] = Field(...)
     gravity: Optional[StrictStr] = None
     margin: Optional[StrictStr] = None
     position: Optional[StrictStr] = None
@@ -43,9 +43,9 @@ class FlexButton(FlexComponent):
     scaling: Optional[StrictBool] = None
     type: str = "button"
 
-    __properties = ["type", "flex", "color", "style", "action", "gravity", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "height", "adjustMode", "scaling"]
+    __properties: ClassVar[List[str]] = ["type", "flex", "color", "style", "action", "gravity", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "height", "adjustMode", "scaling"]
 
-    @validator('style')
+    @field_validator('style')
     def style_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -55,7 +55,7 @@ class FlexButton(FlexComponent):
             raise ValueError("must be one of enum values ('primary', 'secondary', 'link')")
         return value
 
-    @validator('gravity')
+    @field_validator('gravity')
     def gravity_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -65,7 +65,7 @@ class FlexButton(FlexComponent):
             raise ValueError("must be one of enum values ('top', 'bottom', 'center')")
         return value
 
-    @validator('position')
+    @field_validator('position')
     def position_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -75,7 +75,7 @@ class FlexButton(FlexComponent):
             raise ValueError("must be one of enum values ('relative', 'absolute')")
         return value
 
-    @validator('height')
+    @field_validator('height')
     def height_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -85,7 +85,7 @@ class FlexButton(FlexComponent):
             raise ValueError("must be one of enum values ('md', 'sm')")
         return value
 
-    @validator('adjust_mode')
+    @field_validator('adjust_mode')
     def adjust_mode_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -95,14 +95,18 @@ class FlexButton(FlexComponent):
             raise ValueError("must be one of enum values ('shrink-to-fit')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -115,11 +119,11 @@ class FlexButton(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -131,9 +135,9 @@ class FlexButton(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexButton.parse_obj(obj)
+            return FlexButton.model_validate(obj)
 
-        _obj = FlexButton.parse_obj({
+        _obj = FlexButton.model_validate({
             "type": obj.get("type"),
             "flex": obj.get("flex"),
             "color": obj.get("color"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import Field, conlist
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, conlist
 from linebot.v3.messaging.models.flex_bubble import FlexBubble
 from linebot.v3.messaging.models.flex_container import FlexContainer
 
@@ -30,16 +30,20 @@ class FlexCarousel(FlexContainer):
     contents: conlist(FlexBubble) = Field(...)
     type: str = "carousel"
 
-    __properties = ["type", "contents"]
+    __properties: ClassVar[List[str]] = ["type", "contents"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,11 +56,11 @@ class FlexCarousel(FlexContainer):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in contents (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in contents (list)
         _items = []
         if self.contents:
             for _item in self.contents:
@@ -72,9 +76,9 @@ class FlexCarousel(FlexContainer):
             return None
 
         if not isinstance(obj, dict):
-            return FlexCarousel.parse_obj(obj)
+            return FlexCarousel.model_validate(obj)
 
-        _obj = FlexCarousel.parse_obj({
+        _obj = FlexCarousel.model_validate({
             "type": obj.get("type"),
             "contents": [FlexBubble.from_dict(_item) for _item in obj.get("contents")] if obj.get("contents") is not None else None
         })
@@ -19,8 +19,8 @@ import json
 import linebot.v3.messaging.models
 
 
-from typing import Union
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, Dict, List, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class FlexContainer(BaseModel):
     """
@@ -28,18 +28,22 @@ class FlexContainer(BaseModel):
     """
     type: StrictStr = Field(...)
 
-    __properties = ["type"]
+    __properties: ClassVar[List[str]] = ["type"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     # JSON field name that stores the object type
-    __discriminator_property_name = 'type'
+    __discriminator_property_name: ClassVar[str] = 'type'
 
     # discriminator mappings
-    __discriminator_value_class_map = {
+    __discriminator_value_class_map: ClassVar[Dict[str, str]] = {
         'bubble': 'FlexBubble',
         'carousel': 'FlexCarousel'
     }
@@ -55,7 +59,7 @@ class FlexContainer(BaseModel):
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -68,10 +72,10 @@ class FlexContainer(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import StrictInt
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, StrictInt
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
 class FlexFiller(FlexComponent):
@@ -29,16 +29,20 @@ class FlexFiller(FlexComponent):
     flex: Optional[StrictInt] = None
     type: str = "filler"
 
-    __properties = ["type", "flex"]
+    __properties: ClassVar[List[str]] = ["type", "flex"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class FlexFiller(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class FlexFiller(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexFiller.parse_obj(obj)
+            return FlexFiller.model_validate(obj)
 
-        _obj = FlexFiller.parse_obj({
+        _obj = FlexFiller.model_validate({
             "type": obj.get("type"),
             "flex": obj.get("flex")
         })
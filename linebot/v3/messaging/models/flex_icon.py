@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictBool, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictBool, StrictStr, field_validator
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
 class FlexIcon(FlexComponent):
@@ -39,9 +39,9 @@ class FlexIcon(FlexComponent):
     scaling: Optional[StrictBool] = None
     type: str = "icon"
 
-    __properties = ["type", "url", "size", "aspectRatio", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "scaling"]
+    __properties: ClassVar[List[str]] = ["type", "url", "size", "aspectRatio", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "scaling"]
 
-    @validator('position')
+    @field_validator('position')
     def position_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -51,14 +51,18 @@ class FlexIcon(FlexComponent):
             raise ValueError("must be one of enum values ('relative', 'absolute')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -71,10 +75,10 @@ class FlexIcon(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -84,9 +88,9 @@ class FlexIcon(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexIcon.parse_obj(obj)
+            return FlexIcon.model_validate(obj)
 
-        _obj = FlexIcon.parse_obj({
+        _obj = FlexIcon.model_validate({
             "type": obj.get("type"),
             "url": obj.get("url"),
             "size": obj.get("size"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictBool, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictBool, StrictInt, StrictStr, field_validator
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
@@ -42,13 +42,13 @@ class FlexImage(FlexComponent):
     aspect_ratio: Optional[StrictStr] = Field(None, alias="aspectRatio", description="Aspect ratio of the image. `{width}:{height}` format. Specify the value of `{width}` and `{height}` in the range from `1` to `100000`. However, you cannot set `{height}` to a value that is more than three times the value of `{width}`. The default value is `1:1`. ")
     aspect_mode: Optional[StrictStr] = Field(None, alias="aspectMode", description="The display style of the image if the aspect ratio of the image and that specified by the aspectRatio property do not match. ")
     background_color: Optional[StrictStr] = Field(None, alias="backgroundColor", description="Background color of the image. Use a hexadecimal color code.")
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
     animated: Optional[StrictBool] = Field(False, description="When this is `true`, an animated image (APNG) plays. You can specify a value of true up to 10 images in a single message. You can't send messages that exceed this limit. This is `false` by default. Animated images larger than 300 KB aren't played back. ")
     type: str = "image"
 
-    __properties = ["type", "url", "flex", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "align", "gravity", "size", "aspectRatio", "aspectMode", "backgroundColor", "action", "animated"]
+    __properties: ClassVar[List[str]] = ["type", "url", "flex", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "align", "gravity", "size", "aspectRatio", "aspectMode", "backgroundColor", "action", "animated"]
 
-    @validator('position')
+    @field_validator('position')
     def position_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -58,7 +58,7 @@ class FlexImage(FlexComponent):
             raise ValueError("must be one of enum values ('relative', 'absolute')")
         return value
 
-    @validator('align')
+    @field_validator('align')
     def align_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -68,7 +68,7 @@ class FlexImage(FlexComponent):
             raise ValueError("must be one of enum values ('start', 'end', 'center')")
         return value
 
-    @validator('gravity')
+    @field_validator('gravity')
     def gravity_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -78,7 +78,7 @@ class FlexImage(FlexComponent):
             raise ValueError("must be one of enum values ('top', 'bottom', 'center')")
         return value
 
-    @validator('aspect_mode')
+    @field_validator('aspect_mode')
     def aspect_mode_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -88,14 +88,18 @@ class FlexImage(FlexComponent):
             raise ValueError("must be one of enum values ('fit', 'cover')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -108,11 +112,11 @@ class FlexImage(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -124,9 +128,9 @@ class FlexImage(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexImage.parse_obj(obj)
+            return FlexImage.model_validate(obj)
 
-        _obj = FlexImage.parse_obj({
+        _obj = FlexImage.model_validate({
             "type": obj.get("type"),
             "url": obj.get("url"),
             "flex": obj.get("flex"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictStr
 from linebot.v3.messaging.models.flex_container import FlexContainer
 from linebot.v3.messaging.models.message import Message
 from linebot.v3.messaging.models.quick_reply import QuickReply
@@ -31,19 +31,23 @@ class FlexMessage(Message):
     https://developers.line.biz/en/reference/messaging-api/#flex-message
     """
     alt_text: StrictStr = Field(..., alias="altText")
-    contents: FlexContainer = Field(...)
+    contents: SerializeAsAny[FlexContainer] = Field(...)
     type: str = "flex"
 
-    __properties = ["type", "quickReply", "sender", "altText", "contents"]
+    __properties: ClassVar[List[str]] = ["type", "quickReply", "sender", "altText", "contents"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -56,17 +60,17 @@ class FlexMessage(Message):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of quick_reply
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of quick_reply
         if self.quick_reply:
             _dict['quickReply'] = self.quick_reply.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of sender
+        # override the default output from pydantic by calling `to_dict()` of sender
         if self.sender:
             _dict['sender'] = self.sender.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of contents
+        # override the default output from pydantic by calling `to_dict()` of contents
         if self.contents:
             _dict['contents'] = self.contents.to_dict()
         return _dict
@@ -78,9 +82,9 @@ class FlexMessage(Message):
             return None
 
         if not isinstance(obj, dict):
-            return FlexMessage.parse_obj(obj)
+            return FlexMessage.model_validate(obj)
 
-        _obj = FlexMessage.parse_obj({
+        _obj = FlexMessage.model_validate({
             "type": obj.get("type"),
             "quick_reply": QuickReply.from_dict(obj.get("quickReply")) if obj.get("quickReply") is not None else None,
             "sender": Sender.from_dict(obj.get("sender")) if obj.get("sender") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, StrictStr
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
 class FlexSeparator(FlexComponent):
@@ -30,16 +30,20 @@ class FlexSeparator(FlexComponent):
     color: Optional[StrictStr] = None
     type: str = "separator"
 
-    __properties = ["type", "margin", "color"]
+    __properties: ClassVar[List[str]] = ["type", "margin", "color"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class FlexSeparator(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class FlexSeparator(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexSeparator.parse_obj(obj)
+            return FlexSeparator.model_validate(obj)
 
-        _obj = FlexSeparator.parse_obj({
+        _obj = FlexSeparator.model_validate({
             "type": obj.get("type"),
             "margin": obj.get("margin"),
             "color": obj.get("color")
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, StrictStr, field_validator
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
 class FlexSpan(FlexComponent):
@@ -34,9 +34,9 @@ class FlexSpan(FlexComponent):
     decoration: Optional[StrictStr] = None
     type: str = "span"
 
-    __properties = ["type", "text", "size", "color", "weight", "style", "decoration"]
+    __properties: ClassVar[List[str]] = ["type", "text", "size", "color", "weight", "style", "decoration"]
 
-    @validator('weight')
+    @field_validator('weight')
     def weight_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -46,7 +46,7 @@ class FlexSpan(FlexComponent):
             raise ValueError("must be one of enum values ('regular', 'bold')")
         return value
 
-    @validator('style')
+    @field_validator('style')
     def style_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -56,7 +56,7 @@ class FlexSpan(FlexComponent):
             raise ValueError("must be one of enum values ('normal', 'italic')")
         return value
 
-    @validator('decoration')
+    @field_validator('decoration')
     def decoration_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -66,14 +66,18 @@ class FlexSpan(FlexComponent):
             raise ValueError("must be one of enum values ('none', 'underline', 'line-through')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -86,10 +90,10 @@ class FlexSpan(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -99,9 +103,9 @@ class FlexSpan(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexSpan.parse_obj(obj)
+            return FlexSpan.model_validate(obj)
 
-        _obj = FlexSpan.parse_obj({
+        _obj = FlexSpan.model_validate({
             "type": obj.get("type"),
             "text": obj.get("text"),
             "size": obj.get("size"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictBool, StrictInt, StrictStr, conlist, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictBool, StrictInt, StrictStr, conlist, field_validator
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.flex_component import FlexComponent
 from linebot.v3.messaging.models.flex_span import FlexSpan
@@ -45,16 +45,16 @@ class FlexText(FlexComponent):
     offset_bottom: Optional[StrictStr] = Field(None, alias="offsetBottom")
     offset_start: Optional[StrictStr] = Field(None, alias="offsetStart")
     offset_end: Optional[StrictStr] = Field(None, alias="offsetEnd")
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
     max_lines: Optional[StrictInt] = Field(None, alias="maxLines")
     contents: Optional[conlist(FlexSpan)] = None
     adjust_mode: Optional[StrictStr] = Field(None, alias="adjustMode")
     scaling: Optional[StrictBool] = None
     type: str = "text"
 
-    __properties = ["type", "flex", "text", "size", "align", "gravity", "color", "weight", "style", "decoration", "wrap", "lineSpacing", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "action", "maxLines", "contents", "adjustMode", "scaling"]
+    __properties: ClassVar[List[str]] = ["type", "flex", "text", "size", "align", "gravity", "color", "weight", "style", "decoration", "wrap", "lineSpacing", "margin", "position", "offsetTop", "offsetBottom", "offsetStart", "offsetEnd", "action", "maxLines", "contents", "adjustMode", "scaling"]
 
-    @validator('align')
+    @field_validator('align')
     def align_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -64,7 +64,7 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('start', 'end', 'center')")
         return value
 
-    @validator('gravity')
+    @field_validator('gravity')
     def gravity_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -74,7 +74,7 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('top', 'bottom', 'center')")
         return value
 
-    @validator('weight')
+    @field_validator('weight')
     def weight_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -84,7 +84,7 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('regular', 'bold')")
         return value
 
-    @validator('style')
+    @field_validator('style')
     def style_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -94,7 +94,7 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('normal', 'italic')")
         return value
 
-    @validator('decoration')
+    @field_validator('decoration')
     def decoration_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -104,7 +104,7 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('none', 'underline', 'line-through')")
         return value
 
-    @validator('position')
+    @field_validator('position')
     def position_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -114,7 +114,7 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('relative', 'absolute')")
         return value
 
-    @validator('adjust_mode')
+    @field_validator('adjust_mode')
     def adjust_mode_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -124,14 +124,18 @@ class FlexText(FlexComponent):
             raise ValueError("must be one of enum values ('shrink-to-fit')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -144,14 +148,14 @@ class FlexText(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in contents (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in contents (list)
         _items = []
         if self.contents:
             for _item in self.contents:
@@ -167,9 +171,9 @@ class FlexText(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexText.parse_obj(obj)
+            return FlexText.model_validate(obj)
 
-        _obj = FlexText.parse_obj({
+        _obj = FlexText.model_validate({
             "type": obj.get("type"),
             "flex": obj.get("flex"),
             "text": obj.get("text"),
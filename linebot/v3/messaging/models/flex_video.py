@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictStr
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.flex_component import FlexComponent
 
@@ -29,21 +29,25 @@ class FlexVideo(FlexComponent):
     """
     url: StrictStr = Field(...)
     preview_url: StrictStr = Field(..., alias="previewUrl")
-    alt_content: FlexComponent = Field(..., alias="altContent")
+    alt_content: SerializeAsAny[FlexComponent] = Field(..., alias="altContent")
     aspect_ratio: Optional[StrictStr] = Field(None, alias="aspectRatio")
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
     type: str = "video"
 
-    __properties = ["type", "url", "previewUrl", "altContent", "aspectRatio", "action"]
+    __properties: ClassVar[List[str]] = ["type", "url", "previewUrl", "altContent", "aspectRatio", "action"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -56,14 +60,14 @@ class FlexVideo(FlexComponent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of alt_content
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of alt_content
         if self.alt_content:
             _dict['altContent'] = self.alt_content.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -75,9 +79,9 @@ class FlexVideo(FlexComponent):
             return None
 
         if not isinstance(obj, dict):
-            return FlexVideo.parse_obj(obj)
+            return FlexVideo.model_validate(obj)
 
-        _obj = FlexVideo.parse_obj({
+        _obj = FlexVideo.model_validate({
             "type": obj.get("type"),
             "url": obj.get("url"),
             "preview_url": obj.get("previewUrl"),
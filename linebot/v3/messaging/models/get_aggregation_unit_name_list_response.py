@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 
 class GetAggregationUnitNameListResponse(BaseModel):
     """
@@ -29,16 +29,20 @@ class GetAggregationUnitNameListResponse(BaseModel):
     custom_aggregation_units: conlist(StrictStr) = Field(..., alias="customAggregationUnits", description="An array of strings indicating the names of aggregation units used this month.")
     next: Optional[StrictStr] = Field(None, description="A continuation token to get the next array of unit names. Returned only when there are remaining aggregation units that weren't returned in customAggregationUnits in the original request.  ")
 
-    __properties = ["customAggregationUnits", "next"]
+    __properties: ClassVar[List[str]] = ["customAggregationUnits", "next"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class GetAggregationUnitNameListResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class GetAggregationUnitNameListResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetAggregationUnitNameListResponse.parse_obj(obj)
+            return GetAggregationUnitNameListResponse.model_validate(obj)
 
-        _obj = GetAggregationUnitNameListResponse.parse_obj({
+        _obj = GetAggregationUnitNameListResponse.model_validate({
             "custom_aggregation_units": obj.get("customAggregationUnits"),
             "next": obj.get("next")
         })
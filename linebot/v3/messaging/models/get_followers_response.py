@@ -18,27 +18,31 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 
 class GetFollowersResponse(BaseModel):
     """
     GetFollowersResponse
     https://developers.line.biz/en/reference/messaging-api/#get-follower-ids
     """
-    user_ids: conlist(StrictStr, max_items=1000) = Field(..., alias="userIds", description="An array of strings indicating user IDs of users that have added the LINE Official Account as a friend. Only users of LINE for iOS and LINE for Android are included in `userIds`. ")
+    user_ids: conlist(StrictStr, max_length=1000) = Field(..., alias="userIds", description="An array of strings indicating user IDs of users that have added the LINE Official Account as a friend. Only users of LINE for iOS and LINE for Android are included in `userIds`. ")
     next: Optional[StrictStr] = Field(None, description="A continuation token to get the next array of user IDs. Returned only when there are remaining user IDs that weren't returned in `userIds` in the original request. The number of user IDs in the `userIds` element doesn't have to reach the maximum number specified by `limit` for the `next` property to be included in the response.  ")
 
-    __properties = ["userIds", "next"]
+    __properties: ClassVar[List[str]] = ["userIds", "next"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class GetFollowersResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class GetFollowersResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetFollowersResponse.parse_obj(obj)
+            return GetFollowersResponse.model_validate(obj)
 
-        _obj = GetFollowersResponse.parse_obj({
+        _obj = GetFollowersResponse.model_validate({
             "user_ids": obj.get("userIds"),
             "next": obj.get("next")
         })
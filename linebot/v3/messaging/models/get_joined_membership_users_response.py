@@ -18,27 +18,31 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 
 class GetJoinedMembershipUsersResponse(BaseModel):
     """
     List of users who have joined the membership
     https://developers.line.biz/en/reference/messaging-api/#get-membership-user-ids
     """
-    user_ids: conlist(StrictStr, max_items=1000) = Field(..., alias="userIds", description="A list of user IDs who joined the membership. Users who have not agreed to the bot user agreement, are not following the bot, or are not active will be excluded. If there are no users in the membership, an empty list will be returned. ")
+    user_ids: conlist(StrictStr, max_length=1000) = Field(..., alias="userIds", description="A list of user IDs who joined the membership. Users who have not agreed to the bot user agreement, are not following the bot, or are not active will be excluded. If there are no users in the membership, an empty list will be returned. ")
     next: Optional[StrictStr] = Field(None, description="A continuation token to get next remaining membership user IDs. Returned only when there are remaining user IDs that weren't returned in the userIds property in the previous request. The continuation token expires in 24 hours (86,400 seconds).  ")
 
-    __properties = ["userIds", "next"]
+    __properties: ClassVar[List[str]] = ["userIds", "next"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class GetJoinedMembershipUsersResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class GetJoinedMembershipUsersResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetJoinedMembershipUsersResponse.parse_obj(obj)
+            return GetJoinedMembershipUsersResponse.model_validate(obj)
 
-        _obj = GetJoinedMembershipUsersResponse.parse_obj({
+        _obj = GetJoinedMembershipUsersResponse.model_validate({
             "user_ids": obj.get("userIds"),
             "next": obj.get("next")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.messaging.models.subscription import Subscription
 
 class GetMembershipSubscriptionResponse(BaseModel):
@@ -27,18 +27,22 @@ class GetMembershipSubscriptionResponse(BaseModel):
     A user's membership subscription status
     https://developers.line.biz/en/reference/messaging-api/#get-a-users-membership-subscription-status
     """
-    subscriptions: conlist(Subscription, min_items=0) = Field(..., description="List of subscription information")
+    subscriptions: conlist(Subscription, min_length=0) = Field(..., description="List of subscription information")
 
-    __properties = ["subscriptions"]
+    __properties: ClassVar[List[str]] = ["subscriptions"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,11 +55,11 @@ class GetMembershipSubscriptionResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in subscriptions (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in subscriptions (list)
         _items = []
         if self.subscriptions:
             for _item in self.subscriptions:
@@ -71,9 +75,9 @@ class GetMembershipSubscriptionResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetMembershipSubscriptionResponse.parse_obj(obj)
+            return GetMembershipSubscriptionResponse.model_validate(obj)
 
-        _obj = GetMembershipSubscriptionResponse.parse_obj({
+        _obj = GetMembershipSubscriptionResponse.model_validate({
             "subscriptions": [Subscription.from_dict(_item) for _item in obj.get("subscriptions")] if obj.get("subscriptions") is not None else None
         })
         return _obj
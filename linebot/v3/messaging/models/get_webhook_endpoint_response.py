@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 
 class GetWebhookEndpointResponse(BaseModel):
     """
@@ -29,16 +29,20 @@ class GetWebhookEndpointResponse(BaseModel):
     endpoint: StrictStr = Field(..., description="Webhook URL")
     active: StrictBool = Field(..., description="Webhook usage status. Send a webhook event from the LINE Platform to the webhook URL only if enabled.  `true`: Webhook usage is enabled. `false`: Webhook usage is disabled. ")
 
-    __properties = ["endpoint", "active"]
+    __properties: ClassVar[List[str]] = ["endpoint", "active"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class GetWebhookEndpointResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class GetWebhookEndpointResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetWebhookEndpointResponse.parse_obj(obj)
+            return GetWebhookEndpointResponse.model_validate(obj)
 
-        _obj = GetWebhookEndpointResponse.parse_obj({
+        _obj = GetWebhookEndpointResponse.model_validate({
             "endpoint": obj.get("endpoint"),
             "active": obj.get("active")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt
 
 class GroupMemberCountResponse(BaseModel):
     """
@@ -28,16 +28,20 @@ class GroupMemberCountResponse(BaseModel):
     """
     count: StrictInt = Field(..., description="The count of members in the group chat. The number returned excludes the LINE Official Account.")
 
-    __properties = ["count"]
+    __properties: ClassVar[List[str]] = ["count"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class GroupMemberCountResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class GroupMemberCountResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GroupMemberCountResponse.parse_obj(obj)
+            return GroupMemberCountResponse.model_validate(obj)
 
-        _obj = GroupMemberCountResponse.parse_obj({
+        _obj = GroupMemberCountResponse.model_validate({
             "count": obj.get("count")
         })
         return _obj
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class GroupSummaryResponse(BaseModel):
     """
@@ -30,16 +30,20 @@ class GroupSummaryResponse(BaseModel):
     group_name: StrictStr = Field(..., alias="groupName", description="Group name")
     picture_url: Optional[StrictStr] = Field(None, alias="pictureUrl", description="Group icon URL. Not included in the response if the user doesn't set a group profile icon.")
 
-    __properties = ["groupId", "groupName", "pictureUrl"]
+    __properties: ClassVar[List[str]] = ["groupId", "groupName", "pictureUrl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class GroupSummaryResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class GroupSummaryResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GroupSummaryResponse.parse_obj(obj)
+            return GroupSummaryResponse.model_validate(obj)
 
-        _obj = GroupSummaryResponse.parse_obj({
+        _obj = GroupSummaryResponse.model_validate({
             "group_id": obj.get("groupId"),
             "group_name": obj.get("groupName"),
             "picture_url": obj.get("pictureUrl")
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictStr
 from linebot.v3.messaging.models.action import Action
 
 class ImageCarouselColumn(BaseModel):
@@ -27,18 +27,22 @@ class ImageCarouselColumn(BaseModel):
     ImageCarouselColumn
     """
     image_url: StrictStr = Field(..., alias="imageUrl")
-    action: Action = Field(...)
+    action: SerializeAsAny[Action] = Field(...)
 
-    __properties = ["imageUrl", "action"]
+    __properties: ClassVar[List[str]] = ["imageUrl", "action"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,11 +55,11 @@ class ImageCarouselColumn(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -67,9 +71,9 @@ class ImageCarouselColumn(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ImageCarouselColumn.parse_obj(obj)
+            return ImageCarouselColumn.model_validate(obj)
 
-        _obj = ImageCarouselColumn.parse_obj({
+        _obj = ImageCarouselColumn.model_validate({
             "image_url": obj.get("imageUrl"),
             "action": Action.from_dict(obj.get("action")) if obj.get("action") is not None else None
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.message import Message
 from linebot.v3.messaging.models.quick_reply import QuickReply
 from linebot.v3.messaging.models.sender import Sender
@@ -33,16 +33,20 @@ class ImageMessage(Message):
     preview_image_url: StrictStr = Field(..., alias="previewImageUrl")
     type: str = "image"
 
-    __properties = ["type", "quickReply", "sender", "originalContentUrl", "previewImageUrl"]
+    __properties: ClassVar[List[str]] = ["type", "quickReply", "sender", "originalContentUrl", "previewImageUrl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,14 +59,14 @@ class ImageMessage(Message):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of quick_reply
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of quick_reply
         if self.quick_reply:
             _dict['quickReply'] = self.quick_reply.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of sender
+        # override the default output from pydantic by calling `to_dict()` of sender
         if self.sender:
             _dict['sender'] = self.sender.to_dict()
         return _dict
@@ -74,9 +78,9 @@ class ImageMessage(Message):
             return None
 
         if not isinstance(obj, dict):
-            return ImageMessage.parse_obj(obj)
+            return ImageMessage.model_validate(obj)
 
-        _obj = ImageMessage.parse_obj({
+        _obj = ImageMessage.model_validate({
             "type": obj.get("type"),
             "quick_reply": QuickReply.from_dict(obj.get("quickReply")) if obj.get("quickReply") is not None else None,
             "sender": Sender.from_dict(obj.get("sender")) if obj.get("sender") is not None else None,
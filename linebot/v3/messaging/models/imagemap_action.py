@@ -19,8 +19,8 @@ import json
 import linebot.v3.messaging.models
 
 
-from typing import Union
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, Dict, List, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.imagemap_area import ImagemapArea
 
 class ImagemapAction(BaseModel):
@@ -31,18 +31,22 @@ class ImagemapAction(BaseModel):
     type: StrictStr = Field(...)
     area: ImagemapArea = Field(...)
 
-    __properties = ["type", "area"]
+    __properties: ClassVar[List[str]] = ["type", "area"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     # JSON field name that stores the object type
-    __discriminator_property_name = 'type'
+    __discriminator_property_name: ClassVar[str] = 'type'
 
     # discriminator mappings
-    __discriminator_value_class_map = {
+    __discriminator_value_class_map: ClassVar[Dict[str, str]] = {
         'clipboard': 'ClipboardImagemapAction',
         'message': 'MessageImagemapAction',
         'uri': 'URIImagemapAction'
@@ -59,7 +63,7 @@ class ImagemapAction(BaseModel):
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -72,11 +76,11 @@ class ImagemapAction(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of area
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of area
         if self.area:
             _dict['area'] = self.area.to_dict()
         return _dict
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt
 
 class ImagemapArea(BaseModel):
     """
@@ -30,16 +30,20 @@ class ImagemapArea(BaseModel):
     width: StrictInt = Field(...)
     height: StrictInt = Field(...)
 
-    __properties = ["x", "y", "width", "height"]
+    __properties: ClassVar[List[str]] = ["x", "y", "width", "height"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class ImagemapArea(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class ImagemapArea(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ImagemapArea.parse_obj(obj)
+            return ImagemapArea.model_validate(obj)
 
-        _obj = ImagemapArea.parse_obj({
+        _obj = ImagemapArea.model_validate({
             "x": obj.get("x"),
             "y": obj.get("y"),
             "width": obj.get("width"),
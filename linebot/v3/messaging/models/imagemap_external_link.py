@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class ImagemapExternalLink(BaseModel):
     """
@@ -28,16 +28,20 @@ class ImagemapExternalLink(BaseModel):
     link_uri: Optional[StrictStr] = Field(None, alias="linkUri")
     label: Optional[StrictStr] = None
 
-    __properties = ["linkUri", "label"]
+    __properties: ClassVar[List[str]] = ["linkUri", "label"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class ImagemapExternalLink(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class ImagemapExternalLink(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ImagemapExternalLink.parse_obj(obj)
+            return ImagemapExternalLink.model_validate(obj)
 
-        _obj = ImagemapExternalLink.parse_obj({
+        _obj = ImagemapExternalLink.model_validate({
             "link_uri": obj.get("linkUri"),
             "label": obj.get("label")
         })
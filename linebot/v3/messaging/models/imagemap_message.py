@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictStr, conlist
 from linebot.v3.messaging.models.imagemap_action import ImagemapAction
 from linebot.v3.messaging.models.imagemap_base_size import ImagemapBaseSize
 from linebot.v3.messaging.models.imagemap_video import ImagemapVideo
@@ -35,20 +35,24 @@ class ImagemapMessage(Message):
     base_url: StrictStr = Field(..., alias="baseUrl")
     alt_text: StrictStr = Field(..., alias="altText")
     base_size: ImagemapBaseSize = Field(..., alias="baseSize")
-    actions: conlist(ImagemapAction) = Field(...)
+    actions: conlist(SerializeAsAny[ImagemapAction]) = Field(...)
     video: Optional[ImagemapVideo] = None
     type: str = "imagemap"
 
-    __properties = ["type", "quickReply", "sender", "baseUrl", "altText", "baseSize", "actions", "video"]
+    __properties: ClassVar[List[str]] = ["type", "quickReply", "sender", "baseUrl", "altText", "baseSize", "actions", "video"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -61,27 +65,27 @@ class ImagemapMessage(Message):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of quick_reply
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of quick_reply
         if self.quick_reply:
             _dict['quickReply'] = self.quick_reply.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of sender
+        # override the default output from pydantic by calling `to_dict()` of sender
         if self.sender:
             _dict['sender'] = self.sender.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of base_size
+        # override the default output from pydantic by calling `to_dict()` of base_size
         if self.base_size:
             _dict['baseSize'] = self.base_size.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in actions (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in actions (list)
         _items = []
         if self.actions:
             for _item in self.actions:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['actions'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of video
+        # override the default output from pydantic by calling `to_dict()` of video
         if self.video:
             _dict['video'] = self.video.to_dict()
         return _dict
@@ -93,9 +97,9 @@ class ImagemapMessage(Message):
             return None
 
         if not isinstance(obj, dict):
-            return ImagemapMessage.parse_obj(obj)
+            return ImagemapMessage.model_validate(obj)
 
-        _obj = ImagemapMessage.parse_obj({
+        _obj = ImagemapMessage.model_validate({
             "type": obj.get("type"),
             "quick_reply": QuickReply.from_dict(obj.get("quickReply")) if obj.get("quickReply") is not None else None,
             "sender": Sender.from_dict(obj.get("sender")) if obj.get("sender") is not None else None,
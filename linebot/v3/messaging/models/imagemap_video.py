@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.imagemap_area import ImagemapArea
 from linebot.v3.messaging.models.imagemap_external_link import ImagemapExternalLink
 
@@ -32,16 +32,20 @@ class ImagemapVideo(BaseModel):
     area: Optional[ImagemapArea] = None
     external_link: Optional[ImagemapExternalLink] = Field(None, alias="externalLink")
 
-    __properties = ["originalContentUrl", "previewImageUrl", "area", "externalLink"]
+    __properties: ClassVar[List[str]] = ["originalContentUrl", "previewImageUrl", "area", "externalLink"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,14 +58,14 @@ class ImagemapVideo(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of area
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of area
         if self.area:
             _dict['area'] = self.area.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of external_link
+        # override the default output from pydantic by calling `to_dict()` of external_link
         if self.external_link:
             _dict['externalLink'] = self.external_link.to_dict()
         return _dict
@@ -73,9 +77,9 @@ class ImagemapVideo(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ImagemapVideo.parse_obj(obj)
+            return ImagemapVideo.model_validate(obj)
 
-        _obj = ImagemapVideo.parse_obj({
+        _obj = ImagemapVideo.model_validate({
             "original_content_url": obj.get("originalContentUrl"),
             "preview_image_url": obj.get("previewImageUrl"),
             "area": ImagemapArea.from_dict(obj.get("area")) if obj.get("area") is not None else None,
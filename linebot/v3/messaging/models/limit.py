@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, conint
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, conint
 
 class Limit(BaseModel):
     """
@@ -29,16 +29,20 @@ class Limit(BaseModel):
     max: Optional[conint(strict=True, ge=1)] = Field(None, description="The maximum number of narrowcast messages to send. Use this parameter to limit the number of narrowcast messages sent. The recipients will be chosen at random. ")
     up_to_remaining_quota: Optional[StrictBool] = Field(False, alias="upToRemainingQuota", description="If true, the message will be sent within the maximum number of deliverable messages. The default value is `false`.  Targets will be selected at random. ")
 
-    __properties = ["max", "upToRemainingQuota"]
+    __properties: ClassVar[List[str]] = ["max", "upToRemainingQuota"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class Limit(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class Limit(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Limit.parse_obj(obj)
+            return Limit.model_validate(obj)
 
-        _obj = Limit.parse_obj({
+        _obj = Limit.model_validate({
             "max": obj.get("max"),
             "up_to_remaining_quota": obj.get("upToRemainingQuota") if obj.get("upToRemainingQuota") is not None else False
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-
+from typing import ClassVar, List
+from pydantic import ConfigDict
 from linebot.v3.messaging.models.action import Action
 
 class LocationAction(Action):
@@ -28,16 +28,20 @@ class LocationAction(Action):
     """
     type: str = "location"
 
-    __properties = ["type", "label"]
+    __properties: ClassVar[List[str]] = ["type", "label"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class LocationAction(Action):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class LocationAction(Action):
             return None
 
         if not isinstance(obj, dict):
-            return LocationAction.parse_obj(obj)
+            return LocationAction.model_validate(obj)
 
-        _obj = LocationAction.parse_obj({
+        _obj = LocationAction.model_validate({
             "type": obj.get("type"),
             "label": obj.get("label")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Union
-from pydantic.v1 import Field, StrictFloat, StrictInt, StrictStr
+from typing import ClassVar, List, Union
+from pydantic import ConfigDict, Field, StrictFloat, StrictInt, StrictStr
 from linebot.v3.messaging.models.message import Message
 from linebot.v3.messaging.models.quick_reply import QuickReply
 from linebot.v3.messaging.models.sender import Sender
@@ -35,16 +35,20 @@ class LocationMessage(Message):
     longitude: Union[StrictFloat, StrictInt] = Field(...)
     type: str = "location"
 
-    __properties = ["type", "quickReply", "sender", "title", "address", "latitude", "longitude"]
+    __properties: ClassVar[List[str]] = ["type", "quickReply", "sender", "title", "address", "latitude", "longitude"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,14 +61,14 @@ class LocationMessage(Message):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of quick_reply
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of quick_reply
         if self.quick_reply:
             _dict['quickReply'] = self.quick_reply.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of sender
+        # override the default output from pydantic by calling `to_dict()` of sender
         if self.sender:
             _dict['sender'] = self.sender.to_dict()
         return _dict
@@ -76,9 +80,9 @@ class LocationMessage(Message):
             return None
 
         if not isinstance(obj, dict):
-            return LocationMessage.parse_obj(obj)
+            return LocationMessage.model_validate(obj)
 
-        _obj = LocationMessage.parse_obj({
+        _obj = LocationMessage.model_validate({
             "type": obj.get("type"),
             "quick_reply": QuickReply.from_dict(obj.get("quickReply")) if obj.get("quickReply") is not None else None,
             "sender": Sender.from_dict(obj.get("sender")) if obj.get("sender") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field
 from linebot.v3.messaging.models.chat_reference import ChatReference
 
 class MarkMessagesAsReadRequest(BaseModel):
@@ -29,16 +29,20 @@ class MarkMessagesAsReadRequest(BaseModel):
     """
     chat: ChatReference = Field(...)
 
-    __properties = ["chat"]
+    __properties: ClassVar[List[str]] = ["chat"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,11 +55,11 @@ class MarkMessagesAsReadRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of chat
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of chat
         if self.chat:
             _dict['chat'] = self.chat.to_dict()
         return _dict
@@ -67,9 +71,9 @@ class MarkMessagesAsReadRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return MarkMessagesAsReadRequest.parse_obj(obj)
+            return MarkMessagesAsReadRequest.model_validate(obj)
 
-        _obj = MarkMessagesAsReadRequest.parse_obj({
+        _obj = MarkMessagesAsReadRequest.model_validate({
             "chat": ChatReference.from_dict(obj.get("chat")) if obj.get("chat") is not None else None
         })
         return _obj
@@ -18,26 +18,30 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 
 class MembersIdsResponse(BaseModel):
     """
     MembersIdsResponse
     """
-    member_ids: conlist(StrictStr, max_items=100) = Field(..., alias="memberIds", description="List of user IDs of members in the group chat. Only users of LINE for iOS and LINE for Android are included in `memberIds`.")
+    member_ids: conlist(StrictStr, max_length=100) = Field(..., alias="memberIds", description="List of user IDs of members in the group chat. Only users of LINE for iOS and LINE for Android are included in `memberIds`.")
     next: Optional[StrictStr] = Field(None, description="A continuation token to get the next array of user IDs of the members in the group chat. Returned only when there are remaining user IDs that were not returned in `memberIds` in the original request. ")
 
-    __properties = ["memberIds", "next"]
+    __properties: ClassVar[List[str]] = ["memberIds", "next"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class MembersIdsResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class MembersIdsResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return MembersIdsResponse.parse_obj(obj)
+            return MembersIdsResponse.model_validate(obj)
 
-        _obj = MembersIdsResponse.parse_obj({
+        _obj = MembersIdsResponse.model_validate({
             "member_ids": obj.get("memberIds"),
             "next": obj.get("next")
         })
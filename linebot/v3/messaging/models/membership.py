@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional, Union
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictFloat, StrictInt, StrictStr, conlist, validator
+from typing import ClassVar, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr, conlist, field_validator
 
 class Membership(BaseModel):
     """
@@ -28,7 +28,7 @@ class Membership(BaseModel):
     membership_id: StrictInt = Field(..., alias="membershipId", description="Membership plan ID.")
     title: StrictStr = Field(..., description="Membership plan name.")
     description: StrictStr = Field(..., description="Membership plan description.")
-    benefits: conlist(StrictStr, min_items=1) = Field(..., description="List of membership plan perks.")
+    benefits: conlist(StrictStr, min_length=1) = Field(..., description="List of membership plan perks.")
     price: Union[StrictFloat, StrictInt] = Field(..., description="Monthly fee for membership plan. (e.g. 1500.00)")
     currency: StrictStr = Field(..., description="The currency of membership.price.")
     member_count: StrictInt = Field(..., alias="memberCount", description="Number of members subscribed to the membership plan.")
@@ -36,23 +36,27 @@ class Membership(BaseModel):
     is_in_app_purchase: StrictBool = Field(..., alias="isInAppPurchase", description="Payment method for users who subscribe to a membership plan.")
     is_published: StrictBool = Field(..., alias="isPublished", description="Membership plan status.")
 
-    __properties = ["membershipId", "title", "description", "benefits", "price", "currency", "memberCount", "memberLimit", "isInAppPurchase", "isPublished"]
+    __properties: ClassVar[List[str]] = ["membershipId", "title", "description", "benefits", "price", "currency", "memberCount", "memberLimit", "isInAppPurchase", "isPublished"]
 
-    @validator('currency')
+    @field_validator('currency')
     def currency_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('JPY', 'TWD', 'THB'):
             raise ValueError("must be one of enum values ('JPY', 'TWD', 'THB')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -65,13 +69,13 @@ class Membership(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         # set to None if member_limit (nullable) is None
-        # and __fields_set__ contains the field
-        if self.member_limit is None and "member_limit" in self.__fields_set__:
+        # and model_fields_set contains the field
+        if self.member_limit is None and "member_limit" in self.model_fields_set:
             _dict['memberLimit'] = None
 
         return _dict
@@ -83,9 +87,9 @@ class Membership(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Membership.parse_obj(obj)
+            return Membership.model_validate(obj)
 
-        _obj = Membership.parse_obj({
+        _obj = Membership.model_validate({
             "membership_id": obj.get("membershipId"),
             "title": obj.get("title"),
             "description": obj.get("description"),
@@ -18,26 +18,30 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.messaging.models.membership import Membership
 
 class MembershipListResponse(BaseModel):
     """
     List of memberships
     """
-    memberships: conlist(Membership, min_items=0) = Field(..., description="List of membership information")
+    memberships: conlist(Membership, min_length=0) = Field(..., description="List of membership information")
 
-    __properties = ["memberships"]
+    __properties: ClassVar[List[str]] = ["memberships"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,11 +54,11 @@ class MembershipListResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in memberships (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in memberships (list)
         _items = []
         if self.memberships:
             for _item in self.memberships:
@@ -70,9 +74,9 @@ class MembershipListResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return MembershipListResponse.parse_obj(obj)
+            return MembershipListResponse.model_validate(obj)
 
-        _obj = MembershipListResponse.parse_obj({
+        _obj = MembershipListResponse.model_validate({
             "memberships": [Membership.from_dict(_item) for _item in obj.get("memberships")] if obj.get("memberships") is not None else None
         })
         return _obj
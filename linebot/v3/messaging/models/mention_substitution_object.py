@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, SerializeAsAny
 from linebot.v3.messaging.models.mention_target import MentionTarget
 from linebot.v3.messaging.models.substitution_object import SubstitutionObject
 
@@ -28,19 +28,23 @@ class MentionSubstitutionObject(SubstitutionObject):
     An object representing a mention substitution.
     https://developers.line.biz/en/reference/messaging-api/#text-message-v2-mention-object
     """
-    mentionee: MentionTarget = Field(...)
+    mentionee: SerializeAsAny[MentionTarget] = Field(...)
     type: str = "mention"
 
-    __properties = ["type", "mentionee"]
+    __properties: ClassVar[List[str]] = ["type", "mentionee"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,11 +57,11 @@ class MentionSubstitutionObject(SubstitutionObject):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of mentionee
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of mentionee
         if self.mentionee:
             _dict['mentionee'] = self.mentionee.to_dict()
         return _dict
@@ -69,9 +73,9 @@ class MentionSubstitutionObject(SubstitutionObject):
             return None
 
         if not isinstance(obj, dict):
-            return MentionSubstitutionObject.parse_obj(obj)
+            return MentionSubstitutionObject.model_validate(obj)
 
-        _obj = MentionSubstitutionObject.parse_obj({
+        _obj = MentionSubstitutionObject.model_validate({
             "type": obj.get("type"),
             "mentionee": MentionTarget.from_dict(obj.get("mentionee")) if obj.get("mentionee") is not None else None
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.imagemap_action import ImagemapAction
 from linebot.v3.messaging.models.imagemap_area import ImagemapArea
 
@@ -31,16 +31,20 @@ class MessageImagemapAction(ImagemapAction):
     label: Optional[StrictStr] = None
     type: str = "message"
 
-    __properties = ["type", "area", "text", "label"]
+    __properties: ClassVar[List[str]] = ["type", "area", "text", "label"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,11 +57,11 @@ class MessageImagemapAction(ImagemapAction):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of area
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of area
         if self.area:
             _dict['area'] = self.area.to_dict()
         return _dict
@@ -69,9 +73,9 @@ class MessageImagemapAction(ImagemapAction):
             return None
 
         if not isinstance(obj, dict):
-            return MessageImagemapAction.parse_obj(obj)
+            return MessageImagemapAction.model_validate(obj)
 
-        _obj = MessageImagemapAction.parse_obj({
+        _obj = MessageImagemapAction.model_validate({
             "type": obj.get("type"),
             "area": ImagemapArea.from_dict(obj.get("area")) if obj.get("area") is not None else None,
             "text": obj.get("text"),
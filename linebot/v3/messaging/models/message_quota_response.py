@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from linebot.v3.messaging.models.quota_type import QuotaType
 
 class MessageQuotaResponse(BaseModel):
@@ -30,16 +30,20 @@ class MessageQuotaResponse(BaseModel):
     type: QuotaType = Field(...)
     value: Optional[StrictInt] = Field(None, description="The target limit for sending messages in the current month. This property is returned when the `type` property has a value of `limited`. ")
 
-    __properties = ["type", "value"]
+    __properties: ClassVar[List[str]] = ["type", "value"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class MessageQuotaResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class MessageQuotaResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return MessageQuotaResponse.parse_obj(obj)
+            return MessageQuotaResponse.model_validate(obj)
 
-        _obj = MessageQuotaResponse.parse_obj({
+        _obj = MessageQuotaResponse.model_validate({
             "type": obj.get("type"),
             "value": obj.get("value")
         })
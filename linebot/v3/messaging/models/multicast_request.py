@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr, conlist, constr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictBool, StrictStr, conlist, constr, field_validator
 from linebot.v3.messaging.models.message import Message
 
 class MulticastRequest(BaseModel):
@@ -27,21 +27,25 @@ class MulticastRequest(BaseModel):
     MulticastRequest
     https://developers.line.biz/en/reference/messaging-api/#send-multicast-message
     """
-    messages: conlist(Message, max_items=5, min_items=1) = Field(..., description="Messages to send")
-    to: conlist(StrictStr, max_items=500, min_items=1) = Field(..., description="Array of user IDs. Use userId values which are returned in webhook event objects. Do not use LINE IDs found on LINE.")
+    messages: conlist(SerializeAsAny[Message], max_length=5, min_length=1) = Field(..., description="Messages to send")
+    to: conlist(StrictStr, max_length=500, min_length=1) = Field(..., description="Array of user IDs. Use userId values which are returned in webhook event objects. Do not use LINE IDs found on LINE.")
     notification_disabled: Optional[StrictBool] = Field(False, alias="notificationDisabled", description="`true`: The user doesn’t receive a push notification when a message is sent. `false`: The user receives a push notification when the message is sent (unless they have disabled push notifications in LINE and/or their device). The default value is false. ")
-    custom_aggregation_units: Optional[conlist(constr(strict=True, max_length=30, min_length=1), max_items=1)] = Field(None, alias="customAggregationUnits", description="Name of aggregation unit. Case-sensitive.")
+    custom_aggregation_units: Optional[conlist(constr(strict=True, max_length=30, min_length=1), max_length=1)] = Field(None, alias="customAggregationUnits", description="Name of aggregation unit. Case-sensitive.")
 
-    __properties = ["messages", "to", "notificationDisabled", "customAggregationUnits"]
+    __properties: ClassVar[List[str]] = ["messages", "to", "notificationDisabled", "customAggregationUnits"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,11 +58,11 @@ class MulticastRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in messages (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in messages (list)
         _items = []
         if self.messages:
             for _item in self.messages:
@@ -74,9 +78,9 @@ class MulticastRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return MulticastRequest.parse_obj(obj)
+            return MulticastRequest.model_validate(obj)
 
-        _obj = MulticastRequest.parse_obj({
+        _obj = MulticastRequest.model_validate({
             "messages": [Message.from_dict(_item) for _item in obj.get("messages")] if obj.get("messages") is not None else None,
             "to": obj.get("to"),
             "notification_disabled": obj.get("notificationDisabled") if obj.get("notificationDisabled") is not None else False,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 from datetime import datetime
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, field_validator
 
 class NarrowcastProgressResponse(BaseModel):
     """
@@ -35,23 +35,27 @@ class NarrowcastProgressResponse(BaseModel):
     accepted_time: datetime = Field(..., alias="acceptedTime", description="Narrowcast message request accepted time in milliseconds.  Format: ISO 8601 (e.g. 2020-12-03T10:15:30.121Z) Timezone: UTC ")
     completed_time: Optional[datetime] = Field(None, alias="completedTime", description="Processing of narrowcast message request completion time in milliseconds. Returned when the phase property is succeeded or failed.  Format: ISO 8601 (e.g. 2020-12-03T10:15:30.121Z) Timezone: UTC ")
 
-    __properties = ["phase", "successCount", "failureCount", "targetCount", "failedDescription", "errorCode", "acceptedTime", "completedTime"]
+    __properties: ClassVar[List[str]] = ["phase", "successCount", "failureCount", "targetCount", "failedDescription", "errorCode", "acceptedTime", "completedTime"]
 
-    @validator('phase')
+    @field_validator('phase')
     def phase_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('waiting', 'sending', 'succeeded', 'failed'):
             raise ValueError("must be one of enum values ('waiting', 'sending', 'succeeded', 'failed')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -64,10 +68,10 @@ class NarrowcastProgressResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -77,9 +81,9 @@ class NarrowcastProgressResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return NarrowcastProgressResponse.parse_obj(obj)
+            return NarrowcastProgressResponse.model_validate(obj)
 
-        _obj = NarrowcastProgressResponse.parse_obj({
+        _obj = NarrowcastProgressResponse.model_validate({
             "phase": obj.get("phase"),
             "success_count": obj.get("successCount"),
             "failure_count": obj.get("failureCount"),
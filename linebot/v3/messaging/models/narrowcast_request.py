@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictBool, conlist
 from linebot.v3.messaging.models.filter import Filter
 from linebot.v3.messaging.models.limit import Limit
 from linebot.v3.messaging.models.message import Message
@@ -30,22 +30,26 @@ class NarrowcastRequest(BaseModel):
     NarrowcastRequest
     https://developers.line.biz/en/reference/messaging-api/#send-narrowcast-message
     """
-    messages: conlist(Message, max_items=5, min_items=1) = Field(..., description="List of Message objects.")
-    recipient: Optional[Recipient] = None
+    messages: conlist(SerializeAsAny[Message], max_length=5, min_length=1) = Field(..., description="List of Message objects.")
+    recipient: Optional[SerializeAsAny[Recipient]] = None
     filter: Optional[Filter] = None
     limit: Optional[Limit] = None
     notification_disabled: Optional[StrictBool] = Field(False, alias="notificationDisabled", description="`true`: The user doesn’t receive a push notification when a message is sent. `false`: The user receives a push notification when the message is sent (unless they have disabled push notifications in LINE and/or their device). The default value is false. ")
 
-    __properties = ["messages", "recipient", "filter", "limit", "notificationDisabled"]
+    __properties: ClassVar[List[str]] = ["messages", "recipient", "filter", "limit", "notificationDisabled"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -58,24 +62,24 @@ class NarrowcastRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in messages (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in messages (list)
         _items = []
         if self.messages:
             for _item in self.messages:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['messages'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of recipient
+        # override the default output from pydantic by calling `to_dict()` of recipient
         if self.recipient:
             _dict['recipient'] = self.recipient.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of filter
+        # override the default output from pydantic by calling `to_dict()` of filter
         if self.filter:
             _dict['filter'] = self.filter.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of limit
+        # override the default output from pydantic by calling `to_dict()` of limit
         if self.limit:
             _dict['limit'] = self.limit.to_dict()
         return _dict
@@ -87,9 +91,9 @@ class NarrowcastRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return NarrowcastRequest.parse_obj(obj)
+            return NarrowcastRequest.model_validate(obj)
 
-        _obj = NarrowcastRequest.parse_obj({
+        _obj = NarrowcastRequest.model_validate({
             "messages": [Message.from_dict(_item) for _item in obj.get("messages")] if obj.get("messages") is not None else None,
             "recipient": Recipient.from_dict(obj.get("recipient")) if obj.get("recipient") is not None else None,
             "filter": Filter.from_dict(obj.get("filter")) if obj.get("filter") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, field_validator
 
 class NumberOfMessagesResponse(BaseModel):
     """
@@ -28,23 +28,27 @@ class NumberOfMessagesResponse(BaseModel):
     status: StrictStr = Field(..., description="Aggregation process status. One of:  `ready`: The number of messages can be obtained. `unready`: We haven't finished calculating the number of sent messages for the specified in date. For example, this property is returned when the delivery date or a future date is specified. Calculation usually takes about a day. `unavailable_for_privacy`: The total number of messages on the specified day is less than 20. `out_of_service`: The specified date is earlier than the date on which we first started calculating sent messages (March 31, 2018). ")
     success: Optional[StrictInt] = Field(None, description="The number of messages delivered using the phone number on the date specified in `date`. The response has this property only when the value of `status` is `ready`.  ")
 
-    __properties = ["status", "success"]
+    __properties: ClassVar[List[str]] = ["status", "success"]
 
-    @validator('status')
+    @field_validator('status')
     def status_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('ready', 'unready', 'unavailable_for_privacy', 'out_of_service'):
             raise ValueError("must be one of enum values ('ready', 'unready', 'unavailable_for_privacy', 'out_of_service')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,10 +61,10 @@ class NumberOfMessagesResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -70,9 +74,9 @@ class NumberOfMessagesResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return NumberOfMessagesResponse.parse_obj(obj)
+            return NumberOfMessagesResponse.model_validate(obj)
 
-        _obj = NumberOfMessagesResponse.parse_obj({
+        _obj = NumberOfMessagesResponse.model_validate({
             "status": obj.get("status"),
             "success": obj.get("success")
         })
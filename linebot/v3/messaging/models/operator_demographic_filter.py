@@ -18,29 +18,33 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, conlist
 from linebot.v3.messaging.models.demographic_filter import DemographicFilter
 
 class OperatorDemographicFilter(DemographicFilter):
     """
     OperatorDemographicFilter
     """
-    var_and: Optional[conlist(DemographicFilter)] = Field(None, alias="and")
-    var_or: Optional[conlist(DemographicFilter)] = Field(None, alias="or")
-    var_not: Optional[DemographicFilter] = Field(None, alias="not")
+    var_and: Optional[conlist(SerializeAsAny[DemographicFilter])] = Field(None, alias="and")
+    var_or: Optional[conlist(SerializeAsAny[DemographicFilter])] = Field(None, alias="or")
+    var_not: Optional[SerializeAsAny[DemographicFilter]] = Field(None, alias="not")
     type: str = "operator"
 
-    __properties = ["type", "and", "or", "not"]
+    __properties: ClassVar[List[str]] = ["type", "and", "or", "not"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,25 +57,25 @@ class OperatorDemographicFilter(DemographicFilter):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in var_and (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in var_and (list)
         _items = []
         if self.var_and:
             for _item in self.var_and:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['and'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in var_or (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in var_or (list)
         _items = []
         if self.var_or:
             for _item in self.var_or:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['or'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of var_not
+        # override the default output from pydantic by calling `to_dict()` of var_not
         if self.var_not:
             _dict['not'] = self.var_not.to_dict()
         return _dict
@@ -83,9 +87,9 @@ class OperatorDemographicFilter(DemographicFilter):
             return None
 
         if not isinstance(obj, dict):
-            return OperatorDemographicFilter.parse_obj(obj)
+            return OperatorDemographicFilter.model_validate(obj)
 
-        _obj = OperatorDemographicFilter.parse_obj({
+        _obj = OperatorDemographicFilter.model_validate({
             "type": obj.get("type"),
             "var_and": [DemographicFilter.from_dict(_item) for _item in obj.get("and")] if obj.get("and") is not None else None,
             "var_or": [DemographicFilter.from_dict(_item) for _item in obj.get("or")] if obj.get("or") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr, constr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr, constr, field_validator
 from linebot.v3.messaging.models.action import Action
 
 class PostbackAction(Action):
@@ -33,9 +33,9 @@ class PostbackAction(Action):
     fill_in_text: Optional[StrictStr] = Field(None, alias="fillInText")
     type: str = "postback"
 
-    __properties = ["type", "label", "data", "displayText", "text", "inputOption", "fillInText"]
+    __properties: ClassVar[List[str]] = ["type", "label", "data", "displayText", "text", "inputOption", "fillInText"]
 
-    @validator('input_option')
+    @field_validator('input_option')
     def input_option_validate_enum(cls, value):
         """Validates the enum"""
         if value is None:
@@ -45,14 +45,18 @@ class PostbackAction(Action):
             raise ValueError("must be one of enum values ('closeRichMenu', 'openRichMenu', 'openKeyboard', 'openVoice')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -65,10 +69,10 @@ class PostbackAction(Action):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -78,9 +82,9 @@ class PostbackAction(Action):
             return None
 
         if not isinstance(obj, dict):
-            return PostbackAction.parse_obj(obj)
+            return PostbackAction.model_validate(obj)
 
-        _obj = PostbackAction.parse_obj({
+        _obj = PostbackAction.model_validate({
             "type": obj.get("type"),
             "label": obj.get("label"),
             "data": obj.get("data"),
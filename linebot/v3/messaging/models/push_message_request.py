@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictBool, StrictStr, conlist
 from linebot.v3.messaging.models.message import Message
 
 class PushMessageRequest(BaseModel):
@@ -28,20 +28,24 @@ class PushMessageRequest(BaseModel):
     https://developers.line.biz/en/reference/messaging-api/#send-push-message
     """
     to: StrictStr = Field(..., description="ID of the receiver.")
-    messages: conlist(Message, max_items=5, min_items=1) = Field(..., description="List of Message objects.")
+    messages: conlist(SerializeAsAny[Message], max_length=5, min_length=1) = Field(..., description="List of Message objects.")
     notification_disabled: Optional[StrictBool] = Field(False, alias="notificationDisabled", description="`true`: The user doesn’t receive a push notification when a message is sent. `false`: The user receives a push notification when the message is sent (unless they have disabled push notifications in LINE and/or their device). The default value is false. ")
     custom_aggregation_units: Optional[conlist(StrictStr)] = Field(None, alias="customAggregationUnits", description="List of aggregation unit name. Case-sensitive. This functions can only be used by corporate users who have submitted the required applications. ")
 
-    __properties = ["to", "messages", "notificationDisabled", "customAggregationUnits"]
+    __properties: ClassVar[List[str]] = ["to", "messages", "notificationDisabled", "customAggregationUnits"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,11 +58,11 @@ class PushMessageRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in messages (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in messages (list)
         _items = []
         if self.messages:
             for _item in self.messages:
@@ -74,9 +78,9 @@ class PushMessageRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return PushMessageRequest.parse_obj(obj)
+            return PushMessageRequest.model_validate(obj)
 
-        _obj = PushMessageRequest.parse_obj({
+        _obj = PushMessageRequest.model_validate({
             "to": obj.get("to"),
             "messages": [Message.from_dict(_item) for _item in obj.get("messages")] if obj.get("messages") is not None else None,
             "notification_disabled": obj.get("notificationDisabled") if obj.get("notificationDisabled") is not None else False,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.messaging.models.sent_message import SentMessage
 
 class PushMessageResponse(BaseModel):
@@ -27,18 +27,22 @@ class PushMessageResponse(BaseModel):
     PushMessageResponse
     https://developers.line.biz/en/reference/messaging-api/#send-push-message-response
     """
-    sent_messages: conlist(SentMessage, max_items=5, min_items=1) = Field(..., alias="sentMessages", description="Array of sent messages.")
+    sent_messages: conlist(SentMessage, max_length=5, min_length=1) = Field(..., alias="sentMessages", description="Array of sent messages.")
 
-    __properties = ["sentMessages"]
+    __properties: ClassVar[List[str]] = ["sentMessages"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,11 +55,11 @@ class PushMessageResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in sent_messages (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in sent_messages (list)
         _items = []
         if self.sent_messages:
             for _item in self.sent_messages:
@@ -71,9 +75,9 @@ class PushMessageResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return PushMessageResponse.parse_obj(obj)
+            return PushMessageResponse.model_validate(obj)
 
-        _obj = PushMessageResponse.parse_obj({
+        _obj = PushMessageResponse.model_validate({
             "sent_messages": [SentMessage.from_dict(_item) for _item in obj.get("sentMessages")] if obj.get("sentMessages") is not None else None
         })
         return _obj
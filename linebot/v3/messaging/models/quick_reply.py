@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.messaging.models.quick_reply_item import QuickReplyItem
 
 class QuickReply(BaseModel):
@@ -27,18 +27,22 @@ class QuickReply(BaseModel):
     Quick reply
     https://developers.line.biz/en/reference/messaging-api/#items-object
     """
-    items: Optional[conlist(QuickReplyItem, max_items=13)] = Field(None, description="Quick reply button objects.")
+    items: Optional[conlist(QuickReplyItem, max_length=13)] = Field(None, description="Quick reply button objects.")
 
-    __properties = ["items"]
+    __properties: ClassVar[List[str]] = ["items"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,11 +55,11 @@ class QuickReply(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in items (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in items (list)
         _items = []
         if self.items:
             for _item in self.items:
@@ -71,9 +75,9 @@ class QuickReply(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return QuickReply.parse_obj(obj)
+            return QuickReply.model_validate(obj)
 
-        _obj = QuickReply.parse_obj({
+        _obj = QuickReply.model_validate({
             "items": [QuickReplyItem.from_dict(_item) for _item in obj.get("items")] if obj.get("items") is not None else None
         })
         return _obj
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, constr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictStr, constr
 from linebot.v3.messaging.models.action import Action
 
 class QuickReplyItem(BaseModel):
@@ -28,19 +28,23 @@ class QuickReplyItem(BaseModel):
     https://developers.line.biz/en/reference/messaging-api/#items-object
     """
     image_url: Optional[constr(strict=True, max_length=2000)] = Field(None, alias="imageUrl", description="URL of the icon that is displayed at the beginning of the button")
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
     type: Optional[StrictStr] = Field('action', description="`action`")
 
-    __properties = ["imageUrl", "action", "type"]
+    __properties: ClassVar[List[str]] = ["imageUrl", "action", "type"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,11 +57,11 @@ class QuickReplyItem(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -69,9 +73,9 @@ class QuickReplyItem(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return QuickReplyItem.parse_obj(obj)
+            return QuickReplyItem.model_validate(obj)
 
-        _obj = QuickReplyItem.parse_obj({
+        _obj = QuickReplyItem.model_validate({
             "image_url": obj.get("imageUrl"),
             "action": Action.from_dict(obj.get("action")) if obj.get("action") is not None else None,
             "type": obj.get("type") if obj.get("type") is not None else 'action'
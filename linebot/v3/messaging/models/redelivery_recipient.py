@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.recipient import Recipient
 
 class RedeliveryRecipient(Recipient):
@@ -29,16 +29,20 @@ class RedeliveryRecipient(Recipient):
     request_id: Optional[StrictStr] = Field(None, alias="requestId")
     type: str = "redelivery"
 
-    __properties = ["type", "requestId"]
+    __properties: ClassVar[List[str]] = ["type", "requestId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class RedeliveryRecipient(Recipient):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class RedeliveryRecipient(Recipient):
             return None
 
         if not isinstance(obj, dict):
-            return RedeliveryRecipient.parse_obj(obj)
+            return RedeliveryRecipient.model_validate(obj)
 
-        _obj = RedeliveryRecipient.parse_obj({
+        _obj = RedeliveryRecipient.model_validate({
             "type": obj.get("type"),
             "request_id": obj.get("requestId")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.messaging.models.rich_menu_alias_response import RichMenuAliasResponse
 
 class RichMenuAliasListResponse(BaseModel):
@@ -29,16 +29,20 @@ class RichMenuAliasListResponse(BaseModel):
     """
     aliases: conlist(RichMenuAliasResponse) = Field(..., description="Rich menu aliases.")
 
-    __properties = ["aliases"]
+    __properties: ClassVar[List[str]] = ["aliases"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,11 +55,11 @@ class RichMenuAliasListResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in aliases (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in aliases (list)
         _items = []
         if self.aliases:
             for _item in self.aliases:
@@ -71,9 +75,9 @@ class RichMenuAliasListResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuAliasListResponse.parse_obj(obj)
+            return RichMenuAliasListResponse.model_validate(obj)
 
-        _obj = RichMenuAliasListResponse.parse_obj({
+        _obj = RichMenuAliasListResponse.model_validate({
             "aliases": [RichMenuAliasResponse.from_dict(_item) for _item in obj.get("aliases")] if obj.get("aliases") is not None else None
         })
         return _obj
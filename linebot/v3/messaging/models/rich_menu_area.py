@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, SerializeAsAny
 from linebot.v3.messaging.models.action import Action
 from linebot.v3.messaging.models.rich_menu_bounds import RichMenuBounds
 
@@ -28,18 +28,22 @@ class RichMenuArea(BaseModel):
     Rich menu area
     """
     bounds: Optional[RichMenuBounds] = None
-    action: Optional[Action] = None
+    action: Optional[SerializeAsAny[Action]] = None
 
-    __properties = ["bounds", "action"]
+    __properties: ClassVar[List[str]] = ["bounds", "action"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,14 +56,14 @@ class RichMenuArea(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of bounds
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of bounds
         if self.bounds:
             _dict['bounds'] = self.bounds.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of action
+        # override the default output from pydantic by calling `to_dict()` of action
         if self.action:
             _dict['action'] = self.action.to_dict()
         return _dict
@@ -71,9 +75,9 @@ class RichMenuArea(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuArea.parse_obj(obj)
+            return RichMenuArea.model_validate(obj)
 
-        _obj = RichMenuArea.parse_obj({
+        _obj = RichMenuArea.model_validate({
             "bounds": RichMenuBounds.from_dict(obj.get("bounds")) if obj.get("bounds") is not None else None,
             "action": Action.from_dict(obj.get("action")) if obj.get("action") is not None else None
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 from datetime import datetime
-from typing import Optional
-from pydantic.v1 import BaseModel, Field
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from linebot.v3.messaging.models.rich_menu_batch_progress_phase import RichMenuBatchProgressPhase
 
 class RichMenuBatchProgressResponse(BaseModel):
@@ -31,16 +31,20 @@ class RichMenuBatchProgressResponse(BaseModel):
     accepted_time: datetime = Field(..., alias="acceptedTime", description="The accepted time in milliseconds of the request of batch control the rich menu.  Format: ISO 8601 (e.g. 2023-06-08T10:15:30.121Z) Timezone: UTC ")
     completed_time: Optional[datetime] = Field(None, alias="completedTime", description="The completed time in milliseconds of rich menu batch control. Returned when the phase property is succeeded or failed.  Format: ISO 8601 (e.g. 2023-06-08T10:15:30.121Z) Timezone: UTC ")
 
-    __properties = ["phase", "acceptedTime", "completedTime"]
+    __properties: ClassVar[List[str]] = ["phase", "acceptedTime", "completedTime"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,10 +57,10 @@ class RichMenuBatchProgressResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -66,9 +70,9 @@ class RichMenuBatchProgressResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuBatchProgressResponse.parse_obj(obj)
+            return RichMenuBatchProgressResponse.model_validate(obj)
 
-        _obj = RichMenuBatchProgressResponse.parse_obj({
+        _obj = RichMenuBatchProgressResponse.model_validate({
             "phase": obj.get("phase"),
             "accepted_time": obj.get("acceptedTime"),
             "completed_time": obj.get("completedTime")
@@ -18,20 +18,20 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, conlist, constr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, conlist, constr, field_validator
 from linebot.v3.messaging.models.rich_menu_batch_operation import RichMenuBatchOperation
 
 class RichMenuBatchRequest(BaseModel):
     """
     RichMenuBatchRequest
     """
-    operations: conlist(RichMenuBatchOperation, max_items=1000) = Field(..., description="Array of Rich menu operation object...")
+    operations: conlist(SerializeAsAny[RichMenuBatchOperation], max_length=1000) = Field(..., description="Array of Rich menu operation object...")
     resume_request_key: Optional[constr(strict=True, max_length=100, min_length=1)] = Field(None, alias="resumeRequestKey", description="Key for retry. Key value is a string matching the regular expression pattern")
 
-    __properties = ["operations", "resumeRequestKey"]
+    __properties: ClassVar[List[str]] = ["operations", "resumeRequestKey"]
 
-    @validator('resume_request_key')
+    @field_validator('resume_request_key')
     def resume_request_key_validate_regular_expression(cls, value):
         """Validates the regular expression"""
         if value is None:
@@ -41,14 +41,18 @@ class RichMenuBatchRequest(BaseModel):
             raise ValueError(r"must validate the regular expression /^[a-zA-Z0-9_-]{1,100}$/")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -61,11 +65,11 @@ class RichMenuBatchRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in operations (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in operations (list)
         _items = []
         if self.operations:
             for _item in self.operations:
@@ -81,9 +85,9 @@ class RichMenuBatchRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuBatchRequest.parse_obj(obj)
+            return RichMenuBatchRequest.model_validate(obj)
 
-        _obj = RichMenuBatchRequest.parse_obj({
+        _obj = RichMenuBatchRequest.model_validate({
             "operations": [RichMenuBatchOperation.from_dict(_item) for _item in obj.get("operations")] if obj.get("operations") is not None else None,
             "resume_request_key": obj.get("resumeRequestKey")
         })
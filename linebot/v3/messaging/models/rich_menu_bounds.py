@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, conint
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, conint
 
 class RichMenuBounds(BaseModel):
     """
@@ -31,16 +31,20 @@ class RichMenuBounds(BaseModel):
     width: Optional[conint(strict=True, le=2147483647, ge=1)] = Field(None, description="Width of the area.")
     height: Optional[conint(strict=True, le=2147483647, ge=1)] = Field(None, description="Height of the area.")
 
-    __properties = ["x", "y", "width", "height"]
+    __properties: ClassVar[List[str]] = ["x", "y", "width", "height"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,10 +57,10 @@ class RichMenuBounds(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -66,9 +70,9 @@ class RichMenuBounds(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuBounds.parse_obj(obj)
+            return RichMenuBounds.model_validate(obj)
 
-        _obj = RichMenuBounds.parse_obj({
+        _obj = RichMenuBounds.model_validate({
             "x": obj.get("x"),
             "y": obj.get("y"),
             "width": obj.get("width"),
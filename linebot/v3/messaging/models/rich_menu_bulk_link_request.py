@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 
 class RichMenuBulkLinkRequest(BaseModel):
     """
@@ -27,18 +27,22 @@ class RichMenuBulkLinkRequest(BaseModel):
     https://developers.line.biz/en/reference/messaging-api/#link-rich-menu-to-users
     """
     rich_menu_id: StrictStr = Field(..., alias="richMenuId", description="ID of a rich menu")
-    user_ids: conlist(StrictStr, max_items=500, min_items=1) = Field(..., alias="userIds", description="Array of user IDs. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE.")
+    user_ids: conlist(StrictStr, max_length=500, min_length=1) = Field(..., alias="userIds", description="Array of user IDs. Found in the `source` object of webhook event objects. Do not use the LINE ID used in LINE.")
 
-    __properties = ["richMenuId", "userIds"]
+    __properties: ClassVar[List[str]] = ["richMenuId", "userIds"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class RichMenuBulkLinkRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class RichMenuBulkLinkRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuBulkLinkRequest.parse_obj(obj)
+            return RichMenuBulkLinkRequest.model_validate(obj)
 
-        _obj = RichMenuBulkLinkRequest.parse_obj({
+        _obj = RichMenuBulkLinkRequest.model_validate({
             "rich_menu_id": obj.get("richMenuId"),
             "user_ids": obj.get("userIds")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr, conlist, constr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr, conlist, constr
 from linebot.v3.messaging.models.rich_menu_area import RichMenuArea
 from linebot.v3.messaging.models.rich_menu_size import RichMenuSize
 
@@ -32,18 +32,22 @@ class RichMenuResponse(BaseModel):
     selected: StrictBool = Field(..., description="`true` to display the rich menu by default. Otherwise, `false`.")
     name: constr(strict=True, max_length=300) = Field(..., description="Name of the rich menu. This value can be used to help manage your rich menus and is not displayed to users.")
     chat_bar_text: constr(strict=True, max_length=14) = Field(..., alias="chatBarText", description="Text displayed in the chat bar")
-    areas: conlist(RichMenuArea, max_items=20) = Field(..., description="Array of area objects which define the coordinates and size of tappable areas")
+    areas: conlist(RichMenuArea, max_length=20) = Field(..., description="Array of area objects which define the coordinates and size of tappable areas")
 
-    __properties = ["richMenuId", "size", "selected", "name", "chatBarText", "areas"]
+    __properties: ClassVar[List[str]] = ["richMenuId", "size", "selected", "name", "chatBarText", "areas"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -56,14 +60,14 @@ class RichMenuResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of size
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of size
         if self.size:
             _dict['size'] = self.size.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in areas (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in areas (list)
         _items = []
         if self.areas:
             for _item in self.areas:
@@ -79,9 +83,9 @@ class RichMenuResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuResponse.parse_obj(obj)
+            return RichMenuResponse.model_validate(obj)
 
-        _obj = RichMenuResponse.parse_obj({
+        _obj = RichMenuResponse.model_validate({
             "rich_menu_id": obj.get("richMenuId"),
             "size": RichMenuSize.from_dict(obj.get("size")) if obj.get("size") is not None else None,
             "selected": obj.get("selected"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, constr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, constr
 from linebot.v3.messaging.models.action import Action
 
 class RichMenuSwitchAction(Action):
@@ -30,16 +30,20 @@ class RichMenuSwitchAction(Action):
     rich_menu_alias_id: Optional[constr(strict=True, max_length=32, min_length=0)] = Field(None, alias="richMenuAliasId")
     type: str = "richmenuswitch"
 
-    __properties = ["type", "label", "data", "richMenuAliasId"]
+    __properties: ClassVar[List[str]] = ["type", "label", "data", "richMenuAliasId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class RichMenuSwitchAction(Action):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class RichMenuSwitchAction(Action):
             return None
 
         if not isinstance(obj, dict):
-            return RichMenuSwitchAction.parse_obj(obj)
+            return RichMenuSwitchAction.model_validate(obj)
 
-        _obj = RichMenuSwitchAction.parse_obj({
+        _obj = RichMenuSwitchAction.model_validate({
             "type": obj.get("type"),
             "label": obj.get("label"),
             "data": obj.get("data"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class RoomUserProfileResponse(BaseModel):
     """
@@ -30,16 +30,20 @@ class RoomUserProfileResponse(BaseModel):
     user_id: StrictStr = Field(..., alias="userId", description="User ID")
     picture_url: Optional[StrictStr] = Field(None, alias="pictureUrl", description="Profile image URL. `https` image URL. Not included in the response if the user doesn't have a profile image.")
 
-    __properties = ["displayName", "userId", "pictureUrl"]
+    __properties: ClassVar[List[str]] = ["displayName", "userId", "pictureUrl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class RoomUserProfileResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class RoomUserProfileResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return RoomUserProfileResponse.parse_obj(obj)
+            return RoomUserProfileResponse.model_validate(obj)
 
-        _obj = RoomUserProfileResponse.parse_obj({
+        _obj = RoomUserProfileResponse.model_validate({
             "display_name": obj.get("displayName"),
             "user_id": obj.get("userId"),
             "picture_url": obj.get("pictureUrl")
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, constr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, constr
 
 class Sender(BaseModel):
     """
@@ -28,16 +28,20 @@ class Sender(BaseModel):
     name: Optional[constr(strict=True, max_length=20)] = Field(None, description="Display name. Certain words such as `LINE` may not be used.")
     icon_url: Optional[constr(strict=True, max_length=2000)] = Field(None, alias="iconUrl", description="URL of the image to display as an icon when sending a message")
 
-    __properties = ["name", "iconUrl"]
+    __properties: ClassVar[List[str]] = ["name", "iconUrl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class Sender(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class Sender(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Sender.parse_obj(obj)
+            return Sender.model_validate(obj)
 
-        _obj = Sender.parse_obj({
+        _obj = Sender.model_validate({
             "name": obj.get("name"),
             "icon_url": obj.get("iconUrl")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class SentMessage(BaseModel):
     """
@@ -28,16 +28,20 @@ class SentMessage(BaseModel):
     id: StrictStr = Field(..., description="ID of the sent message.")
     quote_token: Optional[StrictStr] = Field(None, alias="quoteToken", description="Quote token of the message. Only included when a message object that can be specified as a quote target was sent as a push or reply message. ")
 
-    __properties = ["id", "quoteToken"]
+    __properties: ClassVar[List[str]] = ["id", "quoteToken"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class SentMessage(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class SentMessage(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return SentMessage.parse_obj(obj)
+            return SentMessage.model_validate(obj)
 
-        _obj = SentMessage.parse_obj({
+        _obj = SentMessage.model_validate({
             "id": obj.get("id"),
             "quote_token": obj.get("quoteToken")
         })
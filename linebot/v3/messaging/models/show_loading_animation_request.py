@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conint
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conint
 
 class ShowLoadingAnimationRequest(BaseModel):
     """
@@ -29,16 +29,20 @@ class ShowLoadingAnimationRequest(BaseModel):
     chat_id: StrictStr = Field(..., alias="chatId", description="User ID of the target user for whom the loading animation is to be displayed.")
     loading_seconds: Optional[conint(strict=True, le=60, ge=5)] = Field(None, alias="loadingSeconds", description="The number of seconds to display the loading indicator. It must be a multiple of 5. The maximum value is 60 seconds. ")
 
-    __properties = ["chatId", "loadingSeconds"]
+    __properties: ClassVar[List[str]] = ["chatId", "loadingSeconds"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class ShowLoadingAnimationRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class ShowLoadingAnimationRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ShowLoadingAnimationRequest.parse_obj(obj)
+            return ShowLoadingAnimationRequest.model_validate(obj)
 
-        _obj = ShowLoadingAnimationRequest.parse_obj({
+        _obj = ShowLoadingAnimationRequest.model_validate({
             "chat_id": obj.get("chatId"),
             "loading_seconds": obj.get("loadingSeconds")
         })
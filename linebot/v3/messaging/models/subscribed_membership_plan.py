@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Union
-from pydantic.v1 import BaseModel, Field, StrictFloat, StrictInt, StrictStr, conlist, validator
+from typing import ClassVar, List, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr, conlist, field_validator
 
 class SubscribedMembershipPlan(BaseModel):
     """
@@ -28,27 +28,31 @@ class SubscribedMembershipPlan(BaseModel):
     membership_id: StrictInt = Field(..., alias="membershipId", description="Membership plan ID.")
     title: StrictStr = Field(..., description="Membership plan name.")
     description: StrictStr = Field(..., description="Membership plan description.")
-    benefits: conlist(StrictStr, min_items=1) = Field(..., description="List of membership plan perks.")
+    benefits: conlist(StrictStr, min_length=1) = Field(..., description="List of membership plan perks.")
     price: Union[StrictFloat, StrictInt] = Field(..., description="Monthly fee for membership plan. (e.g. 1500.00)")
     currency: StrictStr = Field(..., description="The currency of membership.price.")
 
-    __properties = ["membershipId", "title", "description", "benefits", "price", "currency"]
+    __properties: ClassVar[List[str]] = ["membershipId", "title", "description", "benefits", "price", "currency"]
 
-    @validator('currency')
+    @field_validator('currency')
     def currency_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('JPY', 'TWD', 'THB'):
             raise ValueError("must be one of enum values ('JPY', 'TWD', 'THB')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -61,10 +65,10 @@ class SubscribedMembershipPlan(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -74,9 +78,9 @@ class SubscribedMembershipPlan(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return SubscribedMembershipPlan.parse_obj(obj)
+            return SubscribedMembershipPlan.model_validate(obj)
 
-        _obj = SubscribedMembershipPlan.parse_obj({
+        _obj = SubscribedMembershipPlan.model_validate({
             "membership_id": obj.get("membershipId"),
             "title": obj.get("title"),
             "description": obj.get("description"),
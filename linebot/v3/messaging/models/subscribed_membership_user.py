@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class SubscribedMembershipUser(BaseModel):
     """
@@ -30,16 +30,20 @@ class SubscribedMembershipUser(BaseModel):
     next_billing_date: StrictStr = Field(..., alias="nextBillingDate", description="Next payment date for membership plan. - Format: yyyy-MM-dd (e.g. 2024-02-08) - Timezone: UTC+9 ")
     total_subscription_months: StrictInt = Field(..., alias="totalSubscriptionMonths", description="The period of time in months that the user has been subscribed to a membership plan. If a user previously canceled and then re-subscribed to the same membership plan, only the period after the re-subscription will be counted.")
 
-    __properties = ["membershipNo", "joinedTime", "nextBillingDate", "totalSubscriptionMonths"]
+    __properties: ClassVar[List[str]] = ["membershipNo", "joinedTime", "nextBillingDate", "totalSubscriptionMonths"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class SubscribedMembershipUser(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class SubscribedMembershipUser(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return SubscribedMembershipUser.parse_obj(obj)
+            return SubscribedMembershipUser.model_validate(obj)
 
-        _obj = SubscribedMembershipUser.parse_obj({
+        _obj = SubscribedMembershipUser.model_validate({
             "membership_no": obj.get("membershipNo"),
             "joined_time": obj.get("joinedTime"),
             "next_billing_date": obj.get("nextBillingDate"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field
 from linebot.v3.messaging.models.subscribed_membership_plan import SubscribedMembershipPlan
 from linebot.v3.messaging.models.subscribed_membership_user import SubscribedMembershipUser
 
@@ -30,16 +30,20 @@ class Subscription(BaseModel):
     membership: SubscribedMembershipPlan = Field(...)
     user: SubscribedMembershipUser = Field(...)
 
-    __properties = ["membership", "user"]
+    __properties: ClassVar[List[str]] = ["membership", "user"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,14 +56,14 @@ class Subscription(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of membership
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of membership
         if self.membership:
             _dict['membership'] = self.membership.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of user
+        # override the default output from pydantic by calling `to_dict()` of user
         if self.user:
             _dict['user'] = self.user.to_dict()
         return _dict
@@ -71,9 +75,9 @@ class Subscription(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Subscription.parse_obj(obj)
+            return Subscription.model_validate(obj)
 
-        _obj = Subscription.parse_obj({
+        _obj = Subscription.model_validate({
             "membership": SubscribedMembershipPlan.from_dict(obj.get("membership")) if obj.get("membership") is not None else None,
             "user": SubscribedMembershipUser.from_dict(obj.get("user")) if obj.get("user") is not None else None
         })
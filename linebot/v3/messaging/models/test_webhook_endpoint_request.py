@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, constr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, constr
 
 class TestWebhookEndpointRequest(BaseModel):
     """
@@ -28,16 +28,20 @@ class TestWebhookEndpointRequest(BaseModel):
     """
     endpoint: Optional[constr(strict=True, max_length=500, min_length=0)] = Field(None, description="A webhook URL to be validated.")
 
-    __properties = ["endpoint"]
+    __properties: ClassVar[List[str]] = ["endpoint"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class TestWebhookEndpointRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class TestWebhookEndpointRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return TestWebhookEndpointRequest.parse_obj(obj)
+            return TestWebhookEndpointRequest.model_validate(obj)
 
-        _obj = TestWebhookEndpointRequest.parse_obj({
+        _obj = TestWebhookEndpointRequest.model_validate({
             "endpoint": obj.get("endpoint")
         })
         return _obj
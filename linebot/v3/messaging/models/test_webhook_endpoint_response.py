@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 from datetime import datetime
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 
 class TestWebhookEndpointResponse(BaseModel):
     """
@@ -32,16 +32,20 @@ class TestWebhookEndpointResponse(BaseModel):
     reason: StrictStr = Field(..., description="Reason for the response.")
     detail: StrictStr = Field(..., description="Details of the response.")
 
-    __properties = ["success", "timestamp", "statusCode", "reason", "detail"]
+    __properties: ClassVar[List[str]] = ["success", "timestamp", "statusCode", "reason", "detail"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,10 +58,10 @@ class TestWebhookEndpointResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -67,9 +71,9 @@ class TestWebhookEndpointResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return TestWebhookEndpointResponse.parse_obj(obj)
+            return TestWebhookEndpointResponse.model_validate(obj)
 
-        _obj = TestWebhookEndpointResponse.parse_obj({
+        _obj = TestWebhookEndpointResponse.model_validate({
             "success": obj.get("success"),
             "timestamp": obj.get("timestamp"),
             "status_code": obj.get("statusCode"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr, conlist
 from linebot.v3.messaging.models.emoji import Emoji
 from linebot.v3.messaging.models.message import Message
 from linebot.v3.messaging.models.quick_reply import QuickReply
@@ -35,16 +35,20 @@ class TextMessage(Message):
     quote_token: Optional[StrictStr] = Field(None, alias="quoteToken", description="Quote token of the message you want to quote.")
     type: str = "text"
 
-    __properties = ["type", "quickReply", "sender", "text", "emojis", "quoteToken"]
+    __properties: ClassVar[List[str]] = ["type", "quickReply", "sender", "text", "emojis", "quoteToken"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,17 +61,17 @@ class TextMessage(Message):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of quick_reply
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of quick_reply
         if self.quick_reply:
             _dict['quickReply'] = self.quick_reply.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of sender
+        # override the default output from pydantic by calling `to_dict()` of sender
         if self.sender:
             _dict['sender'] = self.sender.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in emojis (list)
+        # override the default output from pydantic by calling `to_dict()` of each item in emojis (list)
         _items = []
         if self.emojis:
             for _item in self.emojis:
@@ -83,9 +87,9 @@ class TextMessage(Message):
             return None
 
         if not isinstance(obj, dict):
-            return TextMessage.parse_obj(obj)
+            return TextMessage.model_validate(obj)
 
-        _obj = TextMessage.parse_obj({
+        _obj = TextMessage.model_validate({
             "type": obj.get("type"),
             "quick_reply": QuickReply.from_dict(obj.get("quickReply")) if obj.get("quickReply") is not None else None,
             "sender": Sender.from_dict(obj.get("sender")) if obj.get("sender") is not None else None,
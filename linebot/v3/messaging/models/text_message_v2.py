@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Dict, Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, Dict, List, Optional
+from pydantic import ConfigDict, Field, SerializeAsAny, StrictStr
 from linebot.v3.messaging.models.message import Message
 from linebot.v3.messaging.models.quick_reply import QuickReply
 from linebot.v3.messaging.models.sender import Sender
@@ -31,20 +31,24 @@ class TextMessageV2(Message):
     https://developers.line.biz/en/reference/messaging-api/#text-message-v2
     """
     text: StrictStr = Field(...)
-    substitution: Optional[Dict[str, SubstitutionObject]] = Field(None, description="A mapping that specifies substitutions for parts enclosed in {} within the `text` field.")
+    substitution: Optional[Dict[str, SerializeAsAny[SubstitutionObject]]] = Field(None, description="A mapping that specifies substitutions for parts enclosed in {} within the `text` field.")
     quote_token: Optional[StrictStr] = Field(None, alias="quoteToken", description="Quote token of the message you want to quote.")
     type: str = "textV2"
 
-    __properties = ["type", "quickReply", "sender", "text", "substitution", "quoteToken"]
+    __properties: ClassVar[List[str]] = ["type", "quickReply", "sender", "text", "substitution", "quoteToken"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,17 +61,17 @@ class TextMessageV2(Message):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of quick_reply
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of quick_reply
         if self.quick_reply:
             _dict['quickReply'] = self.quick_reply.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of sender
+        # override the default output from pydantic by calling `to_dict()` of sender
         if self.sender:
             _dict['sender'] = self.sender.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of each value in substitution (dict)
+        # override the default output from pydantic by calling `to_dict()` of each value in substitution (dict)
         _field_dict = {}
         if self.substitution:
             for _key in self.substitution:
@@ -83,9 +87,9 @@ class TextMessageV2(Message):
             return None
 
         if not isinstance(obj, dict):
-            return TextMessageV2.parse_obj(obj)
+            return TextMessageV2.model_validate(obj)
 
-        _obj = TextMessageV2.parse_obj({
+        _obj = TextMessageV2.model_validate({
             "type": obj.get("type"),
             "quick_reply": QuickReply.from_dict(obj.get("quickReply")) if obj.get("quickReply") is not None else None,
             "sender": Sender.from_dict(obj.get("sender")) if obj.get("sender") is not None else None,
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.messaging.models.mention_target import MentionTarget
 
 class UserMentionTarget(MentionTarget):
@@ -30,16 +30,20 @@ class UserMentionTarget(MentionTarget):
     user_id: StrictStr = Field(..., alias="userId")
     type: str = "user"
 
-    __properties = ["type", "userId"]
+    __properties: ClassVar[List[str]] = ["type", "userId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class UserMentionTarget(MentionTarget):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class UserMentionTarget(MentionTarget):
             return None
 
         if not isinstance(obj, dict):
-            return UserMentionTarget.parse_obj(obj)
+            return UserMentionTarget.model_validate(obj)
 
-        _obj = UserMentionTarget.parse_obj({
+        _obj = UserMentionTarget.model_validate({
             "type": obj.get("type"),
             "user_id": obj.get("userId")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class UserProfileResponse(BaseModel):
     """
@@ -32,16 +32,20 @@ class UserProfileResponse(BaseModel):
     status_message: Optional[StrictStr] = Field(None, alias="statusMessage", description="User's status message. Not included in the response if the user doesn't have a status message.")
     language: Optional[StrictStr] = Field(None, description="User's language, as a BCP 47 language tag. Not included in the response if the user hasn't yet consented to the LINE Privacy Policy.")
 
-    __properties = ["displayName", "userId", "pictureUrl", "statusMessage", "language"]
+    __properties: ClassVar[List[str]] = ["displayName", "userId", "pictureUrl", "statusMessage", "language"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,10 +58,10 @@ class UserProfileResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -67,9 +71,9 @@ class UserProfileResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return UserProfileResponse.parse_obj(obj)
+            return UserProfileResponse.model_validate(obj)
 
-        _obj = UserProfileResponse.parse_obj({
+        _obj = UserProfileResponse.model_validate({
             "display_name": obj.get("displayName"),
             "user_id": obj.get("userId"),
             "picture_url": obj.get("pictureUrl"),
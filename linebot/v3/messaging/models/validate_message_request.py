@@ -18,26 +18,30 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, conlist
 from linebot.v3.messaging.models.message import Message
 
 class ValidateMessageRequest(BaseModel):
     """
     ValidateMessageRequest
     """
-    messages: conlist(Message, max_items=5, min_items=1) = Field(..., description="Array of message objects to validate")
+    messages: conlist(SerializeAsAny[Message], max_length=5, min_length=1) = Field(..., description="Array of message objects to validate")
 
-    __properties = ["messages"]
+    __properties: ClassVar[List[str]] = ["messages"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,11 +54,11 @@ class ValidateMessageRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in messages (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in messages (list)
         _items = []
         if self.messages:
             for _item in self.messages:
@@ -70,9 +74,9 @@ class ValidateMessageRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ValidateMessageRequest.parse_obj(obj)
+            return ValidateMessageRequest.model_validate(obj)
 
-        _obj = ValidateMessageRequest.parse_obj({
+        _obj = ValidateMessageRequest.model_validate({
             "messages": [Message.from_dict(_item) for _item in obj.get("messages")] if obj.get("messages") is not None else None
         })
         return _obj
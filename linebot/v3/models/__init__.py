@@ -17,3 +17,8 @@
 from .events import (  # noqa
     UnknownEvent,
 )
+from .views import (  # noqa
+    ModelView,
+    EventView,
+    view_class,
+)
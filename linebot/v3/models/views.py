@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.models.views module."""
+
+import importlib
+import typing
+
+from pydantic import BaseModel
+
+from linebot.v3.webhooks.models.event import Event
+
+_VIEW_CLASSES = {}
+_set = object.__setattr__
+
+
+class ModelView(object):
+    """Read-only view of a generated model.
+
+    Views are built from the JSON dict of a model without validating it.
+    Each view class holds the fields of its model in ``__slots__``, under the
+    same attribute names, so it needs far less memory than the model.
+    Lists of models are held as tuples. View classes follow the hierarchy of
+    the models, e.g. the view of MessageEvent is a subclass of EventView.
+    Use :py:func:`view_class` to get the view class of a model.
+    """
+
+    __slots__ = ()
+
+    _model = None
+
+    def __setattr__(self, name, value):
+        """__setattr__ method."""
+        raise AttributeError('{} is read-only'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        """__delattr__ method."""
+        raise AttributeError('{} is read-only'.format(type(self).__name__))
+
+    def __eq__(self, other):
+        """__eq__ method."""
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, field[0]) == getattr(other, field[0]) for field in self._fields)
+
+    def __repr__(self):
+        """__repr__ method."""
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(field[0], getattr(self, field[0])) for field in self._fields))
+
+    def __reduce__(self):
+        """__reduce__ method."""
+        return _restore, (self._model, self.to_dict())
+
+    @classmethod
+    def from_dict(cls, obj):
+        """Create a view from a dict.
+
+        When the model has subtypes, the view of the subtype given by the
+        discriminator is returned.
+
+        :param dict obj: JSON dict of the model, with its camelCase keys
+        :rtype: :py:class:`ModelView`
+        """
+        if obj is None:
+            return None
+
+        if cls._discriminated:
+            cls = cls._subclass_for(obj)
+        fields = cls._fields or cls._resolve_fields()
+
+        view = object.__new__(cls)
+        for name, alias, default, convert in fields:
+            value = obj.get(alias, default)
+            if value is not None and convert is not None:
+                value = convert(value)
+            _set(view, name, value)
+        return view
+
+    def to_dict(self):
+        """Return the JSON dict of the model, with its camelCase keys.
+
+        :rtype: dict
+        """
+        _dict = {}
+        for name, alias, default, convert in self._fields:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if convert is not None:
+                value = _to_dict(value)
+            _dict[alias] = value
+        return _dict
+
+    def to_model(self):
+        """Convert to the full model, validating it.
+
+        :rtype: :py:class:`pydantic.BaseModel`
+        """
+        return self._model.from_dict(self.to_dict())
+
+    @classmethod
+    def _subclass_for(cls, obj):
+        try:
+            name = cls._model.get_discriminator_value(obj)
+        except KeyError:
+            name = None
+        model = getattr(cls._models_module, name, None) if name else None
+        if model is None:
+            return cls
+        return view_class(model)
+
+    @classmethod
+    def _resolve_fields(cls):
+        fields = []
+        for name, field in cls._model.model_fields.items():
+            convert = None
+            model, shape = _model_of(field.annotation)
+            if model is not None:
+                convert = _converter(view_class(model), shape)
+            default = None if field.is_required() else field.default
+            fields.append((name, field.alias or name, default, convert))
+        cls._fields = tuple(fields)
+        return cls._fields
+
+
+def _model_of(annotation):
+    # the model in a field annotation, and whether it is held alone, in a
+    # list or in a dict
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _model_of(args[0])
+    if origin is typing.Union:
+        for arg in args:
+            model, shape = _model_of(arg)
+            if model is not None:
+                return model, shape
+    elif origin in (list, tuple, set, frozenset):
+        return _model_of(args[0])[0], 'list'
+    elif origin is dict:
+        return _model_of(args[1])[0], 'dict'
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, 'single'
+    return None, None
+
+
+def _converter(view_cls, shape):
+    from_dict = view_cls.from_dict
+    if shape == 'single':
+        return from_dict
+    if shape == 'dict':
+        return lambda value: {key: from_dict(item) for key, item in value.items()}
+    return lambda value: tuple(from_dict(item) for item in value)
+
+
+def _to_dict(value):
+    if isinstance(value, ModelView):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _to_dict(item) for key, item in value.items()}
+    return [_to_dict(item) for item in value]
+
+
+def _restore(model, obj):
+    return view_class(model).from_dict(obj)
+
+
+def view_class(model):
+    """Return the view class of a generated model.
+
+    :param model: Model class, e.g. :py:class:`linebot.v3.webhooks.models.MessageEvent`
+    :rtype: type
+    """
+    view_cls = _VIEW_CLASSES.get(model)
+    if view_cls is None:
+        parent = model.__bases__[0]
+        base = view_class(parent) if parent is not BaseModel else ModelView
+        view_cls = type(model.__name__ + 'View', (base,), {
+            '__slots__': tuple(name for name in model.model_fields
+                               if name not in parent.model_fields),
+            '__module__': __name__,
+            '_model': model,
+            '_fields': None,
+            '_discriminated': 'get_discriminator_value' in vars(model),
+            '_models_module': importlib.import_module(model.__module__.rsplit('.', 1)[0]),
+        })
+        _VIEW_CLASSES[model] = view_cls
+    return view_cls
+
+
+EventView = view_class(Event)
@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictStr, conint
+from pydantic import Field, StrictStr, conint
 
 from typing import Optional
 
@@ -67,7 +68,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.acquire_chat_control(chat_id, acquire_chat_control_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -81,7 +82,7 @@ class AsyncLineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -100,7 +101,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.acquire_chat_control_with_http_info(chat_id, acquire_chat_control_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -127,7 +128,7 @@ class AsyncLineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -227,7 +228,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.detach_module(detach_module_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param detach_module_request:
         :type detach_module_request: DetachModuleRequest
@@ -239,7 +240,7 @@ class AsyncLineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -258,7 +259,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.detach_module_with_http_info(detach_module_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param detach_module_request:
         :type detach_module_request: DetachModuleRequest
@@ -283,7 +284,7 @@ class AsyncLineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -379,7 +380,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_modules(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. If you can't get all basic information about the bots in one request, include this parameter to get the remaining array. 
         :type start: str
@@ -393,7 +394,7 @@ class AsyncLineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: GetModulesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -412,7 +413,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_modules_with_http_info(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. If you can't get all basic information about the bots in one request, include this parameter to get the remaining array. 
         :type start: str
@@ -439,7 +440,7 @@ class AsyncLineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(GetModulesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -538,7 +539,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.release_chat_control(chat_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -550,7 +551,7 @@ class AsyncLineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -569,7 +570,7 @@ class AsyncLineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.release_chat_control_with_http_info(chat_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -594,7 +595,7 @@ class AsyncLineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictStr, conint
+from pydantic import Field, StrictStr, conint
 
 from typing import Optional
 
@@ -57,7 +58,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.acquire_chat_control(chat_id, acquire_chat_control_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -71,7 +72,7 @@ class LineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -88,7 +89,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.acquire_chat_control_with_http_info(chat_id, acquire_chat_control_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -115,7 +116,7 @@ class LineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -207,7 +208,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.detach_module(detach_module_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param detach_module_request:
         :type detach_module_request: DetachModuleRequest
@@ -219,7 +220,7 @@ class LineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -236,7 +237,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.detach_module_with_http_info(detach_module_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param detach_module_request:
         :type detach_module_request: DetachModuleRequest
@@ -261,7 +262,7 @@ class LineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -349,7 +350,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_modules(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. If you can't get all basic information about the bots in one request, include this parameter to get the remaining array. 
         :type start: str
@@ -363,7 +364,7 @@ class LineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: GetModulesResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -380,7 +381,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.get_modules_with_http_info(start, limit, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param start: Value of the continuation token found in the next property of the JSON object returned in the response. If you can't get all basic information about the bots in one request, include this parameter to get the remaining array. 
         :type start: str
@@ -407,7 +408,7 @@ class LineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(GetModulesResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -498,7 +499,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.release_chat_control(chat_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -510,7 +511,7 @@ class LineModule(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -527,7 +528,7 @@ class LineModule(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.release_chat_control_with_http_info(chat_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param chat_id: The `userId`, `roomId`, or `groupId` (required)
         :type chat_id: str
@@ -552,7 +553,7 @@ class LineModule(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
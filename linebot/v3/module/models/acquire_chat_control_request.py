@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictBool, conint
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, conint
 
 class AcquireChatControlRequest(BaseModel):
     """
@@ -29,16 +29,20 @@ class AcquireChatControlRequest(BaseModel):
     expired: Optional[StrictBool] = Field(None, description="`True`: After the time limit (ttl) has passed, the initiative (Chat Control) will return to the Primary Channel. (Default) `False`: There's no time limit and the initiative (Chat Control) doesn't change over time. ")
     ttl: Optional[conint(strict=True, le=31536000)] = Field(None, description="The time it takes for initiative (Chat Control) to return to the Primary Channel (the time that the module channel stays on the Active Channel). The value is specified in seconds. The maximum value is one year (3600 * 24 * 365). The default value is 3600 (1 hour).  * Ignored if the value of expired is false. ")
 
-    __properties = ["expired", "ttl"]
+    __properties: ClassVar[List[str]] = ["expired", "ttl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class AcquireChatControlRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class AcquireChatControlRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AcquireChatControlRequest.parse_obj(obj)
+            return AcquireChatControlRequest.model_validate(obj)
 
-        _obj = AcquireChatControlRequest.parse_obj({
+        _obj = AcquireChatControlRequest.model_validate({
             "expired": obj.get("expired"),
             "ttl": obj.get("ttl")
         })
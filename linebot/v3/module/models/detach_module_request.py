@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class DetachModuleRequest(BaseModel):
     """
@@ -28,16 +28,20 @@ class DetachModuleRequest(BaseModel):
     """
     bot_id: Optional[StrictStr] = Field(None, alias="botId", description="User ID of the LINE Official Account bot attached to the module channel.")
 
-    __properties = ["botId"]
+    __properties: ClassVar[List[str]] = ["botId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class DetachModuleRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class DetachModuleRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return DetachModuleRequest.parse_obj(obj)
+            return DetachModuleRequest.model_validate(obj)
 
-        _obj = DetachModuleRequest.parse_obj({
+        _obj = DetachModuleRequest.model_validate({
             "bot_id": obj.get("botId")
         })
         return _obj
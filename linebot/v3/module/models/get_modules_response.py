@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 from linebot.v3.module.models.module_bot import ModuleBot
 
 class GetModulesResponse(BaseModel):
@@ -30,16 +30,20 @@ class GetModulesResponse(BaseModel):
     bots: conlist(ModuleBot) = Field(..., description="Array of Bot list Item objects representing basic information about the bot.")
     next: Optional[StrictStr] = Field(None, description="Continuation token. Used to get the next array of basic bot information. This property is only returned if there are more unreturned results. ")
 
-    __properties = ["bots", "next"]
+    __properties: ClassVar[List[str]] = ["bots", "next"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,11 +56,11 @@ class GetModulesResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in bots (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in bots (list)
         _items = []
         if self.bots:
             for _item in self.bots:
@@ -72,9 +76,9 @@ class GetModulesResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return GetModulesResponse.parse_obj(obj)
+            return GetModulesResponse.model_validate(obj)
 
-        _obj = GetModulesResponse.parse_obj({
+        _obj = GetModulesResponse.model_validate({
             "bots": [ModuleBot.from_dict(_item) for _item in obj.get("bots")] if obj.get("bots") is not None else None,
             "next": obj.get("next")
         })
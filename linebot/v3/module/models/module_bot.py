@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class ModuleBot(BaseModel):
     """
@@ -32,16 +32,20 @@ class ModuleBot(BaseModel):
     display_name: StrictStr = Field(..., alias="displayName", description="Bot's display name")
     picture_url: Optional[StrictStr] = Field(None, alias="pictureUrl", description="Profile image URL. Image URL starting with `https://`. Not included in the response if the bot doesn't have a profile image.")
 
-    __properties = ["userId", "basicId", "premiumId", "displayName", "pictureUrl"]
+    __properties: ClassVar[List[str]] = ["userId", "basicId", "premiumId", "displayName", "pictureUrl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,10 +58,10 @@ class ModuleBot(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -67,9 +71,9 @@ class ModuleBot(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ModuleBot.parse_obj(obj)
+            return ModuleBot.model_validate(obj)
 
-        _obj = ModuleBot.parse_obj({
+        _obj = ModuleBot.model_validate({
             "user_id": obj.get("userId"),
             "basic_id": obj.get("basicId"),
             "premium_id": obj.get("premiumId"),
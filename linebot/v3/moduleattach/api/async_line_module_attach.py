@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictStr
+from pydantic import Field, StrictStr
 
 from typing import Optional
 
@@ -65,7 +66,7 @@ class AsyncLineModuleAttach(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.attach_module(grant_type, code, redirect_uri, code_verifier, client_id, client_secret, region, basic_search_id, scope, brand_type, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: authorization_code (required)
         :type grant_type: str
@@ -95,7 +96,7 @@ class AsyncLineModuleAttach(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: AttachModuleResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -114,7 +115,7 @@ class AsyncLineModuleAttach(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.attach_module_with_http_info(grant_type, code, redirect_uri, code_verifier, client_id, client_secret, region, basic_search_id, scope, brand_type, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: authorization_code (required)
         :type grant_type: str
@@ -157,7 +158,7 @@ class AsyncLineModuleAttach(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(AttachModuleResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
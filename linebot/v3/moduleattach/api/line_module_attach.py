@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictStr
+from pydantic import Field, StrictStr
 
 from typing import Optional
 
@@ -55,7 +56,7 @@ class LineModuleAttach(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.attach_module(grant_type, code, redirect_uri, code_verifier, client_id, client_secret, region, basic_search_id, scope, brand_type, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: authorization_code (required)
         :type grant_type: str
@@ -85,7 +86,7 @@ class LineModuleAttach(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: AttachModuleResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -102,7 +103,7 @@ class LineModuleAttach(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.attach_module_with_http_info(grant_type, code, redirect_uri, code_verifier, client_id, client_secret, region, basic_search_id, scope, brand_type, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: authorization_code (required)
         :type grant_type: str
@@ -145,7 +146,7 @@ class LineModuleAttach(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(AttachModuleResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, StrictStr, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, conlist
 
 class AttachModuleResponse(BaseModel):
     """
@@ -28,16 +28,20 @@ class AttachModuleResponse(BaseModel):
     bot_id: StrictStr = Field(..., description="User ID of the bot on the LINE Official Account.")
     scopes: conlist(StrictStr) = Field(..., description="Permissions (scope) granted by the LINE Official Account admin.")
 
-    __properties = ["bot_id", "scopes"]
+    __properties: ClassVar[List[str]] = ["bot_id", "scopes"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class AttachModuleResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class AttachModuleResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return AttachModuleResponse.parse_obj(obj)
+            return AttachModuleResponse.model_validate(obj)
 
-        _obj = AttachModuleResponse.parse_obj({
+        _obj = AttachModuleResponse.model_validate({
             "bot_id": obj.get("bot_id"),
             "scopes": obj.get("scopes")
         })
@@ -16,11 +16,12 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
-from pydantic.v1 import Field, StrictStr
+from pydantic import Field, StrictStr
 
 from linebot.v3.oauth.models.channel_access_token_key_ids_response import ChannelAccessTokenKeyIdsResponse
 from linebot.v3.oauth.models.issue_channel_access_token_response import IssueChannelAccessTokenResponse
@@ -67,7 +68,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.gets_all_valid_channel_access_token_key_ids(client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param client_assertion_type: `urn:ietf:params:oauth:client-assertion-type:jwt-bearer` (required)
         :type client_assertion_type: str
@@ -81,7 +82,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: ChannelAccessTokenKeyIdsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -100,7 +101,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.gets_all_valid_channel_access_token_key_ids_with_http_info(client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param client_assertion_type: `urn:ietf:params:oauth:client-assertion-type:jwt-bearer` (required)
         :type client_assertion_type: str
@@ -127,7 +128,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(ChannelAccessTokenKeyIdsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -226,7 +227,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token(grant_type, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -242,7 +243,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: IssueShortLivedChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -261,7 +262,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token_with_http_info(grant_type, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -290,7 +291,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(IssueShortLivedChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -401,7 +402,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token_by_jwt(grant_type, client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: client_credentials (required)
         :type grant_type: str
@@ -417,7 +418,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: IssueChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -436,7 +437,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token_by_jwt_with_http_info(grant_type, client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: client_credentials (required)
         :type grant_type: str
@@ -465,7 +466,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(IssueChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -575,7 +576,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_stateless_channel_token(grant_type, client_assertion_type, client_assertion, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -595,7 +596,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: IssueStatelessChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -614,7 +615,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_stateless_channel_token_with_http_info(grant_type, client_assertion_type, client_assertion, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -647,7 +648,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(IssueStatelessChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -765,7 +766,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param access_token: Channel access token (required)
         :type access_token: str
@@ -777,7 +778,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -796,7 +797,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token_with_http_info(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param access_token: Channel access token (required)
         :type access_token: str
@@ -821,7 +822,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -917,7 +918,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token_by_jwt(client_id, client_secret, access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param client_id: Channel ID (required)
         :type client_id: str
@@ -933,7 +934,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -952,7 +953,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token_by_jwt_with_http_info(client_id, client_secret, access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param client_id: Channel ID (required)
         :type client_id: str
@@ -981,7 +982,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: None
         """
 
@@ -1085,7 +1086,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param access_token: A short-lived or long-lived channel access token. (required)
         :type access_token: str
@@ -1097,7 +1098,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: VerifyChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1116,7 +1117,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token_with_http_info(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param access_token: A short-lived or long-lived channel access token. (required)
         :type access_token: str
@@ -1141,7 +1142,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(VerifyChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1243,7 +1244,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token_by_jwt(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param access_token: Channel access token with a user-specified expiration (Channel Access Token v2.1). (required)
         :type access_token: str
@@ -1255,7 +1256,7 @@ class AsyncChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: VerifyChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1274,7 +1275,7 @@ class AsyncChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token_by_jwt_with_http_info(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param access_token: Channel access token with a user-specified expiration (Channel Access Token v2.1). (required)
         :type access_token: str
@@ -1299,7 +1300,7 @@ class AsyncChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(VerifyChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -15,10 +15,11 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
-from pydantic.v1 import Field, StrictStr
+from pydantic import Field, StrictStr
 
 from linebot.v3.oauth.models.channel_access_token_key_ids_response import ChannelAccessTokenKeyIdsResponse
 from linebot.v3.oauth.models.issue_channel_access_token_response import IssueChannelAccessTokenResponse
@@ -57,7 +58,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.gets_all_valid_channel_access_token_key_ids(client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param client_assertion_type: `urn:ietf:params:oauth:client-assertion-type:jwt-bearer` (required)
         :type client_assertion_type: str
@@ -71,7 +72,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: ChannelAccessTokenKeyIdsResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -88,7 +89,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.gets_all_valid_channel_access_token_key_ids_with_http_info(client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param client_assertion_type: `urn:ietf:params:oauth:client-assertion-type:jwt-bearer` (required)
         :type client_assertion_type: str
@@ -115,7 +116,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(ChannelAccessTokenKeyIdsResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -206,7 +207,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token(grant_type, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -222,7 +223,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: IssueShortLivedChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -239,7 +240,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token_with_http_info(grant_type, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -268,7 +269,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(IssueShortLivedChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -371,7 +372,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token_by_jwt(grant_type, client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: client_credentials (required)
         :type grant_type: str
@@ -387,7 +388,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: IssueChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -404,7 +405,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_channel_token_by_jwt_with_http_info(grant_type, client_assertion_type, client_assertion, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: client_credentials (required)
         :type grant_type: str
@@ -433,7 +434,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(IssueChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -535,7 +536,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_stateless_channel_token(grant_type, client_assertion_type, client_assertion, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -555,7 +556,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: IssueStatelessChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -572,7 +573,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.issue_stateless_channel_token_with_http_info(grant_type, client_assertion_type, client_assertion, client_id, client_secret, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param grant_type: `client_credentials` (required)
         :type grant_type: str
@@ -605,7 +606,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(IssueStatelessChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -715,7 +716,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param access_token: Channel access token (required)
         :type access_token: str
@@ -727,7 +728,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -744,7 +745,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token_with_http_info(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param access_token: Channel access token (required)
         :type access_token: str
@@ -769,7 +770,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -857,7 +858,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token_by_jwt(client_id, client_secret, access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param client_id: Channel ID (required)
         :type client_id: str
@@ -873,7 +874,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -890,7 +891,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.revoke_channel_token_by_jwt_with_http_info(client_id, client_secret, access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param client_id: Channel ID (required)
         :type client_id: str
@@ -919,7 +920,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -1015,7 +1016,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param access_token: A short-lived or long-lived channel access token. (required)
         :type access_token: str
@@ -1027,7 +1028,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: VerifyChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1044,7 +1045,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token_with_http_info(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param access_token: A short-lived or long-lived channel access token. (required)
         :type access_token: str
@@ -1069,7 +1070,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(VerifyChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -1163,7 +1164,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token_by_jwt(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param access_token: Channel access token with a user-specified expiration (Channel Access Token v2.1). (required)
         :type access_token: str
@@ -1175,7 +1176,7 @@ class ChannelAccessToken(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: VerifyChannelAccessTokenResponse
         """
         kwargs['_return_http_data_only'] = True
@@ -1192,7 +1193,7 @@ class ChannelAccessToken(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.verify_channel_token_by_jwt_with_http_info(access_token, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param access_token: Channel access token with a user-specified expiration (Channel Access Token v2.1). (required)
         :type access_token: str
@@ -1217,7 +1218,7 @@ class ChannelAccessToken(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(VerifyChannelAccessTokenResponse, status_code(int), headers(HTTPHeaderDict))
         """
 
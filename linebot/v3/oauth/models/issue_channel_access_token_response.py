@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class IssueChannelAccessTokenResponse(BaseModel):
     """
@@ -31,16 +31,20 @@ class IssueChannelAccessTokenResponse(BaseModel):
     token_type: StrictStr = Field(..., description="A token type.")
     key_id: StrictStr = Field(..., description="Unique key ID for identifying the channel access token.")
 
-    __properties = ["access_token", "expires_in", "token_type", "key_id"]
+    __properties: ClassVar[List[str]] = ["access_token", "expires_in", "token_type", "key_id"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,10 +57,10 @@ class IssueChannelAccessTokenResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -66,9 +70,9 @@ class IssueChannelAccessTokenResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return IssueChannelAccessTokenResponse.parse_obj(obj)
+            return IssueChannelAccessTokenResponse.model_validate(obj)
 
-        _obj = IssueChannelAccessTokenResponse.parse_obj({
+        _obj = IssueChannelAccessTokenResponse.model_validate({
             "access_token": obj.get("access_token"),
             "expires_in": obj.get("expires_in"),
             "token_type": obj.get("token_type") if obj.get("token_type") is not None else 'Bearer',
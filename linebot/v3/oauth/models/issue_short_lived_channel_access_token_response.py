@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class IssueShortLivedChannelAccessTokenResponse(BaseModel):
     """
@@ -30,16 +30,20 @@ class IssueShortLivedChannelAccessTokenResponse(BaseModel):
     expires_in: StrictInt = Field(..., description="Time until channel access token expires in seconds from time the token is issued.")
     token_type: StrictStr = Field(..., description="Token type. The value is always `Bearer`.")
 
-    __properties = ["access_token", "expires_in", "token_type"]
+    __properties: ClassVar[List[str]] = ["access_token", "expires_in", "token_type"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class IssueShortLivedChannelAccessTokenResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class IssueShortLivedChannelAccessTokenResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return IssueShortLivedChannelAccessTokenResponse.parse_obj(obj)
+            return IssueShortLivedChannelAccessTokenResponse.model_validate(obj)
 
-        _obj = IssueShortLivedChannelAccessTokenResponse.parse_obj({
+        _obj = IssueShortLivedChannelAccessTokenResponse.model_validate({
             "access_token": obj.get("access_token"),
             "expires_in": obj.get("expires_in"),
             "token_type": obj.get("token_type") if obj.get("token_type") is not None else 'Bearer'
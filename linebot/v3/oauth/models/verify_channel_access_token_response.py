@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class VerifyChannelAccessTokenResponse(BaseModel):
     """
@@ -29,16 +29,20 @@ class VerifyChannelAccessTokenResponse(BaseModel):
     expires_in: StrictInt = Field(..., description="Number of seconds before the channel access token expires.")
     scope: Optional[StrictStr] = Field(None, description="Permissions granted to the channel access token.")
 
-    __properties = ["client_id", "expires_in", "scope"]
+    __properties: ClassVar[List[str]] = ["client_id", "expires_in", "scope"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class VerifyChannelAccessTokenResponse(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class VerifyChannelAccessTokenResponse(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return VerifyChannelAccessTokenResponse.parse_obj(obj)
+            return VerifyChannelAccessTokenResponse.model_validate(obj)
 
-        _obj = VerifyChannelAccessTokenResponse.parse_obj({
+        _obj = VerifyChannelAccessTokenResponse.model_validate({
             "client_id": obj.get("client_id"),
             "expires_in": obj.get("expires_in"),
             "scope": obj.get("scope")
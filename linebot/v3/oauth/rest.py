@@ -99,6 +99,13 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
 
+        if configuration.connection_pool is not None:
+            configuration.connection_pool.install(self.pool_manager)
+
+        self.request_timeout = configuration.request_timeout
+        if configuration.circuit_breaker is not None:
+            self.request = configuration.circuit_breaker.wrap(self.request)
+
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
                 _request_timeout=None):
@@ -136,6 +143,7 @@ class RESTClientObject(object):
         query_params = {}
 
         timeout = None
+        _request_timeout = _request_timeout or self.request_timeout
         if _request_timeout:
             if isinstance(_request_timeout, (int,float)):  # noqa: E501,F821
                 timeout = urllib3.Timeout(total=_request_timeout)
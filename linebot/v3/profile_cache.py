@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.profile_cache module."""
+
+import functools
+import threading
+
+from linebot.v3.cache import InFlight, LRUCache
+
+# Seconds for which the result of each method is cached.
+DEFAULT_TTL = {
+    'get_profile': 3600,
+    'get_group_member_profile': 3600,
+    'get_room_member_profile': 3600,
+    'get_group_summary': 3600,
+    'get_group_member_count': 300,
+    'get_room_member_count': 300,
+    'get_bot_info': 86400,
+}
+
+# Arguments which identify the result of each method.
+_PARAMS = {
+    'get_profile': ('user_id',),
+    'get_group_member_profile': ('group_id', 'user_id'),
+    'get_room_member_profile': ('room_id', 'user_id'),
+    'get_group_summary': ('group_id',),
+    'get_group_member_count': ('group_id',),
+    'get_room_member_count': ('room_id',),
+    'get_bot_info': (),
+}
+
+_GROUP_METHODS = ('get_group_summary', 'get_group_member_count', 'get_group_member_profile')
+_ROOM_METHODS = ('get_room_member_count', 'get_room_member_profile')
+_MEMBER_PROFILE_METHODS = ('get_group_member_profile', 'get_room_member_profile')
+
+
+_MISSING = object()
+
+
+def _key(method, args, kwargs):
+    if kwargs.get('async_req'):
+        raise TypeError('{}() of a profile cache does not take async_req; '
+                        'call the API method for that'.format(method))
+    params = _PARAMS[method]
+    for name in params[len(args):]:
+        if name not in kwargs:
+            raise TypeError("{}() missing required argument: '{}'".format(method, name))
+    args = args + tuple(kwargs.pop(name) for name in params[len(args):])
+    return (method,) + args, kwargs
+
+
+class _ProfileCacheBase(object):
+    def __init__(self, api, ttl=None, max_size=4096):
+        self.api = api
+        self.ttl = dict(DEFAULT_TTL, **(ttl or {}))
+        self.max_size = max_size
+        self._entries = LRUCache(max_size)
+        self._inflight = InFlight()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def _cached(self, key):
+        value = self._entries.get(key, _MISSING)
+        if value is not _MISSING:
+            with self._lock:
+                self._stats['hits'] += 1
+        return value
+
+    def _miss(self):
+        # returns the version to store the result with
+        with self._lock:
+            self._stats['misses'] += 1
+            return self._version
+
+    def _store(self, key, version, value):
+        with self._lock:
+            if version != self._version:
+                # invalidated while the request was in flight
+                return
+            self._entries.set(key, value, self.ttl[key[0]])
+
+    def _remove(self, match):
+        with self._lock:
+            self._version += 1
+            self._stats['invalidations'] += self._entries.remove(match)
+
+    def invalidate_user(self, user_id):
+        """Remove the cached profiles of a user, including member profiles.
+
+        :param str user_id: User ID
+        """
+        self._remove(lambda key: (
+            key[0] == 'get_profile' and key[1] == user_id
+            or key[0] in _MEMBER_PROFILE_METHODS and key[2] == user_id))
+
+    def invalidate_group(self, group_id):
+        """Remove everything cached for a group chat.
+
+        :param str group_id: Group ID
+        """
+        self._remove(lambda key: key[0] in _GROUP_METHODS and key[1] == group_id)
+
+    def invalidate_room(self, room_id):
+        """Remove everything cached for a multi-person chat.
+
+        :param str room_id: Room ID
+        """
+        self._remove(lambda key: key[0] in _ROOM_METHODS and key[1] == room_id)
+
+    def invalidate(self, event):
+        """Remove the cached results which a webhook event makes stale.
+
+        Follow and unfollow events remove the profile of the user. Join and
+        leave events remove everything cached for the group or room.
+        Member joined and left events remove its member count and the
+        member profiles of those users. Other events are ignored.
+
+        :param event: Webhook event, its model or its view
+        :type event: :py:class:`linebot.v3.webhooks.Event`
+        """
+        event_type = getattr(event, 'type', None)
+        source = getattr(event, 'source', None)
+        if event_type in ('follow', 'unfollow'):
+            user_id = getattr(source, 'user_id', None)
+            if user_id is not None:
+                self._remove(lambda key: key == ('get_profile', user_id))
+        elif event_type in ('join', 'leave'):
+            if getattr(source, 'group_id', None) is not None:
+                self.invalidate_group(source.group_id)
+            elif getattr(source, 'room_id', None) is not None:
+                self.invalidate_room(source.room_id)
+        elif event_type in ('memberJoined', 'memberLeft'):
+            members = event.joined if event_type == 'memberJoined' else event.left
+            user_ids = set(member.user_id for member in members.members)
+            if getattr(source, 'group_id', None) is not None:
+                chat_id, count, profile = (
+                    source.group_id, 'get_group_member_count', 'get_group_member_profile')
+            elif getattr(source, 'room_id', None) is not None:
+                chat_id, count, profile = (
+                    source.room_id, 'get_room_member_count', 'get_room_member_profile')
+            else:
+                return
+            self._remove(lambda key: key[1:2] == (chat_id,) and (
+                key[0] == count or key[0] == profile and key[2] in user_ids))
+
+    def clear(self):
+        """Remove all the cached results."""
+        self._remove(lambda key: True)
+
+    def stats(self):
+        """Return the number of cache hits, misses, evictions and invalidations.
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['evictions'] = self._entries.evictions
+        stats['size'] = len(self._entries)
+        return stats
+
+
+def _sync_method(method):
+    def get(self, *args, **kwargs):
+        key, kwargs = _key(method, args, kwargs)
+        value = self._cached(key)
+        if value is not _MISSING:
+            return value
+        call, leader = self._inflight.join(key)
+        if not leader:
+            return self._inflight.follow(call)
+        return self._inflight.lead(
+            key, call, functools.partial(getattr(self.api, method), *key[1:], **kwargs),
+            functools.partial(self._store, key, self._miss()))
+
+    get.__name__ = method
+    get.__doc__ = """Return the cached result of {}, or call it.
+
+        Concurrent calls with the same arguments share a single request.
+        The arguments are the same as those of the API method.
+        """.format(method)
+    return get
+
+
+def _async_method(method):
+    async def get(self, *args, **kwargs):
+        key, kwargs = _key(method, args, kwargs)
+        value = self._cached(key)
+        if value is not _MISSING:
+            return value
+        future, leader = self._inflight.async_join(key)
+        if not leader:
+            return await self._inflight.async_follow(future)
+        return await self._inflight.async_lead(
+            key, future, functools.partial(getattr(self.api, method), *key[1:], **kwargs),
+            functools.partial(self._store, key, self._miss()))
+
+    get.__name__ = method
+    get.__doc__ = """Return the cached result of {}, or call it.
+
+        Concurrent calls with the same arguments share a single request.
+        The arguments are the same as those of the API method.
+        """.format(method)
+    return get
+
+
+class ProfileCache(_ProfileCacheBase):
+    """Read-through cache of the profile and chat methods of MessagingApi.
+
+    Results are cached per method and arguments for the seconds given in
+    ttl, at most max_size of them; errors are not cached. The same model is
+    returned to every caller, so do not modify it. Pass webhook events to
+    :py:meth:`invalidate` to drop the results they make stale.
+    """
+
+    def __init__(self, api, ttl=None, max_size=4096):
+        """__init__ method.
+
+        :param api: MessagingApi
+        :type api: :py:class:`linebot.v3.messaging.MessagingApi`
+        :param dict ttl: Seconds to cache by method name, which override
+            :py:data:`DEFAULT_TTL`
+        :param int max_size: Maximum number of cached results
+        """
+        super(ProfileCache, self).__init__(api, ttl, max_size)
+
+    get_profile = _sync_method('get_profile')
+    get_group_member_profile = _sync_method('get_group_member_profile')
+    get_room_member_profile = _sync_method('get_room_member_profile')
+    get_group_summary = _sync_method('get_group_summary')
+    get_group_member_count = _sync_method('get_group_member_count')
+    get_room_member_count = _sync_method('get_room_member_count')
+    get_bot_info = _sync_method('get_bot_info')
+
+
+class AsyncProfileCache(_ProfileCacheBase):
+    """Read-through cache of the profile and chat methods of AsyncMessagingApi.
+
+    Same as :py:class:`ProfileCache`, with coroutine methods.
+    """
+
+    def __init__(self, api, ttl=None, max_size=4096):
+        """__init__ method.
+
+        :param api: AsyncMessagingApi
+        :type api: :py:class:`linebot.v3.messaging.AsyncMessagingApi`
+        :param dict ttl: Seconds to cache by method name, which override
+            :py:data:`DEFAULT_TTL`
+        :param int max_size: Maximum number of cached results
+        """
+        super(AsyncProfileCache, self).__init__(api, ttl, max_size)
+
+    get_profile = _async_method('get_profile')
+    get_group_member_profile = _async_method('get_group_member_profile')
+    get_room_member_profile = _async_method('get_room_member_profile')
+    get_group_summary = _async_method('get_group_summary')
+    get_group_member_count = _async_method('get_group_member_count')
+    get_room_member_count = _async_method('get_room_member_count')
+    get_bot_info = _async_method('get_bot_info')
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.reply_scheduler module.
+
+Sends replies in the order their reply tokens expire, and pushes the
+messages instead once a token has expired.
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import math
+import queue
+import threading
+import time
+from bisect import bisect_left
+
+from linebot.v3.messaging import PushMessageRequest, ReplyMessageRequest
+from linebot.v3.utils import LOGGER
+
+# Seconds after the event timestamp within which a reply token is used.
+DEFAULT_TTL = 30
+
+# Upper bounds in seconds of the reply token age histogram buckets.
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _source_id(source):
+    for name in ('group_id', 'room_id', 'user_id'):
+        value = getattr(source, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+class _Reply(object):
+    __slots__ = ('deadline', 'timestamp', 'reply_token', 'to', 'messages',
+                 'notification_disabled', 'future')
+
+    def __init__(self, event, messages, notification_disabled, ttl, future):
+        self.timestamp = event.timestamp / 1000.0
+        self.deadline = self.timestamp + ttl
+        self.reply_token = event.reply_token
+        self.to = _source_id(event.source)
+        self.messages = messages
+        self.notification_disabled = notification_disabled
+        self.future = future
+
+
+class _ReplySchedulerBase(object):
+    def __init__(self, api, ttl, margin, buckets):
+        self.api = api
+        self.ttl = ttl
+        self.margin = margin
+        self.buckets = tuple(sorted(buckets))
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = {'replied': 0, 'pushed': 0, 'expired': 0, 'failed': 0}
+        # bucket counts, then sum and count
+        self._histogram = [0] * (len(self.buckets) + 1) + [0.0, 0]
+
+    def _request(self, reply):
+        now = time.time()
+        age = now - reply.timestamp
+        if reply.deadline - now > self.margin:
+            kind = 'replied'
+            request = ReplyMessageRequest(
+                reply_token=reply.reply_token, messages=reply.messages,
+                notification_disabled=reply.notification_disabled)
+        elif reply.to is not None:
+            kind = 'pushed'
+            LOGGER.debug('Reply token expired %.3f seconds ago, pushing to %s',
+                         age - self.ttl, reply.to)
+            request = PushMessageRequest(
+                to=reply.to, messages=reply.messages,
+                notification_disabled=reply.notification_disabled)
+        else:
+            kind, request = 'expired', None
+        with self._lock:
+            self._stats[kind] += 1
+            histogram = self._histogram
+            histogram[bisect_left(self.buckets, age)] += 1
+            histogram[-2] += age
+            histogram[-1] += 1
+        return kind, request
+
+    def _failed(self):
+        with self._lock:
+            self._stats['failed'] += 1
+
+    def stats(self):
+        """Return the number of replies, pushes, expired and failed replies, and the token ages.
+
+        ``latency`` is the histogram of the age of the reply tokens, in
+        seconds since the event timestamp, when the reply or push was sent:
+        the cumulative count of each ``buckets`` upper bound, ``sum`` and
+        ``count``.
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            histogram = list(self._histogram)
+        stats['latency'] = {
+            'buckets': dict(zip(self.buckets + (math.inf,), itertools.accumulate(histogram[:-2]))),
+            'sum': histogram[-2],
+            'count': histogram[-1],
+        }
+        return stats
+
+
+class ReplyScheduler(_ReplySchedulerBase):
+    """Sends replies from worker threads, those closest to expiry first.
+
+    A reply token expires ttl seconds after the timestamp of its event.
+    Replies wait in a queue ordered by that deadline. When a reply leaves
+    the queue less than margin seconds before its deadline, its messages
+    are pushed to the group, room or user of the event instead; note that
+    pushes count towards the message quota.
+    """
+
+    def __init__(self, api, workers=4, ttl=DEFAULT_TTL, margin=1.0, buckets=DEFAULT_BUCKETS):
+        """__init__ method.
+
+        :param api: MessagingApi
+        :type api: :py:class:`linebot.v3.messaging.MessagingApi`
+        :param int workers: Number of worker threads
+        :param float ttl: Seconds after the event timestamp within which
+            a reply token is used
+        :param float margin: Seconds before the deadline from which the
+            messages are pushed
+        :param buckets: Upper bounds in seconds of the token age histogram buckets
+        :type buckets: tuple[float]
+        """
+        super(ReplyScheduler, self).__init__(api, ttl, margin, buckets)
+        self.workers = workers
+        self._queue = queue.PriorityQueue()
+        self._threads = []
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+    def _work(self):
+        while True:
+            _, _, reply = self._queue.get()
+            if reply is None:
+                return
+            if not reply.future.set_running_or_notify_cancel():
+                continue
+            try:
+                kind, request = self._request(reply)
+                if kind == 'replied':
+                    result = self.api.reply_message(request)
+                elif kind == 'pushed':
+                    result = self.api.push_message(request)
+                else:
+                    result = None
+            except Exception as e:
+                self._failed()
+                reply.future.set_exception(e)
+            else:
+                reply.future.set_result((kind, result))
+
+    def reply(self, event, messages, notification_disabled=False):
+        """Schedule a reply to an event.
+
+        :param event: Webhook event with a reply token, e.g. MessageEvent
+        :param messages: Messages to send
+        :type messages: list[:py:class:`linebot.v3.messaging.Message`]
+        :param bool notification_disabled: Send the messages without notifying the user
+        :return: Future of ``('replied', ReplyMessageResponse)``,
+            ``('pushed', PushMessageResponse)``, or ``('expired', None)``
+            when there is nobody to push to
+        :rtype: :py:class:`concurrent.futures.Future`
+        """
+        future = concurrent.futures.Future()
+        reply = _Reply(event, messages, notification_disabled, self.ttl, future)
+        with self._lock:
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(
+                    target=self._work, name='linebot-reply-scheduler', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self._queue.put((reply.deadline, next(self._order), reply))
+        return future
+
+    def close(self):
+        """Send the scheduled replies and stop the worker threads."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put((math.inf, next(self._order), None))
+        for thread in threads:
+            thread.join()
+
+
+class AsyncReplyScheduler(_ReplySchedulerBase):
+    """Sends replies from tasks of the running event loop, those closest to expiry first.
+
+    See :py:class:`ReplyScheduler`.
+    """
+
+    def __init__(self, api, concurrency=4, ttl=DEFAULT_TTL, margin=1.0,
+                 buckets=DEFAULT_BUCKETS):
+        """__init__ method.
+
+        :param api: AsyncMessagingApi
+        :type api: :py:class:`linebot.v3.messaging.AsyncMessagingApi`
+        :param int concurrency: Number of replies sent at once
+        :param float ttl: Seconds after the event timestamp within which
+            a reply token is used
+        :param float margin: Seconds before the deadline from which the
+            messages are pushed
+        :param buckets: Upper bounds in seconds of the token age histogram buckets
+        :type buckets: tuple[float]
+        """
+        super(AsyncReplyScheduler, self).__init__(api, ttl, margin, buckets)
+        self.concurrency = concurrency
+        self._queue = None
+        self._tasks = []
+
+    async def __aenter__(self):
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method."""
+        await self.close()
+
+    async def _work(self):
+        replies = self._queue
+        while True:
+            _, _, reply = await replies.get()
+            try:
+                if reply is None:
+                    return
+                if reply.future.done():
+                    continue
+                try:
+                    kind, request = self._request(reply)
+                    if kind == 'replied':
+                        result = await self.api.reply_message(request)
+                    elif kind == 'pushed':
+                        result = await self.api.push_message(request)
+                    else:
+                        result = None
+                except Exception as e:
+                    self._failed()
+                    if not reply.future.done():
+                        reply.future.set_exception(e)
+                else:
+                    if not reply.future.done():
+                        reply.future.set_result((kind, result))
+            finally:
+                replies.task_done()
+
+    def reply(self, event, messages, notification_disabled=False):
+        """Schedule a reply to an event. Call it from the event loop.
+
+        :param event: Webhook event with a reply token, e.g. MessageEvent
+        :param messages: Messages to send
+        :type messages: list[:py:class:`linebot.v3.messaging.Message`]
+        :param bool notification_disabled: Send the messages without notifying the user
+        :return: Future of ``('replied', ReplyMessageResponse)``,
+            ``('pushed', PushMessageResponse)``, or ``('expired', None)``
+            when there is nobody to push to
+        :rtype: :py:class:`asyncio.Future`
+        """
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+            self._tasks = [loop.create_task(self._work()) for _ in range(self.concurrency)]
+        future = loop.create_future()
+        reply = _Reply(event, messages, notification_disabled, self.ttl, future)
+        self._queue.put_nowait((reply.deadline, next(self._order), reply))
+        return future
+
+    async def close(self):
+        """Send the scheduled replies and stop the tasks."""
+        replies, self._queue = self._queue, None
+        if replies is None:
+            return
+        for _ in self._tasks:
+            replies.put_nowait((math.inf, next(self._order), None))
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
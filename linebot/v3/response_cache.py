@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.response_cache module.
+
+Caches the responses of GET requests in the generated API clients.
+Set a :py:class:`ResponseCache` as ``response_cache`` of the Configuration.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from urllib3 import HTTPHeaderDict
+
+from linebot.v3.cache import LRUCache
+from linebot.v3.utils import LOGGER
+
+# Resource paths whose responses are cached by default: rich menus and their
+# aliases, LIFF apps and attached modules.
+DEFAULT_PATHS = (
+    r'^/v2/bot/richmenu/(alias/)?[^/]+$',
+    r'^/liff/v1/apps$',
+    r'^/v2/bot/list$',
+)
+
+# Resource paths whose non-GET requests clear the cache by default.
+DEFAULT_INVALIDATING_PATHS = (
+    r'^/v2/bot/richmenu',
+    r'^/v2/bot/user/[^/]+/richmenu',
+    r'^/liff/v1/apps',
+    r'^/v2/bot/channel/detach$',
+)
+
+
+class CachedResponse(object):
+    """Response served from the cache, in place of the REST response."""
+
+    def __init__(self, status, reason, headers, data):
+        """__init__ method.
+
+        :param int status: HTTP status code
+        :param str reason: HTTP reason phrase
+        :param list headers: (name, value) of each header
+        :param bytes data: Body
+        """
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def getheaders(self):
+        """Return the response headers.
+
+        :rtype: :py:class:`urllib3.HTTPHeaderDict`
+        """
+        return HTTPHeaderDict(self.headers)
+
+    def getheader(self, name, default=None):
+        """Return a response header.
+
+        :param str name: Header name, case-insensitive
+        """
+        return self.getheaders().get(name, default)
+
+
+class MemoryBackend(object):
+    """In-memory storage of a :py:class:`ResponseCache`, with LRU eviction."""
+
+    def __init__(self, max_size=256):
+        """__init__ method.
+
+        :param int max_size: Maximum number of stored responses
+        """
+        self.max_size = max_size
+        self._entries = LRUCache(max_size)
+
+    def get(self, key):
+        """Return the entry stored under key, or None.
+
+        :param str key: Cache key
+        :rtype: tuple
+        """
+        return self._entries.get(key)
+
+    def set(self, key, entry):
+        """Store an entry.
+
+        :param str key: Cache key
+        :param tuple entry: (stored at, status, reason, headers, body)
+        """
+        self._entries.set(key, entry)
+
+    def clear(self):
+        """Remove all the entries."""
+        self._entries.clear()
+
+
+class DiskBackend(object):
+    """On-disk storage of a :py:class:`ResponseCache`, one JSON file per response.
+
+    Responses survive restarts and can be shared by processes on the same host.
+    """
+
+    def __init__(self, directory):
+        """__init__ method.
+
+        :param str directory: Directory of the files, created if missing
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key):
+        """Return the entry stored under key, or None.
+
+        :param str key: Cache key
+        :rtype: tuple
+        """
+        try:
+            with open(self._path(key), encoding='utf-8') as fp:
+                obj = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return (obj['stored_at'], obj['status'], obj['reason'],
+                [tuple(header) for header in obj['headers']], base64.b64decode(obj['data']))
+
+    def set(self, key, entry):
+        """Store an entry.
+
+        :param str key: Cache key
+        :param tuple entry: (stored at, status, reason, headers, body)
+        """
+        stored_at, status, reason, headers, data = entry
+        obj = {'stored_at': stored_at, 'status': status, 'reason': reason,
+               'headers': headers, 'data': base64.b64encode(data).decode('ascii')}
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+            json.dump(obj, fp)
+        # readers see either the old or the new file
+        os.replace(path, self._path(key))
+
+    def clear(self):
+        """Remove all the entries."""
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+class ResponseCache(object):
+    """Cache of the responses of GET requests made by the API clients.
+
+    Responses of the resource paths matching one of paths are kept for ttl
+    seconds, keyed by the URL with its query and by the access token.
+    For stale_ttl more seconds, the stale response is returned at once
+    while a single request refreshes it in the background. Successful
+    non-GET requests to one of invalidating_paths clear the cache.
+
+    The cache is shared, not copied, when the Configuration is copied.
+    """
+
+    def __init__(self, ttl=60, stale_ttl=300, paths=DEFAULT_PATHS,
+                 invalidating_paths=DEFAULT_INVALIDATING_PATHS, backend=None):
+        """__init__ method.
+
+        :param float ttl: Seconds for which a response is fresh
+        :param float stale_ttl: Seconds after ttl for which a stale response
+            is returned while it is refreshed
+        :param paths: Regular expressions of the cached resource paths,
+            or None to cache every GET request
+        :type paths: list[str] | None
+        :param list[str] invalidating_paths: Regular expressions of the
+            resource paths whose non-GET requests clear the cache
+        :param backend: Storage, :py:class:`MemoryBackend` by default
+        :type backend: :py:class:`MemoryBackend` | :py:class:`DiskBackend`
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.paths = None if paths is None else [re.compile(path) for path in paths]
+        self.invalidating_paths = [re.compile(path) for path in invalidating_paths]
+        self.backend = backend if backend is not None else MemoryBackend()
+        self._refreshing = set()
+        self._refresh_tasks = set()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0}
+
+    def _cacheable(self, method, resource_path):
+        if method != 'GET':
+            return False
+        return self.paths is None or any(path.match(resource_path) for path in self.paths)
+
+    def _invalidates(self, method, resource_path):
+        return method != 'GET' and any(
+            path.match(resource_path) for path in self.invalidating_paths)
+
+    @staticmethod
+    def _key(url, headers):
+        authorization = (headers or {}).get('Authorization', '')
+        return hashlib.sha256('\n'.join((url, authorization)).encode('utf-8')).hexdigest()
+
+    def _lookup(self, key):
+        # (response, refresh), where refresh tells to refresh it in the background
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, False
+        age = time.time() - entry[0]
+        if age < self.ttl:
+            stat, refresh = 'hits', False
+        elif age < self.ttl + self.stale_ttl:
+            stat, refresh = 'stale_hits', True
+        else:
+            return None, False
+        with self._lock:
+            self._stats[stat] += 1
+            if refresh:
+                refresh = key not in self._refreshing
+                self._refreshing.add(key)
+        return CachedResponse(*entry[1:]), refresh
+
+    def _store(self, key, response):
+        headers = [(name, value) for name, value in response.getheaders().items()]
+        entry = (time.time(), response.status, response.reason, headers, bytes(response.data))
+        self.backend.set(key, entry)
+        return CachedResponse(*entry[1:])
+
+    def _refreshed(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+            self._stats['refreshes'] += 1
+
+    def _refresh(self, key, request):
+        try:
+            self._store(key, request())
+        except Exception:
+            LOGGER.exception('Failed to refresh a cached response')
+        finally:
+            self._refreshed(key)
+
+    async def _async_refresh(self, key, request):
+        try:
+            self._store(key, await request())
+        finally:
+            self._refreshed(key)
+
+    def _async_refreshed(self, task):
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOGGER.error('Failed to refresh a cached response', exc_info=task.exception())
+
+    def call(self, method, resource_path, url, headers, request):
+        """Return the response of a request, from the cache when possible.
+
+        Called by ApiClient for every request.
+
+        :param str method: HTTP method
+        :param str resource_path: Resource path, without the host and the query
+        :param str url: Full URL, with the query
+        :param dict headers: Request headers
+        :param request: Makes the request and returns the REST response
+        :type request: () -> RESTResponse
+        """
+        if not self._cacheable(method, resource_path):
+            response = request()
+            if self._invalidates(method, resource_path):
+                self.clear()
+            return response
+
+        key = self._key(url, headers)
+        response, refresh = self._lookup(key)
+        if refresh:
+            threading.Thread(target=self._refresh, args=(key, request), daemon=True).start()
+        if response is not None:
+            return response
+
+        with self._lock:
+            self._stats['misses'] += 1
+        return self._store(key, request())
+
+    async def async_call(self, method, resource_path, url, headers, request):
+        """Return the response of a request, from the cache when possible.
+
+        Called by AsyncApiClient for every request; same as :py:meth:`call`.
+
+        :param str method: HTTP method
+        :param str resource_path: Resource path, without the host and the query
+        :param str url: Full URL, with the query
+        :param dict headers: Request headers
+        :param request: Makes the request and returns an awaitable of the REST response
+        :type request: () -> Awaitable[RESTResponse]
+        """
+        if not self._cacheable(method, resource_path):
+            response = await request()
+            if self._invalidates(method, resource_path):
+                self.clear()
+            return response
+
+        key = self._key(url, headers)
+        response, refresh = self._lookup(key)
+        if refresh:
+            # keep a reference, the event loop only keeps a weak one
+            task = asyncio.ensure_future(self._async_refresh(key, request))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._async_refreshed)
+        if response is not None:
+            return response
+
+        with self._lock:
+            self._stats['misses'] += 1
+        return self._store(key, await request())
+
+    def clear(self):
+        """Remove all the cached responses."""
+        self.backend.clear()
+
+    def stats(self):
+        """Return the number of fresh and stale hits, misses and refreshes.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._stats)
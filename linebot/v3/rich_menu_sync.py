@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.rich_menu_sync module.
+
+Brings the rich menus of a channel to a declared state with few requests.
+
+Rich menus cannot be modified, so a changed menu is created again.
+The name of each rich menu created here ends with ``' #'`` and a hash of its
+object and image, which tells whether a menu is up to date without
+downloading its image. Menus whose name has no such hash are never modified
+or deleted.
+"""
+
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from linebot.v3.exceptions import RichMenuSyncError
+from linebot.v3.messaging import (
+    ApiException,
+    CreateRichMenuAliasRequest,
+    RichMenuBatchLinkOperation,
+    RichMenuBatchRequest,
+    RichMenuRequest,
+    UpdateRichMenuAliasRequest,
+)
+
+_TAGGED_NAME = re.compile(r'^(.*) #([0-9a-f]{16})$', re.DOTALL)
+
+MAX_BATCH_OPERATIONS = 1000
+
+
+class RichMenuSpec(object):
+    """Desired rich menu, with its image and aliases."""
+
+    def __init__(self, rich_menu, image, content_type='image/png', aliases=(), default=False):
+        """__init__ method.
+
+        :param rich_menu: Rich menu object; its name identifies the menu
+        :type rich_menu: :py:class:`linebot.v3.messaging.RichMenuRequest` | dict
+        :param bytes image: Image of the rich menu
+        :param str content_type: Content type of the image
+        :param list[str] aliases: Rich menu alias IDs which point at this menu
+        :param bool default: Make this menu the default rich menu
+        """
+        if not isinstance(rich_menu, dict):
+            rich_menu = rich_menu.to_dict()
+        self.rich_menu = rich_menu
+        self.image = bytes(image)
+        self.content_type = content_type
+        self.aliases = tuple(aliases)
+        self.default = default
+
+    @property
+    def name(self):
+        """Name of the rich menu, without the hash.
+
+        :rtype: str
+        """
+        return self.rich_menu['name']
+
+    @property
+    def digest(self):
+        """Hash of the rich menu object, without its name, and of the image.
+
+        :rtype: str
+        """
+        obj = dict(self.rich_menu)
+        del obj['name']
+        sha256 = hashlib.sha256(json.dumps(obj, sort_keys=True).encode('utf-8'))
+        sha256.update(self.content_type.encode('utf-8'))
+        sha256.update(self.image)
+        return sha256.hexdigest()[:16]
+
+    @property
+    def tagged_name(self):
+        """Name of the rich menu created for this spec.
+
+        :rtype: str
+        """
+        return '{} #{}'.format(self.name, self.digest)
+
+
+class RichMenuSyncPlan(object):
+    """Operations which bring the rich menus to the desired state.
+
+    Aliases and the default rich menu refer to specs by name, since the
+    IDs of the rich menus to create are not known yet.
+    """
+
+    def __init__(self, specs):
+        """__init__ method.
+
+        :param list[RichMenuSpec] specs: Desired rich menus
+        """
+        self.specs = {spec.name: spec for spec in specs}
+        #: Specs whose rich menu must be created
+        self.create = []
+        #: Rich menu IDs of the specs which are up to date, by name
+        self.keep = {}
+        #: Name of the spec whose menu replaces each outdated rich menu ID
+        self.relink = {}
+        #: Rich menu IDs to delete
+        self.delete = []
+        #: Name of the spec of each alias to create
+        self.create_aliases = {}
+        #: Name of the spec of each alias to point at another menu
+        self.update_aliases = {}
+        #: Alias IDs to delete
+        self.delete_aliases = []
+        #: Name of the spec to make the default rich menu, or None
+        self.default = None
+
+    def is_empty(self):
+        """Return whether the rich menus are already in the desired state.
+
+        :rtype: bool
+        """
+        return not (self.create or self.delete or self.create_aliases or self.update_aliases
+                    or self.delete_aliases or self.default)
+
+    def __repr__(self):
+        """__repr__ method."""
+        return ('<RichMenuSyncPlan create={} keep={} delete={} relink={} '
+                'create_aliases={} update_aliases={} delete_aliases={} default={}>').format(
+            [spec.name for spec in self.create], sorted(self.keep), len(self.delete),
+            len(self.relink), sorted(self.create_aliases), sorted(self.update_aliases),
+            sorted(self.delete_aliases), self.default)
+
+
+class RichMenuSync(object):
+    """Reconciles the rich menus of a channel with a declared set.
+
+    :py:meth:`plan` fetches the current rich menus, aliases and default rich
+    menu in parallel and computes the operations to apply; :py:meth:`apply`
+    applies them with at most max_workers concurrent requests:
+
+    1. create the new rich menus and upload their images,
+    2. create and update the aliases and set the default rich menu,
+    3. move the users linked to replaced menus to the new ones with
+       ``rich_menu_batch`` and wait for it to complete,
+    4. delete the outdated aliases and rich menus.
+    """
+
+    def __init__(self, api, blob_api, max_workers=4, poll_interval=1.0, batch_timeout=600):
+        """__init__ method.
+
+        :param api: MessagingApi
+        :type api: :py:class:`linebot.v3.messaging.MessagingApi`
+        :param blob_api: MessagingApiBlob, to upload the images
+        :type blob_api: :py:class:`linebot.v3.messaging.MessagingApiBlob`
+        :param int max_workers: Maximum number of concurrent requests
+        :param float poll_interval: Seconds between checks of the batch progress
+        :param float batch_timeout: Seconds to wait for the batch to complete
+        """
+        self.api = api
+        self.blob_api = blob_api
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.batch_timeout = batch_timeout
+
+    def _default_rich_menu_id(self):
+        try:
+            return self.api.get_default_rich_menu_id().rich_menu_id
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def plan(self, specs, prune=True):
+        """Compute the operations which bring the rich menus to the desired state.
+
+        :param list[RichMenuSpec] specs: Desired rich menus
+        :param bool prune: Delete the rich menus created by a previous sync
+            whose name is not in specs
+        :rtype: :py:class:`RichMenuSyncPlan`
+        """
+        plan = RichMenuSyncPlan(specs)
+        if len(plan.specs) != len(specs):
+            raise ValueError('rich menu names must be unique')
+        if sum(1 for spec in specs if spec.default) > 1:
+            raise ValueError('only one rich menu can be the default')
+
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            rich_menus = executor.submit(self.api.get_rich_menu_list)
+            aliases = executor.submit(self.api.get_rich_menu_alias_list)
+            default_id = executor.submit(self._default_rich_menu_id)
+            rich_menus = rich_menus.result().richmenus
+            aliases = aliases.result().aliases
+            default_id = default_id.result()
+
+        tagged = {spec.tagged_name: spec.name for spec in specs}
+        outdated = []
+        for rich_menu in rich_menus:
+            name = tagged.get(rich_menu.name)
+            if name is not None and name not in plan.keep:
+                plan.keep[name] = rich_menu.rich_menu_id
+                continue
+            match = _TAGGED_NAME.match(rich_menu.name)
+            if match is None:
+                continue
+            name = match.group(1)
+            if name in plan.specs:
+                plan.relink[rich_menu.rich_menu_id] = name
+                outdated.append(rich_menu.rich_menu_id)
+            elif prune:
+                outdated.append(rich_menu.rich_menu_id)
+        plan.create = [spec for spec in specs if spec.name not in plan.keep]
+        plan.delete = outdated
+
+        wanted = {alias: spec.name for spec in specs for alias in spec.aliases}
+        actual = {alias.rich_menu_alias_id: alias.rich_menu_id for alias in aliases}
+        for alias, name in wanted.items():
+            if alias not in actual:
+                plan.create_aliases[alias] = name
+            elif actual[alias] != plan.keep.get(name):
+                plan.update_aliases[alias] = name
+        deleted = set(outdated)
+        plan.delete_aliases = [alias for alias, rich_menu_id in actual.items()
+                               if alias not in wanted and rich_menu_id in deleted]
+
+        for spec in specs:
+            if spec.default and (spec.name not in plan.keep or default_id != plan.keep[spec.name]):
+                plan.default = spec.name
+        return plan
+
+    def _create(self, spec):
+        rich_menu = dict(spec.rich_menu, name=spec.tagged_name)
+        rich_menu_id = self.api.create_rich_menu(RichMenuRequest.from_dict(rich_menu)).rich_menu_id
+        try:
+            self.blob_api.set_rich_menu_image(
+                rich_menu_id, spec.image, _headers={'Content-Type': spec.content_type})
+        except Exception:
+            # a rich menu without image cannot be used
+            self.api.delete_rich_menu(rich_menu_id)
+            raise
+        return rich_menu_id
+
+    def _set_alias(self, alias, rich_menu_id, create):
+        if create:
+            self.api.create_rich_menu_alias(CreateRichMenuAliasRequest(
+                rich_menu_alias_id=alias, rich_menu_id=rich_menu_id))
+        else:
+            self.api.update_rich_menu_alias(
+                alias, UpdateRichMenuAliasRequest(rich_menu_id=rich_menu_id))
+
+    def _wait_for_batch(self, request_id):
+        deadline = time.monotonic() + self.batch_timeout
+        while True:
+            phase = self.api.get_rich_menu_batch_progress(request_id).phase
+            if phase == 'succeeded':
+                return
+            if phase == 'failed':
+                raise RichMenuSyncError(
+                    'rich menu batch {} failed for some users'.format(request_id))
+            if time.monotonic() > deadline:
+                raise RichMenuSyncError(
+                    'rich menu batch {} did not complete in time'.format(request_id))
+            time.sleep(self.poll_interval)
+
+    def _relink(self, relink):
+        operations = list(relink.items())
+        for i in range(0, len(operations), MAX_BATCH_OPERATIONS):
+            request = RichMenuBatchRequest(operations=[
+                RichMenuBatchLinkOperation(var_from=old, to=new)
+                for old, new in operations[i:i + MAX_BATCH_OPERATIONS]])
+            response = self.api.rich_menu_batch_with_http_info(request)
+            self._wait_for_batch(response.headers['x-line-request-id'])
+
+    def apply(self, plan):
+        """Apply the operations of a plan.
+
+        :param plan: Plan returned by :py:meth:`plan`
+        :type plan: :py:class:`RichMenuSyncPlan`
+        :rtype: dict[str, str]
+        :return: Rich menu ID of each spec, by name
+        """
+        rich_menu_ids = dict(plan.keep)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            created = executor.map(self._create, plan.create)
+            for spec, rich_menu_id in zip(plan.create, created):
+                rich_menu_ids[spec.name] = rich_menu_id
+
+            calls = [executor.submit(self._set_alias, alias, rich_menu_ids[name], True)
+                     for alias, name in plan.create_aliases.items()]
+            calls += [executor.submit(self._set_alias, alias, rich_menu_ids[name], False)
+                      for alias, name in plan.update_aliases.items()]
+            if plan.default is not None:
+                calls.append(executor.submit(
+                    self.api.set_default_rich_menu, rich_menu_ids[plan.default]))
+            for call in calls:
+                call.result()
+
+            if plan.relink:
+                self._relink({old: rich_menu_ids[name] for old, name in plan.relink.items()})
+
+            for call in [executor.submit(self.api.delete_rich_menu_alias, alias)
+                         for alias in plan.delete_aliases]:
+                call.result()
+            for call in [executor.submit(self.api.delete_rich_menu, rich_menu_id)
+                         for rich_menu_id in plan.delete]:
+                call.result()
+        return rich_menu_ids
+
+    def sync(self, specs, prune=True):
+        """Bring the rich menus to the desired state.
+
+        :param list[RichMenuSpec] specs: Desired rich menus
+        :param bool prune: See :py:meth:`plan`
+        :rtype: dict[str, str]
+        :return: Rich menu ID of each spec, by name
+        """
+        return self.apply(self.plan(specs, prune=prune))
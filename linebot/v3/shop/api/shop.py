@@ -15,7 +15,8 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
 from linebot.v3.shop.models.mission_sticker_request import MissionStickerRequest
@@ -51,7 +52,7 @@ class Shop(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.mission_sticker_v3(mission_sticker_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param mission_sticker_request: (required)
         :type mission_sticker_request: MissionStickerRequest
@@ -63,7 +64,7 @@ class Shop(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
         kwargs['_return_http_data_only'] = True
@@ -80,7 +81,7 @@ class Shop(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.mission_sticker_v3_with_http_info(mission_sticker_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param mission_sticker_request: (required)
         :type mission_sticker_request: MissionStickerRequest
@@ -105,7 +106,7 @@ class Shop(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: None
         """
 
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictBool, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 
 class MissionStickerRequest(BaseModel):
     """
@@ -31,16 +31,20 @@ class MissionStickerRequest(BaseModel):
     product_type: StrictStr = Field(..., alias="productType", description="`STICKER`")
     send_present_message: StrictBool = Field(..., alias="sendPresentMessage", description="`false`")
 
-    __properties = ["to", "productId", "productType", "sendPresentMessage"]
+    __properties: ClassVar[List[str]] = ["to", "productId", "productType", "sendPresentMessage"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,10 +57,10 @@ class MissionStickerRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -66,9 +70,9 @@ class MissionStickerRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return MissionStickerRequest.parse_obj(obj)
+            return MissionStickerRequest.model_validate(obj)
 
-        _obj = MissionStickerRequest.parse_obj({
+        _obj = MissionStickerRequest.model_validate({
             "to": obj.get("to"),
             "product_id": obj.get("productId"),
             "product_type": obj.get("productType"),
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.single_flight module.
+
+Coalesces identical concurrent GET requests of the generated API clients.
+Set a :py:class:`SingleFlight` as ``single_flight`` of the Configuration.
+"""
+
+import asyncio
+import re
+import threading
+
+from linebot.v3.cache import InFlight
+from linebot.v3.utils import LOGGER
+
+# Resource paths whose GET requests are coalesced by default: profiles,
+# group and room summaries and member counts, and the bot info.
+DEFAULT_PATHS = (
+    r'^/v2/bot/profile/[^/]+$',
+    r'^/v2/bot/group/[^/]+/(summary|members/count|member/[^/]+)$',
+    r'^/v2/bot/room/[^/]+/(members/count|member/[^/]+)$',
+    r'^/v2/bot/info$',
+)
+
+
+def _follow(record, value=None, error=None):
+    if record is None:
+        return
+    record.extra['coalesced'] = True
+    if error is not None:
+        record.failed(error)
+    else:
+        record.status = getattr(value, 'status_code', None)
+        record.deserialized()
+
+
+class SingleFlight(object):
+    """Shares one request between identical concurrent GET requests.
+
+    While a GET request is in flight, the same request, i.e. the same URL
+    and Authorization header, made by another thread or task waits for it
+    and receives the same :py:class:`ApiResponse`, or exception, instead of
+    being sent. The models are shared, so do not modify them. Nothing is
+    kept once the request has completed; see
+    :py:class:`linebot.v3.response_cache.ResponseCache` for caching.
+
+    The instrumentation records of the coalesced requests have
+    ``extra['coalesced']`` set, and their wait as the deserialize phase.
+
+    The object is shared, not copied, when the Configuration is copied.
+    """
+
+    def __init__(self, paths=DEFAULT_PATHS):
+        """__init__ method.
+
+        :param paths: Regular expressions of the resource paths whose GET
+            requests are coalesced, e.g. ``^/v2/bot/group/[^/]+/summary$``,
+            or None for all of them. Defaults to :py:data:`DEFAULT_PATHS`.
+        :type paths: list[str]
+        """
+        self.paths = None if paths is None else [re.compile(path) for path in paths]
+        self._calls = InFlight()
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'coalesced': 0}
+
+    def _key(self, method, resource_path, url, headers):
+        if method != 'GET':
+            return None
+        if self.paths is not None and not any(
+                path.search(resource_path) for path in self.paths):
+            return None
+        return url, (headers or {}).get('Authorization')
+
+    def _count(self, key, leader):
+        with self._lock:
+            self._stats['requests' if leader else 'coalesced'] += 1
+        if not leader:
+            LOGGER.debug('Coalesced GET %s', key[0])
+
+    def call(self, method, resource_path, url, headers, request, record=None):
+        """Return the response of request, or that of an identical request in flight.
+
+        Called by ApiClient.
+
+        :param str method: HTTP method
+        :param str resource_path: Resource path, e.g. ``/v2/bot/group/C1234/summary``
+        :param str url: URL with the query string
+        :param dict headers: Request headers
+        :param request: Function which sends the request and returns the
+            deserialized :py:class:`ApiResponse`
+        :param record: Instrumentation record of the request, or None
+        :type record: :py:class:`linebot.v3.instrumentation.RequestRecord`
+        """
+        key = self._key(method, resource_path, url, headers)
+        if key is None:
+            return request()
+        flight, leader = self._calls.join(key)
+        self._count(key, leader)
+        if leader:
+            return self._calls.lead(key, flight, request)
+        try:
+            value = self._calls.follow(flight)
+        except BaseException as e:
+            _follow(record, error=e)
+            raise
+        _follow(record, value)
+        return value
+
+    async def async_call(self, method, resource_path, url, headers, request, record=None):
+        """Return the response of request, or that of an identical request in flight.
+
+        Called by AsyncApiClient; requests are only shared within an event loop.
+
+        :param str method: HTTP method
+        :param str resource_path: Resource path, e.g. ``/v2/bot/group/C1234/summary``
+        :param str url: URL with the query string
+        :param dict headers: Request headers
+        :param request: Coroutine function which sends the request and
+            returns the deserialized :py:class:`ApiResponse`
+        :param record: Instrumentation record of the request, or None
+        :type record: :py:class:`linebot.v3.instrumentation.RequestRecord`
+        """
+        key = self._key(method, resource_path, url, headers)
+        if key is None:
+            return await request()
+        key += (asyncio.get_running_loop(),)
+        future, leader = self._calls.async_join(key)
+        self._count(key, leader)
+        if leader:
+            return await self._calls.async_lead(key, future, request)
+        try:
+            value = await self._calls.async_follow(future)
+        except Exception as e:
+            _follow(record, error=e)
+            raise
+        _follow(record, value)
+        return value
+
+    def stats(self):
+        """Return the number of requests sent, coalesced and in flight.
+
+        ``requests`` counts the GET requests sent for the matching paths and
+        ``coalesced`` those which shared one of them instead.
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+        return stats
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.tracing module.
+
+OpenTelemetry spans of webhook handling and API requests.
+
+The webhook parsers and handlers create spans when the ``opentelemetry-api``
+package is installed, using the global tracer provider unless
+:py:func:`set_tracer_provider` is called. Without it, they do nothing.
+Set a :py:class:`TracingInstrumentation` as ``instrumentation`` of the
+Configuration to create a span for every API request.
+"""
+
+import contextlib
+import contextvars
+import functools
+
+from linebot.__about__ import __version__
+from linebot.v3.instrumentation import Instrumentation
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+_NOOP = contextlib.nullcontext()
+
+_tracer_provider = None
+_tracer = None
+
+# webhook event being dispatched, for the spans of the API requests it makes
+_current_event = contextvars.ContextVar('linebot_current_event', default=None)
+
+
+def set_tracer_provider(tracer_provider):
+    """Use a tracer provider instead of the global one.
+
+    :param tracer_provider: opentelemetry.trace.TracerProvider, or None
+        for the global one
+    """
+    global _tracer_provider, _tracer
+    _tracer_provider = tracer_provider
+    _tracer = None
+
+
+def _get_tracer():
+    global _tracer
+    if _tracer is None:
+        _tracer = trace.get_tracer('linebot', __version__, tracer_provider=_tracer_provider)
+    return _tracer
+
+
+def span(name, attributes=None):
+    """Return a context manager which runs its block in a span.
+
+    Without OpenTelemetry, it is a shared context manager which does nothing.
+
+    :param str name: Span name
+    :param dict attributes: Span attributes
+    """
+    if trace is None:
+        return _NOOP
+    return _get_tracer().start_as_current_span(name, attributes=attributes)
+
+
+def _event_attributes(event):
+    attributes = {'linebot.event.type': getattr(event, 'type', None) or ''}
+    webhook_event_id = getattr(event, 'webhook_event_id', None)
+    if webhook_event_id is not None:
+        attributes['linebot.webhook_event_id'] = webhook_event_id
+    reply_token = getattr(event, 'reply_token', None)
+    if reply_token is not None:
+        attributes['linebot.reply_token'] = reply_token
+    return attributes
+
+
+@contextlib.contextmanager
+def _event_span(event):
+    token = _current_event.set(event)
+    try:
+        with _get_tracer().start_as_current_span(
+                'linebot.webhook.dispatch', attributes=_event_attributes(event)):
+            yield
+    finally:
+        _current_event.reset(token)
+
+
+def event_span(event):
+    """Return a context manager which runs the handler of an event in a span.
+
+    The span has the type, webhookEventId and reply token of the event as
+    attributes, which :py:class:`TracingInstrumentation` also adds to the
+    spans of the API requests made in the block.
+
+    :param event: Webhook event
+    :type event: :py:class:`linebot.v3.webhooks.Event`
+    """
+    if trace is None:
+        return _NOOP
+    return _event_span(event)
+
+
+def propagate(func):
+    """Return func, to be called on another thread in the current context.
+
+    Without OpenTelemetry, func is returned as it is.
+
+    :param func: Function
+    :rtype: func
+    """
+    if trace is None:
+        return func
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+def propagate_async(func):
+    """Return coroutine function func, to be awaited by another task in the current context.
+
+    Without OpenTelemetry, func is returned as it is.
+
+    :param func: Coroutine function
+    :rtype: func
+    """
+    if trace is None:
+        return func
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    async def call(*args, **kwargs):
+        # the task which awaits it keeps its context between calls
+        tokens = [(var, var.set(value)) for var, value in context.items()]
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            for var, token in reversed(tokens):
+                var.reset(token)
+
+    return call
+
+
+class TracingInstrumentation(Instrumentation):
+    """Creates an OpenTelemetry client span for every API request.
+
+    Requests made while a webhook event is handled are children of its
+    dispatch span, and carry its webhookEventId and reply token.
+    """
+
+    def started(self, record):
+        """Start the span of a request.
+
+        :param record: Record of the request
+        :type record: :py:class:`linebot.v3.instrumentation.RequestRecord`
+        """
+        if trace is None:
+            return
+        attributes = {'http.request.method': record.method, 'url.template': record.path}
+        event = _current_event.get()
+        if event is not None:
+            attributes.update(_event_attributes(event))
+        record.extra['span'] = _get_tracer().start_span(
+            '{} {}'.format(record.method, record.path), kind=trace.SpanKind.CLIENT,
+            attributes=attributes)
+
+    def finish(self, record):
+        """End the span of a request.
+
+        :param record: Record of the request
+        :type record: :py:class:`linebot.v3.instrumentation.RequestRecord`
+        """
+        request_span = record.extra.pop('span', None)
+        if request_span is None:
+            return
+        if record.status is not None:
+            request_span.set_attribute('http.response.status_code', record.status)
+        if record.request_id is not None:
+            request_span.set_attribute('linebot.request_id', record.request_id)
+        if record.error is not None:
+            request_span.record_exception(record.error)
+            request_span.set_status(trace.StatusCode.ERROR, str(record.error))
+        request_span.end()
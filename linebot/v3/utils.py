@@ -15,11 +15,14 @@
 """linebot.v3.utils module."""
 
 
+import functools
 import logging
 import re
 
 import sys
 
+import pydantic
+
 LOGGER = logging.getLogger('linebot')
 
 PY3 = sys.version_info[0] == 3
@@ -67,3 +70,24 @@ def safe_compare_digest(val1, val2):
             result |= (ord(i) ^ ord(j))
 
     return result == 0
+
+
+def validate_arguments(func):
+    """Validate the arguments of a generated API method with pydantic.
+
+    Unlike ``pydantic.validate_call``, the check is skipped when
+    ``client_side_validation`` is disabled in the Configuration of the API client,
+    so model instances built by the caller are sent without being validated again.
+
+    :param func: API method
+    :rtype: func
+    """
+    validated = pydantic.validate_call(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.api_client.client_side_validation:
+            return validated(self, *args, **kwargs)
+        return func(self, *args, **kwargs)
+
+    return wrapper
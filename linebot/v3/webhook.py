@@ -15,12 +15,18 @@
 """linebot.v3.webhook module."""
 
 
+import asyncio
 import base64
+import contextvars
+import functools
 import hashlib
 import hmac
 import inspect
 import json
+import re
+import threading
 
+from . import tracing
 from .exceptions import InvalidSignatureError
 from .webhooks import (
     Event,
@@ -129,24 +135,178 @@ class WebhookParser(object):
             | :py:class:`linebot.v3.webhook.WebhookPayload`
         :return: Events list, or WebhookPayload instance
         """
-        if not self.signature_validator.validate(body, signature):
-            raise InvalidSignatureError(
-                'Invalid signature. signature=' + signature)
-
-        body_json = json.loads(body)
-        events = []
-        for event in body_json['events']:
-            try:
-                events.append(Event.from_dict(event))
-            except ValueError:
-                LOGGER.info('Unknown event type. type=' + event['type'])
-                events.append(UnknownEvent.new_from_json_dict(event))
+        self._validate(body, signature)
+
+        with tracing.span('linebot.webhook.parse'):
+            body_json = json.loads(body)
+            events = [self._parse_event(event) for event in body_json['events']]
 
         if as_payload:
             return WebhookPayload(events=events, destination=body_json.get('destination'))
         else:
             return events
 
+    def iter_parse(self, body, signature, as_payload=False):
+        """Parse webhook request body as text, yielding events one by one.
+
+        The signature is validated before this method returns.
+        Each event is decoded from the ``events`` array when it is requested,
+        so handling can start before the rest of the body has been decoded.
+        With as_payload, the destination of the returned WebhookPayload is set
+        when it is decoded; the LINE Platform sends it before the events.
+
+        :param str body: Webhook request body (as text)
+        :param str signature: X-Line-Signature value (as text)
+        :param bool as_payload: (optional) True to return WebhookPayload object
+            whose events is an iterator.
+        :rtype: iterator[T <= :py:class:`linebot.v3.webhooks.models.Event`]
+            | :py:class:`linebot.v3.webhook.WebhookPayload`
+        :return: Events iterator, or WebhookPayload instance
+        """
+        self._validate(body, signature)
+
+        payload = WebhookPayload()
+        payload.events = (self._parse_event(event)
+                          for event in _iter_webhook_body(body, payload))
+
+        if as_payload:
+            return payload
+        else:
+            return payload.events
+
+    def _validate(self, body, signature):
+        with tracing.span('linebot.webhook.validate_signature'):
+            if not self.signature_validator.validate(body, signature):
+                raise InvalidSignatureError(
+                    'Invalid signature. signature=' + signature)
+
+    @staticmethod
+    def _parse_event(event):
+        try:
+            return Event.from_dict(event)
+        except ValueError:
+            LOGGER.info('Unknown event type. type=' + event['type'])
+            return UnknownEvent.new_from_json_dict(event)
+
+
+class AsyncWebhookParser(WebhookParser):
+    """Webhook Parser for asyncio applications.
+
+    Signature validation and parsing are CPU-bound. For bodies of
+    offload_threshold characters or more, they run on a thread pool so that
+    the event loop keeps serving other requests. hashlib releases the GIL
+    while hashing large buffers, so validation runs in parallel on several cores.
+    """
+
+    def __init__(self, channel_secret, offload_threshold=None, executor=None):
+        """__init__ method.
+
+        :param str channel_secret: Channel secret (as text)
+        :param int offload_threshold: (optional) Minimum body length to parse
+            on the thread pool. None never offloads.
+        :param executor: (optional) concurrent.futures.Executor to offload to.
+            Default is the default executor of the event loop.
+        """
+        super(AsyncWebhookParser, self).__init__(channel_secret)
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+
+    async def parse(self, body, signature, as_payload=False):
+        """Parse webhook request body as text.
+
+        :param str body: Webhook request body (as text)
+        :param str signature: X-Line-Signature value (as text)
+        :param bool as_payload: (optional) True to return WebhookPayload object.
+        :rtype: list[T <= :py:class:`linebot.v3.webhooks.models.Event`]
+            | :py:class:`linebot.v3.webhook.WebhookPayload`
+        :return: Events list, or WebhookPayload instance
+        """
+        parse = functools.partial(
+            super(AsyncWebhookParser, self).parse, body, signature, as_payload=as_payload)
+        if self.offload_threshold is None or len(body) < self.offload_threshold:
+            return parse()
+        # keep the current span as the parent of the spans on the thread
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, contextvars.copy_context().run, parse)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def _expect(body, end, chars):
+    end = _WHITESPACE.match(body, end).end()
+    char = body[end:end + 1]
+    if char not in chars:
+        raise ValueError(
+            'Expecting one of {0!r}: char {1}'.format(chars, end))
+    return char, _WHITESPACE.match(body, end + 1).end()
+
+
+def _iter_webhook_body(body, payload):
+    """Yield the event dicts of the webhook body one by one.
+
+    Other members of the top-level object are decoded as a whole,
+    and destination is stored on payload.
+    """
+    _, end = _expect(body, 0, '{')
+    if body[end:end + 1] == '}':
+        return
+    while True:
+        key, end = _DECODER.raw_decode(body, end)
+        _, end = _expect(body, end, ':')
+        if key == 'events' and body[end:end + 1] == '[':
+            end = _WHITESPACE.match(body, end + 1).end()
+            if body[end:end + 1] == ']':
+                end += 1
+            else:
+                while True:
+                    event, end = _DECODER.raw_decode(body, end)
+                    yield event
+                    char, end = _expect(body, end, ',]')
+                    if char == ']':
+                        break
+        else:
+            value, end = _DECODER.raw_decode(body, end)
+            if key == 'destination':
+                payload.destination = value
+        char, end = _expect(body, end, ',}')
+        if char == '}':
+            return
+
+
+class _EventBatch(object):
+
+    def __init__(self, func, max_size, max_latency):
+        self.func = func
+        self.max_size = max_size
+        self.max_latency = max_latency
+        self.timer = None
+        self._events = []
+        self._lock = threading.Lock()
+
+    def add(self, event, start_timer):
+        """Add an event and return the events to emit when the batch is full."""
+        with self._lock:
+            self._events.append(event)
+            if self.max_size is not None and len(self._events) >= self.max_size:
+                return self._take()
+            if self.timer is None and self.max_latency is not None:
+                self.timer = start_timer(self)
+            return None
+
+    def take(self):
+        """Remove and return the pending events."""
+        with self._lock:
+            return self._take()
+
+    def _take(self):
+        events, self._events = self._events, []
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        return events
+
 
 class WebhookHandler(object):
     """Webhook Handler.
@@ -154,13 +314,18 @@ class WebhookHandler(object):
     Please read https://github.com/line/line-bot-sdk-python#webhookhandler
     """
 
-    def __init__(self, channel_secret):
+    def __init__(self, channel_secret, executor=None):
         """__init__ method.
 
         :param str channel_secret: Channel secret (as text)
+        :param executor: (optional) Executor which runs handlers in the background.
+            If set, handle returns as soon as the events are enqueued.
+        :type executor: :py:class:`linebot.v3.executor.BackgroundExecutor`
         """
         self.parser = WebhookParser(channel_secret)
+        self.executor = executor
         self._handlers = {}
+        self._batches = {}
         self._default = None
 
     def add(self, event, message=None):
@@ -185,6 +350,29 @@ class WebhookHandler(object):
 
         return decorator
 
+    def add_batch(self, event, max_size=100, max_latency=None):
+        """Add batch handler method.
+
+        The handler method is called with a list of events instead of each event.
+        If max_latency is None, the events of one webhook request are passed at once.
+        Otherwise events are accumulated across requests until max_size events
+        are collected or max_latency seconds have passed since the first one.
+
+        :param event: Specify a kind of Event which you want to handle
+        :type event: T <= :py:class:`linebot.v3.webhooks.models.Event` class
+        :param int max_size: (optional) Maximum number of events in one call.
+            None means unlimited.
+        :param float max_latency: (optional) Maximum seconds an event waits in the batch
+        :rtype: func
+        :return: decorator
+        """
+        def decorator(func):
+            key = self.__get_handler_key(event)
+            self._batches[key] = _EventBatch(func, max_size, max_latency)
+            return func
+
+        return decorator
+
     def default(self):
         """Set default handler method.
 
@@ -200,31 +388,110 @@ class WebhookHandler(object):
     def handle(self, body, signature):
         """Handle webhook.
 
+        If an executor is set, events are enqueued and handlers run later.
+
         :param str body: Webhook request body (as text)
         :param str signature: X-Line-Signature value (as text)
         """
-        payload = self.parser.parse(body, signature, as_payload=True)
+        with tracing.span('linebot.webhook.handle'):
+            payload = self.parser.parse(body, signature, as_payload=True)
+            self._handle_payload(payload)
+
+    def iter_handle(self, body, signature):
+        """Handle webhook, decoding events one by one.
 
+        Each event is dispatched as soon as it is decoded,
+        before the rest of the body is decoded.
+        See :py:meth:`linebot.v3.webhook.WebhookParser.iter_parse`.
+
+        :param str body: Webhook request body (as text)
+        :param str signature: X-Line-Signature value (as text)
+        """
+        with tracing.span('linebot.webhook.handle'):
+            payload = self.parser.iter_parse(body, signature, as_payload=True)
+            self._handle_payload(payload)
+
+    def _handle_payload(self, payload):
         for event in payload.events:
-            func = None
-            key = None
+            batch = self._get_batch(event)
+            if batch is not None:
+                events = batch.add(event, self._start_batch_timer)
+                if events:
+                    self._emit_batch(batch, events)
+            elif self.executor is None:
+                self._dispatch(event, payload)
+            else:
+                self.executor.submit(tracing.propagate(self._dispatch), event, payload)
 
-            if isinstance(event, MessageEvent):
-                key = self.__get_handler_key(
-                    event.__class__, event.message.__class__)
-                func = self._handlers.get(key, None)
+        for batch in self._batches.values():
+            if batch.max_latency is None:
+                self._flush_batch(batch)
 
-            if func is None:
-                key = self.__get_handler_key(event.__class__)
-                func = self._handlers.get(key, None)
+    def flush(self):
+        """Call the batch handlers with all pending events.
 
-            if func is None:
-                func = self._default
+        Also cancels the pending max_latency timers.
+        Call this on shutdown (before shutting down the executor, if any).
+        """
+        for batch in self._batches.values():
+            self._flush_batch(batch)
+
+    def _get_batch(self, event):
+        if not self._batches:
+            return None
+        return self._batches.get(self.__get_handler_key(event.__class__))
+
+    def _start_batch_timer(self, batch):
+        timer = threading.Timer(batch.max_latency, self._flush_batch_timer, [batch])
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _flush_batch(self, batch):
+        events = batch.take()
+        if events:
+            self._emit_batch(batch, events)
+
+    def _flush_batch_timer(self, batch):
+        events = batch.take()
+        if not events:
+            return
+        try:
+            self._emit_batch(batch, events)
+        except Exception:
+            # e.g. the executor was shut down without flush() first
+            LOGGER.exception('Failed to flush a batch of %d events', len(events))
+
+    def _emit_batch(self, batch, events):
+        if self.executor is None:
+            batch.func(events)
+        else:
+            self.executor.submit(batch.func, events)
 
-            if func is None:
-                LOGGER.info('No handler of ' + key + ' and no default handler')
-            else:
-                self.__invoke_func(func, event, payload)
+    def _dispatch(self, event, payload):
+        with tracing.event_span(event):
+            return self._call_handler(event, payload)
+
+    def _call_handler(self, event, payload):
+        func = None
+        key = None
+
+        if isinstance(event, MessageEvent):
+            key = self.__get_handler_key(
+                event.__class__, event.message.__class__)
+            func = self._handlers.get(key, None)
+
+        if func is None:
+            key = self.__get_handler_key(event.__class__)
+            func = self._handlers.get(key, None)
+
+        if func is None:
+            func = self._default
+
+        if func is None:
+            LOGGER.info('No handler of ' + key + ' and no default handler')
+        else:
+            return self.__invoke_func(func, event, payload)
 
     def __add_handler(self, func, event, message=None):
         key = self.__get_handler_key(event, message=message)
@@ -234,11 +501,11 @@ class WebhookHandler(object):
     def __invoke_func(cls, func, event, payload):
         (has_varargs, args_count) = cls.__get_args_count(func)
         if has_varargs or args_count == 2:
-            func(event, payload.destination)
+            return func(event, payload.destination)
         elif args_count == 1:
-            func(event)
+            return func(event)
         else:
-            func()
+            return func()
 
     @staticmethod
     def __get_args_count(func):
@@ -255,3 +522,114 @@ class WebhookHandler(object):
             return event.__name__
         else:
             return event.__name__ + '_' + message.__name__
+
+
+class AsyncWebhookHandler(WebhookHandler):
+    """Webhook Handler for asyncio applications.
+
+    Handlers may be coroutine functions or plain functions.
+    """
+
+    def __init__(self, channel_secret, executor=None,
+                 offload_threshold=None, offload_executor=None):
+        """__init__ method.
+
+        :param str channel_secret: Channel secret (as text)
+        :param executor: (optional) Executor which runs handlers in the background.
+            If set, handle returns as soon as the events are enqueued.
+        :type executor: :py:class:`linebot.v3.executor.AsyncBackgroundExecutor`
+        :param int offload_threshold: (optional) Minimum body length to validate
+            and parse on a thread pool. See :py:class:`AsyncWebhookParser`.
+        :param offload_executor: (optional) concurrent.futures.Executor to offload to.
+        """
+        super(AsyncWebhookHandler, self).__init__(channel_secret, executor=executor)
+        self.parser = AsyncWebhookParser(
+            channel_secret, offload_threshold=offload_threshold, executor=offload_executor)
+        self._flush_tasks = set()
+
+    async def handle(self, body, signature):
+        """Handle webhook.
+
+        If an executor is set, events are enqueued and handlers run later.
+
+        :param str body: Webhook request body (as text)
+        :param str signature: X-Line-Signature value (as text)
+        """
+        with tracing.span('linebot.webhook.handle'):
+            payload = await self.parser.parse(body, signature, as_payload=True)
+            await self._handle_payload_async(payload)
+
+    async def iter_handle(self, body, signature):
+        """Handle webhook, decoding events one by one.
+
+        Each event is dispatched as soon as it is decoded,
+        before the rest of the body is decoded.
+        See :py:meth:`linebot.v3.webhook.WebhookParser.iter_parse`.
+
+        :param str body: Webhook request body (as text)
+        :param str signature: X-Line-Signature value (as text)
+        """
+        with tracing.span('linebot.webhook.handle'):
+            payload = self.parser.iter_parse(body, signature, as_payload=True)
+            await self._handle_payload_async(payload)
+
+    async def _handle_payload_async(self, payload):
+        for event in payload.events:
+            batch = self._get_batch(event)
+            if batch is not None:
+                events = batch.add(event, self._start_batch_timer)
+                if events:
+                    await self._emit_batch_async(batch, events)
+            elif self.executor is None:
+                await self._dispatch_async(event, payload)
+            else:
+                await self.executor.submit(
+                    tracing.propagate_async(self._dispatch_async), event, payload)
+
+        for batch in self._batches.values():
+            if batch.max_latency is None:
+                await self._flush_batch_async(batch)
+
+    async def flush(self):
+        """Call the batch handlers with all pending events.
+
+        Also waits for the batches flushed by max_latency in the meantime.
+        Call this on shutdown (before shutting down the executor, if any).
+        """
+        for batch in self._batches.values():
+            await self._flush_batch_async(batch)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    async def _dispatch_async(self, event, payload):
+        with tracing.event_span(event):
+            result = self._call_handler(event, payload)
+            if inspect.isawaitable(result):
+                await result
+
+    def _start_batch_timer(self, batch):
+        loop = asyncio.get_running_loop()
+        return loop.call_later(batch.max_latency, self._start_flush_task, batch)
+
+    def _start_flush_task(self, batch):
+        task = asyncio.ensure_future(self._flush_batch_async(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_task_done)
+
+    def _flush_task_done(self, task):
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOGGER.error('Batch handler raised an exception', exc_info=task.exception())
+
+    async def _flush_batch_async(self, batch):
+        events = batch.take()
+        if events:
+            await self._emit_batch_async(batch, events)
+
+    async def _emit_batch_async(self, batch, events):
+        if self.executor is None:
+            result = batch.func(events)
+            if inspect.isawaitable(result):
+                await result
+        else:
+            await self.executor.submit(batch.func, events)
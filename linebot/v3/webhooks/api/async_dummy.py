@@ -16,7 +16,8 @@ import re  # noqa: F401
 import io
 import warnings
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 from typing import overload, Optional, Union, Awaitable
 
@@ -61,7 +62,7 @@ class AsyncDummy(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.callback(callback_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param callback_request: (required)
         :type callback_request: CallbackRequest
@@ -73,7 +74,7 @@ class AsyncDummy(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: str
         """
         kwargs['_return_http_data_only'] = True
@@ -92,7 +93,7 @@ class AsyncDummy(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.callback_with_http_info(callback_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = await thread
 
         :param callback_request: (required)
         :type callback_request: CallbackRequest
@@ -117,7 +118,7 @@ class AsyncDummy(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns an asyncio.Task.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
 
@@ -15,7 +15,8 @@
 import re  # noqa: F401
 import io
 
-from pydantic.v1 import validate_arguments, ValidationError
+from pydantic import ValidationError
+from linebot.v3.utils import validate_arguments
 from typing_extensions import Annotated
 
 from linebot.v3.webhooks.models.callback_request import CallbackRequest
@@ -51,7 +52,7 @@ class Dummy(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.callback(callback_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param callback_request: (required)
         :type callback_request: CallbackRequest
@@ -63,7 +64,7 @@ class Dummy(object):
                                  (connection, read) timeouts.
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: str
         """
         kwargs['_return_http_data_only'] = True
@@ -80,7 +81,7 @@ class Dummy(object):
         asynchronous HTTP request, please pass async_req=True
 
         >>> thread = api.callback_with_http_info(callback_request, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param callback_request: (required)
         :type callback_request: CallbackRequest
@@ -105,7 +106,7 @@ class Dummy(object):
         :type _content_type: string, optional: force content-type for the request
         :return: Returns the result object.
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
 
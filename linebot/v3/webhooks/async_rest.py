@@ -12,6 +12,7 @@
 """
 
 
+import asyncio
 import io
 import json
 import logging
@@ -61,22 +62,71 @@ class RESTClientObject(object):
             ssl_context.check_hostname = False
             ssl_context.verify_mode = ssl.CERT_NONE
 
-        connector = aiohttp.TCPConnector(
-            limit=maxsize,
-            ssl=ssl_context
-        )
+        self.maxsize = maxsize
+        self.ssl_context = ssl_context
+        # linebot.v3.connector.SharedConnector, or None for a connector
+        # owned by the session
+        self.connector = configuration.connector
 
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
 
-        # https pool manager
-        self.pool_manager = aiohttp.ClientSession(
-            connector=connector,
-            trust_env=True
-        )
+        self.request_timeout = configuration.request_timeout
+        if configuration.circuit_breaker is not None:
+            self.request = configuration.circuit_breaker.wrap_async(self.request)
+
+        # the session is created on first use, in the running event loop
+        self._session = None
+        self._loop = None
+
+    @property
+    def pool_manager(self):
+        """Returns the aiohttp.ClientSession of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._loop is not loop:
+                self._close_stale(self._session, self._loop)
+            if self.connector is not None:
+                connector = self.connector.get()
+                connector_owner = False
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.maxsize,
+                    ssl=self.ssl_context
+                )
+                connector_owner = True
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=connector_owner,
+                trust_env=True
+            )
+            self._loop = loop
+        return self._session
+
+    def _close_stale(self, session, loop):
+        """Closes a session of another event loop in that loop.
+
+        Returns a concurrent.futures.Future of the close, or None.
+        """
+        if session is None or session.closed:
+            return None
+        if loop.is_closed() or not loop.is_running():
+            logger.warning("Dropping an aiohttp.ClientSession whose event "
+                           "loop is not running; close the client in the "
+                           "event loop which used it")
+            return None
+        return asyncio.run_coroutine_threadsafe(session.close(), loop)
 
     async def close(self):
-        await self.pool_manager.close()
+        session, self._session = self._session, None
+        if session is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await session.close()
+        else:
+            future = self._close_stale(session, self._loop)
+            if future is not None:
+                await asyncio.wrap_future(future)
 
     async def request(self, method, url, query_params=None, headers=None,
                       body=None, post_params=None, _preload_content=True,
@@ -112,7 +162,10 @@ class RESTClientObject(object):
         # url already contains the URL query string
         # so reset query_params to empty dict
         query_params = {}
-        timeout = _request_timeout or 5 * 60
+        timeout = _request_timeout or self.request_timeout or 5 * 60
+        if isinstance(timeout, tuple):
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=timeout[0], sock_read=timeout[1])
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.webhooks.models.delivery_context import DeliveryContext
 from linebot.v3.webhooks.models.event import Event
 from linebot.v3.webhooks.models.event_mode import EventMode
@@ -34,16 +34,20 @@ class AccountLinkEvent(Event):
     link: LinkContent = Field(...)
     type: str = "accountLink"
 
-    __properties = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext", "replyToken", "link"]
+    __properties: ClassVar[List[str]] = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext", "replyToken", "link"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -56,17 +60,17 @@ class AccountLinkEvent(Event):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of source
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of source
         if self.source:
             _dict['source'] = self.source.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of delivery_context
+        # override the default output from pydantic by calling `to_dict()` of delivery_context
         if self.delivery_context:
             _dict['deliveryContext'] = self.delivery_context.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of link
+        # override the default output from pydantic by calling `to_dict()` of link
         if self.link:
             _dict['link'] = self.link.to_dict()
         return _dict
@@ -78,9 +82,9 @@ class AccountLinkEvent(Event):
             return None
 
         if not isinstance(obj, dict):
-            return AccountLinkEvent.parse_obj(obj)
+            return AccountLinkEvent.model_validate(obj)
 
-        _obj = AccountLinkEvent.parse_obj({
+        _obj = AccountLinkEvent.model_validate({
             "type": obj.get("type"),
             "source": Source.from_dict(obj.get("source")) if obj.get("source") is not None else None,
             "timestamp": obj.get("timestamp"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
 class ActionResult(BaseModel):
     """
@@ -28,23 +28,27 @@ class ActionResult(BaseModel):
     type: StrictStr = Field(...)
     data: Optional[StrictStr] = Field(None, description="Base64-encoded binary data")
 
-    __properties = ["type", "data"]
+    __properties: ClassVar[List[str]] = ["type", "data"]
 
-    @validator('type')
+    @field_validator('type')
     def type_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('void', 'binary'):
             raise ValueError("must be one of enum values ('void', 'binary')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,10 +61,10 @@ class ActionResult(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -70,9 +74,9 @@ class ActionResult(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ActionResult.parse_obj(obj)
+            return ActionResult.model_validate(obj)
 
-        _obj = ActionResult.parse_obj({
+        _obj = ActionResult.model_validate({
             "type": obj.get("type"),
             "data": obj.get("data")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field
 from linebot.v3.webhooks.models.chat_control import ChatControl
 from linebot.v3.webhooks.models.delivery_context import DeliveryContext
 from linebot.v3.webhooks.models.event import Event
@@ -33,16 +33,20 @@ class ActivatedEvent(Event):
     chat_control: ChatControl = Field(..., alias="chatControl")
     type: str = "activated"
 
-    __properties = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext", "chatControl"]
+    __properties: ClassVar[List[str]] = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext", "chatControl"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -55,17 +59,17 @@ class ActivatedEvent(Event):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of source
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of source
         if self.source:
             _dict['source'] = self.source.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of delivery_context
+        # override the default output from pydantic by calling `to_dict()` of delivery_context
         if self.delivery_context:
             _dict['deliveryContext'] = self.delivery_context.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of chat_control
+        # override the default output from pydantic by calling `to_dict()` of chat_control
         if self.chat_control:
             _dict['chatControl'] = self.chat_control.to_dict()
         return _dict
@@ -77,9 +81,9 @@ class ActivatedEvent(Event):
             return None
 
         if not isinstance(obj, dict):
-            return ActivatedEvent.parse_obj(obj)
+            return ActivatedEvent.model_validate(obj)
 
-        _obj = ActivatedEvent.parse_obj({
+        _obj = ActivatedEvent.model_validate({
             "type": obj.get("type"),
             "source": Source.from_dict(obj.get("source")) if obj.get("source") is not None else None,
             "timestamp": obj.get("timestamp"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-
+from typing import ClassVar, List
+from pydantic import ConfigDict
 from linebot.v3.webhooks.models.mentionee import Mentionee
 
 class AllMentionee(Mentionee):
@@ -28,16 +28,20 @@ class AllMentionee(Mentionee):
     """
     type: str = "all"
 
-    __properties = ["type", "index", "length"]
+    __properties: ClassVar[List[str]] = ["type", "index", "length"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,10 +54,10 @@ class AllMentionee(Mentionee):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -63,9 +67,9 @@ class AllMentionee(Mentionee):
             return None
 
         if not isinstance(obj, dict):
-            return AllMentionee.parse_obj(obj)
+            return AllMentionee.model_validate(obj)
 
-        _obj = AllMentionee.parse_obj({
+        _obj = AllMentionee.model_validate({
             "type": obj.get("type"),
             "index": obj.get("index"),
             "length": obj.get("length")
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr, conlist
 from linebot.v3.webhooks.models.module_content import ModuleContent
 
 class AttachedModuleContent(ModuleContent):
@@ -30,16 +30,20 @@ class AttachedModuleContent(ModuleContent):
     scopes: conlist(StrictStr) = Field(..., description="An array of strings indicating the scope permitted by the admin of the LINE Official Account.")
     type: str = "attached"
 
-    __properties = ["type", "botId", "scopes"]
+    __properties: ClassVar[List[str]] = ["type", "botId", "scopes"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class AttachedModuleContent(ModuleContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class AttachedModuleContent(ModuleContent):
             return None
 
         if not isinstance(obj, dict):
-            return AttachedModuleContent.parse_obj(obj)
+            return AttachedModuleContent.model_validate(obj)
 
-        _obj = AttachedModuleContent.parse_obj({
+        _obj = AttachedModuleContent.model_validate({
             "type": obj.get("type"),
             "bot_id": obj.get("botId"),
             "scopes": obj.get("scopes")
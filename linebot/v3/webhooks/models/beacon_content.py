@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
 class BeaconContent(BaseModel):
     """
@@ -29,23 +29,27 @@ class BeaconContent(BaseModel):
     type: StrictStr = Field(..., description="Type of beacon event.")
     dm: Optional[StrictStr] = Field(None, description="Device message of beacon that was detected.")
 
-    __properties = ["hwid", "type", "dm"]
+    __properties: ClassVar[List[str]] = ["hwid", "type", "dm"]
 
-    @validator('type')
+    @field_validator('type')
     def type_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('enter', 'banner', 'stay'):
             raise ValueError("must be one of enum values ('enter', 'banner', 'stay')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -58,10 +62,10 @@ class BeaconContent(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -71,9 +75,9 @@ class BeaconContent(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return BeaconContent.parse_obj(obj)
+            return BeaconContent.model_validate(obj)
 
-        _obj = BeaconContent.parse_obj({
+        _obj = BeaconContent.model_validate({
             "hwid": obj.get("hwid"),
             "type": obj.get("type"),
             "dm": obj.get("dm")
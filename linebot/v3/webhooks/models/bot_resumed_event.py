@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-
+from typing import ClassVar, List
+from pydantic import ConfigDict
 from linebot.v3.webhooks.models.delivery_context import DeliveryContext
 from linebot.v3.webhooks.models.event import Event
 from linebot.v3.webhooks.models.event_mode import EventMode
@@ -31,16 +31,20 @@ class BotResumedEvent(Event):
     """
     type: str = "botResumed"
 
-    __properties = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext"]
+    __properties: ClassVar[List[str]] = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,14 +57,14 @@ class BotResumedEvent(Event):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of source
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of source
         if self.source:
             _dict['source'] = self.source.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of delivery_context
+        # override the default output from pydantic by calling `to_dict()` of delivery_context
         if self.delivery_context:
             _dict['deliveryContext'] = self.delivery_context.to_dict()
         return _dict
@@ -72,9 +76,9 @@ class BotResumedEvent(Event):
             return None
 
         if not isinstance(obj, dict):
-            return BotResumedEvent.parse_obj(obj)
+            return BotResumedEvent.model_validate(obj)
 
-        _obj = BotResumedEvent.parse_obj({
+        _obj = BotResumedEvent.model_validate({
             "type": obj.get("type"),
             "source": Source.from_dict(obj.get("source")) if obj.get("source") is not None else None,
             "timestamp": obj.get("timestamp"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist, constr, validator
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, conlist, constr, field_validator
 from linebot.v3.webhooks.models.event import Event
 
 class CallbackRequest(BaseModel):
@@ -28,25 +28,29 @@ class CallbackRequest(BaseModel):
     https://developers.line.biz/en/reference/messaging-api/#request-body
     """
     destination: constr(strict=True, max_length=33, min_length=33) = Field(..., description="User ID of a bot that should receive webhook events. The user ID value is a string that matches the regular expression, `U[0-9a-f]{32}`. ")
-    events: conlist(Event) = Field(..., description="Array of webhook event objects. The LINE Platform may send an empty array that doesn't include a webhook event object to confirm communication. ")
+    events: conlist(SerializeAsAny[Event]) = Field(..., description="Array of webhook event objects. The LINE Platform may send an empty array that doesn't include a webhook event object to confirm communication. ")
 
-    __properties = ["destination", "events"]
+    __properties: ClassVar[List[str]] = ["destination", "events"]
 
-    @validator('destination')
+    @field_validator('destination')
     def destination_validate_regular_expression(cls, value):
         """Validates the regular expression"""
         if not re.match(r"^U[0-9a-f]{32}$", value):
             raise ValueError(r"must validate the regular expression /^U[0-9a-f]{32}$/")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -59,11 +63,11 @@ class CallbackRequest(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in events (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in events (list)
         _items = []
         if self.events:
             for _item in self.events:
@@ -79,9 +83,9 @@ class CallbackRequest(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return CallbackRequest.parse_obj(obj)
+            return CallbackRequest.model_validate(obj)
 
-        _obj = CallbackRequest.parse_obj({
+        _obj = CallbackRequest.model_validate({
             "destination": obj.get("destination"),
             "events": [Event.from_dict(_item) for _item in obj.get("events")] if obj.get("events") is not None else None
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt
 
 class ChatControl(BaseModel):
     """
@@ -27,16 +27,20 @@ class ChatControl(BaseModel):
     """
     expire_at: StrictInt = Field(..., alias="expireAt")
 
-    __properties = ["expireAt"]
+    __properties: ClassVar[List[str]] = ["expireAt"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -49,10 +53,10 @@ class ChatControl(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -62,9 +66,9 @@ class ChatControl(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ChatControl.parse_obj(obj)
+            return ChatControl.model_validate(obj)
 
-        _obj = ChatControl.parse_obj({
+        _obj = ChatControl.model_validate({
             "expire_at": obj.get("expireAt")
         })
         return _obj
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import BaseModel, Field, StrictStr, validator
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
 class ContentProvider(BaseModel):
     """
@@ -29,23 +29,27 @@ class ContentProvider(BaseModel):
     original_content_url: Optional[StrictStr] = Field(None, alias="originalContentUrl", description="URL of the image file. Only included when contentProvider.type is external.")
     preview_image_url: Optional[StrictStr] = Field(None, alias="previewImageUrl", description="URL of the preview image. Only included when contentProvider.type is external.")
 
-    __properties = ["type", "originalContentUrl", "previewImageUrl"]
+    __properties: ClassVar[List[str]] = ["type", "originalContentUrl", "previewImageUrl"]
 
-    @validator('type')
+    @field_validator('type')
     def type_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('line', 'external'):
             raise ValueError("must be one of enum values ('line', 'external')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -58,10 +62,10 @@ class ContentProvider(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -71,9 +75,9 @@ class ContentProvider(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ContentProvider.parse_obj(obj)
+            return ContentProvider.model_validate(obj)
 
-        _obj = ContentProvider.parse_obj({
+        _obj = ContentProvider.model_validate({
             "type": obj.get("type"),
             "original_content_url": obj.get("originalContentUrl"),
             "preview_image_url": obj.get("previewImageUrl")
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr, validator
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr, field_validator
 from linebot.v3.webhooks.models.module_content import ModuleContent
 
 class DetachedModuleContent(ModuleContent):
@@ -30,23 +30,27 @@ class DetachedModuleContent(ModuleContent):
     reason: StrictStr = Field(..., description="Reason for detaching")
     type: str = "detached"
 
-    __properties = ["type", "botId", "reason"]
+    __properties: ClassVar[List[str]] = ["type", "botId", "reason"]
 
-    @validator('reason')
+    @field_validator('reason')
     def reason_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('bot_deleted'):
             raise ValueError("must be one of enum values ('bot_deleted')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -59,10 +63,10 @@ class DetachedModuleContent(ModuleContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -72,9 +76,9 @@ class DetachedModuleContent(ModuleContent):
             return None
 
         if not isinstance(obj, dict):
-            return DetachedModuleContent.parse_obj(obj)
+            return DetachedModuleContent.model_validate(obj)
 
-        _obj = DetachedModuleContent.parse_obj({
+        _obj = DetachedModuleContent.model_validate({
             "type": obj.get("type"),
             "bot_id": obj.get("botId"),
             "reason": obj.get("reason")
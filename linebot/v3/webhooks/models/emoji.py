@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 
 class Emoji(BaseModel):
     """
@@ -30,16 +30,20 @@ class Emoji(BaseModel):
     product_id: StrictStr = Field(..., alias="productId", description="Product ID for a LINE emoji set.")
     emoji_id: StrictStr = Field(..., alias="emojiId", description="ID for a LINE emoji inside a set.")
 
-    __properties = ["index", "length", "productId", "emojiId"]
+    __properties: ClassVar[List[str]] = ["index", "length", "productId", "emojiId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class Emoji(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class Emoji(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Emoji.parse_obj(obj)
+            return Emoji.model_validate(obj)
 
-        _obj = Emoji.parse_obj({
+        _obj = Emoji.model_validate({
             "index": obj.get("index"),
             "length": obj.get("length"),
             "product_id": obj.get("productId"),
@@ -19,8 +19,8 @@ import json
 import linebot.v3.webhooks.models
 
 
-from typing import Optional, Union
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr
+from typing import ClassVar, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, StrictInt, StrictStr
 from linebot.v3.webhooks.models.delivery_context import DeliveryContext
 from linebot.v3.webhooks.models.event_mode import EventMode
 from linebot.v3.webhooks.models.source import Source
@@ -30,24 +30,28 @@ class Event(BaseModel):
     Webhook event
     """
     type: StrictStr = Field(..., description="Type of the event")
-    source: Optional[Source] = None
+    source: Optional[SerializeAsAny[Source]] = None
     timestamp: StrictInt = Field(..., description="Time of the event in milliseconds.")
     mode: EventMode = Field(...)
     webhook_event_id: StrictStr = Field(..., alias="webhookEventId", description="Webhook Event ID. An ID that uniquely identifies a webhook event. This is a string in ULID format.")
     delivery_context: DeliveryContext = Field(..., alias="deliveryContext")
 
-    __properties = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext"]
+    __properties: ClassVar[List[str]] = ["type", "source", "timestamp", "mode", "webhookEventId", "deliveryContext"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     # JSON field name that stores the object type
-    __discriminator_property_name = 'type'
+    __discriminator_property_name: ClassVar[str] = 'type'
 
     # discriminator mappings
-    __discriminator_value_class_map = {
+    __discriminator_value_class_map: ClassVar[Dict[str, str]] = {
         'accountLink': 'AccountLinkEvent',
         'activated': 'ActivatedEvent',
         'beacon': 'BeaconEvent',
@@ -81,7 +85,7 @@ class Event(BaseModel):
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -94,14 +98,14 @@ class Event(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of source
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of source
         if self.source:
             _dict['source'] = self.source.to_dict()
-        # override the default output from pydantic.v1 by calling `to_dict()` of delivery_context
+        # override the default output from pydantic by calling `to_dict()` of delivery_context
         if self.delivery_context:
             _dict['deliveryContext'] = self.delivery_context.to_dict()
         return _dict
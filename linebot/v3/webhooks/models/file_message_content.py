@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictInt, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictInt, StrictStr
 from linebot.v3.webhooks.models.message_content import MessageContent
 
 class FileMessageContent(MessageContent):
@@ -30,16 +30,20 @@ class FileMessageContent(MessageContent):
     file_size: StrictInt = Field(..., alias="fileSize", description="File size in bytes")
     type: str = "file"
 
-    __properties = ["type", "id", "fileName", "fileSize"]
+    __properties: ClassVar[List[str]] = ["type", "id", "fileName", "fileSize"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class FileMessageContent(MessageContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class FileMessageContent(MessageContent):
             return None
 
         if not isinstance(obj, dict):
-            return FileMessageContent.parse_obj(obj)
+            return FileMessageContent.model_validate(obj)
 
-        _obj = FileMessageContent.parse_obj({
+        _obj = FileMessageContent.model_validate({
             "type": obj.get("type"),
             "id": obj.get("id"),
             "file_name": obj.get("fileName"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.webhooks.models.source import Source
 
 class GroupSource(Source):
@@ -30,16 +30,20 @@ class GroupSource(Source):
     user_id: Optional[StrictStr] = Field(None, alias="userId", description="ID of the source user. Only included in message events. Only users of LINE for iOS and LINE for Android are included in userId.")
     type: str = "group"
 
-    __properties = ["type", "groupId", "userId"]
+    __properties: ClassVar[List[str]] = ["type", "groupId", "userId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class GroupSource(Source):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class GroupSource(Source):
             return None
 
         if not isinstance(obj, dict):
-            return GroupSource.parse_obj(obj)
+            return GroupSource.model_validate(obj)
 
-        _obj = GroupSource.parse_obj({
+        _obj = GroupSource.model_validate({
             "type": obj.get("type"),
             "group_id": obj.get("groupId"),
             "user_id": obj.get("userId")
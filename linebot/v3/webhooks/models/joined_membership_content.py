@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictInt
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictInt
 from linebot.v3.webhooks.models.membership_content import MembershipContent
 
 class JoinedMembershipContent(MembershipContent):
@@ -29,16 +29,20 @@ class JoinedMembershipContent(MembershipContent):
     membership_id: StrictInt = Field(..., alias="membershipId", description="The ID of the membership that the user joined. This is defined for each membership.")
     type: str = "joined"
 
-    __properties = ["type", "membershipId"]
+    __properties: ClassVar[List[str]] = ["type", "membershipId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class JoinedMembershipContent(MembershipContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class JoinedMembershipContent(MembershipContent):
             return None
 
         if not isinstance(obj, dict):
-            return JoinedMembershipContent.parse_obj(obj)
+            return JoinedMembershipContent.model_validate(obj)
 
-        _obj = JoinedMembershipContent.parse_obj({
+        _obj = JoinedMembershipContent.model_validate({
             "type": obj.get("type"),
             "membership_id": obj.get("membershipId")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, conlist
 from linebot.v3.webhooks.models.user_source import UserSource
 
 class LeftMembers(BaseModel):
@@ -28,16 +28,20 @@ class LeftMembers(BaseModel):
     """
     members: conlist(UserSource) = Field(..., description="Users who left. Array of source user objects.")
 
-    __properties = ["members"]
+    __properties: ClassVar[List[str]] = ["members"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,11 +54,11 @@ class LeftMembers(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in members (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in members (list)
         _items = []
         if self.members:
             for _item in self.members:
@@ -70,9 +74,9 @@ class LeftMembers(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return LeftMembers.parse_obj(obj)
+            return LeftMembers.model_validate(obj)
 
-        _obj = LeftMembers.parse_obj({
+        _obj = LeftMembers.model_validate({
             "members": [UserSource.from_dict(_item) for _item in obj.get("members")] if obj.get("members") is not None else None
         })
         return _obj
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictStr, validator
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
 class LinkContent(BaseModel):
     """
@@ -28,23 +28,27 @@ class LinkContent(BaseModel):
     result: StrictStr = Field(..., description="One of the following values to indicate whether linking the account was successful or not")
     nonce: StrictStr = Field(..., description="Specified nonce (number used once) when verifying the user ID.")
 
-    __properties = ["result", "nonce"]
+    __properties: ClassVar[List[str]] = ["result", "nonce"]
 
-    @validator('result')
+    @field_validator('result')
     def result_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('ok', 'failed'):
             raise ValueError("must be one of enum values ('ok', 'failed')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,10 +61,10 @@ class LinkContent(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -70,9 +74,9 @@ class LinkContent(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return LinkContent.parse_obj(obj)
+            return LinkContent.model_validate(obj)
 
-        _obj = LinkContent.parse_obj({
+        _obj = LinkContent.model_validate({
             "result": obj.get("result"),
             "nonce": obj.get("nonce")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional, Union
-from pydantic.v1 import Field, StrictFloat, StrictInt, StrictStr
+from typing import ClassVar, List, Optional, Union
+from pydantic import ConfigDict, Field, StrictFloat, StrictInt, StrictStr
 from linebot.v3.webhooks.models.message_content import MessageContent
 
 class LocationMessageContent(MessageContent):
@@ -32,16 +32,20 @@ class LocationMessageContent(MessageContent):
     longitude: Union[StrictFloat, StrictInt] = Field(..., description="Longitude")
     type: str = "location"
 
-    __properties = ["type", "id", "title", "address", "latitude", "longitude"]
+    __properties: ClassVar[List[str]] = ["type", "id", "title", "address", "latitude", "longitude"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,10 +58,10 @@ class LocationMessageContent(MessageContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -67,9 +71,9 @@ class LocationMessageContent(MessageContent):
             return None
 
         if not isinstance(obj, dict):
-            return LocationMessageContent.parse_obj(obj)
+            return LocationMessageContent.model_validate(obj)
 
-        _obj = LocationMessageContent.parse_obj({
+        _obj = LocationMessageContent.model_validate({
             "type": obj.get("type"),
             "id": obj.get("id"),
             "title": obj.get("title"),
@@ -18,26 +18,30 @@ import re  # noqa: F401
 import json
 
 
-from typing import List
-from pydantic.v1 import BaseModel, Field, conlist
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, conlist
 from linebot.v3.webhooks.models.mentionee import Mentionee
 
 class Mention(BaseModel):
     """
     Mention
     """
-    mentionees: conlist(Mentionee) = Field(..., description="Array of one or more mention objects. Max: 20 mentions")
+    mentionees: conlist(SerializeAsAny[Mentionee]) = Field(..., description="Array of one or more mention objects. Max: 20 mentions")
 
-    __properties = ["mentionees"]
+    __properties: ClassVar[List[str]] = ["mentionees"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -50,11 +54,11 @@ class Mention(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in mentionees (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in mentionees (list)
         _items = []
         if self.mentionees:
             for _item in self.mentionees:
@@ -70,9 +74,9 @@ class Mention(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return Mention.parse_obj(obj)
+            return Mention.model_validate(obj)
 
-        _obj = Mention.parse_obj({
+        _obj = Mention.model_validate({
             "mentionees": [Mentionee.from_dict(_item) for _item in obj.get("mentionees")] if obj.get("mentionees") is not None else None
         })
         return _obj
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictInt
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictInt
 from linebot.v3.webhooks.models.membership_content import MembershipContent
 
 class RenewedMembershipContent(MembershipContent):
@@ -29,16 +29,20 @@ class RenewedMembershipContent(MembershipContent):
     membership_id: StrictInt = Field(..., alias="membershipId", description="The ID of the membership that the user renewed. This is defined for each membership.")
     type: str = "renewed"
 
-    __properties = ["type", "membershipId"]
+    __properties: ClassVar[List[str]] = ["type", "membershipId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class RenewedMembershipContent(MembershipContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class RenewedMembershipContent(MembershipContent):
             return None
 
         if not isinstance(obj, dict):
-            return RenewedMembershipContent.parse_obj(obj)
+            return RenewedMembershipContent.model_validate(obj)
 
-        _obj = RenewedMembershipContent.parse_obj({
+        _obj = RenewedMembershipContent.model_validate({
             "type": obj.get("type"),
             "membership_id": obj.get("membershipId")
         })
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import BaseModel, Field, StrictInt, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, conlist
 from linebot.v3.webhooks.models.action_result import ActionResult
 
 class ScenarioResult(BaseModel):
@@ -36,16 +36,20 @@ class ScenarioResult(BaseModel):
     ble_notification_payload: Optional[StrictStr] = Field(None, alias="bleNotificationPayload", description="Data contained in notification.")
     error_reason: Optional[StrictStr] = Field(None, alias="errorReason", description="Error reason.")
 
-    __properties = ["scenarioId", "revision", "startTime", "endTime", "resultCode", "actionResults", "bleNotificationPayload", "errorReason"]
+    __properties: ClassVar[List[str]] = ["scenarioId", "revision", "startTime", "endTime", "resultCode", "actionResults", "bleNotificationPayload", "errorReason"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -58,11 +62,11 @@ class ScenarioResult(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in action_results (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in action_results (list)
         _items = []
         if self.action_results:
             for _item in self.action_results:
@@ -78,9 +82,9 @@ class ScenarioResult(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return ScenarioResult.parse_obj(obj)
+            return ScenarioResult.model_validate(obj)
 
-        _obj = ScenarioResult.parse_obj({
+        _obj = ScenarioResult.model_validate({
             "scenario_id": obj.get("scenarioId"),
             "revision": obj.get("revision"),
             "start_time": obj.get("startTime"),
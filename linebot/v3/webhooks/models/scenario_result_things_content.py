@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.webhooks.models.scenario_result import ScenarioResult
 from linebot.v3.webhooks.models.things_content import ThingsContent
 
@@ -31,16 +31,20 @@ class ScenarioResultThingsContent(ThingsContent):
     result: ScenarioResult = Field(...)
     type: str = "scenarioResult"
 
-    __properties = ["type", "deviceId", "result"]
+    __properties: ClassVar[List[str]] = ["type", "deviceId", "result"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -53,11 +57,11 @@ class ScenarioResultThingsContent(ThingsContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of result
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of result
         if self.result:
             _dict['result'] = self.result.to_dict()
         return _dict
@@ -69,9 +73,9 @@ class ScenarioResultThingsContent(ThingsContent):
             return None
 
         if not isinstance(obj, dict):
-            return ScenarioResultThingsContent.parse_obj(obj)
+            return ScenarioResultThingsContent.model_validate(obj)
 
-        _obj = ScenarioResultThingsContent.parse_obj({
+        _obj = ScenarioResultThingsContent.model_validate({
             "type": obj.get("type"),
             "device_id": obj.get("deviceId"),
             "result": ScenarioResult.from_dict(obj.get("result")) if obj.get("result") is not None else None
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictStr, conlist, constr, validator
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr, conlist, constr, field_validator
 from linebot.v3.webhooks.models.message_content import MessageContent
 
 class StickerMessageContent(MessageContent):
@@ -30,29 +30,33 @@ class StickerMessageContent(MessageContent):
     package_id: StrictStr = Field(..., alias="packageId", description="Package ID")
     sticker_id: StrictStr = Field(..., alias="stickerId", description="Sticker ID")
     sticker_resource_type: StrictStr = Field(..., alias="stickerResourceType")
-    keywords: Optional[conlist(StrictStr, max_items=15)] = Field(None, description="Array of up to 15 keywords describing the sticker. If a sticker has 16 or more keywords, a random selection of 15 keywords will be returned. The keyword selection is random for each event, so different keywords may be returned for the same sticker. ")
+    keywords: Optional[conlist(StrictStr, max_length=15)] = Field(None, description="Array of up to 15 keywords describing the sticker. If a sticker has 16 or more keywords, a random selection of 15 keywords will be returned. The keyword selection is random for each event, so different keywords may be returned for the same sticker. ")
     text: Optional[constr(strict=True, max_length=100)] = Field(None, description="Any text entered by the user. This property is only included for message stickers. Max character limit: 100 ")
     quote_token: StrictStr = Field(..., alias="quoteToken", description="Quote token to quote this message. ")
     quoted_message_id: Optional[StrictStr] = Field(None, alias="quotedMessageId", description="Message ID of a quoted message. Only included when the received message quotes a past message.  ")
     type: str = "sticker"
 
-    __properties = ["type", "id", "packageId", "stickerId", "stickerResourceType", "keywords", "text", "quoteToken", "quotedMessageId"]
+    __properties: ClassVar[List[str]] = ["type", "id", "packageId", "stickerId", "stickerResourceType", "keywords", "text", "quoteToken", "quotedMessageId"]
 
-    @validator('sticker_resource_type')
+    @field_validator('sticker_resource_type')
     def sticker_resource_type_validate_enum(cls, value):
         """Validates the enum"""
         if value not in ('STATIC', 'ANIMATION', 'SOUND', 'ANIMATION_SOUND', 'POPUP', 'POPUP_SOUND', 'CUSTOM', 'MESSAGE', 'NAME_TEXT', 'PER_STICKER_TEXT'):
             raise ValueError("must be one of enum values ('STATIC', 'ANIMATION', 'SOUND', 'ANIMATION_SOUND', 'POPUP', 'POPUP_SOUND', 'CUSTOM', 'MESSAGE', 'NAME_TEXT', 'PER_STICKER_TEXT')")
         return value
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -65,10 +69,10 @@ class StickerMessageContent(MessageContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -78,9 +82,9 @@ class StickerMessageContent(MessageContent):
             return None
 
         if not isinstance(obj, dict):
-            return StickerMessageContent.parse_obj(obj)
+            return StickerMessageContent.model_validate(obj)
 
-        _obj = StickerMessageContent.parse_obj({
+        _obj = StickerMessageContent.model_validate({
             "type": obj.get("type"),
             "id": obj.get("id"),
             "package_id": obj.get("packageId"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import List, Optional
-from pydantic.v1 import Field, StrictStr, conlist
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictStr, conlist
 from linebot.v3.webhooks.models.emoji import Emoji
 from linebot.v3.webhooks.models.mention import Mention
 from linebot.v3.webhooks.models.message_content import MessageContent
@@ -35,16 +35,20 @@ class TextMessageContent(MessageContent):
     quoted_message_id: Optional[StrictStr] = Field(None, alias="quotedMessageId", description="Message ID of a quoted message. Only included when the received message quotes a past message.")
     type: str = "text"
 
-    __properties = ["type", "id", "text", "emojis", "mention", "quoteToken", "quotedMessageId"]
+    __properties: ClassVar[List[str]] = ["type", "id", "text", "emojis", "mention", "quoteToken", "quotedMessageId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -57,18 +61,18 @@ class TextMessageContent(MessageContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of each item in emojis (list)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in emojis (list)
         _items = []
         if self.emojis:
             for _item in self.emojis:
                 if _item:
                     _items.append(_item.to_dict())
             _dict['emojis'] = _items
-        # override the default output from pydantic.v1 by calling `to_dict()` of mention
+        # override the default output from pydantic by calling `to_dict()` of mention
         if self.mention:
             _dict['mention'] = self.mention.to_dict()
         return _dict
@@ -80,9 +84,9 @@ class TextMessageContent(MessageContent):
             return None
 
         if not isinstance(obj, dict):
-            return TextMessageContent.parse_obj(obj)
+            return TextMessageContent.model_validate(obj)
 
-        _obj = TextMessageContent.parse_obj({
+        _obj = TextMessageContent.model_validate({
             "type": obj.get("type"),
             "id": obj.get("id"),
             "text": obj.get("text"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import Field, StrictStr
+from typing import ClassVar, List
+from pydantic import ConfigDict, Field, StrictStr
 from linebot.v3.webhooks.models.things_content import ThingsContent
 
 class UnlinkThingsContent(ThingsContent):
@@ -29,16 +29,20 @@ class UnlinkThingsContent(ThingsContent):
     device_id: StrictStr = Field(..., alias="deviceId", description="Device ID of the device that has been linked with LINE.")
     type: str = "unlink"
 
-    __properties = ["type", "deviceId"]
+    __properties: ClassVar[List[str]] = ["type", "deviceId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -51,10 +55,10 @@ class UnlinkThingsContent(ThingsContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -64,9 +68,9 @@ class UnlinkThingsContent(ThingsContent):
             return None
 
         if not isinstance(obj, dict):
-            return UnlinkThingsContent.parse_obj(obj)
+            return UnlinkThingsContent.model_validate(obj)
 
-        _obj = UnlinkThingsContent.parse_obj({
+        _obj = UnlinkThingsContent.model_validate({
             "type": obj.get("type"),
             "device_id": obj.get("deviceId")
         })
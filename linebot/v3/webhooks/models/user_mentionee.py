@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictBool, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictBool, StrictStr
 from linebot.v3.webhooks.models.mentionee import Mentionee
 
 class UserMentionee(Mentionee):
@@ -30,16 +30,20 @@ class UserMentionee(Mentionee):
     is_self: Optional[StrictBool] = Field(None, alias="isSelf", description="Whether the mentioned user is the bot that receives the webhook.")
     type: str = "user"
 
-    __properties = ["type", "index", "length", "userId", "isSelf"]
+    __properties: ClassVar[List[str]] = ["type", "index", "length", "userId", "isSelf"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -52,10 +56,10 @@ class UserMentionee(Mentionee):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -65,9 +69,9 @@ class UserMentionee(Mentionee):
             return None
 
         if not isinstance(obj, dict):
-            return UserMentionee.parse_obj(obj)
+            return UserMentionee.model_validate(obj)
 
-        _obj = UserMentionee.parse_obj({
+        _obj = UserMentionee.model_validate({
             "type": obj.get("type"),
             "index": obj.get("index"),
             "length": obj.get("length"),
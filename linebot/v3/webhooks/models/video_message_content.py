@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic.v1 import Field, StrictInt, StrictStr
+from typing import ClassVar, List, Optional
+from pydantic import ConfigDict, Field, StrictInt, StrictStr
 from linebot.v3.webhooks.models.content_provider import ContentProvider
 from linebot.v3.webhooks.models.message_content import MessageContent
 
@@ -32,16 +32,20 @@ class VideoMessageContent(MessageContent):
     quote_token: StrictStr = Field(..., alias="quoteToken", description="Quote token to quote this message. ")
     type: str = "video"
 
-    __properties = ["type", "id", "duration", "contentProvider", "quoteToken"]
+    __properties: ClassVar[List[str]] = ["type", "id", "duration", "contentProvider", "quoteToken"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -54,11 +58,11 @@ class VideoMessageContent(MessageContent):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic.v1 by calling `to_dict()` of content_provider
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of content_provider
         if self.content_provider:
             _dict['contentProvider'] = self.content_provider.to_dict()
         return _dict
@@ -70,9 +74,9 @@ class VideoMessageContent(MessageContent):
             return None
 
         if not isinstance(obj, dict):
-            return VideoMessageContent.parse_obj(obj)
+            return VideoMessageContent.model_validate(obj)
 
-        _obj = VideoMessageContent.parse_obj({
+        _obj = VideoMessageContent.model_validate({
             "type": obj.get("type"),
             "id": obj.get("id"),
             "duration": obj.get("duration"),
@@ -18,8 +18,8 @@ import re  # noqa: F401
 import json
 
 
-
-from pydantic.v1 import BaseModel, Field, StrictStr
+from typing import ClassVar, List
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 class VideoPlayComplete(BaseModel):
     """
@@ -27,16 +27,20 @@ class VideoPlayComplete(BaseModel):
     """
     tracking_id: StrictStr = Field(..., alias="trackingId", description="ID used to identify a video. Returns the same value as the trackingId assigned to the video message.")
 
-    __properties = ["trackingId"]
+    __properties: ClassVar[List[str]] = ["trackingId"]
 
-    class Config:
-        """Pydantic configuration"""
-        allow_population_by_field_name = True
-        validate_assignment = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+        # child instances are kept, neither copied nor validated again,
+        # so from_dict validates each node of a tree once
+        revalidate_instances='never',
+    )
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.dict(by_alias=True))
+        return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
@@ -49,10 +53,10 @@ class VideoPlayComplete(BaseModel):
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.dict(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        _dict = self.model_dump(by_alias=True,
+                                exclude={
+                                },
+                                exclude_none=True)
         return _dict
 
     @classmethod
@@ -62,9 +66,9 @@ class VideoPlayComplete(BaseModel):
             return None
 
         if not isinstance(obj, dict):
-            return VideoPlayComplete.parse_obj(obj)
+            return VideoPlayComplete.model_validate(obj)
 
-        _obj = VideoPlayComplete.parse_obj({
+        _obj = VideoPlayComplete.model_validate({
             "tracking_id": obj.get("trackingId")
         })
         return _obj
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+import json
+import unittest
+
+from pydantic import ValidationError
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.messaging import (
+    Configuration,
+    ApiClient,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+)
+
+
+class TestClientSideValidation(unittest.TestCase):
+    def _push(self, httpserver, client_side_validation, push_message_request):
+        configuration = Configuration(
+            access_token="dummy-channel-access-token",
+            host=httpserver.url_for("/")
+        )
+        configuration.client_side_validation = client_side_validation
+        with ApiClient(configuration) as api_client:
+            line_bot_api = MessagingApi(api_client)
+            line_bot_api.push_message(push_message_request)
+
+    def test_enabled_by_default(self):
+        self.assertTrue(Configuration().client_side_validation)
+        with HTTPServer() as httpserver:
+            with self.assertRaises(ValidationError):
+                self._push(httpserver, True, "not a request")
+            self.assertEqual(len(httpserver.log), 0)
+
+    def test_disabled(self):
+        request = PushMessageRequest(to="U4af4980629", messages=[TextMessage(text="Hello")])
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri="/v2/bot/message/push",
+                method="POST",
+            ).respond_with_json(
+                {"sentMessages": [{"id": "461230966842064897", "quoteToken": "IStG5h1Tz7b"}]},
+                status=200
+            )
+
+            self._push(httpserver, False, request)
+
+            self.assertEqual(len(httpserver.log), 1)
+            req, res = httpserver.log[0]
+            self.assertEqual(json.loads(req.get_data()), request.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+import unittest
+
+from linebot.v3.messaging import (
+    FlexBox,
+    FlexBubble,
+    FlexText,
+    URIAction,
+)
+
+
+def _tree(depth):
+    if depth == 1:
+        return {'type': 'text', 'text': 'hello',
+                'action': {'type': 'uri', 'label': 'open', 'uri': 'https://line.me/'}}
+    return {'type': 'box', 'layout': 'vertical', 'contents': [_tree(depth - 1), _tree(depth - 1)]}
+
+
+class TestFlexModels(unittest.TestCase):
+    def test_children_are_not_copied(self):
+        action = URIAction(label='open', uri='https://line.me/')
+        text = FlexText(text='hello', action=action)
+        box = FlexBox(layout='vertical', contents=[text])
+        self.assertIs(box.contents[0], text)
+        self.assertIs(box.contents[0].action, action)
+
+    def test_children_are_not_revalidated(self):
+        # built without validation, so validating it again would fail
+        text = FlexText.model_construct(type='text', text=1)
+        box = FlexBox(layout='vertical', contents=[text])
+        bubble = FlexBubble(body=box)
+        self.assertIs(bubble.body, box)
+        self.assertIs(bubble.body.contents[0], text)
+        with self.assertRaises(ValueError):
+            FlexText.model_validate({'type': 'text', 'text': 1})
+
+    def test_nested_from_dict(self):
+        body = _tree(4)
+        bubble = FlexBubble.from_dict({'type': 'bubble', 'body': body})
+
+        self.assertIsInstance(bubble.body, FlexBox)
+        leaf = bubble.body.contents[0].contents[1].contents[0]
+        self.assertIsInstance(leaf, FlexText)
+        self.assertIsInstance(leaf.action, URIAction)
+        self.assertEqual(bubble.to_dict()['body'], body)
+
+    def test_nested_from_dict_still_validates(self):
+        body = _tree(3)
+        body['contents'][1]['contents'][0]['action']['uri'] = 1
+        with self.assertRaises(ValueError):
+            FlexBubble.from_dict({'type': 'bubble', 'body': body})
+
+
+if __name__ == '__main__':
+    unittest.main()
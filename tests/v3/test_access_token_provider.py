@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import threading
+import unittest
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.messaging import (
+    ApiClient,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+)
+
+PROFILE = {'displayName': 'LINE', 'userId': 'U1234'}
+
+
+def _authorizations(httpserver):
+    return [request.headers.get('Authorization') for request, _ in httpserver.log]
+
+
+class TestAccessTokenProvider(unittest.TestCase):
+    def test_sync(self):
+        tokens = iter(['token-1', 'token-2'])
+        with HTTPServer() as httpserver:
+            httpserver.expect_request('/v2/bot/profile/U1234').respond_with_json(PROFILE)
+            configuration = Configuration(host=httpserver.url_for('/'))
+            configuration.access_token_provider = lambda: next(tokens)
+
+            with ApiClient(configuration) as api_client:
+                api = MessagingApi(api_client)
+                api.get_profile('U1234')
+                api.get_profile('U1234')
+
+            self.assertEqual(_authorizations(httpserver), ['Bearer token-1', 'Bearer token-2'])
+
+    def test_rotated_access_token(self):
+        with HTTPServer() as httpserver:
+            httpserver.expect_request('/v2/bot/profile/U1234').respond_with_json(PROFILE)
+            configuration = Configuration(access_token='old', host=httpserver.url_for('/'))
+
+            with ApiClient(configuration) as api_client:
+                api = MessagingApi(api_client)
+                api.get_profile('U1234')
+                configuration.access_token = 'new'
+                api.get_profile('U1234')
+
+            self.assertEqual(_authorizations(httpserver), ['Bearer old', 'Bearer new'])
+
+    def test_async(self):
+        async def provider():
+            await asyncio.sleep(0)
+            return 'async-token'
+
+        async def run(configuration):
+            async with AsyncApiClient(configuration) as api_client:
+                profile = await AsyncMessagingApi(api_client).get_profile('U1234')
+                self.assertEqual(profile.display_name, 'LINE')
+
+        with HTTPServer() as httpserver:
+            httpserver.expect_request('/v2/bot/profile/U1234').respond_with_json(PROFILE)
+            configuration = Configuration(access_token='unused', host=httpserver.url_for('/'))
+            configuration.access_token_provider = provider
+            asyncio.run(run(configuration))
+
+            self.assertEqual(_authorizations(httpserver), ['Bearer async-token'])
+
+    def test_async_update_params_for_auth(self):
+        # update_params_for_auth stays a plain method for sync callers and subclasses
+        configuration = Configuration(access_token='token')
+        api_client = AsyncApiClient(configuration)
+        headers = {}
+        api_client.update_params_for_auth(headers, [], ['Bearer'], '/v2/bot/info', 'GET', None)
+        self.assertEqual(headers['Authorization'], 'Bearer token')
+
+        api_client.update_params_for_auth(headers, [], ['Bearer'], '/v2/bot/info', 'GET', None,
+                                          access_token='resolved')
+        self.assertEqual(headers['Authorization'], 'Bearer resolved')
+
+    def test_shared_by_copies(self):
+        class Tokens(object):
+            def __init__(self):
+                self.lock = threading.Lock()
+                self.token = 'token'
+
+            def get(self):
+                with self.lock:
+                    return self.token
+
+        tokens = Tokens()
+        configuration = Configuration()
+        configuration.access_token_provider = tokens.get
+        copied = copy.deepcopy(configuration)
+        self.assertIs(copied.access_token_provider.__self__, tokens)
+        tokens.token = 'rotated'
+        self.assertEqual(copied.access_token_provider(), 'rotated')
+
+
+if __name__ == '__main__':
+    unittest.main()
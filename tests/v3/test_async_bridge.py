@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.async_bridge import AsyncBridge
+from linebot.v3.messaging import (
+    ApiException,
+    AsyncMessagingApi,
+    Configuration,
+    PushMessageRequest,
+    TextMessage,
+)
+
+
+def _push_request(user_id):
+    return PushMessageRequest(to=user_id, messages=[TextMessage(text='hello')])
+
+
+class TestAsyncBridge(unittest.TestCase):
+    def test_api(self):
+        with HTTPServer() as httpserver:
+            httpserver.expect_request('/v2/bot/message/push', method='POST').respond_with_json(
+                {'sentMessages': [{'id': '1', 'quoteToken': 'q'}]})
+            httpserver.expect_request('/v2/bot/profile/U1').respond_with_json(
+                {'displayName': 'LINE', 'userId': 'U1'}, status=404)
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+
+            with AsyncBridge(configuration) as bridge:
+                api = bridge.api(AsyncMessagingApi)
+                response = api.push_message(_push_request('U1'))
+                self.assertEqual(response.sent_messages[0].id, '1')
+
+                future = api.push_message(_push_request('U2'), async_req=True)
+                self.assertIsInstance(future, Future)
+                self.assertEqual(future.result().sent_messages[0].id, '1')
+
+                with self.assertRaises(ApiException) as e:
+                    api.get_profile('U1')
+                self.assertEqual(e.exception.status, 404)
+            self.assertFalse(bridge._thread.is_alive())
+
+    def test_map(self):
+        with HTTPServer() as httpserver:
+            httpserver.expect_request('/v2/bot/message/push', method='POST').respond_with_json(
+                {'sentMessages': [{'id': '1', 'quoteToken': 'q'}]})
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+
+            with AsyncBridge(configuration, concurrency=4) as bridge:
+                api = AsyncMessagingApi(bridge.api_client)
+                threads = threading.active_count()
+                responses = bridge.map(api.push_message, [_push_request('U{}'.format(i))
+                                                          for i in range(20)])
+                self.assertEqual(len(responses), 20)
+                # the loop thread and the resolver threads of asyncio
+                self.assertLessEqual(threading.active_count() - threads, 4)
+            self.assertEqual(len(httpserver.log), 20)
+
+    def test_concurrency(self):
+        in_flight = []
+        peak = []
+
+        async def call(i):
+            in_flight.append(i)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(i)
+            if i == 5:
+                raise ValueError(i)
+            return i
+
+        with AsyncBridge(Configuration(access_token='token'), concurrency=3) as bridge:
+            results = bridge.map(call, range(10), return_exceptions=True)
+            self.assertEqual(results[:5], [0, 1, 2, 3, 4])
+            self.assertIsInstance(results[5], ValueError)
+            with self.assertRaises(ValueError):
+                bridge.gather(bridge.submit(call, 5))
+        self.assertEqual(max(peak), 3)
+
+    def test_close_from_loop(self):
+        async def close(bridge):
+            bridge.close()
+
+        with AsyncBridge(Configuration(access_token='token')) as bridge:
+            with self.assertRaises(RuntimeError):
+                bridge.submit(close, bridge).result(5)
+
+    def test_close_timeout(self):
+        release = threading.Event()
+
+        async def block():
+            release.wait(5)
+
+        bridge = AsyncBridge(Configuration(access_token='token'))
+        bridge.submit(block)
+        started = time.monotonic()
+        bridge.close(timeout=0.2)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertTrue(bridge._thread.is_alive())
+
+        release.set()
+        bridge._thread.join(5)
+        self.assertFalse(bridge._thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
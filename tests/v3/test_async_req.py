@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import threading
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+)
+
+
+def _expect_profiles(httpserver):
+    for user_id in ('U1', 'U2', 'U3'):
+        httpserver.expect_request('/v2/bot/profile/' + user_id).respond_with_json(
+            {'displayName': 'name ' + user_id, 'userId': user_id})
+
+
+class TestSyncAsyncReq(unittest.TestCase):
+    def test_future(self):
+        with HTTPServer() as httpserver:
+            _expect_profiles(httpserver)
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+            with ApiClient(configuration, pool_threads=2) as api_client:
+                api = MessagingApi(api_client)
+                futures = [api.get_profile(user_id, async_req=True)
+                           for user_id in ('U1', 'U2', 'U3')]
+                self.assertIsInstance(futures[0], Future)
+                self.assertEqual([future.result().display_name for future in futures],
+                                 ['name U1', 'name U2', 'name U3'])
+                self.assertEqual(api_client.pool._max_workers, 2)
+            self.assertIsNone(api_client._pool)
+
+    def test_shared_executor(self):
+        with HTTPServer() as httpserver, ThreadPoolExecutor(4) as executor:
+            _expect_profiles(httpserver)
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+            configuration.executor = executor
+            copied = copy.deepcopy(configuration)
+            self.assertIs(copied.executor, executor)
+
+            with ApiClient(configuration) as first, ApiClient(copied) as second:
+                self.assertIs(first.pool, executor)
+                self.assertIs(second.pool, executor)
+                future = MessagingApi(second).get_profile('U2', async_req=True)
+                self.assertEqual(future.result().user_id, 'U2')
+            # the clients do not shut down an executor they do not own
+            self.assertEqual(executor.submit(lambda: 1).result(), 1)
+
+
+class TestAsyncClient(unittest.TestCase):
+    def test_no_threads(self):
+        async def run(configuration):
+            async with AsyncApiClient(configuration) as api_client:
+                api = AsyncMessagingApi(api_client)
+                task = api.get_profile('U1', async_req=True)
+                self.assertIsInstance(task, asyncio.Task)
+                self.assertEqual((await task).display_name, 'name U1')
+                profiles = await api_client.map(api.get_profile, ['U1', 'U2', 'U3'], concurrency=2)
+                self.assertEqual([profile.user_id for profile in profiles], ['U1', 'U2', 'U3'])
+                self.assertFalse(hasattr(api_client, 'pool'))
+
+        with HTTPServer() as httpserver:
+            _expect_profiles(httpserver)
+            threads = threading.active_count()
+            asyncio.run(run(Configuration(access_token='token', host=httpserver.url_for('/'))))
+            self.assertEqual(threading.active_count(), threads)
+
+    def test_gather_concurrency(self):
+        in_flight = []
+        peak = []
+
+        async def call(i):
+            in_flight.append(i)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(i)
+            if i == 3:
+                raise ApiException(status=400)
+            return i
+
+        async def run():
+            api_client = AsyncApiClient(Configuration(access_token='token'))
+            results = await api_client.gather(*[call(i) for i in range(10)], concurrency=3,
+                                              return_exceptions=True)
+            self.assertEqual(results[:3], [0, 1, 2])
+            self.assertIsInstance(results[3], ApiException)
+            with self.assertRaises(ApiException):
+                await api_client.map(call, [3])
+
+        asyncio.run(run())
+        self.assertEqual(max(peak), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import threading
+import time
+import unittest
+
+from linebot.v3.cache import InFlight, LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_ttl(self):
+        cache = LRUCache(2)
+        cache.set('a', None, ttl=0)
+        cache.set('b', None, ttl=60)
+        missing = object()
+        self.assertIs(cache.get('a', missing), missing)
+        self.assertIsNone(cache.get('b', missing))
+        self.assertEqual(len(cache), 1)
+
+    def test_remove(self):
+        cache = LRUCache(4)
+        for key in ('a1', 'a2', 'b1'):
+            cache.set(key, key)
+        self.assertEqual(cache.remove(lambda key: key.startswith('a')), 2)
+        self.assertEqual(len(cache), 1)
+
+
+class TestInFlight(unittest.TestCase):
+    def test_threads(self):
+        calls = InFlight()
+        results = []
+
+        def call():
+            time.sleep(0.1)
+            return 'value'
+
+        def run():
+            flight, leader = calls.join('key')
+            results.append(calls.lead('key', flight, call) if leader else calls.follow(flight))
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['value'] * 4)
+        self.assertEqual(len(calls), 0)
+
+    def test_threads_error(self):
+        calls = InFlight()
+        errors = []
+
+        def call():
+            time.sleep(0.1)
+            raise ValueError('failed')
+
+        def run():
+            flight, leader = calls.join('key')
+            try:
+                if leader:
+                    calls.lead('key', flight, call)
+                else:
+                    calls.follow(flight)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(error) for error in errors}), 4)
+        leaders = [error for error in errors if error.__cause__ is None]
+        self.assertEqual(len(leaders), 1)
+        self.assertTrue(all(error.__cause__ is leaders[0] for error in errors if error is not leaders[0]))
+        self.assertEqual([error.args for error in errors], [('failed',)] * 4)
+
+    def test_asyncio(self):
+        calls = InFlight()
+        stored = []
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError('failed')
+
+        async def run():
+            future, leader = calls.async_join('key')
+            if leader:
+                return await calls.async_lead('key', future, call, stored.append)
+            return await calls.async_follow(future)
+
+        async def main():
+            return await asyncio.gather(*[run() for _ in range(3)], return_exceptions=True)
+
+        errors = asyncio.run(main())
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+        self.assertEqual(len({id(error) for error in errors}), 3)
+        self.assertEqual([error.__cause__ for error in errors[1:]], [errors[0]] * 2)
+        self.assertEqual(stored, [])
+        self.assertEqual(len(calls), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
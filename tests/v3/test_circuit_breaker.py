@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from urllib3.exceptions import ReadTimeoutError
+
+from linebot.v3.circuit_breaker import CircuitBreaker
+from linebot.v3.exceptions import CircuitOpenError, ConcurrencyLimitError
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+)
+
+PUSH = PushMessageRequest(to='U1234', messages=[TextMessage(text='hello')])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _respond(self):
+        self.server.paths.append(self.path)
+        time.sleep(self.server.latency)
+        if self.path.startswith('/v2/bot/message/'):
+            status = self.server.status
+            body = {'sentMessages': [{'id': '1', 'quoteToken': 'q'}]}
+        else:
+            status = 200
+            body = {'displayName': 'LINE', 'userId': 'U1234'}
+        body = json.dumps(body if status == 200 else {'message': 'error'}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._respond()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.paths = []
+        self.server.status = 503
+        self.server.latency = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.configuration = Configuration(
+            access_token='token', host='http://127.0.0.1:{}'.format(self.server.server_address[1]))
+        self.configuration.retries = 0
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _push(self, api, count):
+        errors = []
+        for _ in range(count):
+            try:
+                api.push_message(PUSH)
+            except ApiException as e:
+                errors.append(e.status)
+            except CircuitOpenError:
+                errors.append('open')
+        return errors
+
+    def test_open(self):
+        breaker = CircuitBreaker(minimum_requests=4, open_seconds=60)
+        self.configuration.circuit_breaker = breaker
+        with ApiClient(self.configuration) as api_client:
+            api = MessagingApi(api_client)
+            errors = self._push(api, 6)
+            self.assertEqual(errors, [503] * 4 + ['open'] * 2)
+            self.assertEqual(len(self.server.paths), 4)
+            # other endpoint groups are not affected
+            self.assertEqual(api.get_profile('U1234').user_id, 'U1234')
+
+        name = '127.0.0.1:{}/message'.format(self.server.server_address[1])
+        circuit = breaker.stats()['circuits'][name]
+        self.assertEqual(circuit['state'], 'open')
+        self.assertEqual(circuit['failures'], 4)
+        self.assertEqual(circuit['rejected'], 2)
+
+    def test_half_open(self):
+        breaker = CircuitBreaker(minimum_requests=2, open_seconds=0.2)
+        self.configuration.circuit_breaker = breaker
+        with ApiClient(self.configuration) as api_client:
+            api = MessagingApi(api_client)
+            self.assertEqual(self._push(api, 3), [503] * 2 + ['open'])
+            time.sleep(0.3)
+            # the probe fails, so the circuit opens again
+            self.assertEqual(self._push(api, 2), [503, 'open'])
+            time.sleep(0.3)
+            self.server.status = 200
+            self.assertEqual(self._push(api, 3), [])
+
+        circuit = list(breaker.stats()['circuits'].values())[0]
+        self.assertEqual(circuit['state'], 'closed')
+        self.assertEqual(circuit['opened'], 2)
+
+    def test_client_errors(self):
+        self.server.status = 400
+        self.configuration.circuit_breaker = CircuitBreaker(minimum_requests=2)
+        with ApiClient(self.configuration) as api_client:
+            self.assertEqual(self._push(MessagingApi(api_client), 4), [400] * 4)
+
+    def test_concurrency_limit(self):
+        self.server.status = 200
+        self.server.latency = 0.2
+        breaker = CircuitBreaker(max_concurrency=2)
+        self.configuration.circuit_breaker = breaker
+        with ApiClient(self.configuration) as api_client, ThreadPoolExecutor(4) as executor:
+            api = MessagingApi(api_client)
+            futures = [executor.submit(api.push_message, PUSH) for _ in range(4)]
+            shed = sum(1 for future in futures
+                       if isinstance(future.exception(), ConcurrencyLimitError))
+        self.assertEqual(shed, 2)
+        self.assertEqual(breaker.stats()['shed'], 2)
+        self.assertEqual(breaker.stats()['in_flight'], 0)
+
+    def test_asyncio(self):
+        breaker = CircuitBreaker(minimum_requests=2, open_seconds=60)
+        self.configuration.circuit_breaker = breaker
+
+        async def push():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api = AsyncMessagingApi(api_client)
+                errors = []
+                for _ in range(3):
+                    try:
+                        await api.push_message(PUSH)
+                    except ApiException as e:
+                        errors.append(e.status)
+                    except CircuitOpenError:
+                        errors.append('open')
+                return errors
+
+        self.assertEqual(asyncio.run(push()), [503] * 2 + ['open'])
+
+    def test_default_timeout(self):
+        self.server.status = 200
+        self.server.latency = 0.5
+        self.configuration.request_timeout = (1, 0.1)
+        with ApiClient(self.configuration) as api_client:
+            with self.assertRaises(ReadTimeoutError):
+                MessagingApi(api_client).push_message(PUSH)
+
+    def test_async_default_timeout(self):
+        self.server.status = 200
+        self.server.latency = 0.5
+        self.configuration.request_timeout = (1, 0.1)
+
+        async def push():
+            async with AsyncApiClient(self.configuration) as api_client:
+                await AsyncMessagingApi(api_client).push_message(PUSH)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(push())
+
+    def test_shared_by_copies(self):
+        breaker = CircuitBreaker()
+        self.configuration.circuit_breaker = breaker
+        self.assertIs(copy.deepcopy(self.configuration).circuit_breaker, breaker)
+
+
+if __name__ == '__main__':
+    unittest.main()
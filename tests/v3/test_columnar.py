@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import math
+import os
+import unittest
+
+from linebot.v3 import WebhookParser
+from linebot.v3.columnar import schema, to_columns, to_numpy, to_arrow
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def _webhook_body():
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        return fp.read()
+
+
+class TestToColumns(unittest.TestCase):
+    def test_one_table_per_event_type(self):
+        body = json.loads(_webhook_body())
+        tables = to_columns([body, body])
+
+        self.assertEqual(set(tables), {event['type'] for event in body['events']})
+        for event_type, table in tables.items():
+            self.assertEqual(list(table), [column[0] for column in schema(event_type)])
+            rows = 2 * sum(1 for event in body['events'] if event['type'] == event_type)
+            for values in table.values():
+                self.assertEqual(len(values), rows)
+
+    def test_values(self):
+        tables = to_columns([json.loads(_webhook_body())])
+
+        message = tables['message']
+        self.assertEqual(message['message_type'][:6],
+                         ['text', 'image', 'video', 'audio', 'location', 'sticker'])
+        self.assertEqual(message['message_text'][0], 'Hello, world')
+        self.assertEqual(message['destination'][0], 'U123')
+        self.assertEqual(message['user_id'][0], 'U206d25c2ea6bd87c17655609a1c37cb8')
+        self.assertEqual(message['group_id'][6], 'Ca56f94637cc4347f90a25382909b24b9')
+        self.assertEqual(message['room_id'][1], 'Ra8dbf4673c4c812cd491258042226c99')
+        self.assertEqual(message['is_redelivery'][10], True)
+        self.assertEqual(message['message_content_provider_type'][1], 'external')
+        self.assertEqual(message['message_latitude'][4], 35.65910807942215)
+        self.assertEqual(tables['postback']['postback_data'][0], 'action=buyItem&itemId=123123&color=red')
+        self.assertEqual(tables['things']['things_device_id'][0], 't2c449c9d1')
+        self.assertEqual(list(tables['undefined']), [column[0] for column in schema('undefined')])
+
+    def test_webhook_payload(self):
+        parser = WebhookParser('channel_secret')
+        parser.signature_validator.validate = lambda a, b: True
+        payload = parser.parse(_webhook_body(), 'signature', as_payload=True)
+        tables = to_columns([payload])
+        expected = to_columns([json.loads(_webhook_body())])
+
+        self.assertEqual(tables['postback'], expected['postback'])
+        self.assertEqual(tables['message']['message_id'], expected['message']['message_id'])
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestToNumpy(unittest.TestCase):
+    def test_record_arrays(self):
+        arrays = to_numpy([json.loads(_webhook_body())])
+
+        message = arrays['message']
+        self.assertEqual(message.timestamp.dtype, numpy.int64)
+        self.assertEqual(message.is_redelivery.dtype, numpy.bool_)
+        self.assertEqual(message.message_type[0], 'text')
+        self.assertEqual(message.message_file_size[8], 2138)
+        self.assertEqual(message.message_file_size[0], 0)
+        self.assertTrue(math.isnan(message.message_latitude[0]))
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class TestToArrow(unittest.TestCase):
+    def test_tables(self):
+        tables = to_arrow([json.loads(_webhook_body())])
+
+        message = tables['message']
+        self.assertEqual(message.schema.field('timestamp').type, pyarrow.int64())
+        self.assertEqual(message.num_rows, 11)
+        self.assertIsNone(message.column('message_file_size')[0].as_py())
+        self.assertEqual(message.column('message_file_size')[8].as_py(), 2138)
+        self.assertEqual(tables['follow'].column('follow_is_unblocked').to_pylist(), [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import copy
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from urllib3.exceptions import EmptyPoolError
+
+from linebot.v3.connection_pool import ConnectionPoolMonitor
+from linebot.v3.messaging import (
+    ApiClient,
+    Configuration,
+    MessagingApi,
+)
+
+BODY = json.dumps({'displayName': 'LINE', 'userId': 'U1234'}).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.2
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPoolMonitor(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.host = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _fetch(self, monitor, concurrency, maxsize=1):
+        configuration = Configuration(access_token='token', host=self.host)
+        configuration.connection_pool_maxsize = maxsize
+        configuration.connection_pool = monitor
+        with ApiClient(configuration) as api_client, ThreadPoolExecutor(concurrency) as executor:
+            api = MessagingApi(api_client)
+            futures = [executor.submit(api.get_profile, 'U1234') for _ in range(concurrency)]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except EmptyPoolError as e:
+                    results.append(e)
+            return results, monitor.stats()[self.host]
+
+    def test_discarded(self):
+        results, stats = self._fetch(ConnectionPoolMonitor(), 3)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(stats['created'], 3)
+        self.assertEqual(stats['discarded'], 2)
+        self.assertEqual(stats['peak_in_use'], 3)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 1)
+        self.assertEqual(stats['maxsize'], 1)
+
+    def test_adaptive(self):
+        results, stats = self._fetch(ConnectionPoolMonitor(adaptive=True, max_size=2), 3)
+        self.assertEqual(stats['maxsize'], 2)
+        self.assertEqual(stats['discarded'], 1)
+        self.assertEqual(stats['idle'], 2)
+        self.assertGreaterEqual(stats['grown'], 1)
+
+    def test_block(self):
+        results, stats = self._fetch(ConnectionPoolMonitor(block=True), 3)
+        self.assertEqual([profile.user_id for profile in results], ['U1234'] * 3)
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['discarded'], 0)
+        self.assertEqual(stats['peak_in_use'], 3)
+        self.assertEqual(stats['waits'], 2)
+        self.assertGreater(stats['max_wait_seconds'], 0.1)
+
+    def test_block_timeout(self):
+        results, stats = self._fetch(ConnectionPoolMonitor(block=True, block_timeout=0.05), 2)
+        self.assertEqual(sum(1 for result in results if isinstance(result, EmptyPoolError)), 1)
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['in_use'], 0)
+
+    def test_adaptive_block(self):
+        monitor = ConnectionPoolMonitor(block=True, adaptive=True, max_size=4)
+        results, stats = self._fetch(monitor, 3)
+        self.assertEqual(stats['created'], 3)
+        self.assertEqual(stats['waits'], 0)
+        self.assertEqual(stats['idle'], 3)
+
+    def test_shared_by_copies(self):
+        monitor = ConnectionPoolMonitor()
+        configuration = Configuration()
+        configuration.connection_pool = monitor
+        self.assertIs(copy.deepcopy(configuration).connection_pool, monitor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import threading
+import unittest
+import warnings
+
+from aiohttp import web
+
+from linebot.v3.connector import SharedConnector
+from linebot.v3.messaging import (
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+)
+from linebot.v3.audience import (
+    AsyncApiClient as AsyncAudienceApiClient,
+    AsyncManageAudience,
+)
+
+
+async def _serve(peers):
+    async def profile(request):
+        peers.add(request.transport.get_extra_info('peername'))
+        return web.json_response({'displayName': 'LINE', 'userId': 'U1234'})
+
+    async def audience_groups(request):
+        peers.add(request.transport.get_extra_info('peername'))
+        return web.json_response({'audienceGroups': [], 'hasNextPage': False,
+                                  'totalCount': 0, 'page': 1, 'size': 20})
+
+    app = web.Application()
+    app.router.add_get('/v2/bot/profile/{user_id}', profile)
+    app.router.add_get('/v2/bot/audienceGroup/list', audience_groups)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, 'http://127.0.0.1:{}'.format(runner.addresses[0][1])
+
+
+class TestSharedConnector(unittest.TestCase):
+    def test_lazy_session(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            api_client = AsyncApiClient(Configuration(access_token='token'))
+        self.assertIsNone(api_client.rest_client._session)
+
+        async def run():
+            async with api_client:
+                session = api_client.rest_client.pool_manager
+                self.assertIs(api_client.rest_client.pool_manager, session)
+            self.assertTrue(session.closed)
+
+        asyncio.run(run())
+
+    def test_shared_by_clients(self):
+        connector = SharedConnector()
+        peers = set()
+
+        async def run():
+            runner, host = await _serve(peers)
+            try:
+                configuration = Configuration(access_token='token', host=host)
+                configuration.connector = connector
+                for _ in range(5):
+                    async with AsyncApiClient(configuration) as api_client:
+                        profile = await AsyncMessagingApi(api_client).get_profile('U1234')
+                        self.assertEqual(profile.display_name, 'LINE')
+                    async with AsyncAudienceApiClient(copy.deepcopy(configuration)) as api_client:
+                        await AsyncManageAudience(api_client).get_audience_groups(page=1)
+                self.assertFalse(connector.get().closed)
+                await connector.close()
+            finally:
+                await runner.cleanup()
+
+        asyncio.run(run())
+        self.assertEqual(len(peers), 1)
+
+    def test_not_shared(self):
+        peers = set()
+
+        async def run():
+            runner, host = await _serve(peers)
+            try:
+                configuration = Configuration(access_token='token', host=host)
+                for _ in range(3):
+                    async with AsyncApiClient(configuration) as api_client:
+                        await AsyncMessagingApi(api_client).get_profile('U1234')
+            finally:
+                await runner.cleanup()
+
+        asyncio.run(run())
+        self.assertEqual(len(peers), 3)
+
+    def test_bound_to_loop(self):
+        connector = SharedConnector()
+
+        async def get():
+            async with connector:
+                return connector.get()
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+
+    def test_loop_switch(self):
+        # a loop running in another thread, e.g. that of a web framework
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        rest_client = AsyncApiClient(Configuration(access_token='token')).rest_client
+
+        async def session():
+            return rest_client.pool_manager
+
+        try:
+            first = asyncio.run_coroutine_threadsafe(session(), other).result()
+
+            async def switch():
+                second = rest_client.pool_manager
+                self.assertIsNot(second, first)
+                # the session of the other loop is closed in that loop
+                await asyncio.sleep(0.1)
+                self.assertTrue(first.closed)
+                return second
+
+            second = asyncio.run(switch())
+            # the loop of asyncio.run is closed, so its session is dropped
+            with self.assertLogs('linebot.v3.messaging.async_rest', 'WARNING'):
+                third = asyncio.run_coroutine_threadsafe(session(), other).result()
+            self.assertFalse(second.closed)
+            # close() from another loop closes the session in its own loop
+            asyncio.run(rest_client.close())
+            self.assertTrue(third.closed)
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
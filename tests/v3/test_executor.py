@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import os
+import threading
+import unittest
+
+import pytest
+
+from linebot.v3 import (
+    WebhookHandler, AsyncWebhookHandler,
+    BackgroundExecutor, AsyncBackgroundExecutor,
+    ShardedExecutor, AsyncShardedExecutor,
+)
+from linebot.v3.exceptions import QueueFullError
+from linebot.v3.executor import source_key
+from linebot.v3.webhooks.models import (
+    MessageEvent, UserSource, GroupSource, RoomSource,
+)
+
+
+def _webhook_body():
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        return fp.read()
+
+
+class TestBackgroundExecutor(unittest.TestCase):
+    def test_handle_returns_before_handlers_run(self):
+        executor = BackgroundExecutor(max_workers=2)
+        handler = WebhookHandler('channel_secret', executor=executor)
+        handler.parser.signature_validator.validate = lambda a, b: True
+        release = threading.Event()
+        handled = []
+
+        @handler.default()
+        def default(event):
+            release.wait(5)
+            handled.append(event)
+
+        handler.handle(_webhook_body(), 'signature')
+        self.assertEqual(handled, [])
+
+        release.set()
+        self.assertTrue(executor.shutdown(timeout=5))
+        self.assertEqual(len(handled), 30)
+        stats = executor.stats()
+        self.assertEqual(stats['submitted'], 30)
+        self.assertEqual(stats['completed'], 30)
+        self.assertEqual(stats['queue_depth'], 0)
+
+    def test_reject(self):
+        executor = BackgroundExecutor(max_workers=1, max_queue_size=1, overflow='reject')
+        release = threading.Event()
+        executor.submit(lambda e: release.wait(5), 'running')
+        while executor.queue_depth:
+            pass
+        executor.submit(lambda e: None, 'queued')
+        with self.assertRaises(QueueFullError):
+            executor.submit(lambda e: None, 'rejected')
+        release.set()
+        executor.shutdown(timeout=5)
+        self.assertEqual(executor.stats()['rejected'], 1)
+
+    def test_drop_oldest(self):
+        executor = BackgroundExecutor(max_workers=1, max_queue_size=1, overflow='drop_oldest')
+        release = threading.Event()
+        handled = []
+        executor.submit(lambda e: release.wait(5), 'running')
+        while executor.queue_depth:
+            pass
+        executor.submit(handled.append, 'oldest')
+        executor.submit(handled.append, 'newest')
+        release.set()
+        executor.shutdown(timeout=5)
+        self.assertEqual(handled, ['newest'])
+        self.assertEqual(executor.stats()['dropped'], 1)
+
+    def test_handler_error_is_counted(self):
+        executor = BackgroundExecutor(max_workers=1)
+
+        def fail(event):
+            raise ValueError(event)
+
+        executor.submit(fail, 'event')
+        executor.shutdown()
+        self.assertEqual(executor.stats()['failed'], 1)
+
+    def test_submit_after_shutdown(self):
+        executor = BackgroundExecutor()
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda e: None, 'event')
+
+    def test_shutdown_waits_for_submits(self):
+        executor = BackgroundExecutor(max_workers=1, max_queue_size=1)
+        release = threading.Event()
+        handled = []
+        executor.submit(lambda e: release.wait(5), 'running')
+        while executor.queue_depth:
+            pass
+        executor.submit(handled.append, 'queued')
+        submit = threading.Thread(target=executor.submit, args=(handled.append, 'blocked'))
+        submit.start()
+        while not executor._submitting:
+            pass
+        shutdown = threading.Thread(target=executor.shutdown)
+        shutdown.start()
+        while not executor._shutdown:
+            pass
+        with self.assertRaises(RuntimeError):
+            executor.submit(handled.append, 'rejected')
+
+        release.set()
+        submit.join(5)
+        shutdown.join(5)
+        self.assertFalse(shutdown.is_alive())
+        self.assertEqual(handled, ['queued', 'blocked'])
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            BackgroundExecutor(overflow='unknown')
+
+
+@pytest.mark.asyncio
+async def test_async_webhook_handler_with_executor():
+    executor = AsyncBackgroundExecutor(max_workers=2)
+    handler = AsyncWebhookHandler('channel_secret', executor=executor)
+    handler.parser.signature_validator.validate = lambda a, b: True
+    release = asyncio.Event()
+    messages = []
+    others = []
+
+    @handler.add(MessageEvent)
+    async def message(event, destination):
+        await release.wait()
+        messages.append(event)
+
+    @handler.default()
+    def default(event):
+        others.append(event)
+
+    await handler.handle(_webhook_body(), 'signature')
+    assert messages == []
+
+    release.set()
+    assert await executor.shutdown(timeout=5)
+    assert len(messages) + len(others) == 30
+    assert all(isinstance(event, MessageEvent) for event in messages)
+    assert executor.stats()['completed'] == 30
+
+
+@pytest.mark.asyncio
+async def test_async_webhook_handler_inline():
+    handler = AsyncWebhookHandler('channel_secret')
+    handler.parser.signature_validator.validate = lambda a, b: True
+    handled = []
+
+    @handler.default()
+    async def default(event):
+        handled.append(event)
+
+    await handler.handle(_webhook_body(), 'signature')
+    assert len(handled) == 30
+
+
+@pytest.mark.asyncio
+async def test_async_reject():
+    executor = AsyncBackgroundExecutor(max_workers=1, max_queue_size=1, overflow='reject')
+    release = asyncio.Event()
+
+    async def wait(event):
+        await release.wait()
+
+    await executor.submit(wait, 'running')
+    await asyncio.sleep(0)
+    await executor.submit(wait, 'queued')
+    with pytest.raises(QueueFullError):
+        await executor.submit(wait, 'rejected')
+    release.set()
+    assert await executor.shutdown(timeout=5)
+    assert executor.stats()['rejected'] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_shutdown_without_wait():
+    executor = AsyncBackgroundExecutor(max_workers=1, max_queue_size=1)
+    release = asyncio.Event()
+
+    async def wait(event):
+        await release.wait()
+
+    await executor.submit(wait, 'running')
+    await asyncio.sleep(0)
+    await executor.submit(wait, 'queued')
+    assert not await asyncio.wait_for(executor.shutdown(wait=False), 1)
+    with pytest.raises(RuntimeError):
+        await executor.submit(wait, 'rejected')
+
+
+class _Event(object):
+    def __init__(self, source, seq):
+        self.source = source
+        self.seq = seq
+
+
+def _conversations():
+    return [
+        UserSource(type='user', user_id='U1'),
+        GroupSource(type='group', group_id='G1', user_id='U1'),
+        RoomSource(type='room', room_id='R1', user_id='U2'),
+        UserSource(type='user', user_id='U3'),
+    ]
+
+
+class TestShardedExecutor(unittest.TestCase):
+    def test_source_key(self):
+        keys = [source_key(_Event(source, 0)) for source in _conversations()]
+        self.assertEqual(keys, ['U1', 'G1', 'R1', 'U3'])
+        self.assertIsNone(source_key(_Event(None, 0)))
+
+    def test_keeps_order_per_conversation(self):
+        executor = ShardedExecutor(num_lanes=3)
+        lock = threading.Lock()
+        handled = {}
+
+        def handle(event):
+            with lock:
+                handled.setdefault(source_key(event), []).append(event.seq)
+
+        for seq in range(100):
+            for source in _conversations():
+                executor.submit(handle, _Event(source, seq))
+
+        self.assertTrue(executor.shutdown(timeout=5))
+        self.assertEqual(len(handled), 4)
+        for seqs in handled.values():
+            self.assertEqual(seqs, list(range(100)))
+        stats = executor.stats()
+        self.assertEqual(len(stats), 3)
+        self.assertEqual(sum(lane['completed'] for lane in stats), 400)
+
+    def test_same_conversation_same_lane(self):
+        executor = ShardedExecutor(num_lanes=8)
+        for source in _conversations():
+            lanes = {executor.lane_for(_Event(source, seq)) for seq in range(10)}
+            self.assertEqual(len(lanes), 1)
+        executor.shutdown()
+
+    def test_with_webhook_handler(self):
+        executor = ShardedExecutor(num_lanes=2)
+        handler = WebhookHandler('channel_secret', executor=executor)
+        handler.parser.signature_validator.validate = lambda a, b: True
+        handled = []
+
+        @handler.default()
+        def default(event):
+            handled.append(event)
+
+        handler.handle(_webhook_body(), 'signature')
+        executor.shutdown()
+        self.assertEqual(len(handled), 30)
+
+
+@pytest.mark.asyncio
+async def test_async_sharded_executor_keeps_order():
+    executor = AsyncShardedExecutor(num_lanes=3)
+    handled = {}
+
+    async def handle(event):
+        await asyncio.sleep(0)
+        handled.setdefault(source_key(event), []).append(event.seq)
+
+    for seq in range(50):
+        for source in _conversations():
+            await executor.submit(handle, _Event(source, seq))
+
+    assert await executor.shutdown(timeout=5)
+    assert len(handled) == 4
+    for seqs in handled.values():
+        assert seqs == list(range(50))
+    assert sum(lane['completed'] for lane in executor.stats()) == 200
+
+
+if __name__ == '__main__':
+    unittest.main()
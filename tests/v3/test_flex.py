@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+from linebot.v3.flex import FlexTemplate
+from linebot.v3.messaging import (
+    FlexBox,
+    FlexBubble,
+    FlexText,
+)
+
+
+def _bubble():
+    return FlexBubble(
+        header=FlexBox(layout='vertical', contents=[FlexText(text='{name}', weight='bold')]),
+        body=FlexBox(layout='vertical', contents=[
+            FlexText(text='Hello'),
+            FlexBox(layout='baseline', contents=[FlexText(text='こんにちは', flex=1)]),
+        ]),
+    )
+
+
+class TestFlexTemplate(unittest.TestCase):
+    def test_set(self):
+        bubble = _bubble()
+        template = FlexTemplate(bubble)
+        variant = template.set('header.contents.0.text', 'Alice')
+
+        self.assertEqual(variant.get(('header', 'contents', 0, 'text')), 'Alice')
+        self.assertEqual(template.get('header.contents.0.text'), '{name}')
+        self.assertEqual(template.to_dict(), bubble.to_dict())
+
+        expected = bubble.to_dict()
+        expected['header']['contents'][0]['text'] = 'Alice'
+        self.assertEqual(variant.to_dict(), expected)
+        self.assertEqual(variant.to_json(), json.dumps(expected))
+
+    def test_unchanged_subtrees_are_shared(self):
+        template = FlexTemplate(_bubble())
+        template.to_json()
+        variant = template.set('header.contents.0.text', 'Alice')
+
+        self.assertIs(variant.to_dict()['body'], template.to_dict()['body'])
+        self.assertIsNot(variant.to_dict()['header'], template.to_dict()['header'])
+
+    def test_set_all_and_new_key(self):
+        variant = FlexTemplate(_bubble()).set_all({
+            'header.contents.0.text': 'Alice',
+            ('body', 'contents', 0, 'color'): '#ff0000',
+            'body.contents.1': FlexText(text='replaced'),
+        })
+
+        self.assertEqual(variant.get('body.contents.0'), {'type': 'text', 'text': 'Hello', 'color': '#ff0000'})
+        self.assertEqual(variant.get('body.contents.1'), {'type': 'text', 'text': 'replaced'})
+        self.assertEqual(json.loads(variant.to_json()), variant.to_dict())
+
+    def test_negative_index(self):
+        template = FlexTemplate({'type': 'carousel', 'contents': [{'a': 1}, {'a': 2}, {'a': 3}]})
+        self.assertEqual(template.set('contents.-1.a', 9).to_dict()['contents'],
+                         [{'a': 1}, {'a': 2}, {'a': 9}])
+        self.assertEqual(template.set('contents.-3.a', 9).to_dict()['contents'],
+                         [{'a': 9}, {'a': 2}, {'a': 3}])
+        self.assertEqual(template.get('contents.-2.a'), 2)
+        with self.assertRaises(KeyError):
+            template.set('contents.-4.a', 9)
+
+    def test_invalid_path(self):
+        template = FlexTemplate(_bubble())
+        with self.assertRaises(KeyError):
+            template.set('body.unknown.text', 'x')
+        with self.assertRaises(KeyError):
+            template.set('body.contents.5.text', 'x')
+        with self.assertRaises(KeyError):
+            template.get('body.layout.text')
+
+    def test_to_model(self):
+        model = FlexTemplate(_bubble()).set('header.contents.0.text', 'Alice').to_model()
+
+        self.assertIsInstance(model, FlexBubble)
+        self.assertEqual(model.header.contents[0].text, 'Alice')
+        with self.assertRaises(ValueError):
+            FlexTemplate(_bubble()).set('header.layout', 'diagonal').to_model()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import unittest
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.instrumentation import Instrumentation, PrometheusInstrumentation
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+    PushMessageRequest,
+    TextMessage,
+)
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.records = []
+
+    def finish(self, record):
+        self.records.append(record)
+
+
+def _configuration(httpserver, instrumentation):
+    configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+    configuration.instrumentation = instrumentation
+    return configuration
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_records(self):
+        instrumentation = RecordingInstrumentation()
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/message/push', method='POST',
+            ).respond_with_json({'sentMessages': [{'id': '1', 'quoteToken': 'q'}]}, status=200,
+                                headers={'x-line-request-id': 'req-1'})
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U1', method='GET',
+            ).respond_with_json({'message': 'Not found'}, status=404,
+                                headers={'x-line-request-id': 'req-2'})
+            with ApiClient(_configuration(httpserver, instrumentation)) as api_client:
+                api = MessagingApi(api_client)
+                api.push_message(PushMessageRequest(to='U1', messages=[TextMessage(text='Hello')]))
+                with self.assertRaises(ApiException):
+                    api.get_profile('U1')
+
+        push, profile = instrumentation.records
+        self.assertEqual((push.method, push.path, push.status, push.request_id),
+                         ('POST', '/v2/bot/message/push', 200, 'req-1'))
+        self.assertEqual(sorted(push.timings), ['deserialize', 'request', 'serialize'])
+        self.assertGreater(push.request_size, 0)
+        self.assertGreater(push.response_size, 0)
+        self.assertIsNone(push.error)
+
+        self.assertEqual((profile.method, profile.path, profile.status, profile.request_id),
+                         ('GET', '/v2/bot/profile/{userId}', 404, 'req-2'))
+        self.assertIsInstance(profile.error, ApiException)
+
+    def test_failures(self):
+        instrumentation = RecordingInstrumentation()
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U1', method='GET',
+            ).respond_with_json({'displayName': 'Brown'}, status=200)
+            configuration = _configuration(httpserver, instrumentation)
+            with ApiClient(configuration) as api_client:
+                api = MessagingApi(api_client)
+                # the response lacks userId
+                with self.assertRaises(ValueError):
+                    api.get_profile('U1')
+
+                def provider():
+                    raise RuntimeError('no token')
+
+                configuration.access_token_provider = provider
+                with self.assertRaises(RuntimeError):
+                    api.get_profile('U1')
+
+        deserialize, auth = instrumentation.records
+        self.assertEqual(deserialize.status, 200)
+        self.assertIsInstance(deserialize.error, ValueError)
+        self.assertEqual(sorted(deserialize.timings), ['deserialize', 'request', 'serialize'])
+        self.assertIsNone(auth.status)
+        self.assertIsInstance(auth.error, RuntimeError)
+        self.assertEqual(list(auth.timings), ['serialize'])
+
+    def test_prometheus(self):
+        instrumentation = PrometheusInstrumentation(buckets=(0.1, 1.0))
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U1', method='GET',
+            ).respond_with_json({'userId': 'U1', 'displayName': 'Brown'}, status=200)
+            with ApiClient(_configuration(httpserver, instrumentation)) as api_client:
+                api = MessagingApi(api_client)
+                api.get_profile('U1')
+                api.get_profile('U1')
+
+        metrics = instrumentation.render()
+        self.assertIn('linebot_requests_total{method="GET",path="/v2/bot/profile/{userId}",status="200"} 2',
+                      metrics)
+        self.assertIn('linebot_request_duration_seconds_bucket{method="GET",path="/v2/bot/profile/{userId}",'
+                      'phase="request",le="+Inf"} 2', metrics)
+        self.assertIn('linebot_request_duration_seconds_count{method="GET",path="/v2/bot/profile/{userId}",'
+                      'phase="deserialize"} 2', metrics)
+        self.assertIn('direction="response"', metrics)
+
+    def test_async(self):
+        instrumentation = RecordingInstrumentation()
+
+        async def run(configuration):
+            async with AsyncApiClient(configuration) as api_client:
+                await AsyncMessagingApi(api_client).get_profile('U1')
+
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U1', method='GET',
+            ).respond_with_json({'userId': 'U1', 'displayName': 'Brown'}, status=200)
+            asyncio.run(run(_configuration(httpserver, instrumentation)))
+
+        record, = instrumentation.records
+        self.assertEqual((record.path, record.status), ('/v2/bot/profile/{userId}', 200))
+        self.assertEqual(sorted(record.timings), ['deserialize', 'request', 'serialize'])
+
+    def test_shared_by_copies(self):
+        instrumentation = PrometheusInstrumentation()
+        configuration = Configuration(access_token='token')
+        configuration.instrumentation = instrumentation
+        self.assertIs(copy.deepcopy(configuration).instrumentation, instrumentation)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import unittest
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.exceptions import InvalidMessageError
+from linebot.v3.message_validation import (
+    AsyncValidationCache,
+    ValidationCache,
+    check_messages,
+    message_hash,
+)
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+    TextMessage,
+    ValidateMessageRequest,
+)
+
+
+def _request(text='Hello'):
+    return ValidateMessageRequest(messages=[TextMessage(text=text)])
+
+
+def _buttons(actions):
+    return {
+        'type': 'template',
+        'altText': 'buttons',
+        'template': {
+            'type': 'buttons',
+            'text': 'Choose',
+            'actions': [{'type': 'message', 'label': str(i), 'text': str(i)} for i in range(actions)],
+        },
+    }
+
+
+class TestCheckMessages(unittest.TestCase):
+    def test_valid(self):
+        check_messages(_request())
+        check_messages([_buttons(4)])
+        check_messages({'messages': [{'type': 'text', 'text': 'Hello'}]})
+
+    def test_count(self):
+        with self.assertRaises(InvalidMessageError):
+            check_messages([])
+        with self.assertRaises(InvalidMessageError):
+            check_messages([{'type': 'text', 'text': 'Hello'}] * 6)
+
+    def test_schema(self):
+        with self.assertRaises(InvalidMessageError) as cm:
+            check_messages([{'type': 'text', 'text': 'Hello'}, {'type': 'text'}])
+        self.assertIn('messages[1]', cm.exception.message)
+
+    def test_limits(self):
+        with self.assertRaises(InvalidMessageError) as cm:
+            check_messages([{'type': 'text', 'text': 'a' * 5001}])
+        self.assertIn('messages[0].text', cm.exception.message)
+
+        with self.assertRaises(InvalidMessageError) as cm:
+            check_messages([_buttons(5)])
+        self.assertIn('messages[0].template.actions', cm.exception.message)
+
+        carousel = {
+            'type': 'template',
+            'altText': 'carousel',
+            'template': {'type': 'carousel', 'columns': [
+                {'text': 'a', 'actions': [{'type': 'message', 'label': 'a', 'text': 'a'}]},
+                {'text': 'b', 'actions': []},
+            ]},
+        }
+        with self.assertRaises(InvalidMessageError):
+            check_messages([carousel])
+
+        bubble = {'type': 'bubble', 'body': {'type': 'box', 'layout': 'vertical', 'contents': [
+            {'type': 'text', 'text': 'a' * 1000} for _ in range(31)]}}
+        with self.assertRaises(InvalidMessageError) as cm:
+            check_messages([{'type': 'flex', 'altText': 'flex', 'contents': bubble}])
+        self.assertIn('bytes', cm.exception.message)
+
+    def test_message_hash(self):
+        self.assertEqual(message_hash(_request()),
+                         message_hash({'messages': [{'text': 'Hello', 'type': 'text'}]}))
+        self.assertNotEqual(message_hash(_request()), message_hash(_request('Bye')))
+
+
+class TestValidationCache(unittest.TestCase):
+    def test_cached(self):
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/message/validate/push', method='POST',
+            ).respond_with_json({}, status=200)
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+            with ApiClient(configuration) as api_client:
+                cache = ValidationCache(MessagingApi(api_client))
+                cache.validate_push(_request())
+                cache.validate_push(_request())
+                cache.validate_push(_request('Bye'))
+
+            self.assertEqual(len(httpserver.log), 2)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_rejected_is_cached(self):
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/message/validate/push', method='POST',
+            ).respond_with_json({'message': 'The request body has 1 error(s)'}, status=400)
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+            with ApiClient(configuration) as api_client:
+                cache = ValidationCache(MessagingApi(api_client))
+                errors = []
+                for _ in range(2):
+                    with self.assertRaises(ApiException) as cm:
+                        cache.validate_push(_request())
+                    errors.append(cm.exception)
+                    self.assertEqual(cm.exception.status, 400)
+                # a new exception is raised from the cache
+                self.assertIsNot(errors[0], errors[1])
+                self.assertEqual(errors[0].body, errors[1].body)
+
+            self.assertEqual(len(httpserver.log), 1)
+
+    def test_local_error_is_not_sent(self):
+        with HTTPServer() as httpserver:
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+            with ApiClient(configuration) as api_client:
+                cache = ValidationCache(MessagingApi(api_client))
+                with self.assertRaises(InvalidMessageError):
+                    cache.validate_push({'messages': [_buttons(5)]})
+
+            self.assertEqual(len(httpserver.log), 0)
+
+    def test_ttl_and_lru(self):
+        calls = []
+
+        class FakeApi(object):
+            def validate_push(self, validate_message_request):
+                calls.append(validate_message_request)
+
+        cache = ValidationCache(FakeApi(), ttl=0)
+        cache.validate_push(_request())
+        cache.validate_push(_request())
+        self.assertEqual(len(calls), 2)
+
+        cache = ValidationCache(FakeApi(), max_size=2)
+        for text in ('a', 'b', 'c', 'a'):
+            cache.validate_push(_request(text))
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(cache.stats()['evictions'], 2)
+        self.assertEqual(cache.stats()['size'], 2)
+
+
+class TestAsyncValidationCache(unittest.TestCase):
+    def test_cached(self):
+        async def validate(url):
+            configuration = Configuration(access_token='token', host=url)
+            async with AsyncApiClient(configuration) as api_client:
+                cache = AsyncValidationCache(AsyncMessagingApi(api_client))
+                await cache.validate_broadcast(_request())
+                await cache.validate_broadcast(_request())
+                return cache.stats()
+
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/message/validate/broadcast', method='POST',
+            ).respond_with_json({}, status=200)
+            stats = asyncio.run(validate(httpserver.url_for('/')))
+
+            self.assertEqual(len(httpserver.log), 1)
+        self.assertEqual(stats['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import os
+import unittest
+
+from linebot.v3.messaging import (
+    FlexBox,
+    FlexBubble,
+    FlexMessage,
+    FlexText,
+    PushMessageRequest,
+    TextMessage,
+    URIAction,
+)
+from linebot.v3.webhooks import Event
+
+
+def _webhook_event():
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        return json.load(fp)['events'][0]
+
+
+class TestSubclassFields(unittest.TestCase):
+    def test_webhook_event(self):
+        event = Event.from_dict(_webhook_event())
+
+        self.assertEqual(event.to_dict()['message']['text'], 'Hello, world')
+        self.assertEqual(event.to_dict()['source']['userId'], 'U206d25c2ea6bd87c17655609a1c37cb8')
+        dumped = event.model_dump(by_alias=True)
+        self.assertEqual(dumped['message']['text'], 'Hello, world')
+        self.assertEqual(dumped['source']['userId'], 'U206d25c2ea6bd87c17655609a1c37cb8')
+        self.assertIn("'text': 'Hello, world'", event.to_str())
+        self.assertIn("'userId': 'U206d25c2ea6bd87c17655609a1c37cb8'", event.to_str())
+
+    def test_push_request(self):
+        request = PushMessageRequest(to='U1234', messages=[TextMessage(text='hello')])
+
+        self.assertEqual(request.to_dict()['messages'], [{'type': 'text', 'text': 'hello'}])
+        self.assertEqual(request.model_dump()['messages'][0]['text'], 'hello')
+        self.assertIn("'text': 'hello'", request.to_str())
+
+    def test_nested_flex_bubble(self):
+        action = URIAction(label='open', uri='https://line.me/')
+        inner = FlexBox(layout='horizontal', contents=[FlexText(text='hello', action=action)])
+        bubble = FlexBubble(body=FlexBox(layout='vertical', contents=[inner]))
+        request = PushMessageRequest(
+            to='U1234', messages=[FlexMessage(alt_text='hello', contents=bubble)])
+
+        expected = {'type': 'box', 'layout': 'horizontal', 'contents': [
+            {'type': 'text', 'text': 'hello',
+             'action': {'type': 'uri', 'label': 'open', 'uri': 'https://line.me/'}}]}
+        self.assertEqual(
+            request.to_dict()['messages'][0]['contents']['body']['contents'][0], expected)
+        dumped = request.model_dump(by_alias=True, exclude_none=True)
+        self.assertEqual(dumped['messages'][0]['contents']['body']['contents'][0], expected)
+        self.assertIn("'uri': 'https://line.me/'", request.to_str())
+        self.assertIn("'layout': 'horizontal'", request.to_str())
+
+
+if __name__ == '__main__':
+    unittest.main()
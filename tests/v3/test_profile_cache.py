@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import threading
+import time
+import unittest
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    Configuration,
+    MessagingApi,
+)
+from linebot.v3.models import EventView
+from linebot.v3.profile_cache import AsyncProfileCache, ProfileCache
+from linebot.v3.webhooks import (
+    FollowEvent,
+    LeaveEvent,
+)
+
+
+class FakeApi(object):
+    def __init__(self, delay=0):
+        self.calls = []
+        self.delay = delay
+
+    def _call(self, *args):
+        self.calls.append(args)
+        time.sleep(self.delay)
+        return args
+
+    def get_profile(self, user_id):
+        return self._call('get_profile', user_id)
+
+    def get_group_member_profile(self, group_id, user_id):
+        return self._call('get_group_member_profile', group_id, user_id)
+
+    def get_group_member_count(self, group_id):
+        return self._call('get_group_member_count', group_id)
+
+    def get_group_summary(self, group_id):
+        return self._call('get_group_summary', group_id)
+
+
+class AsyncFakeApi(object):
+    def __init__(self):
+        self.calls = []
+
+    async def get_profile(self, user_id):
+        self.calls.append(user_id)
+        await asyncio.sleep(0.01)
+        if user_id == 'Ubad':
+            raise ValueError(user_id)
+        return user_id
+
+
+def _event(event_type, source, **kwargs):
+    return dict({
+        'type': event_type,
+        'source': source,
+        'timestamp': 1462629479859,
+        'mode': 'active',
+        'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3ZR',
+        'deliveryContext': {'isRedelivery': False},
+        'replyToken': 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA',
+    }, **kwargs)
+
+
+class TestProfileCache(unittest.TestCase):
+    def test_cached(self):
+        api = FakeApi()
+        cache = ProfileCache(api)
+        self.assertEqual(cache.get_profile('U1'), ('get_profile', 'U1'))
+        self.assertEqual(cache.get_profile(user_id='U1'), ('get_profile', 'U1'))
+        cache.get_profile('U2')
+        self.assertEqual(len(api.calls), 2)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_ttl_and_lru(self):
+        api = FakeApi()
+        cache = ProfileCache(api, ttl={'get_profile': 0}, max_size=2)
+        cache.get_profile('U1')
+        cache.get_profile('U1')
+        self.assertEqual(len(api.calls), 2)
+
+        for group_id in ('C1', 'C2', 'C3', 'C1'):
+            cache.get_group_summary(group_id)
+        self.assertEqual(len(api.calls), 6)
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_arguments(self):
+        cache = ProfileCache(FakeApi())
+        with self.assertRaisesRegex(TypeError, "'user_id'"):
+            cache.get_profile()
+        with self.assertRaisesRegex(TypeError, "'user_id'"):
+            cache.get_group_member_profile('C1')
+        with self.assertRaisesRegex(TypeError, 'async_req'):
+            cache.get_profile('U1', async_req=True)
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_single_flight(self):
+        api = FakeApi(delay=0.1)
+        cache = ProfileCache(api)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_profile('U1')))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(api.calls), 1)
+        self.assertEqual(results, [('get_profile', 'U1')] * 8)
+
+    def test_invalidate(self):
+        api = FakeApi()
+        cache = ProfileCache(api)
+        cache.get_profile('U1')
+        cache.get_group_summary('C1')
+        cache.get_group_member_count('C1')
+        cache.get_group_member_profile('C1', 'U1')
+        cache.get_group_member_profile('C1', 'U2')
+
+        cache.invalidate(FollowEvent.from_dict(_event(
+            'follow', {'type': 'user', 'userId': 'U1'}, follow={'isUnblocked': False})))
+        self.assertEqual(cache.stats()['size'], 4)
+
+        cache.invalidate(EventView.from_dict(_event(
+            'memberJoined', {'type': 'group', 'groupId': 'C1'},
+            joined={'members': [{'type': 'user', 'userId': 'U2'}]})))
+        self.assertEqual(cache.stats()['size'], 2)
+
+        cache.invalidate(LeaveEvent.from_dict(_event('leave', {'type': 'group', 'groupId': 'C1'})))
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_messaging_api(self):
+        with HTTPServer() as httpserver:
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U1', method='GET',
+            ).respond_with_json({'userId': 'U1', 'displayName': 'Brown'}, status=200)
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U2', method='GET',
+            ).respond_with_json({'message': 'Not found'}, status=404)
+            configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+            with ApiClient(configuration) as api_client:
+                cache = ProfileCache(MessagingApi(api_client))
+                self.assertEqual(cache.get_profile('U1').display_name, 'Brown')
+                self.assertIs(cache.get_profile('U1'), cache.get_profile('U1'))
+                for _ in range(2):
+                    with self.assertRaises(ApiException):
+                        cache.get_profile('U2')
+
+            self.assertEqual(len(httpserver.log), 3)
+
+
+class TestAsyncProfileCache(unittest.TestCase):
+    def test_single_flight(self):
+        api = AsyncFakeApi()
+        cache = AsyncProfileCache(api)
+
+        async def run():
+            results = await asyncio.gather(*[cache.get_profile('U1') for _ in range(8)])
+            errors = await asyncio.gather(*[cache.get_profile('Ubad') for _ in range(2)],
+                                          return_exceptions=True)
+            return results, errors
+
+        results, errors = asyncio.run(run())
+        self.assertEqual(results, ['U1'] * 8)
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+        self.assertEqual(api.calls, ['U1', 'Ubad'])
+
+
+if __name__ == '__main__':
+    unittest.main()
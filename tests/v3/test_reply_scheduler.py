@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import threading
+import time
+import unittest
+
+from linebot.v3.messaging import TextMessage
+from linebot.v3.reply_scheduler import AsyncReplyScheduler, ReplyScheduler
+from linebot.v3.webhooks import MessageEvent
+
+MESSAGES = [TextMessage(text='hello')]
+
+
+class FakeApi(object):
+    def __init__(self, gate=None):
+        self.calls = []
+        self.gate = gate
+
+    def reply_message(self, request):
+        if self.gate is not None:
+            self.gate.wait()
+        if request.reply_token == 'bad':
+            raise ValueError(request.reply_token)
+        self.calls.append(('reply', request.reply_token))
+        return 'reply response'
+
+    def push_message(self, request):
+        self.calls.append(('push', request.to))
+        return 'push response'
+
+
+class AsyncFakeApi(FakeApi):
+    async def reply_message(self, request):
+        await asyncio.sleep(0.01)
+        return super(AsyncFakeApi, self).reply_message(request)
+
+    async def push_message(self, request):
+        return super(AsyncFakeApi, self).push_message(request)
+
+
+def _event(reply_token, age, source=None):
+    return MessageEvent.from_dict({
+        'type': 'message',
+        'source': source or {'type': 'user', 'userId': 'U1'},
+        'timestamp': int((time.time() - age) * 1000),
+        'mode': 'active',
+        'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3ZR',
+        'deliveryContext': {'isRedelivery': False},
+        'replyToken': reply_token,
+        'message': {'type': 'text', 'id': '1', 'text': 'hi', 'quoteToken': 'q'},
+    })
+
+
+class TestReplyScheduler(unittest.TestCase):
+    def test_reply_and_push(self):
+        api = FakeApi()
+        with ReplyScheduler(api) as scheduler:
+            replied = scheduler.reply(_event('fresh', 0.1), MESSAGES)
+            pushed = scheduler.reply(
+                _event('old', 29.5, {'type': 'group', 'groupId': 'C1', 'userId': 'U1'}), MESSAGES)
+            self.assertEqual(replied.result(), ('replied', 'reply response'))
+            self.assertEqual(pushed.result(), ('pushed', 'push response'))
+        self.assertEqual(sorted(api.calls), [('push', 'C1'), ('reply', 'fresh')])
+
+        stats = scheduler.stats()
+        self.assertEqual((stats['replied'], stats['pushed']), (1, 1))
+        latency = stats['latency']
+        self.assertEqual(latency['count'], 2)
+        self.assertEqual(latency['buckets'][0.25], 1)
+        self.assertEqual(latency['buckets'][30.0], 2)
+        self.assertGreater(latency['sum'], 29.5)
+
+    def test_deadline_order(self):
+        gate = threading.Event()
+        api = FakeApi(gate)
+        with ReplyScheduler(api, workers=1, ttl=60) as scheduler:
+            # the worker waits in this reply while the others are queued
+            scheduler.reply(_event('first', 0), MESSAGES)
+            time.sleep(0.05)
+            futures = [scheduler.reply(_event(token, age), MESSAGES)
+                       for token, age in (('new', 1), ('oldest', 20), ('old', 10))]
+            gate.set()
+            for future in futures:
+                future.result()
+        self.assertEqual([token for _, token in api.calls], ['first', 'oldest', 'old', 'new'])
+
+    def test_failed(self):
+        with ReplyScheduler(FakeApi()) as scheduler:
+            future = scheduler.reply(_event('bad', 0), MESSAGES)
+            with self.assertRaises(ValueError):
+                future.result()
+        self.assertEqual(scheduler.stats()['failed'], 1)
+
+    def test_asyncio(self):
+        api = AsyncFakeApi()
+
+        async def reply():
+            async with AsyncReplyScheduler(api, concurrency=2) as scheduler:
+                futures = [scheduler.reply(_event(token, age), MESSAGES)
+                           for token, age in (('a', 0), ('b', 40), ('bad', 0))]
+                results = await asyncio.gather(*futures, return_exceptions=True)
+            return scheduler, results
+
+        scheduler, results = asyncio.run(reply())
+        self.assertEqual(results[:2], [('replied', 'reply response'), ('pushed', 'push response')])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(scheduler.stats()['failed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
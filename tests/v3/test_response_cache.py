@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3.messaging import (
+    ApiClient,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+)
+from linebot.v3.response_cache import DiskBackend, ResponseCache
+
+RICH_MENU_LIST = {'richmenus': [{
+    'richMenuId': 'richmenu-1',
+    'size': {'width': 2500, 'height': 843},
+    'selected': False,
+    'name': 'Menu',
+    'chatBarText': 'Menu',
+    'areas': [],
+}]}
+
+
+def _configuration(httpserver, response_cache):
+    configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+    configuration.response_cache = response_cache
+    return configuration
+
+
+def _expect_list(httpserver):
+    httpserver.expect_request(
+        uri='/v2/bot/richmenu/list', method='GET',
+    ).respond_with_json(RICH_MENU_LIST, status=200, headers={'x-line-request-id': 'abc'})
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_cached(self):
+        with HTTPServer() as httpserver:
+            _expect_list(httpserver)
+            httpserver.expect_request(
+                uri='/v2/bot/profile/U1', method='GET',
+            ).respond_with_json({'userId': 'U1', 'displayName': 'Brown'}, status=200)
+            cache = ResponseCache()
+            with ApiClient(_configuration(httpserver, cache)) as api_client:
+                api = MessagingApi(api_client)
+                for _ in range(3):
+                    response = api.get_rich_menu_list_with_http_info()
+                    self.assertEqual(response.data.richmenus[0].rich_menu_id, 'richmenu-1')
+                    self.assertEqual(response.headers['X-Line-Request-Id'], 'abc')
+                # not in the cached paths
+                api.get_profile('U1')
+                api.get_profile('U1')
+
+            self.assertEqual(len(httpserver.log), 3)
+        self.assertEqual(cache.stats()['hits'], 2)
+
+    def test_shared_by_copies(self):
+        cache = ResponseCache()
+        configuration = Configuration(access_token='token')
+        configuration.response_cache = cache
+        self.assertIs(copy.deepcopy(configuration).response_cache, cache)
+
+    def test_invalidated_by_mutation(self):
+        with HTTPServer() as httpserver:
+            _expect_list(httpserver)
+            httpserver.expect_request(
+                uri='/v2/bot/richmenu/richmenu-1', method='DELETE',
+            ).respond_with_json({}, status=200)
+            with ApiClient(_configuration(httpserver, ResponseCache())) as api_client:
+                api = MessagingApi(api_client)
+                api.get_rich_menu_list()
+                api.delete_rich_menu('richmenu-1')
+                api.get_rich_menu_list()
+
+            self.assertEqual(len(httpserver.log), 3)
+
+    def test_stale_while_revalidate(self):
+        with HTTPServer() as httpserver:
+            _expect_list(httpserver)
+            cache = ResponseCache(ttl=0.05, stale_ttl=60)
+            with ApiClient(_configuration(httpserver, cache)) as api_client:
+                api = MessagingApi(api_client)
+                api.get_rich_menu_list()
+                time.sleep(0.1)
+                self.assertEqual(len(api.get_rich_menu_list().richmenus), 1)
+                for _ in range(50):
+                    if cache.stats()['refreshes']:
+                        break
+                    time.sleep(0.02)
+
+            self.assertEqual(len(httpserver.log), 2)
+        self.assertEqual(cache.stats()['stale_hits'], 1)
+        self.assertEqual(cache.stats()['refreshes'], 1)
+
+    def test_disk_backend(self):
+        with tempfile.TemporaryDirectory() as directory, HTTPServer() as httpserver:
+            _expect_list(httpserver)
+            for _ in range(2):
+                # a new cache and client, as after a restart
+                cache = ResponseCache(backend=DiskBackend(directory))
+                with ApiClient(_configuration(httpserver, cache)) as api_client:
+                    api = MessagingApi(api_client)
+                    self.assertEqual(len(api.get_rich_menu_list().richmenus), 1)
+
+            self.assertEqual(len(httpserver.log), 1)
+            cache.clear()
+            self.assertIsNone(cache.backend.get('missing'))
+
+    def test_async(self):
+        async def run(configuration):
+            async with AsyncApiClient(configuration) as api_client:
+                api = AsyncMessagingApi(api_client)
+                for _ in range(3):
+                    response = await api.get_rich_menu_list()
+                    self.assertEqual(response.richmenus[0].rich_menu_id, 'richmenu-1')
+
+        with HTTPServer() as httpserver:
+            _expect_list(httpserver)
+            asyncio.run(run(_configuration(httpserver, ResponseCache())))
+
+            self.assertEqual(len(httpserver.log), 1)
+
+    def test_async_refresh_failure(self):
+        response = mock.Mock(status=200, reason='OK', data=b'{}')
+        response.getheaders.return_value = {}
+
+        async def fetch():
+            return response
+
+        async def fail():
+            raise ValueError('failed')
+
+        async def run(cache):
+            await cache.async_call('GET', '/v2/bot/richmenu/list', 'url', {}, fetch)
+            stale = await cache.async_call('GET', '/v2/bot/richmenu/list', 'url', {}, fail)
+            self.assertEqual(len(cache._refresh_tasks), 1)
+            await asyncio.gather(*cache._refresh_tasks, return_exceptions=True)
+            return stale
+
+        cache = ResponseCache(ttl=0, stale_ttl=60)
+        with mock.patch('linebot.v3.response_cache.LOGGER') as logger:
+            stale = asyncio.run(run(cache))
+        self.assertEqual(stale.data, b'{}')
+        self.assertEqual(cache._refresh_tasks, set())
+        self.assertEqual(cache.stats()['refreshes'], 1)
+        logger.error.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import threading
+import unittest
+from types import SimpleNamespace
+
+from linebot.v3.exceptions import RichMenuSyncError
+from linebot.v3.messaging import ApiException
+from linebot.v3.rich_menu_sync import RichMenuSpec, RichMenuSync
+
+
+def _rich_menu(name, text='Menu'):
+    return {
+        'size': {'width': 2500, 'height': 843},
+        'selected': False,
+        'name': name,
+        'chatBarText': text,
+        'areas': [{
+            'bounds': {'x': 0, 'y': 0, 'width': 2500, 'height': 843},
+            'action': {'type': 'postback', 'data': name},
+        }],
+    }
+
+
+class FakeApi(object):
+    """In-memory rich menus of a channel."""
+
+    def __init__(self, phase='succeeded'):
+        self.menus = {}
+        self.images = {}
+        self.aliases = {}
+        self.default = None
+        self.batches = []
+        self.calls = []
+        self.phase = phase
+        self._lock = threading.Lock()
+
+    def _record(self, name):
+        with self._lock:
+            self.calls.append(name)
+
+    def get_rich_menu_list(self):
+        self._record('get_rich_menu_list')
+        return SimpleNamespace(richmenus=[
+            SimpleNamespace(rich_menu_id=rich_menu_id, name=menu.name)
+            for rich_menu_id, menu in sorted(self.menus.items())])
+
+    def get_rich_menu_alias_list(self):
+        self._record('get_rich_menu_alias_list')
+        return SimpleNamespace(aliases=[
+            SimpleNamespace(rich_menu_alias_id=alias, rich_menu_id=rich_menu_id)
+            for alias, rich_menu_id in self.aliases.items()])
+
+    def get_default_rich_menu_id(self):
+        self._record('get_default_rich_menu_id')
+        if self.default is None:
+            raise ApiException(status=404, reason='Not Found')
+        return SimpleNamespace(rich_menu_id=self.default)
+
+    def create_rich_menu(self, rich_menu_request):
+        self._record('create_rich_menu')
+        with self._lock:
+            rich_menu_id = 'richmenu-{}'.format(len(self.menus) + len(self.calls))
+            self.menus[rich_menu_id] = rich_menu_request
+        return SimpleNamespace(rich_menu_id=rich_menu_id)
+
+    def set_rich_menu_image(self, rich_menu_id, body, _headers=None):
+        self._record('set_rich_menu_image')
+        self.images[rich_menu_id] = body
+
+    def create_rich_menu_alias(self, request):
+        self._record('create_rich_menu_alias')
+        self.aliases[request.rich_menu_alias_id] = request.rich_menu_id
+
+    def update_rich_menu_alias(self, alias, request):
+        self._record('update_rich_menu_alias')
+        self.aliases[alias] = request.rich_menu_id
+
+    def delete_rich_menu_alias(self, alias):
+        self._record('delete_rich_menu_alias')
+        del self.aliases[alias]
+
+    def set_default_rich_menu(self, rich_menu_id):
+        self._record('set_default_rich_menu')
+        self.default = rich_menu_id
+
+    def delete_rich_menu(self, rich_menu_id):
+        self._record('delete_rich_menu')
+        del self.menus[rich_menu_id]
+        if self.default == rich_menu_id:
+            self.default = None
+
+    def rich_menu_batch_with_http_info(self, request):
+        self._record('rich_menu_batch')
+        self.batches.append([(op.var_from, op.to) for op in request.operations])
+        return SimpleNamespace(headers={'x-line-request-id': 'request-1'})
+
+    def get_rich_menu_batch_progress(self, request_id):
+        self._record('get_rich_menu_batch_progress')
+        return SimpleNamespace(phase=self.phase)
+
+
+def _specs(text='Menu'):
+    return [
+        RichMenuSpec(_rich_menu('a', text), b'image-a', aliases=['alias-a'], default=True),
+        RichMenuSpec(_rich_menu('b'), b'image-b', aliases=['alias-b']),
+    ]
+
+
+class TestRichMenuSync(unittest.TestCase):
+    def test_sync(self):
+        api = FakeApi()
+        sync = RichMenuSync(api, api)
+        ids = sync.sync(_specs())
+
+        self.assertEqual(sorted(ids), ['a', 'b'])
+        self.assertEqual(api.aliases, {'alias-a': ids['a'], 'alias-b': ids['b']})
+        self.assertEqual(api.default, ids['a'])
+        self.assertEqual(api.images[ids['a']], b'image-a')
+        self.assertTrue(api.menus[ids['a']].name.startswith('a #'))
+
+    def test_unchanged(self):
+        api = FakeApi()
+        sync = RichMenuSync(api, api)
+        ids = sync.sync(_specs())
+        del api.calls[:]
+
+        plan = sync.plan(_specs())
+        self.assertTrue(plan.is_empty())
+        self.assertEqual(sync.apply(plan), ids)
+        self.assertEqual(sorted(api.calls), [
+            'get_default_rich_menu_id', 'get_rich_menu_alias_list', 'get_rich_menu_list'])
+
+    def test_changed(self):
+        api = FakeApi()
+        sync = RichMenuSync(api, api)
+        old = sync.sync(_specs())
+        api.menus['richmenu-manual'] = SimpleNamespace(name='manual')
+
+        plan = sync.plan(_specs(text='New menu'))
+        self.assertEqual([spec.name for spec in plan.create], ['a'])
+        self.assertEqual(plan.keep, {'b': old['b']})
+        self.assertEqual(plan.update_aliases, {'alias-a': 'a'})
+        new = sync.apply(plan)
+
+        self.assertNotEqual(new['a'], old['a'])
+        self.assertEqual(new['b'], old['b'])
+        self.assertEqual(api.batches, [[(old['a'], new['a'])]])
+        self.assertEqual(sorted(api.menus), sorted([new['a'], new['b'], 'richmenu-manual']))
+        self.assertEqual(api.aliases['alias-a'], new['a'])
+        self.assertEqual(api.default, new['a'])
+
+    def test_prune(self):
+        api = FakeApi()
+        sync = RichMenuSync(api, api)
+        ids = sync.sync(_specs())
+
+        self.assertEqual(sync.plan(_specs()[:1], prune=False).delete, [])
+        sync.sync(_specs()[:1])
+        self.assertEqual(list(api.menus), [ids['a']])
+        self.assertEqual(api.aliases, {'alias-a': ids['a']})
+
+    def test_batch_failed(self):
+        api = FakeApi()
+        sync = RichMenuSync(api, api)
+        sync.sync(_specs())
+        api.phase = 'failed'
+        with self.assertRaises(RichMenuSyncError):
+            sync.sync(_specs(text='New menu'))
+
+    def test_invalid_specs(self):
+        sync = RichMenuSync(FakeApi(), None)
+        with self.assertRaises(ValueError):
+            sync.plan(_specs() + _specs())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import copy
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linebot.v3.instrumentation import Instrumentation
+from linebot.v3.messaging import (
+    ApiClient,
+    ApiException,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+)
+from linebot.v3.single_flight import SingleFlight
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        time.sleep(0.2)
+        group_id = self.path.split('/')[4]
+        if group_id == 'missing':
+            self.send_response(404)
+            body = b'{"message": "Not found"}'
+        else:
+            self.send_response(200)
+            body = json.dumps({'groupId': group_id, 'groupName': 'group', 'count': 3,
+                               'pictureUrl': 'https://example.com/a.png'}).encode('utf-8')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Records(Instrumentation):
+    def __init__(self):
+        self.records = []
+
+    def finish(self, record):
+        self.records.append(record)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.paths = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.single_flight = SingleFlight()
+        self.configuration = Configuration(
+            access_token='token', host='http://127.0.0.1:{}'.format(self.server.server_address[1]))
+        self.configuration.single_flight = self.single_flight
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _fetch(self, *group_ids):
+        with ApiClient(self.configuration) as api_client, \
+                ThreadPoolExecutor(len(group_ids)) as executor:
+            api = MessagingApi(api_client)
+            futures = [executor.submit(api.get_group_summary, group_id)
+                       for group_id in group_ids]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except ApiException as e:
+                    results.append(e)
+            return results
+
+    def test_threads(self):
+        results = self._fetch('C1', 'C1', 'C1', 'C1', 'C2')
+        self.assertEqual([summary.group_id for summary in results], ['C1'] * 4 + ['C2'])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(sorted(self.server.paths),
+                         ['/v2/bot/group/C1/summary', '/v2/bot/group/C2/summary'])
+        self.assertEqual(self.single_flight.stats(),
+                         {'requests': 2, 'coalesced': 3, 'in_flight': 0})
+
+    def test_error(self):
+        results = self._fetch('missing', 'missing')
+        self.assertIsInstance(results[0], ApiException)
+        self.assertIsInstance(results[1], ApiException)
+        # the follower raises its own copy, caused by the leader's exception
+        self.assertIsNot(results[0], results[1])
+        self.assertIn(results[0].__cause__ or results[1].__cause__, results)
+        self.assertEqual([error.status for error in results], [404, 404])
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_paths(self):
+        self.configuration.single_flight = SingleFlight(paths=[r'^/v2/bot/profile/'])
+        self._fetch('C1', 'C1')
+        self.assertEqual(len(self.server.paths), 2)
+
+    def test_instrumentation(self):
+        instrumentation = _Records()
+        self.configuration.instrumentation = instrumentation
+        self._fetch('C1', 'C1', 'C1')
+        coalesced = [record for record in instrumentation.records
+                     if record.extra.get('coalesced')]
+        self.assertEqual(len(instrumentation.records), 3)
+        self.assertEqual(len(coalesced), 2)
+        self.assertEqual([record.status for record in coalesced], [200, 200])
+
+    def test_asyncio(self):
+        async def fetch():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api = AsyncMessagingApi(api_client)
+                return await asyncio.gather(
+                    api.get_group_summary('C1'), api.get_group_summary('C1'),
+                    api.get_group_member_count('C1'), api.get_group_summary('C1'))
+
+        results = asyncio.run(fetch())
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(len(self.server.paths), 2)
+        self.assertEqual(self.single_flight.stats()['coalesced'], 2)
+
+    def test_shared_by_copies(self):
+        self.assertIs(copy.deepcopy(self.configuration).single_flight, self.single_flight)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import unittest
+
+from pytest_httpserver.httpserver import HTTPServer
+
+from linebot.v3 import AsyncWebhookHandler, WebhookHandler, tracing
+from linebot.v3.exceptions import InvalidSignatureError
+from linebot.v3.executor import AsyncBackgroundExecutor
+from linebot.v3.messaging import (
+    ApiClient,
+    AsyncApiClient,
+    AsyncMessagingApi,
+    Configuration,
+    MessagingApi,
+    ReplyMessageRequest,
+    TextMessage,
+)
+from linebot.v3.webhooks import MessageEvent, TextMessageContent
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None
+
+SECRET = 'channel_secret'
+BODY = json.dumps({'destination': 'Uxxx', 'events': [{
+    'type': 'message',
+    'mode': 'active',
+    'timestamp': 1462629479859,
+    'source': {'type': 'user', 'userId': 'U4af4980629'},
+    'webhookEventId': '01FZ74A0TDDPYRVKNK77XKC3ZR',
+    'deliveryContext': {'isRedelivery': False},
+    'replyToken': 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA',
+    'message': {'id': '325708', 'type': 'text', 'text': 'Hello', 'quoteToken': 'q3Plxr4AgKd'},
+}]})
+SIGNATURE = base64.b64encode(
+    hmac.new(SECRET.encode('utf-8'), BODY.encode('utf-8'), hashlib.sha256).digest()).decode('utf-8')
+
+
+def _configuration(httpserver):
+    configuration = Configuration(access_token='token', host=httpserver.url_for('/'))
+    configuration.instrumentation = tracing.TracingInstrumentation()
+    return configuration
+
+
+def _expect_reply(httpserver):
+    httpserver.expect_request(
+        uri='/v2/bot/message/reply', method='POST',
+    ).respond_with_json({'sentMessages': [{'id': '1', 'quoteToken': 'q'}]}, status=200,
+                        headers={'x-line-request-id': 'req-1'})
+
+
+@unittest.skipIf(TracerProvider is None, 'opentelemetry-sdk is not installed')
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        tracing.set_tracer_provider(provider)
+
+    def tearDown(self):
+        tracing.set_tracer_provider(None)
+
+    def _spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def _assert_trace(self):
+        spans = self._spans()
+        self.assertEqual(sorted(spans), [
+            'POST /v2/bot/message/reply',
+            'linebot.webhook.dispatch',
+            'linebot.webhook.handle',
+            'linebot.webhook.parse',
+            'linebot.webhook.validate_signature',
+        ])
+        handle = spans['linebot.webhook.handle']
+        dispatch = spans['linebot.webhook.dispatch']
+        reply = spans['POST /v2/bot/message/reply']
+        self.assertEqual(dispatch.parent.span_id, handle.context.span_id)
+        self.assertEqual(reply.parent.span_id, dispatch.context.span_id)
+        self.assertEqual(reply.context.trace_id, handle.context.trace_id)
+        for span in (dispatch, reply):
+            self.assertEqual(span.attributes['linebot.webhook_event_id'], '01FZ74A0TDDPYRVKNK77XKC3ZR')
+            self.assertEqual(span.attributes['linebot.reply_token'], 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA')
+        self.assertEqual(reply.attributes['url.template'], '/v2/bot/message/reply')
+        self.assertEqual(reply.attributes['http.response.status_code'], 200)
+        self.assertEqual(reply.attributes['linebot.request_id'], 'req-1')
+
+    def test_webhook_and_reply(self):
+        with HTTPServer() as httpserver:
+            _expect_reply(httpserver)
+            with ApiClient(_configuration(httpserver)) as api_client:
+                api = MessagingApi(api_client)
+                handler = WebhookHandler(SECRET)
+
+                @handler.add(MessageEvent, message=TextMessageContent)
+                def handle_message(event):
+                    api.reply_message(ReplyMessageRequest(
+                        reply_token=event.reply_token, messages=[TextMessage(text='Hi')]))
+
+                handler.handle(BODY, SIGNATURE)
+
+        self._assert_trace()
+
+    def test_async_webhook_and_reply(self):
+        async def run(configuration):
+            async with AsyncApiClient(configuration) as api_client:
+                api = AsyncMessagingApi(api_client)
+                handler = AsyncWebhookHandler(SECRET)
+
+                @handler.add(MessageEvent, message=TextMessageContent)
+                async def handle_message(event):
+                    await api.reply_message(ReplyMessageRequest(
+                        reply_token=event.reply_token, messages=[TextMessage(text='Hi')]))
+
+                await handler.handle(BODY, SIGNATURE)
+
+        with HTTPServer() as httpserver:
+            _expect_reply(httpserver)
+            asyncio.run(run(_configuration(httpserver)))
+
+        self._assert_trace()
+
+    def test_async_executor_two_requests(self):
+        async def run():
+            async with AsyncBackgroundExecutor(max_workers=1) as executor:
+                handler = AsyncWebhookHandler(SECRET, executor=executor)
+
+                @handler.add(MessageEvent, message=TextMessageContent)
+                async def handle_message(event):
+                    pass
+
+                await handler.handle(BODY, SIGNATURE)
+                await handler.handle(BODY, SIGNATURE)
+
+        asyncio.run(run())
+        spans = self.exporter.get_finished_spans()
+        handles = [span for span in spans if span.name == 'linebot.webhook.handle']
+        dispatches = [span for span in spans if span.name == 'linebot.webhook.dispatch']
+        self.assertEqual(len(handles), 2)
+        self.assertNotEqual(handles[0].context.trace_id, handles[1].context.trace_id)
+        self.assertEqual(sorted(span.parent.span_id for span in dispatches),
+                         sorted(span.context.span_id for span in handles))
+        for dispatch in dispatches:
+            self.assertIn(dispatch.context.trace_id,
+                          [span.context.trace_id for span in handles])
+
+    def test_invalid_signature(self):
+        with self.assertRaises(InvalidSignatureError):
+            WebhookHandler(SECRET).handle(BODY, 'invalid')
+        span = self._spans()['linebot.webhook.validate_signature']
+        self.assertFalse(span.status.is_ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
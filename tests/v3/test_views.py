@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import os
+import pickle
+import unittest
+
+import linebot.v3.webhooks.models
+from linebot.v3.models import EventView, ModelView, view_class
+from linebot.v3.webhooks.models import (
+    Event,
+    MessageEvent,
+    TextMessageContent,
+    UserSource,
+)
+
+
+def _webhook_events():
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        return json.load(fp)['events']
+
+
+class TestEventView(unittest.TestCase):
+    def test_same_attributes_as_models(self):
+        for event in _webhook_events():
+            if event['type'] == 'undefined':
+                continue
+            view = EventView.from_dict(event)
+            model = Event.from_dict(event)
+
+            self.assertIsInstance(view, view_class(type(model)))
+            self.assertIsInstance(view, EventView)
+            self.assertEqual(view.to_dict(), model.to_dict())
+            self.assertEqual(view.to_model(), model)
+            for name in type(model).model_fields:
+                value = getattr(view, name)
+                if not isinstance(value, (ModelView, tuple)):
+                    self.assertEqual(value, getattr(model, name))
+
+    def test_all_event_types(self):
+        names = Event._Event__discriminator_value_class_map.values()
+        self.assertEqual(len(names), 20)
+        for name in names:
+            model = getattr(linebot.v3.webhooks.models, name)
+            view_cls = view_class(model)
+            self.assertTrue(issubclass(view_cls, EventView))
+            self.assertFalse(hasattr(view_cls(), '__dict__'))
+            fields = [field[0] for field in view_cls._resolve_fields()]
+            self.assertEqual(sorted(fields), sorted(model.model_fields))
+
+    def test_nested_views(self):
+        view = EventView.from_dict(_webhook_events()[0])
+
+        self.assertIsInstance(view, view_class(MessageEvent))
+        self.assertIsInstance(view.source, view_class(UserSource))
+        self.assertIsInstance(view.message, view_class(TextMessageContent))
+        self.assertEqual(view.message.text, 'Hello, world')
+        self.assertEqual(view.delivery_context.is_redelivery, False)
+        self.assertIsNone(view.message.mention)
+
+    def test_read_only(self):
+        view = EventView.from_dict(_webhook_events()[0])
+        with self.assertRaises(AttributeError):
+            view.type = 'follow'
+        with self.assertRaises(AttributeError):
+            view.unknown = 1
+        with self.assertRaises(AttributeError):
+            del view.type
+
+    def test_unknown_event_type(self):
+        view = EventView.from_dict(_webhook_events()[-1])
+
+        self.assertIs(type(view), EventView)
+        self.assertEqual(view.type, 'undefined')
+        with self.assertRaises(ValueError):
+            view.to_model()
+
+    def test_pickle(self):
+        for event in _webhook_events():
+            view = EventView.from_dict(event)
+            self.assertEqual(pickle.loads(pickle.dumps(view)), view)
+
+
+if __name__ == '__main__':
+    unittest.main()
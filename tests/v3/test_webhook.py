@@ -14,13 +14,22 @@
 
 from __future__ import unicode_literals, absolute_import
 
+import asyncio
+import json
 import os
+import threading
+import time
 import unittest
+from unittest import mock
 from builtins import open
 import inspect
 
+import pytest
+
 from linebot.v3 import (
-    SignatureValidator, WebhookParser, WebhookHandler
+    SignatureValidator, WebhookParser, AsyncWebhookParser,
+    WebhookHandler, AsyncWebhookHandler,
+    BackgroundExecutor,
 )
 from linebot.v3.webhooks.models import (
     MessageEvent, FollowEvent, UnfollowEvent, JoinEvent,
@@ -37,6 +46,7 @@ from linebot.v3.webhooks.models import (
 from linebot.v3.models import (
     UnknownEvent,
 )
+from linebot.v3.exceptions import InvalidSignatureError
 from linebot.v3.utils import PY3
 
 
@@ -623,6 +633,73 @@ class TestWebhookParser(unittest.TestCase):
         payload = self.parser.parse(body=body, signature='channel_secret', as_payload=True)
         self.assertEqual(None, payload.destination)
 
+    def test_iter_parse(self):
+        file_dir = os.path.dirname(__file__)
+        webhook_sample_json_path = os.path.join(file_dir, 'text', 'webhook.json')
+        with open(webhook_sample_json_path) as fp:
+            body = fp.read()
+
+        expected = self.parser.parse(body, 'channel_secret', as_payload=True)
+        payload = self.parser.iter_parse(body, 'channel_secret', as_payload=True)
+        events = list(payload.events)
+
+        self.assertEqual(len(events), 30)
+        self.assertEqual(payload.destination, expected.destination)
+        for event, expected_event in zip(events, expected.events):
+            self.assertIs(type(event), type(expected_event))
+            self.assertEqual(event, expected_event)
+
+    def test_iter_parse_is_incremental(self):
+        body = """{"destination": "U123", "events": [
+            {"type": "unfollow", "mode": "active", "timestamp": 1462629479859,
+             "source": {"type": "user", "userId": "U206d25c2ea6bd87c17655609a1c37cb8"},
+             "webhookEventId": "id", "deliveryContext": {"isRedelivery": false}},
+            broken"""
+        events = self.parser.iter_parse(body, 'channel_secret')
+        self.assertIsInstance(next(events), UnfollowEvent)
+        with self.assertRaises(ValueError):
+            next(events)
+
+    def test_iter_parse_empty_events(self):
+        payload = self.parser.iter_parse(
+            ' { "events" : [ ] , "destination" : "U123" } ', 'channel_secret', as_payload=True)
+        self.assertEqual(list(payload.events), [])
+        self.assertEqual(payload.destination, 'U123')
+
+    def test_iter_parse_validates_signature_eagerly(self):
+        parser = WebhookParser('channel_secret')
+        with self.assertRaises(InvalidSignatureError):
+            parser.iter_parse('{"events": []}', 'invalid_signature')
+
+
+@pytest.mark.asyncio
+async def test_async_parser_offload():
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        body = fp.read()
+    threads = []
+
+    def validate(body, signature):
+        threads.append(threading.current_thread())
+        return True
+
+    parser = AsyncWebhookParser('channel_secret', offload_threshold=len(body))
+    parser.signature_validator.validate = validate
+
+    events = await parser.parse(body, 'signature')
+    assert len(events) == 30
+    payload = await parser.parse(body + ' ', 'signature', as_payload=True)
+    assert payload.destination == 'U123'
+    assert threads[0] is not threading.current_thread()
+    assert threads[1] is not threading.current_thread()
+
+    await parser.parse('{"events": []}', 'signature')
+    assert threads[2] is threading.current_thread()
+
+    parser.signature_validator.validate = lambda a, b: False
+    with pytest.raises(InvalidSignatureError):
+        await parser.parse(body, 'signature')
+
 
 class TestWebhookHandler(unittest.TestCase):
     def setUp(self):
@@ -697,6 +774,199 @@ class TestWebhookHandler(unittest.TestCase):
 
         self.handler.handle(body, 'signature')
 
+    def test_iter_handle(self):
+        file_dir = os.path.dirname(__file__)
+        webhook_sample_json_path = os.path.join(file_dir, 'text', 'webhook.json')
+        with open(webhook_sample_json_path) as fp:
+            body = fp.read()
+
+        handler = WebhookHandler('channel_secret')
+        handler.parser.signature_validator.validate = lambda a, b: True
+        handled = []
+
+        @handler.default()
+        def default(event, destination):
+            handled.append((event.type, destination))
+
+        handler.iter_handle(body, 'signature')
+        types = [event['type'] for event in json.loads(body)['events']]
+        self.assertEqual(len(handled), 30)
+        self.assertEqual(handled, [(event_type, 'U123') for event_type in types])
+
+
+class TestWebhookHandlerBatch(unittest.TestCase):
+    def setUp(self):
+        self.handler = WebhookHandler('channel_secret')
+        self.handler.parser.signature_validator.validate = lambda a, b: True
+        file_dir = os.path.dirname(__file__)
+        with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+            self.body = fp.read()
+
+    def test_batch_per_request(self):
+        batches = []
+        others = []
+
+        @self.handler.add_batch(ThingsEvent)
+        def things(events):
+            batches.append(events)
+
+        @self.handler.default()
+        def default(event):
+            others.append(event)
+
+        self.handler.handle(self.body, 'signature')
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 3)
+        self.assertTrue(all(isinstance(event, ThingsEvent) for event in batches[0]))
+        self.assertEqual(len(others), 27)
+
+    def test_batch_max_size(self):
+        batches = []
+
+        @self.handler.add_batch(PostbackEvent, max_size=3, max_latency=60)
+        def postbacks(events):
+            batches.append(events)
+
+        self.handler.handle(self.body, 'signature')
+        self.handler.handle(self.body, 'signature')
+        self.assertEqual([len(b) for b in batches], [3, 3])
+
+        self.handler.flush()
+        self.assertEqual([len(b) for b in batches], [3, 3, 2])
+        self.handler.flush()
+        self.assertEqual(len(batches), 3)
+
+    def test_batch_max_latency(self):
+        batches = []
+
+        @self.handler.add_batch(BeaconEvent, max_size=None, max_latency=0.05)
+        def beacons(events):
+            batches.append(events)
+
+        self.handler.handle(self.body, 'signature')
+        self.handler.handle(self.body, 'signature')
+        deadline = time.monotonic() + 5
+        while not batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([len(b) for b in batches], [4])
+
+    def test_batch_with_executor(self):
+        executor = BackgroundExecutor(max_workers=2)
+        handler = WebhookHandler('channel_secret', executor=executor)
+        handler.parser.signature_validator.validate = lambda a, b: True
+        batches = []
+
+        @handler.add_batch(MessageEvent, max_size=100, max_latency=60)
+        def messages(events):
+            batches.append(events)
+
+        handler.handle(self.body, 'signature')
+        handler.handle(self.body, 'signature')
+        handler.flush()
+        executor.shutdown()
+        self.assertEqual([len(b) for b in batches], [22])
+
+    def test_batch_timer_after_shutdown(self):
+        executor = BackgroundExecutor(max_workers=1)
+        handler = WebhookHandler('channel_secret', executor=executor)
+        handler.parser.signature_validator.validate = lambda a, b: True
+        batches = []
+
+        @handler.add_batch(BeaconEvent, max_size=None, max_latency=0.2)
+        def beacons(events):
+            batches.append(events)
+
+        with mock.patch('linebot.v3.webhook.LOGGER') as logger:
+            handler.handle(self.body, 'signature')
+            timer = handler._batches[BeaconEvent.__name__].timer
+            executor.shutdown()
+            timer.join(5)
+        self.assertEqual(batches, [])
+        logger.exception.assert_called_once_with('Failed to flush a batch of %d events', 2)
+
+    def test_flush_cancels_timer(self):
+        batches = []
+
+        @self.handler.add_batch(BeaconEvent, max_size=None, max_latency=0.05)
+        def beacons(events):
+            batches.append(events)
+
+        self.handler.handle(self.body, 'signature')
+        timer = self.handler._batches[BeaconEvent.__name__].timer
+        self.handler.flush()
+        timer.join(5)
+        self.assertTrue(timer.finished.is_set())
+        self.assertEqual([len(b) for b in batches], [2])
+
+
+@pytest.mark.asyncio
+async def test_async_batch_handler():
+    handler = AsyncWebhookHandler('channel_secret')
+    handler.parser.signature_validator.validate = lambda a, b: True
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        body = fp.read()
+    batches = []
+
+    @handler.add_batch(ThingsEvent, max_size=4, max_latency=0.05)
+    async def things(events):
+        batches.append(events)
+
+    await handler.handle(body, 'signature')
+    assert [len(b) for b in batches] == []
+    await handler.handle(body, 'signature')
+    assert [len(b) for b in batches] == [4]
+    await asyncio.sleep(0.2)
+    assert [len(b) for b in batches] == [4, 2]
+
+    await handler.handle(body, 'signature')
+    await handler.flush()
+    assert [len(b) for b in batches] == [4, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_timer_task():
+    handler = AsyncWebhookHandler('channel_secret')
+    handler.parser.signature_validator.validate = lambda a, b: True
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        body = fp.read()
+    batches = []
+
+    @handler.add_batch(ThingsEvent, max_size=None, max_latency=0.01)
+    async def things(events):
+        await asyncio.sleep(0.1)
+        batches.append(events)
+        raise ValueError('failed')
+
+    await handler.handle(body, 'signature')
+    await asyncio.sleep(0.05)
+    assert len(handler._flush_tasks) == 1
+    with mock.patch('linebot.v3.webhook.LOGGER') as logger:
+        await handler.flush()
+        await asyncio.sleep(0)
+    assert [len(b) for b in batches] == [3]
+    assert not handler._flush_tasks
+    logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_iter_handle():
+    handler = AsyncWebhookHandler('channel_secret')
+    handler.parser.signature_validator.validate = lambda a, b: True
+    file_dir = os.path.dirname(__file__)
+    with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+        body = fp.read()
+    handled = []
+
+    @handler.default()
+    async def default(event, destination):
+        handled.append((event, destination))
+
+    await handler.iter_handle(body, 'signature')
+    assert len(handled) == 30
+    assert all(destination == 'U123' for _, destination in handled)
+
 
 class TestInvokeWebhookHandler(unittest.TestCase):
     def setUp(self):